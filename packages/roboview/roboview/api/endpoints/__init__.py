@@ -1,21 +1,32 @@
 """Central router that bundles all API endpoints."""
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+from roboview.api.etag import conditional_get
+from roboview.api.projects import project_scope
 
 from .files import api_router as files_router
 from .keyword_usage import api_router as keyword_usage_router
 from .overview import api_router as overview_router
 from .reports import router as reports_router
 from .robocop import api_router as robocop_router
+from .runtime import api_router as runtime_router
 from .system import api_router as system_router
 
 # Create main API router
 api_router = APIRouter()
 
+# Project endpoints are routed to the project selected by the request
+project_dependencies = [Depends(project_scope)]
+# Read endpoints backed by the registry snapshot answer conditional requests via ETag
+snapshot_dependencies = [*project_dependencies, Depends(conditional_get)]
+
 # Include all endpoint routers
 api_router.include_router(system_router, prefix="/system", tags=["system"])
 api_router.include_router(files_router, prefix="/files", tags=["files"])
-api_router.include_router(keyword_usage_router, prefix="/keyword-usage", tags=["keyword-usage"])
-api_router.include_router(overview_router, prefix="/overview", tags=["overview"])
-api_router.include_router(robocop_router, prefix="/robocop", tags=["robocop"])
-api_router.include_router(reports_router, prefix="/reports", tags=["reports"])
+api_router.include_router(
+    keyword_usage_router, prefix="/keyword-usage", tags=["keyword-usage"], dependencies=snapshot_dependencies
+)
+api_router.include_router(overview_router, prefix="/overview", tags=["overview"], dependencies=snapshot_dependencies)
+api_router.include_router(robocop_router, prefix="/robocop", tags=["robocop"], dependencies=snapshot_dependencies)
+api_router.include_router(runtime_router, prefix="/runtime", tags=["runtime"], dependencies=snapshot_dependencies)
+api_router.include_router(reports_router, prefix="/reports", tags=["reports"], dependencies=project_dependencies)
@@ -2,6 +2,7 @@
 
 from fastapi import APIRouter
 
+from .keyword_call_graph import router as keyword_call_graph_router
 from .keyword_duplicates import router as keyword_duplicate_router
 from .keyword_similarity import router as keyword_similarity_router
 from .keyword_usage_resource import router as keyword_usage_resource_router
@@ -28,3 +29,4 @@ api_router.include_router(
 
 api_router.include_router(keywords_wo_usages_router, prefix="/keywords-without-usages", tags=["keyword_without_usages"])
 api_router.include_router(keyword_duplicate_router, prefix="/keywords-duplicates", tags=["keyword_duplicates"])
+api_router.include_router(keyword_call_graph_router, prefix="/call-graph", tags=["keyword_call_graph"])
@@ -0,0 +1,127 @@
+"""Endpoints for querying callers, callees and calling cycles in the resolved call graph."""
+
+import logging
+from typing import Annotated
+
+from fastapi import APIRouter, HTTPException, Query
+from roboview.api.projects import get_project
+from roboview.schemas.dtos.keyword_usage import (
+    KeywordCalleesResponse,
+    KeywordCallersResponse,
+    RecursiveKeywordsResponse,
+)
+from starlette.requests import Request
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+MaxDepth = Annotated[
+    int | None, Query(ge=1, description="Maximum number of calls in between, 1 for direct calls, no limit if omitted.")
+]
+
+
+@router.get(
+    "/callers",
+    summary="Get the keywords, test cases and files calling a keyword",
+    response_model=KeywordCallersResponse,
+    responses={
+        200: {"description": "Callers fetched successfully."},
+        400: {"description": "Invalid input data."},
+        404: {"description": "Keyword not found."},
+        500: {"description": "Internal Server Error."},
+        503: {"description": "Service is unavailable."},
+    },
+)
+async def get_keyword_callers(request: Request, keyword_name: str, max_depth: MaxDepth = None):  # noqa: ANN201
+    """Endpoint retrieving the callers of a keyword, transitively up to a maximum depth.
+
+    Test cases call the keywords of their setup, teardown and template, files call their test
+    cases and the keywords of their suite setup and teardown.
+
+    Arguments:
+        request (Request): FastAPI request object.
+        keyword_name (str): Name of the keyword, with or without prefix.
+        max_depth (int | None): Maximum number of calls in between, no limit if None.
+
+    Returns:
+        KeywordCallersResponse: The keyword and its callers with their call distance.
+
+    """
+    try:
+        result = get_project(request).keyword_usage_service.get_keyword_callers(keyword_name, max_depth)
+    except Exception as e:
+        logger.exception("Error retrieving callers of keyword %s", keyword_name)
+        raise HTTPException(status_code=500, detail="Internal Server Error") from e
+
+    if result is None:
+        raise HTTPException(status_code=404, detail="Keyword not found")
+    keyword, callers = result
+    return KeywordCallersResponse(keyword=keyword, callers=callers)
+
+
+@router.get(
+    "/callees",
+    summary="Get the keywords called by a keyword",
+    response_model=KeywordCalleesResponse,
+    responses={
+        200: {"description": "Callees fetched successfully."},
+        400: {"description": "Invalid input data."},
+        404: {"description": "Keyword not found."},
+        500: {"description": "Internal Server Error."},
+        503: {"description": "Service is unavailable."},
+    },
+)
+async def get_keyword_callees(request: Request, keyword_name: str, max_depth: MaxDepth = None):  # noqa: ANN201
+    """Endpoint retrieving the keywords called by a keyword, transitively up to a maximum depth.
+
+    Arguments:
+        request (Request): FastAPI request object.
+        keyword_name (str): Name of the keyword, with or without prefix.
+        max_depth (int | None): Maximum number of calls in between, no limit if None.
+
+    Returns:
+        KeywordCalleesResponse: The keyword and its callees with their call distance.
+
+    """
+    try:
+        result = get_project(request).keyword_usage_service.get_keyword_callees(keyword_name, max_depth)
+    except Exception as e:
+        logger.exception("Error retrieving callees of keyword %s", keyword_name)
+        raise HTTPException(status_code=500, detail="Internal Server Error") from e
+
+    if result is None:
+        raise HTTPException(status_code=404, detail="Keyword not found")
+    keyword, callees = result
+    return KeywordCalleesResponse(keyword=keyword, callees=callees)
+
+
+@router.get(
+    "/recursion-groups",
+    summary="Get the recursive and mutually recursive keywords",
+    response_model=RecursiveKeywordsResponse,
+    responses={
+        200: {"description": "Recursive keyword groups fetched successfully."},
+        500: {"description": "Internal Server Error."},
+        503: {"description": "Service is unavailable."},
+    },
+)
+async def get_recursive_keywords(request: Request):  # noqa: ANN201
+    """Endpoint retrieving the keywords calling themselves, directly or through other keywords.
+
+    Every group is a strongly connected component of the keyword call graph, either a single
+    keyword calling itself or several keywords calling each other in a cycle.
+
+    Arguments:
+        request (Request): FastAPI request object.
+
+    Returns:
+        RecursiveKeywordsResponse: The recursive keyword groups, largest group first.
+
+    """
+    try:
+        recursion_groups = get_project(request).keyword_usage_service.get_recursive_keyword_groups()
+        return RecursiveKeywordsResponse(recursion_groups=recursion_groups)
+
+    except Exception as e:
+        logger.exception("Error retrieving recursive keywords")
+        raise HTTPException(status_code=500, detail="Internal Server Error") from e
@@ -3,6 +3,7 @@
 import logging
 
 from fastapi import APIRouter, HTTPException
+from roboview.api.projects import get_project
 from roboview.schemas.dtos.keyword_similarity import DuplicateKeywordResponse
 from starlette.requests import Request
 
@@ -33,8 +34,9 @@ async def get_potential_duplicate_keywords(request: Request) -> DuplicateKeyword
 
     """
     try:
-        potential_duplicate_keywords = request.app.state.keyword_usage_service.get_potential_duplicate_keywords(
-            request.app.state.keyword_similarity_service
+        project = get_project(request)
+        potential_duplicate_keywords = project.keyword_usage_service.get_potential_duplicate_keywords(
+            project.keyword_similarity_service
         )
     except Exception as e:
         logger.exception("Error retrieving potential duplicate keywords")
@@ -1,8 +1,10 @@
 """Endpoint for fetching the keyword similarity for a specific keyword."""
 
 import logging
+from typing import Annotated
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
+from roboview.api.projects import get_project
 from roboview.schemas.dtos.keyword_similarity import KeywordSimilarityResponse
 from starlette.requests import Request
 
@@ -21,12 +23,19 @@ router = APIRouter()
         503: {"description": "Service is unavailable."},
     },
 )
-async def get_keyword_similarity(request: Request, keyword_name: str) -> KeywordSimilarityResponse:
-    """Endpoint retrieving the top 5 most similar keywords.
+async def get_keyword_similarity(
+    request: Request,
+    keyword_name: str,
+    top_n: Annotated[int, Query(ge=1, le=100, description="Maximum number of similar keywords.")] = 5,
+    min_score: Annotated[float, Query(ge=0.0, le=1.0, description="Minimum similarity score.")] = 0.0,
+) -> KeywordSimilarityResponse:
+    """Endpoint retrieving the top n most similar keywords.
 
     Arguments:
         request (Request): FastAPI request object.
         keyword_name (str): Target keyword name to get the corresponding n most similar keywords.
+        top_n (int): Maximum number of similar keywords to return (default: 5).
+        min_score (float): Minimum similarity score in range [0.0, 1.0] (default: 0.0).
 
     Returns:
         KeywordSimilarityResponse: top_n_similar_keywords (dict): Dictionary containing the n most similar keywords
@@ -34,9 +43,8 @@ async def get_keyword_similarity(request: Request, keyword_name: str) -> Keyword
 
     """
     try:
-        top_n = 5
-        top_n_similar_keywords = request.app.state.keyword_similarity_service.get_n_most_similar_keywords(
-            keyword_name, top_n
+        top_n_similar_keywords = get_project(request).keyword_similarity_service.get_n_most_similar_keywords(
+            keyword_name, top_n, min_score=min_score
         )
     except Exception as e:
         logger.exception("Error retrieving similarity values for keyword %s: ", keyword_name)
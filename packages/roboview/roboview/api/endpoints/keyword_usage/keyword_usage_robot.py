@@ -3,6 +3,7 @@
 import logging
 
 from fastapi import APIRouter, HTTPException
+from roboview.api.projects import get_project
 from roboview.schemas.domain.common import FileType
 from roboview.schemas.dtos.keyword_usage import KeywordUsageRobotResponse
 from starlette.requests import Request
@@ -34,7 +35,7 @@ async def get_kw_usage_robot(request: Request, keyword_name: str):  # noqa: ANN2
 
     """
     try:
-        kw_usages_robot = request.app.state.keyword_usage_service.get_keyword_usage_in_files_for_target_keyword(
+        kw_usages_robot = get_project(request).keyword_usage_service.get_keyword_usage_in_files_for_target_keyword(
             keyword_name, FileType.ROBOT
         )
     except Exception as e:
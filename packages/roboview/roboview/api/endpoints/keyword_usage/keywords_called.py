@@ -4,6 +4,7 @@ import logging
 from pathlib import Path
 
 from fastapi import APIRouter, HTTPException
+from roboview.api.projects import get_project
 from roboview.schemas.domain.common import KeywordType
 from roboview.schemas.dtos.keyword_usage import CalledKeywordsResponse
 from starlette.requests import Request
@@ -35,7 +36,7 @@ async def get_called_keywords(request: Request, file_path: Path):  # noqa: ANN20
 
     """
     try:
-        called_keywords_with_usage = request.app.state.keyword_usage_service.get_keywords_with_global_usage_for_file(
+        called_keywords_with_usage = get_project(request).keyword_usage_service.get_keywords_with_global_usage_for_file(
             file_path, KeywordType.CALLED
         )
     except ValueError as v:
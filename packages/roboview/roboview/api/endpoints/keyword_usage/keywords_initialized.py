@@ -4,6 +4,7 @@ import logging
 from pathlib import Path
 
 from fastapi import APIRouter, HTTPException
+from roboview.api.projects import get_project
 from roboview.schemas.domain.common import KeywordType
 from roboview.schemas.dtos.keyword_usage import InitializedKeywordsResponse
 from starlette.requests import Request
@@ -35,7 +36,7 @@ async def get_init_keywords(request: Request, file_path: Path) -> InitializedKey
 
     """
     try:
-        init_keywords_with_usage = request.app.state.keyword_usage_service.get_keywords_with_global_usage_for_file(
+        init_keywords_with_usage = get_project(request).keyword_usage_service.get_keywords_with_global_usage_for_file(
             file_path, KeywordType.INITIALIZED
         )
     except Exception as e:
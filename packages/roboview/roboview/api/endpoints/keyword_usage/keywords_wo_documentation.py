@@ -3,6 +3,7 @@
 import logging
 
 from fastapi import APIRouter, HTTPException
+from roboview.api.projects import get_project
 from roboview.schemas.dtos.keyword_usage import KeywordsWithoutDocResponse
 from starlette.requests import Request
 
@@ -32,7 +33,7 @@ async def get_keywords_wo_doc(request: Request):  # noqa: ANN201
 
     """
     try:
-        keywords_wo_doc = request.app.state.keyword_usage_service.get_keywords_without_documentation()
+        keywords_wo_doc = get_project(request).keyword_usage_service.get_keywords_without_documentation()
     except Exception as e:
         logger.exception("Error retrieving keywords without documentation.")
         raise HTTPException(status_code=500, detail="Internal Server Error") from e
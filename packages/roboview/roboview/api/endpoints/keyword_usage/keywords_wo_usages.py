@@ -1,8 +1,9 @@
-"""Endpoint for fetching keywords that have not total usages across the whole project."""
+"""Endpoint for fetching keywords that no test case reaches across the whole project."""
 
 import logging
 
 from fastapi import APIRouter, HTTPException
+from roboview.api.projects import get_project
 from roboview.schemas.dtos.keyword_usage import KeywordsWithoutUsagesResponse
 from starlette.requests import Request
 
@@ -12,7 +13,7 @@ router = APIRouter()
 
 @router.get(
     "",
-    summary="Get keywords that have not total usages across the whole project.",
+    summary="Get keywords that no test case reaches across the whole project.",
     response_model=KeywordsWithoutUsagesResponse,
     responses={
         200: {"description": "Keywords without usages fetched successfully."},
@@ -22,17 +23,20 @@ router = APIRouter()
     },
 )
 async def get_keywords_wo_usages(request: Request):  # noqa: ANN201
-    """Returns a list of keywords that have no total usages across the whole project.
+    """Returns a list of keywords that no test case or suite setting reaches across the whole project.
+
+    Keywords nothing calls are directly unused, keywords only called by other unreachable
+    keywords are transitively dead.
 
     Arguments:
         request (Request): FastAPI request object.
 
     Returns:
-        KeywordsWithoutUsagesResponse: List containing all keywords that have no total usages.
+        KeywordsWithoutUsagesResponse: List containing all unreachable keywords.
 
     """
     try:
-        keywords_wo_usages = request.app.state.keyword_usage_service.get_keywords_without_usages()
+        keywords_wo_usages = get_project(request).keyword_usage_service.get_keywords_without_usages()
     except Exception as e:
         logger.exception("Error retrieving keywords without usages.")
         raise HTTPException(status_code=500, detail="Internal Server Error") from e
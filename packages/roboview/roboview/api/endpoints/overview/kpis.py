@@ -4,6 +4,7 @@ import logging
 from pathlib import Path
 
 from fastapi import APIRouter, HTTPException
+from roboview.api.projects import get_project
 from roboview.schemas.dtos.overview import KPIResponse
 from roboview.utils.directory_parsing import DirectoryParser
 from starlette.requests import Request
@@ -35,11 +36,12 @@ async def get_kpis(request: Request, project_root_dir: Path):  # noqa: ANN201
 
     """
     try:
-        keyword_reusage_rate = request.app.state.keyword_usage_service.get_keyword_reusage_rate()
-        documentation_coverage = request.app.state.keyword_usage_service.get_documentation_coverage()
-        num_user_keywords = len(request.app.state.keyword_registry.get_user_defined_keywords())
-        num_unused_keywords = len(request.app.state.keyword_usage_service.get_keywords_without_usages())
-        num_robocop_issues = len(request.app.state.robocop_service.get_robocop_error_messages())
+        project = get_project(request)
+        keyword_reusage_rate = project.keyword_usage_service.get_keyword_reusage_rate()
+        documentation_coverage = project.keyword_usage_service.get_documentation_coverage()
+        num_user_keywords = len(project.keyword_registry.get_user_defined_keywords())
+        num_unused_keywords = len(project.keyword_usage_service.get_keywords_without_usages())
+        num_robocop_issues = len(project.robocop_service.get_robocop_error_messages())
 
         directory_parser = DirectoryParser(Path(project_root_dir))
         robot_files_names = directory_parser.get_test_file_paths()
@@ -3,6 +3,7 @@
 import logging
 
 from fastapi import APIRouter, HTTPException
+from roboview.api.projects import get_project
 from roboview.schemas.dtos.overview import MostUsedKeywordsResponse
 from starlette.requests import Request
 
@@ -32,9 +33,10 @@ async def get_most_used_keywords(request: Request):  # noqa: ANN201
 
     """
     try:
-        most_used_user_keywords = request.app.state.keyword_usage_service.get_most_used_user_defined_keywords(5)
+        project = get_project(request)
+        most_used_user_keywords = project.keyword_usage_service.get_most_used_user_defined_keywords(5)
         most_used_external_or_builtin_keywords = (
-            request.app.state.keyword_usage_service.get_most_used_external_or_builtin_keywords(5)
+            project.keyword_usage_service.get_most_used_external_or_builtin_keywords(5)
         )
 
     except Exception as e:
@@ -3,6 +3,7 @@
 import logging
 
 from fastapi import APIRouter, HTTPException
+from roboview.api.projects import get_project
 from roboview.schemas.dtos.overview import RobocopIssueSummaryResponse
 from starlette.requests import Request
 
@@ -32,7 +33,7 @@ async def get_robocop_issue_summary(request: Request):  # noqa: ANN201
 
     """
     try:
-        issue_summary = request.app.state.robocop_service.get_robocop_issue_summary()
+        issue_summary = get_project(request).robocop_service.get_robocop_issue_summary()
 
     except Exception as e:
         logger.exception("Error calculating KPIs")
@@ -2,43 +2,92 @@
 
 import logging
 import tempfile
-from datetime import UTC, datetime
 from pathlib import Path
-from uuid import uuid4
 
 import anyio
+import anyio.to_thread
 from fastapi import APIRouter, HTTPException
-from roboview.schemas.dtos.reports import GenerateReportRequest, ReportStatusResponse
+from roboview.api.etag import get_snapshot_versions
+from roboview.api.projects import get_project
+from roboview.core.config import get_settings
+from roboview.schemas.domain.reports import ReportJob, ReportJobStatusEnum
+from roboview.schemas.dtos.reports import ExportFormatEnum, GenerateReportRequest, ReportStatusResponse
+from roboview.services.report_job_service import ReportJobService, ReportQueueFullError
 from roboview.utils.exporters.html_exporter import HTMLExporter
 from starlette.requests import Request
-from starlette.responses import FileResponse
+from starlette.responses import FileResponse, StreamingResponse
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
-# In-memory store for report status (in production, would use database)
-_REPORT_STATUS_STORE: dict[str, dict] = {}
 
+def get_report_job_service(request: Request) -> ReportJobService:
+    """Get the report job service of the application, creating it on first use.
 
-def _get_report_or_raise(report_id: str) -> dict:
-    """Get report from store or raise HTTPException."""
-    if report_id not in _REPORT_STATUS_STORE:
+    Arguments:
+        request (Request): FastAPI request object.
+
+    Returns:
+        ReportJobService: Report job service bound to the application state.
+
+    """
+    report_job_service = getattr(request.app.state, "report_job_service", None)
+    if report_job_service is None:
+        settings = get_settings()
+        output_dir = (
+            Path(settings.REPORT_OUTPUT_DIR)
+            if settings.REPORT_OUTPUT_DIR
+            else Path(tempfile.gettempdir()) / ".roboview" / "reports"
+        )
+        report_job_service = ReportJobService(
+            output_dir,
+            max_workers=settings.REPORT_MAX_WORKERS,
+            max_pending_jobs=settings.REPORT_MAX_PENDING_JOBS,
+            max_stored_reports=settings.REPORT_MAX_STORED_REPORTS,
+            max_storage_bytes=settings.REPORT_MAX_STORAGE_BYTES,
+            max_age_seconds=settings.REPORT_MAX_AGE_SECONDS,
+        )
+        request.app.state.report_job_service = report_job_service
+    return report_job_service
+
+
+def _get_report_or_raise(request: Request, report_id: str) -> ReportJob:
+    """Get report job or raise HTTPException."""
+    job = get_report_job_service(request).get_job(report_id)
+    if job is None:
         raise HTTPException(status_code=404, detail="Report not found")
-    return _REPORT_STATUS_STORE[report_id]
+    return job
+
+
+def _to_status_response(job: ReportJob) -> ReportStatusResponse:
+    """Convert a report job into its status response."""
+    return ReportStatusResponse(
+        report_id=job.report_id,
+        status=job.status,
+        download_url=f"/v1/reports/download/{job.report_id}" if job.status == ReportJobStatusEnum.COMPLETED else None,
+        error_message=job.error_message,
+        file_size=job.file_size,
+        created_at=job.created_at.isoformat(),
+    )
 
 
 @router.post(
     "/generate",
     summary="Generate a summary report",
     response_model=ReportStatusResponse,
+    status_code=202,
     responses={
-        200: {"description": "Report generation started."},
+        202: {"description": "Report generation queued."},
         400: {"description": "Invalid input data."},
         500: {"description": "Internal Server Error."},
+        503: {"description": "Report queue is full."},
     },
 )
 async def generate_report(request: Request, report_request: GenerateReportRequest):  # noqa: ANN201
-    """Generate a comprehensive summary report as HTML.
+    """Queue the generation of a comprehensive summary report as HTML.
+
+    Identical requests for the same analysis snapshot and author are coalesced onto
+    the same report. Poll ``/reports/status/{report_id}`` until the report is completed.
 
     Arguments:
         request: FastAPI request object
@@ -48,57 +97,59 @@ async def generate_report(request: Request, report_request: GenerateReportReques
         ReportStatusResponse: Status of report generation
 
     """
+    if report_request.export_format not in {export_format.value for export_format in ExportFormatEnum}:
+        raise HTTPException(status_code=400, detail=f"Unsupported export format: {report_request.export_format}")
+
     try:
-        report_id = str(uuid4())
-        created_at = datetime.now(UTC).isoformat()
-
-        # Store report status
-        _REPORT_STATUS_STORE[report_id] = {
-            "status": "generating",
-            "created_at": created_at,
-            "report_type": "summary",
-            "export_format": "html",
-        }
-
-        # Generate summary report
-        reporting_service = request.app.state.reporting_service
-        report = reporting_service.generate_report(author=report_request.author)
-
-        # Export to HTML
-        temp_dir = Path(tempfile.gettempdir()) / ".roboview" / "reports"
-        temp_dir.mkdir(parents=True, exist_ok=True)
-
-        output_file = temp_dir / f"{report_id}.html"
-        HTMLExporter.export(report, output_file)
-        file_size = output_file.stat().st_size
-
-        # Update status
-        _REPORT_STATUS_STORE[report_id] = {
-            "status": "completed",
-            "created_at": created_at,
-            "report_type": "summary",
-            "export_format": "html",
-            "file_path": str(output_file),
-            "file_size": file_size,
-        }
-
-        return ReportStatusResponse(
-            report_id=report_id,
-            status="completed",
-            download_url=f"/v1/reports/download/{report_id}",
-            file_size=file_size,
-            created_at=created_at,
+        project = get_project(request)
+        reporting_service = project.reporting_service
+        snapshot_versions = get_snapshot_versions(project)
+        dedup_key = (snapshot_versions, report_request.author) if snapshot_versions is not None else None
+
+        job = get_report_job_service(request).submit(
+            lambda: reporting_service.generate_report(author=report_request.author),
+            author=report_request.author,
+            dedup_key=dedup_key,
         )
+        return _to_status_response(job)
 
-    except HTTPException:
-        raise
+    except ReportQueueFullError as e:
+        logger.warning("Rejecting report request: %s", e)
+        raise HTTPException(status_code=503, detail="Report queue is full") from None
     except Exception:
         logger.exception("Error generating report")
-        report_id_local = str(uuid4())
-        _REPORT_STATUS_STORE[report_id_local] = {
-            "status": "failed",
-            "error": "Internal error",
-        }
+        raise HTTPException(status_code=500, detail="Internal Server Error") from None
+
+
+@router.get(
+    "/stream",
+    summary="Stream a summary report",
+    response_class=StreamingResponse,
+    responses={
+        200: {"description": "Report rendered as HTML.", "content": {"text/html": {}}},
+        500: {"description": "Internal Server Error."},
+    },
+)
+async def stream_report(request: Request, author: str | None = None):  # noqa: ANN201
+    """Render a summary report and stream the HTML directly into the response.
+
+    The report is not stored, the template is rendered chunk by chunk while it is sent.
+
+    Arguments:
+        request: FastAPI request object
+        author: Author of the report
+
+    Returns:
+        StreamingResponse: Rendered HTML report
+
+    """
+    try:
+        reporting_service = get_project(request).reporting_service
+        report = await anyio.to_thread.run_sync(lambda: reporting_service.generate_report(author=author))
+        return StreamingResponse(HTMLExporter.iter_html(report), media_type="text/html")
+
+    except Exception:
+        logger.exception("Error streaming report")
         raise HTTPException(status_code=500, detail="Internal Server Error") from None
 
 
@@ -112,10 +163,11 @@ async def generate_report(request: Request, report_request: GenerateReportReques
         500: {"description": "Internal Server Error."},
     },
 )
-async def get_report_status(report_id: str):  # noqa: ANN201
+async def get_report_status(request: Request, report_id: str):  # noqa: ANN201
     """Get the status of a report generation request.
 
     Arguments:
+        request: FastAPI request object
         report_id: ID of the report
 
     Returns:
@@ -123,15 +175,7 @@ async def get_report_status(report_id: str):  # noqa: ANN201
 
     """
     try:
-        status_data = _get_report_or_raise(report_id)
-        return ReportStatusResponse(
-            report_id=report_id,
-            status=status_data["status"],
-            download_url=f"/v1/reports/download/{report_id}" if status_data["status"] == "completed" else None,
-            error_message=status_data.get("error"),
-            file_size=status_data.get("file_size"),
-            created_at=status_data["created_at"],
-        )
+        return _to_status_response(_get_report_or_raise(request, report_id))
 
     except HTTPException:
         raise
@@ -149,29 +193,30 @@ async def get_report_status(report_id: str):  # noqa: ANN201
         500: {"description": "Internal Server Error."},
     },
 )
-async def download_report(report_id: str):  # noqa: ANN201
+async def download_report(request: Request, report_id: str):  # noqa: ANN201
     """Download a generated report file.
 
     Arguments:
+        request: FastAPI request object
         report_id: ID of the report
 
     Returns:
         FileResponse: Report file
 
     """
-    status_data = _get_report_or_raise(report_id)
+    job = _get_report_or_raise(request, report_id)
 
-    if status_data["status"] != "completed":
+    if job.status != ReportJobStatusEnum.COMPLETED or job.file_path is None:
         raise HTTPException(status_code=400, detail="Report generation not completed")
 
-    file_path = anyio.Path(status_data["file_path"])
+    file_path = anyio.Path(job.file_path)
 
     try:
         if not await file_path.exists():
             raise HTTPException(status_code=404, detail="Report file not found")  # noqa: TRY301
 
         return FileResponse(
-            Path(status_data["file_path"]),
+            Path(job.file_path),
             media_type="text/html",
             filename=f"report_{report_id[:8]}.html",
         )
@@ -191,9 +236,12 @@ async def download_report(report_id: str):  # noqa: ANN201
         500: {"description": "Internal Server Error."},
     },
 )
-async def get_available_reports():  # noqa: ANN201
+async def get_available_reports(request: Request):  # noqa: ANN201
     """Get list of available reports.
 
+    Arguments:
+        request: FastAPI request object
+
     Returns:
         List of report metadata
 
@@ -201,15 +249,14 @@ async def get_available_reports():  # noqa: ANN201
     try:
         reports = [
             {
-                "report_id": report_id,
-                "report_type": status_data["report_type"],
-                "export_format": status_data["export_format"],
-                "created_at": status_data["created_at"],
-                "file_size": status_data.get("file_size"),
-                "status": status_data["status"],
+                "report_id": job.report_id,
+                "report_type": job.report_type,
+                "export_format": job.export_format,
+                "created_at": job.created_at.isoformat(),
+                "file_size": job.file_size,
+                "status": job.status,
             }
-            for report_id, status_data in _REPORT_STATUS_STORE.items()
-            if status_data["status"] == "completed"
+            for job in get_report_job_service(request).list_jobs(ReportJobStatusEnum.COMPLETED)
         ]
     except Exception:
         logger.exception("Error retrieving available reports")
@@ -227,26 +274,21 @@ async def get_available_reports():  # noqa: ANN201
         500: {"description": "Internal Server Error."},
     },
 )
-async def delete_report(report_id: str):  # noqa: ANN201
+async def delete_report(request: Request, report_id: str):  # noqa: ANN201
     """Delete a generated report.
 
     Arguments:
+        request: FastAPI request object
         report_id: ID of the report to delete
 
     Returns:
         Success message
 
     """
-    status_data = _get_report_or_raise(report_id)
-    file_path = anyio.Path(status_data.get("file_path", ""))
-
     try:
-        # Delete file if exists
-        if await file_path.exists():
-            await file_path.unlink()
-
-        # Remove from store
-        del _REPORT_STATUS_STORE[report_id]
+        # Removes the status entry together with the report file
+        if not get_report_job_service(request).delete_job(report_id):
+            raise HTTPException(status_code=404, detail="Report not found")  # noqa: TRY301
     except HTTPException:
         raise
     except Exception:
@@ -3,6 +3,7 @@
 import logging
 
 from fastapi import APIRouter, HTTPException
+from roboview.api.projects import get_project
 from roboview.schemas.dtos.robocop import RobocopMessageResponse
 from starlette.requests import Request
 
@@ -17,6 +18,7 @@ router = APIRouter()
     responses={
         200: {"description": "Robocop message fetched successfully."},
         400: {"description": "Invalid input data."},
+        404: {"description": "Robocop message not found."},
         500: {"description": "Internal Server Error."},
         503: {"description": "Service is unavailable."},
     },
@@ -33,8 +35,10 @@ async def get_robocop_message(request: Request, message_uuid: str):  # noqa: ANN
 
     """
     try:
-        message = request.app.state.robocop_service.get_robocop_message_by_id(message_uuid)
+        message = get_project(request).robocop_service.get_robocop_message_by_id(message_uuid)
     except Exception as e:
         logger.exception("Error retrieving keywords without usages.")
         raise HTTPException(status_code=500, detail="Internal Server Error") from e
+    if message is None:
+        raise HTTPException(status_code=404, detail="Robocop message not found")
     return RobocopMessageResponse(message=message)
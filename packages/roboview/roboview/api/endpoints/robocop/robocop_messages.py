@@ -3,6 +3,7 @@
 import logging
 
 from fastapi import APIRouter, HTTPException
+from roboview.api.projects import get_project
 from roboview.schemas.dtos.robocop import RobocopMessagesResponse
 from starlette.requests import Request
 
@@ -32,7 +33,7 @@ async def get_robocop_messages(request: Request):  # noqa: ANN201
 
     """
     try:
-        messages = request.app.state.robocop_service.get_robocop_error_messages()
+        messages = get_project(request).robocop_service.get_robocop_error_messages()
     except Exception as e:
         logger.exception("Error retrieving keywords without usages.")
         raise HTTPException(status_code=500, detail="Internal Server Error") from e
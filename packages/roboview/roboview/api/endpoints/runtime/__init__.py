@@ -0,0 +1,13 @@
+"""Router that bundles keyword runtime related endpoints."""
+
+from fastapi import APIRouter
+
+from .output_ingestion import router as output_ingestion_router
+from .slowest_keywords import router as slowest_keywords_router
+
+# Create keyword runtime API router
+api_router = APIRouter()
+
+# Include all keyword runtime endpoint routers
+api_router.include_router(output_ingestion_router, prefix="/output-files", tags=["output_ingestion"])
+api_router.include_router(slowest_keywords_router, prefix="/slowest-keywords", tags=["slowest_keywords"])
@@ -0,0 +1,55 @@
+"""Endpoint for ingesting the keyword runtimes of Robot Framework output files."""
+
+import logging
+
+import anyio
+from fastapi import APIRouter, HTTPException
+from roboview.api.projects import get_project
+from roboview.schemas.dtos.runtime import OutputIngestionRequest, OutputIngestionResponse
+from roboview.utils.output_xml import OutputXmlError
+from starlette.requests import Request
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+
+@router.post(
+    "",
+    summary="Ingest the keyword runtimes of Robot Framework output files",
+    response_model=OutputIngestionResponse,
+    responses={
+        200: {"description": "Output files ingested successfully."},
+        400: {"description": "Invalid input data."},
+        500: {"description": "Internal Server Error."},
+        503: {"description": "Service is unavailable."},
+    },
+)
+async def post_output_files(request: Request, ingestion_request: OutputIngestionRequest):  # noqa: ANN201
+    """Endpoint streaming output.xml files and attaching the keyword runtimes to the registered keywords.
+
+    The runtimes replace those of an earlier ingestion, several files, e.g. of the shards of a
+    run, are aggregated together.
+
+    Arguments:
+        request (Request): FastAPI request object.
+        ingestion_request (OutputIngestionRequest): output_files (list[Path]): Paths of the output.xml files.
+
+    Returns:
+        OutputIngestionResponse: Number of ingested files, keyword calls and keywords.
+
+    """
+    missing = [path for path in ingestion_request.output_files if not path.is_file()]
+    if missing:
+        raise HTTPException(status_code=400, detail=f"Output file not found: {missing[0]}")
+
+    try:
+        runtime_service = get_project(request).keyword_runtime_service
+        summary = await anyio.to_thread.run_sync(runtime_service.ingest_output_files, ingestion_request.output_files)
+    except OutputXmlError as e:
+        logger.warning("Invalid output file: %s", e)
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    except Exception as e:
+        logger.exception("Error ingesting output files")
+        raise HTTPException(status_code=500, detail="Internal Server Error") from e
+    else:
+        return OutputIngestionResponse(summary=summary)
@@ -0,0 +1,47 @@
+"""Endpoint for fetching the keywords the ingested test runs spent the most time in."""
+
+import logging
+from typing import Annotated
+
+from fastapi import APIRouter, HTTPException, Query
+from roboview.api.projects import get_project
+from roboview.schemas.dtos.runtime import SlowestKeywordsResponse
+from starlette.requests import Request
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+
+@router.get(
+    "",
+    summary="Get the keywords ranked by total time spent in them",
+    response_model=SlowestKeywordsResponse,
+    responses={
+        200: {"description": "Slowest keywords fetched successfully."},
+        400: {"description": "Invalid input data."},
+        500: {"description": "Internal Server Error."},
+        503: {"description": "Service is unavailable."},
+    },
+)
+async def get_slowest_keywords(  # noqa: ANN201
+    request: Request, limit: Annotated[int | None, Query(ge=1, description="Maximum number of keywords.")] = 20
+):
+    """Endpoint retrieving the executed keywords with call counts, durations and failures.
+
+    The list is empty until output files were ingested.
+
+    Arguments:
+        request (Request): FastAPI request object.
+        limit (int | None): Maximum number of keywords, all if None.
+
+    Returns:
+        SlowestKeywordsResponse: Runtime statistics, the most total time first.
+
+    """
+    try:
+        slowest_keywords = get_project(request).keyword_runtime_service.get_slowest_keywords(limit)
+    except Exception as e:
+        logger.exception("Error retrieving the slowest keywords")
+        raise HTTPException(status_code=500, detail="Internal Server Error") from e
+    else:
+        return SlowestKeywordsResponse(slowest_keywords=slowest_keywords)
@@ -4,10 +4,20 @@ from fastapi import APIRouter
 
 from .health import router as health_router
 from .initialize import router as initialize_router
+from .memory import router as memory_router
+from .metrics import router as metrics_router
+from .profile import router as profile_router
+from .projects import router as projects_router
+from .ready import router as ready_router
 
 # Create system API router
 api_router = APIRouter()
 
 # Include all system endpoint routers
 api_router.include_router(health_router, prefix="/health", tags=["health"])
+api_router.include_router(ready_router, prefix="/ready", tags=["health"])
 api_router.include_router(initialize_router, prefix="/initialize", tags=["initialize"])
+api_router.include_router(projects_router, prefix="/projects", tags=["projects"])
+api_router.include_router(metrics_router, prefix="/metrics", tags=["metrics"])
+api_router.include_router(profile_router, prefix="/profile", tags=["profile"])
+api_router.include_router(memory_router, prefix="/memory", tags=["memory"])
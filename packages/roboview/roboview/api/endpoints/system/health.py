@@ -22,7 +22,8 @@ async def health_check():  # noqa: ANN201
     """Performs a basic health check on the FastAPI backend.
 
     This endpoint can primarily be used for Docker to ensure a robust container orchestration
-    and management is in place.
+    and management is in place. It only reports that the server is alive, whether the
+    project the server was started for is warmed up is reported by ``/system/ready``.
 
     Returns:
         HealthCheck: Returns a JSON response with the health status
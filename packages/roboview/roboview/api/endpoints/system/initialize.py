@@ -1,23 +1,112 @@
 """Endpoint for initializing RoboView."""
 
 import logging
+import time
 from pathlib import Path
 
+import anyio
 from fastapi import APIRouter, HTTPException
+from roboview.api.profiling import get_profiling_service
+from roboview.api.projects import get_state_project_pool
+from roboview.core.config import get_settings
+from roboview.core.metrics import INITIALIZATION_PHASE_DURATION
+from roboview.schemas.domain.profiling import ProfilingTargetEnum
 from roboview.schemas.dtos.common import InitializationRequest, InitializationResponse
 from roboview.services.file_register_service import FileRegistryService
 from roboview.services.keyword_register_service import KeywordRegistryService
 from roboview.services.keyword_similarity_service import KeywordSimilarityService
 from roboview.services.keyword_usage_service import KeywordUsageService
+from roboview.services.project_pool_service import ProjectContext
 from roboview.services.reporting_service import ReportingService
 from roboview.services.robocop_register_service import RobocopRegistryService
 from roboview.services.robocop_service import RobocopService
+from roboview.utils.similarity_index import get_similarity_index_path
+from starlette.datastructures import State
 from starlette.requests import Request
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+def initialize_project(
+    state: State, project_root: Path, robocop_config_file: Path | None = None, *, make_default: bool = True
+) -> ProjectContext:
+    """Analyze a project and add it to the project pool of an application state.
+
+    A profiling session waiting for an initialization records this one.
+
+    Arguments:
+        state (State): Application state.
+        project_root (Path): Root directory of the project.
+        robocop_config_file (Path | None): Robocop configuration file of the project.
+        make_default (bool): Whether the project replaces an existing default project.
+
+    Returns:
+        ProjectContext: The initialized project.
+
+    """
+    project_pool = get_state_project_pool(state)
+    start = time.perf_counter()
+
+    with get_profiling_service(state).profile(ProfilingTargetEnum.INITIALIZATION):
+        keyword_registry_service = KeywordRegistryService(project_root, project_pool.library_catalog)
+        with INITIALIZATION_PHASE_DURATION.time("keywords"):
+            keyword_registry_service.initialize()
+
+        file_registry_service = FileRegistryService(project_root)
+        with INITIALIZATION_PHASE_DURATION.time("files"):
+            file_registry_service.initialize()
+
+        robocop_registry_service = RobocopRegistryService(project_root, robocop_config_file)
+        with INITIALIZATION_PHASE_DURATION.time("robocop"):
+            robocop_registry_service.initialize()
+
+        keyword_registry = keyword_registry_service.get_keyword_registry()
+        file_registry = file_registry_service.get_file_registry()
+        robocop_registry = robocop_registry_service.get_robocop_registry()
+
+        logger.info("Initialize Keyword Usage Service")
+        keyword_usage_service = KeywordUsageService(keyword_registry, file_registry)
+
+        logger.info("Initialize Keyword Similarity Service")
+        keyword_similarity_service = KeywordSimilarityService(
+            keyword_registry,
+            index_path=get_similarity_index_path(project_root),
+            index_top_k=get_settings().SIMILARITY_INDEX_TOP_K,
+        )
+        with INITIALIZATION_PHASE_DURATION.time("similarity"):
+            keyword_similarity_service.calculate_keyword_similarity_matrix()
+
+        logger.info("Initialize Robocop Service")
+        robocop_service = RobocopService(robocop_registry)
+
+        logger.info("Initialize Reporting Service")
+        reporting_service = ReportingService(
+            keyword_registry,
+            file_registry,
+            robocop_registry,
+            keyword_usage_service,
+            keyword_similarity_service,
+            robocop_service,
+            project_root,
+        )
+
+        project_context = ProjectContext(
+            project_root,
+            keyword_registry=keyword_registry,
+            file_registry=file_registry,
+            robocop_registry=robocop_registry,
+            keyword_usage_service=keyword_usage_service,
+            keyword_similarity_service=keyword_similarity_service,
+            robocop_service=robocop_service,
+            reporting_service=reporting_service,
+        )
+        project_pool.add(project_context, make_default=make_default)
+        INITIALIZATION_PHASE_DURATION.observe(time.perf_counter() - start, "total")
+
+    return project_context
+
+
 @router.post(
     "",
     summary="Initialize RoboView",
@@ -30,58 +119,38 @@ router = APIRouter()
     },
 )
 async def post_initialize_roboview(request: Request, initialization_request: InitializationRequest):  # noqa: ANN201
-    """Endpoint to initialize RoboView.
+    """Endpoint to initialize RoboView for a project.
+
+    The project is added to the project pool and becomes the default project. Projects
+    initialized earlier stay available and can be selected by their project key. A profiling
+    session waiting for an initialization records this one. If the server is warming up the
+    same project at startup, the request waits for the warm-up instead of repeating it.
 
     Arguments:
         request (Request): FastAPI request object.
         initialization_request (InitializationRequest): project_root_dir (str): Project root directory.
 
     Returns:
-        InitializationResponse: Statuscode indicating whether initialization was successful.
+        InitializationResponse: Statuscode indicating whether initialization was successful and the project key.
 
     """
     try:
         logger.info("Initialization Requested")
-        keyword_registry_service = KeywordRegistryService(Path(initialization_request.project_root_dir))
-        keyword_registry_service.initialize()
-
-        file_registry_service = FileRegistryService(Path(initialization_request.project_root_dir))
-        file_registry_service.initialize()
-
-        robocop_registry_service = RobocopRegistryService(
-            Path(initialization_request.project_root_dir),
-            Path(initialization_request.robocop_config_file) if initialization_request.robocop_config_file else None,
+        project_root = Path(initialization_request.project_root_dir)
+        robocop_config_file = (
+            Path(initialization_request.robocop_config_file) if initialization_request.robocop_config_file else None
         )
-        robocop_registry_service.initialize()
 
-        request.app.state.keyword_registry = keyword_registry_service.get_keyword_registry()
-        request.app.state.file_registry = file_registry_service.get_file_registry()
-        request.app.state.robocop_registry = robocop_registry_service.get_robocop_registry()
+        project_key = None
+        warmup_service = getattr(request.app.state, "warmup_service", None)
+        if warmup_service is not None and warmup_service.is_running_for(project_root, robocop_config_file):
+            # Join the warm-up instead of analyzing the project a second time
+            logger.info("Waiting for the warm-up of %s", project_root)
+            await anyio.to_thread.run_sync(warmup_service.wait)
+            project_key = warmup_service.project_key
 
-        logger.info("Initialize Keyword Usage Service")
-        request.app.state.keyword_usage_service = KeywordUsageService(
-            request.app.state.keyword_registry, request.app.state.file_registry
-        )
-
-        logger.info("Initialize Keyword Similarity Service")
-        request.app.state.keyword_similarity_service = KeywordSimilarityService(
-            request.app.state.keyword_registry,
-        )
-        request.app.state.keyword_similarity_service.calculate_keyword_similarity_matrix()
-
-        logger.info("Initialize Robocop Service")
-        request.app.state.robocop_service = RobocopService(request.app.state.robocop_registry)
-
-        logger.info("Initialize Reporting Service")
-        request.app.state.reporting_service = ReportingService(
-            request.app.state.keyword_registry,
-            request.app.state.file_registry,
-            request.app.state.robocop_registry,
-            request.app.state.keyword_usage_service,
-            request.app.state.keyword_similarity_service,
-            request.app.state.robocop_service,
-            Path(initialization_request.project_root_dir),
-        )
+        if project_key is None:
+            project_key = initialize_project(request.app.state, project_root, robocop_config_file).project_key
 
         logger.info("Initialization Successfull")
 
@@ -89,4 +158,4 @@ async def post_initialize_roboview(request: Request, initialization_request: Ini
         logger.exception("Error initializing Keyword List")
         raise HTTPException(status_code=500, detail="Internal Server Error") from e
     else:
-        return InitializationResponse(status="success")
+        return InitializationResponse(status="success", project_key=project_key)
@@ -0,0 +1,77 @@
+"""Endpoint reporting the memory held by the backend."""
+
+import logging
+import tracemalloc
+from typing import Annotated
+
+import anyio.to_thread
+from fastapi import APIRouter, HTTPException, Query
+from roboview.api.projects import get_project_pool
+from roboview.core.metrics import get_peak_rss_bytes, get_process_rss_bytes
+from roboview.schemas.dtos.memory import MemoryResponse
+from roboview.services.project_pool_service import ProjectPoolService
+from roboview.utils.memory import estimate_deep_size, get_top_allocation_sites
+from starlette.requests import Request
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+
+def collect_memory_usage(project_pool: ProjectPoolService, top: int = 10) -> MemoryResponse:
+    """Measure the memory held by the projects of a project pool and the process.
+
+    Arguments:
+        project_pool (ProjectPoolService): Project pool holding the initialized projects.
+        top (int): Number of allocation sites returned when tracemalloc is tracing.
+
+    Returns:
+        MemoryResponse: Memory per project structure, library catalog and process.
+
+    """
+    library_catalog = project_pool.library_catalog
+    library_keyword_ids = library_catalog.keyword_ids()
+
+    return MemoryResponse(
+        projects=[context.get_memory_usage(library_keyword_ids) for context in project_pool.list_projects()],
+        library_catalog_bytes=estimate_deep_size(library_catalog),
+        process_rss_bytes=get_process_rss_bytes(),
+        peak_rss_bytes=get_peak_rss_bytes(),
+        tracing_allocations=tracemalloc.is_tracing(),
+        top_allocation_sites=get_top_allocation_sites(top),
+    )
+
+
+@router.get(
+    "",
+    summary="Memory held by the registries and services",
+    response_model=MemoryResponse,
+    responses={
+        200: {"description": "Memory held by the backend."},
+        500: {"description": "Internal Server Error."},
+    },
+)
+async def get_memory(  # noqa: ANN201
+    request: Request,
+    top: Annotated[int, Query(description="Number of allocation sites returned", ge=1, le=100)] = 10,
+):
+    """Endpoint to report the approximate retained size of each registry and service.
+
+    Objects shared between structures are attributed to the first structure measured, so
+    the sizes of a project add up to its total. Allocation sites are only reported if the
+    server traces allocations, see ``roboview serve --trace-allocations``.
+
+    Arguments:
+        request (Request): FastAPI request object.
+        top (int): Number of allocation sites returned.
+
+    Returns:
+        MemoryResponse: Memory per project structure, library catalog and process.
+
+    """
+    try:
+        # Walking large projects takes a while, the event loop keeps serving meanwhile
+        return await anyio.to_thread.run_sync(collect_memory_usage, get_project_pool(request), top)
+
+    except Exception as e:
+        logger.exception("Error collecting memory usage")
+        raise HTTPException(status_code=500, detail="Internal Server Error") from e
@@ -0,0 +1,90 @@
+"""Endpoint exposing the backend metrics in the Prometheus text format."""
+
+import logging
+
+from fastapi import APIRouter, HTTPException
+from roboview.api.projects import get_project_pool
+from roboview.core.metrics import (
+    CONTENT_TYPE,
+    METRICS,
+    PROCESS_PEAK_RESIDENT_MEMORY,
+    PROCESS_RESIDENT_MEMORY,
+    PROJECT_ESTIMATED_SIZE,
+    PROJECT_REGISTRY_ENTRIES,
+    PROJECT_SIMILARITY_KEYWORDS,
+    get_peak_rss_bytes,
+    get_process_rss_bytes,
+)
+from roboview.services.project_pool_service import ProjectPoolService
+from starlette.requests import Request
+from starlette.responses import Response
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+
+def collect_project_metrics(project_pool: ProjectPoolService) -> None:
+    """Set the gauges describing the initialized projects and the process.
+
+    Gauges are collected on scrape, so the request paths only pay for counters and histograms.
+    Projects removed from the pool disappear from the gauges.
+
+    Arguments:
+        project_pool (ProjectPoolService): Project pool holding the initialized projects.
+
+    """
+    for gauge in (PROJECT_REGISTRY_ENTRIES, PROJECT_SIMILARITY_KEYWORDS, PROJECT_ESTIMATED_SIZE):
+        gauge.clear()
+
+    for context in project_pool.list_projects():
+        project_key = context.project_key
+        PROJECT_REGISTRY_ENTRIES.set(len(context.keyword_registry), project_key, "keywords")
+        PROJECT_REGISTRY_ENTRIES.set(len(context.file_registry), project_key, "files")
+        PROJECT_REGISTRY_ENTRIES.set(len(context.robocop_registry), project_key, "robocop_messages")
+        PROJECT_ESTIMATED_SIZE.set(context.estimated_size_bytes, project_key)
+
+        similarity_service = context.keyword_similarity_service
+        if similarity_service is not None:
+            PROJECT_SIMILARITY_KEYWORDS.set(
+                similarity_service.indexed_keyword_count,
+                project_key,
+                str(similarity_service.is_memory_mapped).lower(),
+            )
+
+    for gauge, value in (
+        (PROCESS_RESIDENT_MEMORY, get_process_rss_bytes()),
+        (PROCESS_PEAK_RESIDENT_MEMORY, get_peak_rss_bytes()),
+    ):
+        if value is not None:
+            gauge.set(value)
+
+
+@router.get(
+    "",
+    summary="Metrics in the Prometheus text format",
+    response_class=Response,
+    responses={
+        200: {"description": "Metrics of the backend.", "content": {CONTENT_TYPE: {}}},
+        500: {"description": "Internal Server Error."},
+    },
+)
+async def get_metrics(request: Request) -> Response:
+    """Endpoint to scrape the backend metrics.
+
+    Reports initialization phase durations, registry sizes, similarity engine statistics,
+    request counts and latency histograms per endpoint, cache lookups and the process RSS.
+
+    Arguments:
+        request (Request): FastAPI request object.
+
+    Returns:
+        Response: Metrics in the Prometheus text exposition format.
+
+    """
+    try:
+        collect_project_metrics(get_project_pool(request))
+        return Response(METRICS.render(), media_type=CONTENT_TYPE)
+
+    except Exception as e:
+        logger.exception("Error collecting metrics")
+        raise HTTPException(status_code=500, detail="Internal Server Error") from e
@@ -0,0 +1,199 @@
+"""Endpoints profiling requests and initializations of the live server."""
+
+import json
+import logging
+import marshal
+
+from fastapi import APIRouter, HTTPException
+from roboview.api.profiling import get_profiling_service
+from roboview.core.config import get_settings
+from roboview.schemas.dtos.profiling import ProfilingStatusResponse, StartProfilingRequest
+from roboview.services.profiling_service import ProfilingSession
+from roboview.utils.profiling import SPEEDSCOPE_FILE_NAME, get_hotspots, get_raw_stats, to_speedscope
+from starlette.requests import Request
+from starlette.responses import Response
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+
+def _ensure_profiling_enabled() -> None:
+    """Raise HTTPException if profiling is not enabled for the server."""
+    if not get_settings().PROFILING_ENABLED:
+        raise HTTPException(status_code=403, detail="Profiling is disabled")
+
+
+def _get_session_or_raise(request: Request) -> ProfilingSession:
+    """Get the current profiling session or raise HTTPException."""
+    session = get_profiling_service(request.app.state).get_session()
+    if session is None:
+        raise HTTPException(status_code=404, detail="No profiling session")
+    return session
+
+
+def _to_status_response(session: ProfilingSession) -> ProfilingStatusResponse:
+    """Convert a profiling session into its status response."""
+    stats = session.get_stats()
+    return ProfilingStatusResponse(
+        session_id=session.session_id,
+        target=session.target,
+        status=session.status,
+        request_count=session.request_count,
+        profiled_count=session.profiled_count,
+        created_at=session.created_at.isoformat(),
+        completed_at=session.completed_at.isoformat() if session.completed_at else None,
+        hotspots=get_hotspots(stats) if stats is not None else [],
+    )
+
+
+@router.post(
+    "",
+    summary="Profile the next requests or the next initialization",
+    response_model=ProfilingStatusResponse,
+    status_code=202,
+    responses={
+        202: {"description": "Profiling session started."},
+        403: {"description": "Profiling is disabled."},
+        409: {"description": "A profiling session is recording."},
+        500: {"description": "Internal Server Error."},
+    },
+)
+async def post_profile(request: Request, profiling_request: StartProfilingRequest):  # noqa: ANN201
+    """Endpoint to start a profiling session.
+
+    Requests to the profiling and metrics endpoints are not profiled. Profiling is only
+    available if the server was started with ``PROFILING_ENABLED``.
+
+    Arguments:
+        request (Request): FastAPI request object.
+        profiling_request (StartProfilingRequest): Work to profile.
+
+    Returns:
+        ProfilingStatusResponse: State of the started session.
+
+    """
+    _ensure_profiling_enabled()
+    try:
+        session = get_profiling_service(request.app.state).start(
+            profiling_request.target, profiling_request.request_count
+        )
+        return _to_status_response(session)
+
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e)) from e
+    except Exception as e:
+        logger.exception("Error starting profiling session")
+        raise HTTPException(status_code=500, detail="Internal Server Error") from e
+
+
+@router.get(
+    "",
+    summary="State and hotspots of the profiling session",
+    response_model=ProfilingStatusResponse,
+    responses={
+        200: {"description": "State of the profiling session."},
+        403: {"description": "Profiling is disabled."},
+        404: {"description": "No profiling session."},
+        500: {"description": "Internal Server Error."},
+    },
+)
+async def get_profile(request: Request):  # noqa: ANN201
+    """Endpoint to get the state of the profiling session.
+
+    Arguments:
+        request (Request): FastAPI request object.
+
+    Returns:
+        ProfilingStatusResponse: State of the session and its hotspots once completed.
+
+    """
+    _ensure_profiling_enabled()
+    session = _get_session_or_raise(request)
+    try:
+        return _to_status_response(session)
+
+    except Exception as e:
+        logger.exception("Error getting profiling session")
+        raise HTTPException(status_code=500, detail="Internal Server Error") from e
+
+
+@router.get(
+    "/speedscope",
+    summary="Download the profile in the speedscope format",
+    response_class=Response,
+    responses={
+        200: {"description": "Profile as speedscope file.", "content": {"application/json": {}}},
+        403: {"description": "Profiling is disabled."},
+        404: {"description": "No profiling session."},
+        409: {"description": "Profiling session is not completed."},
+        500: {"description": "Internal Server Error."},
+    },
+)
+async def get_profile_speedscope(request: Request) -> Response:
+    """Endpoint to download the completed profile for https://www.speedscope.app.
+
+    Arguments:
+        request (Request): FastAPI request object.
+
+    Returns:
+        Response: Profile as speedscope JSON file.
+
+    """
+    _ensure_profiling_enabled()
+    session = _get_session_or_raise(request)
+    stats = session.get_stats()
+    if stats is None:
+        raise HTTPException(status_code=409, detail="Profiling session is not completed")
+
+    try:
+        content = json.dumps(to_speedscope({session.target.value: stats}, name=f"roboview-{session.session_id}"))
+        return Response(
+            content,
+            media_type="application/json",
+            headers={"Content-Disposition": f'attachment; filename="{SPEEDSCOPE_FILE_NAME}"'},
+        )
+
+    except Exception as e:
+        logger.exception("Error exporting profile")
+        raise HTTPException(status_code=500, detail="Internal Server Error") from e
+
+
+@router.get(
+    "/pstats",
+    summary="Download the profile in the pstats format",
+    response_class=Response,
+    responses={
+        200: {"description": "Profile as pstats file.", "content": {"application/octet-stream": {}}},
+        403: {"description": "Profiling is disabled."},
+        404: {"description": "No profiling session."},
+        409: {"description": "Profiling session is not completed."},
+        500: {"description": "Internal Server Error."},
+    },
+)
+async def get_profile_pstats(request: Request) -> Response:
+    """Endpoint to download the completed profile for ``pstats`` or snakeviz.
+
+    Arguments:
+        request (Request): FastAPI request object.
+
+    Returns:
+        Response: Profile as pstats file.
+
+    """
+    _ensure_profiling_enabled()
+    session = _get_session_or_raise(request)
+    stats = session.get_stats()
+    if stats is None:
+        raise HTTPException(status_code=409, detail="Profiling session is not completed")
+
+    try:
+        # Same content pstats.Stats.dump_stats writes
+        return Response(
+            marshal.dumps(get_raw_stats(stats)),
+            media_type="application/octet-stream",
+            headers={"Content-Disposition": f'attachment; filename="{session.target.value}.pstats"'},
+        )
+
+    except Exception as e:
+        logger.exception("Error exporting profile")
+        raise HTTPException(status_code=500, detail="Internal Server Error") from e
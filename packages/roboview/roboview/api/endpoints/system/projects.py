@@ -0,0 +1,89 @@
+"""Endpoints for managing the projects held by the backend."""
+
+import logging
+
+from fastapi import APIRouter, HTTPException
+from roboview.api.projects import get_project_pool
+from roboview.schemas.dtos.common import ProjectInfo, ProjectListResponse
+from starlette.requests import Request
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+
+@router.get(
+    "",
+    summary="List initialized projects",
+    response_model=ProjectListResponse,
+    responses={
+        200: {"description": "Projects retrieved successfully."},
+        500: {"description": "Internal Server Error."},
+    },
+)
+async def get_projects(request: Request):  # noqa: ANN201
+    """Endpoint to list the projects held by the project pool.
+
+    Arguments:
+        request (Request): FastAPI request object.
+
+    Returns:
+        ProjectListResponse: Projects with their estimated memory, least recently used first.
+
+    """
+    try:
+        project_pool = get_project_pool(request)
+        default_project_key = project_pool.default_project_key
+        projects = [
+            ProjectInfo(
+                project_key=context.project_key,
+                project_root_dir=context.project_root,
+                num_keywords=len(context.keyword_registry),
+                num_files=len(context.file_registry),
+                estimated_size_bytes=context.estimated_size_bytes,
+                active_requests=context.active_requests,
+                is_default=context.project_key == default_project_key,
+            )
+            for context in project_pool.list_projects()
+        ]
+
+    except Exception as e:
+        logger.exception("Error listing projects")
+        raise HTTPException(status_code=500, detail="Internal Server Error") from e
+    else:
+        return ProjectListResponse(
+            projects=projects,
+            estimated_size_bytes=sum(project.estimated_size_bytes for project in projects),
+            memory_budget_bytes=project_pool.memory_budget_bytes,
+        )
+
+
+@router.delete(
+    "/{project_key}",
+    summary="Remove a project",
+    responses={
+        200: {"description": "Project removed."},
+        404: {"description": "Project not found."},
+        500: {"description": "Internal Server Error."},
+    },
+)
+async def delete_project(request: Request, project_key: str):  # noqa: ANN201
+    """Endpoint to remove a project from the project pool and release its memory.
+
+    Arguments:
+        request (Request): FastAPI request object.
+        project_key (str): Key of the project.
+
+    Returns:
+        Success message
+
+    """
+    try:
+        if not get_project_pool(request).remove(project_key):
+            raise HTTPException(status_code=404, detail="Project not found")  # noqa: TRY301
+    except HTTPException:
+        raise
+    except Exception:
+        logger.exception("Error removing project")
+        raise HTTPException(status_code=500, detail="Internal Server Error") from None
+    else:
+        return {"status": "success", "message": "Project removed"}
@@ -0,0 +1,51 @@
+"""Readiness check endpoint reporting whether the project data is warmed up."""
+
+import logging
+
+from fastapi import APIRouter
+from roboview.api.warmup import get_warmup_service
+from roboview.schemas.domain.warmup import WarmupStatusEnum
+from roboview.schemas.dtos.common import ReadinessResponse
+from starlette.requests import Request
+from starlette.responses import Response
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+
+@router.get(
+    "",
+    summary="Readiness Check",
+    response_model=ReadinessResponse,
+    responses={
+        200: {"description": "Service is ready, the configured project is warmed up or none was configured."},
+        503: {"description": "The configured project is still warming up or the warm-up failed."},
+    },
+)
+async def readiness_check(request: Request, response: Response):  # noqa: ANN201
+    """Reports whether the project the server was started for is initialized.
+
+    Unlike the health check, which only reports that the server is alive, this endpoint
+    answers 503 until the background warm-up of ``roboview serve --project`` finished. Clients
+    can poll it and use the warmed up project without initializing it themselves. After a
+    failed warm-up, projects can still be initialized with ``/system/initialize``.
+
+    Arguments:
+        request (Request): FastAPI request object.
+        response (Response): Response whose status code is set.
+
+    Returns:
+        ReadinessResponse: State of the warm-up.
+
+    """
+    warmup_service = get_warmup_service(request.app.state)
+    if warmup_service.status in {WarmupStatusEnum.RUNNING, WarmupStatusEnum.FAILED}:
+        response.status_code = 503
+
+    return ReadinessResponse(
+        status=warmup_service.status,
+        project_root=str(warmup_service.project_root) if warmup_service.project_root else None,
+        project_key=warmup_service.project_key,
+        duration_seconds=warmup_service.duration_seconds,
+        error=warmup_service.error,
+    )
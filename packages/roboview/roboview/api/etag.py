@@ -0,0 +1,130 @@
+"""Conditional GET support for read endpoints based on registry snapshot versions."""
+
+import hashlib
+import logging
+
+from fastapi import HTTPException
+from roboview.api.projects import get_project
+from roboview.core.metrics import CACHE_LOOKUPS
+from roboview.core.snapshot import get_snapshot_boot_id
+from starlette.datastructures import State
+from starlette.requests import Request
+from starlette.responses import Response
+
+logger = logging.getLogger(__name__)
+
+# Registries whose snapshot versions make up the ETag of a read endpoint
+_SNAPSHOT_REGISTRIES = ("keyword_registry", "file_registry", "robocop_registry")
+
+_CONDITIONAL_METHODS = {"GET", "HEAD"}
+
+
+def get_snapshot_versions(state: State | object) -> tuple[int, ...] | None:
+    """Return the snapshot versions of all registries held by the given state.
+
+    Arguments:
+        state: Object holding the initialized registries, e.g. ``app.state``.
+
+    Returns:
+        tuple[int, ...] | None: Snapshot versions of the registries, or None if RoboView is not
+            initialized or a registry does not carry a version.
+
+    """
+    versions = []
+    for registry_name in _SNAPSHOT_REGISTRIES:
+        version = getattr(getattr(state, registry_name, None), "version", None)
+        if not isinstance(version, int):
+            return None
+        versions.append(version)
+    return tuple(versions)
+
+
+def build_etag(request: Request, state: State | object | None = None) -> str | None:
+    """Build a weak ETag for a read request.
+
+    The ETag is derived from the boot id of the process, the registry snapshot versions,
+    the route path and the query parameters, so it changes after every re-initialization
+    and server restart and differs per query.
+
+    Arguments:
+        request (Request): Incoming request.
+        state: Object holding the registries, defaults to the project targeted by the request.
+
+    Returns:
+        str | None: Weak ETag, or None if no versioned snapshot is available.
+
+    """
+    versions = get_snapshot_versions(state if state is not None else get_project(request))
+    if versions is None:
+        return None
+
+    digest = hashlib.sha1(usedforsecurity=False)
+    digest.update(get_snapshot_boot_id().encode())
+    digest.update(b"\x00")
+    digest.update(".".join(str(version) for version in versions).encode())
+    digest.update(b"\x00")
+    digest.update(request.url.path.encode())
+    for key, value in sorted(request.query_params.multi_items()):
+        digest.update(b"\x00")
+        digest.update(key.encode())
+        digest.update(b"=")
+        digest.update(value.encode())
+
+    return f'W/"{digest.hexdigest()[:24]}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check whether an If-None-Match header matches the given ETag.
+
+    Uses weak comparison as required for If-None-Match (RFC 9110, section 13.1.2).
+
+    Arguments:
+        if_none_match (str | None): Value of the If-None-Match request header.
+        etag (str): Current ETag of the resource.
+
+    Returns:
+        bool: True if the client already holds the current representation.
+
+    """
+    if not if_none_match:
+        return False
+
+    opaque_tag = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        candidate_tag = candidate.strip()
+        if candidate_tag == "*":
+            return True
+        if candidate_tag.removeprefix("W/") == opaque_tag:
+            return True
+    return False
+
+
+async def conditional_get(request: Request, response: Response) -> None:
+    """Dependency answering conditional read requests from the snapshot version.
+
+    Sets the ETag header on regular responses and short-circuits with ``304 Not Modified``
+    before the endpoint computes anything if the client's If-None-Match matches.
+
+    Arguments:
+        request (Request): Incoming request.
+        response (Response): Response used to attach the ETag header.
+
+    Raises:
+        HTTPException: With status code 304 if the client's representation is current.
+
+    """
+    if request.method not in _CONDITIONAL_METHODS:
+        return
+
+    etag = build_etag(request)
+    if etag is None:
+        return
+
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        CACHE_LOOKUPS.inc("etag", "hit")
+        logger.debug("Snapshot unchanged, answering %s with 304", request.url.path)
+        raise HTTPException(status_code=304, headers=headers)
+
+    CACHE_LOOKUPS.inc("etag", "miss")
+    response.headers.update(headers)
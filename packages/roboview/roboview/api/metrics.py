@@ -0,0 +1,109 @@
+"""Request metrics recorded per route template."""
+
+import logging
+import re
+import time
+from collections.abc import Callable
+
+from fastapi import FastAPI
+from roboview.core.metrics import HTTP_REQUEST_DURATION, HTTP_REQUESTS
+from starlette.requests import Request
+from starlette.responses import Response
+
+logger = logging.getLogger(__name__)
+
+UNMATCHED_ROUTE = "unmatched"
+
+# Request paths whose route template is remembered, paths with IDs would otherwise grow without bound
+_MAX_CACHED_PATHS = 4096
+_PATH_PARAMETER = re.compile(r"\{[^/]+?\}")
+
+
+class RouteTemplateResolver:
+    """Map request paths to the route templates of an application.
+
+    The templates are taken from the OpenAPI paths of the application, which do not depend
+    on how routers are nested, and compiled on first use.
+
+    Attributes:
+        _app: Application whose routes are resolved.
+        _patterns: Compiled route patterns and their templates.
+        _cache: Route template per already resolved request path.
+
+    """
+
+    def __init__(self, app: FastAPI) -> None:
+        """Initialize RouteTemplateResolver.
+
+        Arguments:
+            app (FastAPI): Application whose routes are resolved.
+
+        """
+        self._app = app
+        self._patterns: list[tuple[re.Pattern[str], str]] | None = None
+        self._cache: dict[str, str] = {}
+
+    def _compile_patterns(self) -> list[tuple[re.Pattern[str], str]]:
+        """Compile the OpenAPI paths into patterns, static paths first."""
+        templates = sorted(self._app.openapi().get("paths", {}), key=lambda template: ("{" in template, template))
+        return [
+            (re.compile("[^/]+".join(re.escape(part) for part in _PATH_PARAMETER.split(template)) + "$"), template)
+            for template in templates
+        ]
+
+    def resolve(self, path: str) -> str:
+        """Return the route template of a request path.
+
+        Arguments:
+            path (str): Request path, e.g. ``/api/v1/reports/status/1234``.
+
+        Returns:
+            str: Route template, e.g. ``/api/v1/reports/status/{report_id}``, or ``unmatched``.
+
+        """
+        template = self._cache.get(path)
+        if template is not None:
+            return template
+
+        if self._patterns is None:
+            self._patterns = self._compile_patterns()
+
+        template = next((template for pattern, template in self._patterns if pattern.match(path)), UNMATCHED_ROUTE)
+        if len(self._cache) < _MAX_CACHED_PATHS:
+            self._cache[path] = template
+        return template
+
+
+async def metrics_middleware(request: Request, call_next: Callable) -> Response:
+    """Count requests and record their latency per route.
+
+    Requests are labelled with the route template instead of the URL, so path and query
+    parameters do not create new label combinations.
+
+    Arguments:
+        request (Request): Incoming request.
+        call_next (Callable): Next application in the middleware chain.
+
+    Returns:
+        Response: Response of the application.
+
+    """
+    start = time.perf_counter()
+    status_code = 500
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+    finally:
+        resolver = getattr(request.app.state, "route_template_resolver", None)
+        if resolver is None:
+            resolver = request.app.state.route_template_resolver = RouteTemplateResolver(request.app)
+
+        try:
+            route = resolver.resolve(request.url.path)
+        except Exception:
+            logger.exception("Could not resolve route of %s", request.url.path)
+            route = UNMATCHED_ROUTE
+
+        HTTP_REQUEST_DURATION.observe(time.perf_counter() - start, request.method, route)
+        HTTP_REQUESTS.inc(request.method, route, str(status_code))
+    return response
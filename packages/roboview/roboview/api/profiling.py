@@ -0,0 +1,48 @@
+"""Profiling of requests selected by the profiling endpoint."""
+
+from collections.abc import Callable
+
+from roboview.core.config import get_settings
+from roboview.schemas.domain.profiling import ProfilingTargetEnum
+from roboview.services.profiling_service import ProfilingService
+from starlette.datastructures import State
+from starlette.requests import Request
+from starlette.responses import Response
+
+# Polling the profile or scraping metrics does not use up the profiled requests
+_UNPROFILED_PATHS = tuple(f"{get_settings().API_VERSION_STR}/system/{path}" for path in ("profile", "metrics"))
+
+
+def get_profiling_service(state: State) -> ProfilingService:
+    """Get the profiling service held by an application state, creating it on first use.
+
+    Arguments:
+        state (State): Application state.
+
+    Returns:
+        ProfilingService: Profiling service bound to the application state.
+
+    """
+    profiling_service = getattr(state, "profiling_service", None)
+    if profiling_service is None:
+        profiling_service = state.profiling_service = ProfilingService()
+    return profiling_service
+
+
+async def profiling_middleware(request: Request, call_next: Callable) -> Response:
+    """Profile the request if a profiling session records requests.
+
+    Arguments:
+        request (Request): Incoming request.
+        call_next (Callable): Next application in the middleware chain.
+
+    Returns:
+        Response: Response of the application.
+
+    """
+    profiling_service = getattr(request.app.state, "profiling_service", None)
+    if profiling_service is None or request.url.path.startswith(_UNPROFILED_PATHS):
+        return await call_next(request)
+
+    with profiling_service.profile(ProfilingTargetEnum.REQUESTS):
+        return await call_next(request)
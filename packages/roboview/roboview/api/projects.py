@@ -0,0 +1,155 @@
+"""Routing of requests to the project they target."""
+
+import logging
+import time
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import Annotated
+
+from fastapi import Header, HTTPException, Query
+from roboview.core.config import get_settings
+from roboview.core.metrics import INITIALIZATION_PHASE_DURATION
+from roboview.services.project_pool_service import ProjectContext, ProjectPoolService
+from roboview.utils.analysis_snapshot import read_analysis_snapshot
+from starlette.datastructures import State
+from starlette.requests import Request
+
+logger = logging.getLogger(__name__)
+
+PROJECT_HEADER = "X-RoboView-Project"
+
+
+def get_project_pool(request: Request) -> ProjectPoolService:
+    """Get the project pool of the application, creating it on first use.
+
+    Arguments:
+        request (Request): FastAPI request object.
+
+    Returns:
+        ProjectPoolService: Project pool bound to the application state.
+
+    """
+    return get_state_project_pool(request.app.state)
+
+
+def get_state_project_pool(state: State) -> ProjectPoolService:
+    """Get the project pool held by an application state, creating it on first use.
+
+    Arguments:
+        state (State): Application state.
+
+    Returns:
+        ProjectPoolService: Project pool bound to the application state.
+
+    """
+    project_pool = getattr(state, "project_pool", None)
+    if project_pool is None:
+        settings = get_settings()
+        project_pool = ProjectPoolService(
+            max_projects=settings.PROJECT_POOL_MAX_PROJECTS,
+            memory_budget_bytes=settings.PROJECT_POOL_MEMORY_BUDGET_BYTES,
+        )
+        state.project_pool = project_pool
+    return project_pool
+
+
+def load_snapshot_project(state: State, snapshot_path: Path, project_root: Path | None = None) -> ProjectContext:
+    """Add the project analysis stored in a snapshot file to the project pool.
+
+    Arguments:
+        state (State): Application state.
+        snapshot_path (Path): Path of the analysis snapshot.
+        project_root (Path | None): Root directory of the local checkout of the project,
+            the root directory the snapshot was taken from if None.
+
+    Returns:
+        ProjectContext: The added project.
+
+    """
+    start = time.perf_counter()
+    context = ProjectContext.from_snapshot(read_analysis_snapshot(snapshot_path, project_root))
+    get_state_project_pool(state).add(context)
+    duration = time.perf_counter() - start
+    INITIALIZATION_PHASE_DURATION.observe(duration, "snapshot")
+    logger.info("Loaded analysis snapshot %s in %.3f s", snapshot_path, duration)
+    return context
+
+
+def resolve_project(request: Request, project: str | None = None) -> ProjectContext | State:
+    """Resolve the project a request targets.
+
+    The project is selected by key or root directory via the ``project`` query parameter or
+    the ``X-RoboView-Project`` header, falling back to the default project of the pool. As
+    long as no project has been added to the pool, the services held directly by the
+    application state are used.
+
+    Arguments:
+        request (Request): FastAPI request object.
+        project (str | None): Project key or root directory, read from the request if None.
+
+    Returns:
+        ProjectContext | State: Object holding the registries and services of the project.
+
+    Raises:
+        HTTPException: With status code 404 if the selected project is not initialized.
+
+    """
+    project_pool = getattr(request.app.state, "project_pool", None)
+    if project_pool is None or len(project_pool) == 0:
+        return request.app.state
+
+    if project is None:
+        project = request.query_params.get("project") or request.headers.get(PROJECT_HEADER)
+
+    context = project_pool.get(project)
+    if context is None:
+        logger.warning("Request for project that is not initialized: %s", project)
+        raise HTTPException(status_code=404, detail="Project not initialized")
+    return context
+
+
+def get_project(request: Request) -> ProjectContext | State:
+    """Return the project resolved for the request by ``project_scope`` or resolve it now.
+
+    Arguments:
+        request (Request): FastAPI request object.
+
+    Returns:
+        ProjectContext | State: Object holding the registries and services of the project.
+
+    """
+    project = getattr(request.state, "project", None)
+    if project is not None:
+        return project
+    return resolve_project(request)
+
+
+async def project_scope(
+    request: Request,
+    project: Annotated[
+        str | None, Query(description="Key or root directory of the project, defaults to the last initialized one")
+    ] = None,
+    x_roboview_project: Annotated[str | None, Header(include_in_schema=False)] = None,
+) -> AsyncIterator[None]:
+    """Dependency binding a request to its project for the duration of the request.
+
+    The project is protected from eviction while the request is processed.
+
+    Arguments:
+        request (Request): FastAPI request object.
+        project (str | None): Key or root directory of the project from the query.
+        x_roboview_project (str | None): Key or root directory of the project from the header.
+
+    Yields:
+        None: Control to the endpoint.
+
+    """
+    context = resolve_project(request, project or x_roboview_project)
+    request.state.project = context
+
+    if not isinstance(context, ProjectContext):
+        yield
+        return
+
+    with request.app.state.project_pool.use(context):
+        yield
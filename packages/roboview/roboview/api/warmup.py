@@ -0,0 +1,44 @@
+"""Warm-up of the project the server was started for."""
+
+from functools import partial
+from pathlib import Path
+
+from roboview.api.endpoints.system.initialize import initialize_project
+from roboview.services.warmup_service import WarmupService
+from starlette.datastructures import State
+
+
+def get_warmup_service(state: State) -> WarmupService:
+    """Get the warm-up service held by an application state, creating it on first use.
+
+    Arguments:
+        state (State): Application state.
+
+    Returns:
+        WarmupService: Warm-up service bound to the application state.
+
+    """
+    warmup_service = getattr(state, "warmup_service", None)
+    if warmup_service is None:
+        warmup_service = state.warmup_service = WarmupService()
+    return warmup_service
+
+
+def start_project_warmup(state: State, project_root: Path, robocop_config_file: Path | None = None) -> WarmupService:
+    """Start initializing a project in the background.
+
+    The warmed up project only becomes the default project if no client initialized another
+    project in the meantime.
+
+    Arguments:
+        state (State): Application state.
+        project_root (Path): Root directory of the project.
+        robocop_config_file (Path | None): Robocop configuration file of the project.
+
+    Returns:
+        WarmupService: Warm-up service running the initialization.
+
+    """
+    warmup_service = get_warmup_service(state)
+    warmup_service.start(project_root, robocop_config_file, partial(initialize_project, state, make_default=False))
+    return warmup_service
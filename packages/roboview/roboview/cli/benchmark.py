@@ -0,0 +1,318 @@
+"""CLI commands for benchmarking the analysis pipeline."""
+
+import logging
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Annotated
+
+import typer
+
+if TYPE_CHECKING:
+    from roboview.schemas.domain.benchmarks import BenchmarkResult, LoadTestResult, PhaseRegression
+
+logger = logging.getLogger(__name__)
+
+app = typer.Typer(help="RoboView benchmark commands")
+
+# Constants
+_MB = 1024 * 1024
+
+
+def _load_result(path: Path) -> "BenchmarkResult":
+    """Load a stored benchmark result or exit with an error."""
+    from roboview.schemas.domain.benchmarks import BenchmarkResult
+
+    try:
+        return BenchmarkResult.model_validate_json(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        typer.echo(f"❌ Error: Could not read benchmark result: {path}", err=True)
+        raise typer.Exit(code=1) from None
+
+
+def _print_result(result: "BenchmarkResult") -> None:
+    """Print the measurements of a benchmark run as table."""
+    for corpus in result.corpora:
+        typer.echo("")
+        typer.echo(f"📦 {corpus.corpus}: {corpus.keywords} keywords in {corpus.files} files")
+        typer.echo(f"   {'Phase':<12} {'Wall [s]':>10} {'CPU [s]':>10} {'Peak RSS [MB]':>14}")
+        for measurement in corpus.phases:
+            peak_rss = f"{measurement.peak_rss_bytes / _MB:.1f}" if measurement.peak_rss_bytes is not None else "-"
+            typer.echo(
+                f"   {measurement.phase.value:<12} {measurement.wall_seconds:>10.3f} "
+                f"{measurement.cpu_seconds:>10.3f} {peak_rss:>14}"
+            )
+
+
+def _print_load_result(result: "LoadTestResult") -> None:
+    """Print the latencies of a load test run as table."""
+    typer.echo("")
+    typer.echo(
+        f"🚦 {result.requests} requests from {result.clients} clients in {result.duration_seconds:.2f}s "
+        f"({result.throughput_rps:.1f} req/s, {result.errors} errors)"
+    )
+    typer.echo(
+        f"   {'Endpoint':<24} {'Requests':>8} {'Errors':>6} {'req/s':>8} "
+        f"{'p50 [ms]':>9} {'p95 [ms]':>9} {'p99 [ms]':>9} {'max [ms]':>9}"
+    )
+    for endpoint in result.endpoints:
+        typer.echo(
+            f"   {endpoint.endpoint:<24} {endpoint.requests:>8} {endpoint.errors:>6} {endpoint.throughput_rps:>8.1f} "
+            f"{endpoint.p50_ms:>9.1f} {endpoint.p95_ms:>9.1f} {endpoint.p99_ms:>9.1f} {endpoint.max_ms:>9.1f}"
+        )
+
+
+def _parse_request_mix(mix: str | None) -> dict[str, int] | None:
+    """Parse a request mix like ``kpis=5,keyword-similarity=20`` or exit with an error."""
+    from roboview.services.load_test_service import DEFAULT_REQUEST_MIX
+
+    if mix is None:
+        return None
+    try:
+        request_mix = {
+            scenario.strip(): int(weight) for scenario, weight in (item.split("=") for item in mix.split(",") if item)
+        }
+    except ValueError:
+        typer.echo(f"❌ Error: Invalid request mix: {mix}", err=True)
+        raise typer.Exit(code=1) from None
+
+    unknown_scenarios = set(request_mix) - set(DEFAULT_REQUEST_MIX)
+    if unknown_scenarios:
+        typer.echo(f"❌ Error: Unknown request scenarios: {', '.join(sorted(unknown_scenarios))}", err=True)
+        typer.echo(f"   Available: {', '.join(DEFAULT_REQUEST_MIX)}", err=True)
+        raise typer.Exit(code=1)
+    return request_mix
+
+
+def _report_regressions(regressions: "list[PhaseRegression]", max_regression: float) -> None:
+    """Print regressed phases and exit with an error if there are any."""
+    typer.echo("")
+    if not regressions:
+        typer.echo(f"✅ No phase regressed by more than {max_regression:.0f}%")
+        return
+
+    typer.echo(f"❌ {len(regressions)} phase(s) regressed by more than {max_regression:.0f}%:", err=True)
+    for regression in regressions:
+        typer.echo(
+            f"   • {regression.corpus} / {regression.phase.value}: {regression.baseline_seconds:.3f}s → "
+            f"{regression.current_seconds:.3f}s (+{regression.change_percent:.1f}%)",
+            err=True,
+        )
+    raise typer.Exit(code=1)
+
+
+@app.command()
+def run(  # noqa: PLR0913, PLR0917
+    sizes: Annotated[
+        str,
+        typer.Option("--sizes", help="Comma-separated keyword counts of generated corpora"),
+    ] = "1000,10000",
+    project_root: Annotated[
+        Path | None,
+        typer.Option("--project", "-p", help="Benchmark an existing project instead of generated corpora"),
+    ] = None,
+    repeat: Annotated[
+        int,
+        typer.Option("--repeat", "-r", help="Pipeline runs per corpus, the minimum times are reported", min=1),
+    ] = 1,
+    output: Annotated[
+        Path,
+        typer.Option("--output", "-o", help="Output JSON file path"),
+    ] = Path("roboview-bench.json"),
+    baseline: Annotated[
+        Path | None,
+        typer.Option("--baseline", "-b", help="Compare against a stored benchmark result"),
+    ] = None,
+    max_regression: Annotated[
+        float,
+        typer.Option("--max-regression", help="Allowed slowdown per phase in percent", min=0),
+    ] = 20.0,
+    min_seconds: Annotated[
+        float,
+        typer.Option("--min-seconds", help="Slowdowns below this absolute time are treated as noise", min=0),
+    ] = 0.05,
+) -> None:
+    """Time every phase of the analysis pipeline on generated corpora or an existing project.
+
+    Records wall clock time, CPU time and peak RSS per phase: directory discovery, parsing,
+    LibDoc loading, Robocop, keyword usage, similarity, report build and HTML export.
+
+    Examples:
+        # Benchmark generated 1k and 10k keyword corpora
+        roboview bench run --sizes 1000,10000 --output bench.json
+
+        # Fail if a phase got more than 15% slower than the baseline
+        roboview bench run --baseline baseline.json --max-regression 15
+
+        # Benchmark an existing project
+        roboview bench run --project ./rf-tests --repeat 3
+
+    """
+    from roboview.services.benchmark_service import BenchmarkService
+    from roboview.utils.project_generator import ProjectGenerator
+
+    logging.getLogger("roboview").setLevel(logging.WARNING)
+    benchmark_service = BenchmarkService(repetitions=repeat)
+
+    with tempfile.TemporaryDirectory(prefix="roboview-corpus-") as corpus_dir:
+        if project_root is not None:
+            if not project_root.exists():
+                typer.echo(f"❌ Error: Project directory does not exist: {project_root}", err=True)
+                raise typer.Exit(code=1)
+            projects = [(project_root.resolve().name, project_root)]
+        else:
+            try:
+                keyword_counts = [int(size) for size in sizes.split(",") if size.strip()]
+            except ValueError:
+                typer.echo(f"❌ Error: Invalid corpus sizes: {sizes}", err=True)
+                raise typer.Exit(code=1) from None
+
+            projects = []
+            for keyword_count in keyword_counts:
+                typer.echo(f"🏗️  Generating corpus with {keyword_count} keywords...")
+                corpus_root = Path(corpus_dir) / f"generated-{keyword_count}"
+                ProjectGenerator(BenchmarkService.get_corpus_config(keyword_count)).generate(corpus_root)
+                projects.append((f"generated-{keyword_count}", corpus_root))
+
+        typer.echo("⏱️  Running benchmark...")
+        result = benchmark_service.run(projects)
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(result.model_dump_json(indent=2), encoding="utf-8")
+
+    _print_result(result)
+    typer.echo("")
+    typer.echo(f"📄 Results: {output.resolve()}")
+
+    if baseline is not None:
+        regressions = BenchmarkService.compare(result, _load_result(baseline), max_regression, min_seconds)
+        _report_regressions(regressions, max_regression)
+
+
+@app.command()
+def compare(
+    current: Annotated[
+        Path,
+        typer.Argument(help="Benchmark result of the current run"),
+    ],
+    baseline: Annotated[
+        Path,
+        typer.Argument(help="Stored baseline benchmark result"),
+    ],
+    max_regression: Annotated[
+        float,
+        typer.Option("--max-regression", help="Allowed slowdown per phase in percent", min=0),
+    ] = 20.0,
+    min_seconds: Annotated[
+        float,
+        typer.Option("--min-seconds", help="Slowdowns below this absolute time are treated as noise", min=0),
+    ] = 0.05,
+) -> None:
+    """Compare two stored benchmark results and fail if a phase regressed.
+
+    Examples:
+        roboview bench compare bench.json baseline.json --max-regression 10
+
+    """
+    from roboview.services.benchmark_service import BenchmarkService
+
+    regressions = BenchmarkService.compare(_load_result(current), _load_result(baseline), max_regression, min_seconds)
+    _report_regressions(regressions, max_regression)
+
+
+@app.command()
+def load(  # noqa: PLR0913, PLR0917
+    keywords: Annotated[
+        int,
+        typer.Option("--keywords", "-k", help="Keyword count of the generated corpus", min=1),
+    ] = 1000,
+    project_root: Annotated[
+        Path | None,
+        typer.Option("--project", "-p", help="Load test an existing project instead of a generated corpus"),
+    ] = None,
+    clients: Annotated[
+        int,
+        typer.Option("--clients", "-c", help="Number of concurrent clients", min=1),
+    ] = 4,
+    requests: Annotated[
+        int,
+        typer.Option("--requests", "-n", help="Number of requests per client", min=1),
+    ] = 50,
+    url: Annotated[
+        str | None,
+        typer.Option("--url", help="Base URL of a running server instead of the in-process application"),
+    ] = None,
+    mix: Annotated[
+        str | None,
+        typer.Option("--mix", help="Request weights per scenario, e.g. 'kpis=5,keyword-similarity=20'"),
+    ] = None,
+    seed: Annotated[
+        int,
+        typer.Option("--seed", help="Seed of the request sequences"),
+    ] = 0,
+    output: Annotated[
+        Path | None,
+        typer.Option("--output", "-o", help="Output JSON file path"),
+    ] = None,
+) -> None:
+    """Replay a realistic request mix with concurrent clients and report latencies per endpoint.
+
+    Initializes the project, then every client sends its requests one after another:
+    per-file keyword views, keyword usages, similarity lookups, Robocop messages, KPIs and
+    report generation. Reports throughput and p50/p95/p99 latency per endpoint.
+
+    Examples:
+        # In-process against a generated 1k keyword corpus
+        roboview bench load --keywords 1000 --clients 8 --requests 100
+
+        # Against a running server, the project path must be readable by the server
+        roboview bench load --project ./rf-tests --url http://127.0.0.1:18123
+
+    """
+    import httpx
+    from roboview.services.benchmark_service import BenchmarkService
+    from roboview.services.load_test_service import LoadTestService
+    from roboview.utils.project_generator import ProjectGenerator
+
+    logging.getLogger("roboview").setLevel(logging.WARNING)
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    request_mix = _parse_request_mix(mix)
+
+    with tempfile.TemporaryDirectory(prefix="roboview-corpus-") as corpus_dir:
+        if project_root is not None:
+            if not project_root.exists():
+                typer.echo(f"❌ Error: Project directory does not exist: {project_root}", err=True)
+                raise typer.Exit(code=1)
+        else:
+            typer.echo(f"🏗️  Generating corpus with {keywords} keywords...")
+            project_root = Path(corpus_dir) / f"generated-{keywords}"
+            ProjectGenerator(BenchmarkService.get_corpus_config(keywords)).generate(project_root)
+
+        # Imported here, the application configures logging and settings on import
+        asgi_app = None
+        if url is None:
+            from roboview.main import app as asgi_app
+
+            logging.getLogger("roboview").setLevel(logging.WARNING)
+
+        load_test_service = LoadTestService(
+            project_root,
+            app=asgi_app,
+            base_url=url,
+            clients=clients,
+            requests_per_client=requests,
+            request_mix=request_mix,
+            seed=seed,
+        )
+        typer.echo("🚦 Running load test...")
+        try:
+            result = load_test_service.run()
+        except (httpx.HTTPError, ValueError) as e:
+            typer.echo(f"❌ Error: Load test failed: {e}", err=True)
+            raise typer.Exit(code=1) from None
+
+    _print_load_result(result)
+    if output is not None:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(result.model_dump_json(indent=2), encoding="utf-8")
+        typer.echo("")
+        typer.echo(f"📄 Results: {output.resolve()}")
@@ -1,25 +1,24 @@
 """Main CLI entry point for RoboView."""
 
 import os
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Annotated
 
 import typer
-import uvicorn
+from roboview.cli.benchmark import app as benchmark_app
 from roboview.cli.reporting import app as reporting_app
-from roboview.services.file_register_service import FileRegistryService
-from roboview.services.keyword_register_service import KeywordRegistryService
-from roboview.services.keyword_similarity_service import KeywordSimilarityService
-from roboview.services.keyword_usage_service import KeywordUsageService
-from roboview.services.reporting_service import ReportingService
-from roboview.services.robocop_register_service import RobocopRegistryService
-from roboview.services.robocop_service import RobocopService
-from roboview.utils.exporters.html_exporter import HTMLExporter
+
+# Commands import the analysis pipeline and server when they run, so short-lived calls
+# such as 'roboview version' do not load Robot Framework, Robocop, FastAPI or uvicorn
 
 app = typer.Typer(help="RoboView - Robot Framework Keyword Management Tool")
 
 # Add sub-apps
 app.add_typer(reporting_app, name="report", help="Report generation commands")
+app.add_typer(benchmark_app, name="bench", help="Benchmark commands")
 
 # Constants
 _KB = 1024
@@ -32,7 +31,7 @@ def version() -> None:
 
 
 @app.command()
-def serve(
+def serve(  # noqa: C901, PLR0912, PLR0913, PLR0917
     host: Annotated[
         str,
         typer.Option("--host", "-h", help="Host to bind the server to"),
@@ -42,9 +41,9 @@ def serve(
         typer.Option("--port", "-p", help="Port to run the server on"),
     ] = 18123,
     project_root: Annotated[
-        Path,
-        typer.Option("--project", help="Project root directory to analyze"),
-    ] = Path(),
+        Path | None,
+        typer.Option("--project", help="Project root directory to analyze in the background at startup"),
+    ] = None,
     robocop_config: Annotated[
         Path | None,
         typer.Option("--robocop-config", help="Path to robocop configuration file"),
@@ -53,6 +52,23 @@ def serve(
         str,
         typer.Option("--log-level", help="Log level (debug, info, warning, error)"),
     ] = "info",
+    snapshot: Annotated[
+        Path | None,
+        typer.Option("--snapshot", help="Serve the analysis stored by 'analyze --save-snapshot'"),
+    ] = None,
+    *,
+    warmup: Annotated[
+        bool,
+        typer.Option("--warmup/--no-warmup", help="Analyze the --project at startup, see /system/ready"),
+    ] = True,
+    enable_profiling: Annotated[
+        bool,
+        typer.Option("--enable-profiling", help="Enable the /system/profile endpoint profiling live requests"),
+    ] = False,
+    trace_allocations: Annotated[
+        bool,
+        typer.Option("--trace-allocations", help="Trace allocations with tracemalloc for the /system/memory endpoint"),
+    ] = False,
 ) -> None:
     """Start the RoboView backend server for headless workflows.
 
@@ -66,26 +82,66 @@ def serve(
         # Start server on custom port
         roboview serve --port 8080
 
-        # Start server with specific project
+        # Start server and analyze a project in the background, ready once /api/v1/system/ready answers 200
         roboview serve --project /path/to/rf-project
 
         # Start with debug logging
         roboview serve --log-level debug
 
+        # Serve an analysis computed in CI, resolving its paths against the project
+        roboview serve --project /path/to/rf-project --snapshot snap.rvsnap
+
+        # Allow profiling the next requests or initialization via /api/v1/system/profile
+        roboview serve --enable-profiling
+
+        # Report the top allocation sites via /api/v1/system/memory, slows the server down
+        roboview serve --trace-allocations
+
     """
-    # Set environment variables for the server
-    os.environ["PROJECT_ROOT"] = str(project_root.resolve())
+    import uvicorn
+    from roboview.core.config import get_settings
+
+    # Set environment variables for the server, snapshot paths are resolved against the working directory by default
+    if project_root is None and snapshot:
+        project_root = Path()
+    if project_root is not None:
+        if not project_root.is_dir():
+            typer.echo(f"❌ Error: Project directory does not exist: {project_root}", err=True)
+            raise typer.Exit(code=1)
+        os.environ["PROJECT_ROOT"] = str(project_root.resolve())
+    if not warmup:
+        os.environ["WARMUP_ENABLED"] = "false"
     if robocop_config:
         os.environ["ROBOCOP_CONFIG"] = str(robocop_config.resolve())
     os.environ["LOG_LEVEL"] = log_level.upper()
+    if snapshot:
+        if not snapshot.is_file():
+            typer.echo(f"❌ Error: Snapshot file does not exist: {snapshot}", err=True)
+            raise typer.Exit(code=1)
+        os.environ["SNAPSHOT_PATH"] = str(snapshot.resolve())
+    if enable_profiling:
+        os.environ["PROFILING_ENABLED"] = "true"
+    get_settings.cache_clear()
 
     typer.echo("🚀 Starting RoboView server...")
-    typer.echo(f"📁 Project: {project_root.resolve()}")
+    if project_root is not None:
+        typer.echo(f"📁 Project: {project_root.resolve()}")
+    if snapshot:
+        typer.echo(f"📦 Snapshot: {snapshot.resolve()}")
+    elif project_root is not None and warmup:
+        typer.echo(
+            f"🔥 Warming up, ready once http://{host}:{port}{get_settings().API_VERSION_STR}/system/ready answers"
+        )
     typer.echo(f"🌐 URL: http://{host}:{port}")
     typer.echo(f"📋 API Docs: http://{host}:{port}/docs")
+    if enable_profiling:
+        typer.echo(f"🔬 Profiling: http://{host}:{port}{get_settings().API_VERSION_STR}/system/profile")
     typer.echo("")
     typer.echo("Press Ctrl+C to stop the server.")
 
+    if trace_allocations:
+        tracemalloc.start()
+
     uvicorn.run(
         "roboview.main:app",
         host=host,
@@ -96,7 +152,7 @@ def serve(
 
 
 @app.command()
-def analyze(  # noqa: PLR0915
+def analyze(  # noqa: C901, PLR0912, PLR0913, PLR0915, PLR0917
     project_root: Annotated[
         Path,
         typer.Option("--project", "-p", help="Project root directory to analyze"),
@@ -113,7 +169,29 @@ def analyze(  # noqa: PLR0915
         Path | None,
         typer.Option("--robocop-config", help="Path to robocop configuration file"),
     ] = None,
+    save_snapshot: Annotated[
+        Path | None,
+        typer.Option("--save-snapshot", help="Also store the analysis as snapshot file for 'serve --snapshot'"),
+    ] = None,
+    output_xml: Annotated[
+        list[Path] | None,
+        typer.Option("--output-xml", help="Robot Framework output.xml to add keyword runtimes from, repeatable"),
+    ] = None,
+    profile: Annotated[
+        Path | None,
+        typer.Option("--profile", help="Write a pstats and speedscope profile per analysis phase to this directory"),
+    ] = None,
+    memory_report: Annotated[
+        Path | None,
+        typer.Option("--memory-report", help="Write the memory held per registry and service as JSON file"),
+    ] = None,
     *,
+    trace_allocations: Annotated[
+        bool,
+        typer.Option(
+            "--trace-allocations", help="Add the top tracemalloc allocation sites per phase to the memory report"
+        ),
+    ] = False,
     quiet: Annotated[
         bool,
         typer.Option("--quiet", "-q", help="Suppress output except errors"),
@@ -134,6 +212,18 @@ def analyze(  # noqa: PLR0915
         # Quiet mode for CI/CD pipelines
         roboview analyze --project . --output report.html --quiet
 
+        # Rank the slowest keywords by the runtimes of executed runs
+        roboview analyze --project . --output-xml output.xml --output-xml shard2/output.xml
+
+        # Store the analysis for later 'roboview serve --snapshot'
+        roboview analyze --project . --save-snapshot snap.rvsnap
+
+        # Profile the analysis phases, open profile.speedscope.json on speedscope.app
+        roboview analyze --project . --profile ./profiles
+
+        # Find the structures and allocation sites holding the most memory
+        roboview analyze --project . --memory-report memory.json --trace-allocations
+
         # Full options
         roboview analyze \
             --project ./rf-tests \
@@ -142,11 +232,43 @@ def analyze(  # noqa: PLR0915
             --robocop-config ./robocop.toml
 
     """
+    from roboview.core.config import get_settings
+    from roboview.core.metrics import get_peak_rss_bytes, get_process_rss_bytes
+    from roboview.schemas.domain.memory import MemoryReport, ProjectMemory
+    from roboview.services.file_register_service import FileRegistryService
+    from roboview.services.keyword_register_service import KeywordRegistryService
+    from roboview.services.keyword_runtime_service import KeywordRuntimeService
+    from roboview.services.keyword_similarity_service import KeywordSimilarityService
+    from roboview.services.keyword_usage_service import KeywordUsageService
+    from roboview.services.project_pool_service import ProjectContext
+    from roboview.services.reporting_service import ReportingService
+    from roboview.services.robocop_register_service import RobocopRegistryService
+    from roboview.services.robocop_service import RobocopService
+    from roboview.utils.analysis_snapshot import write_analysis_snapshot
+    from roboview.utils.exporters.html_exporter import HTMLExporter
+    from roboview.utils.memory import AllocationTracker
+    from roboview.utils.output_xml import OutputXmlError
+    from roboview.utils.profiling import PhaseProfiler
+    from roboview.utils.similarity_index import get_similarity_index_path
 
     def log(message: str) -> None:
         if not quiet:
             typer.echo(message)
 
+    if trace_allocations and memory_report is None:
+        typer.echo("❌ Error: --trace-allocations requires --memory-report", err=True)
+        raise typer.Exit(code=1)
+
+    profiler = PhaseProfiler(enabled=profile is not None)
+    allocation_tracker = AllocationTracker(enabled=trace_allocations)
+    project_memory: ProjectMemory | None = None
+
+    @contextmanager
+    def phase(name: str) -> Iterator[None]:
+        # Snapshots are taken outside of the profile, so they do not show up as hotspots
+        with allocation_tracker.phase(name), profiler.phase(name):
+            yield
+
     try:
         log("🔍 Analyzing Robot Framework project...")
         log(f"📁 Project: {project_root.resolve()}")
@@ -156,32 +278,55 @@ def analyze(  # noqa: PLR0915
             typer.echo(f"❌ Error: Project directory does not exist: {project_root}", err=True)
             raise typer.Exit(code=1)  # noqa: TRY301
 
+        missing_output_files = [path for path in output_xml or () if not path.is_file()]
+        if missing_output_files:
+            typer.echo(f"❌ Error: Output file does not exist: {missing_output_files[0]}", err=True)
+            raise typer.Exit(code=1)  # noqa: TRY301
+
         # Initialize registries
         log("📊 Initializing registries...")
         keyword_registry_service = KeywordRegistryService(project_root)
-        keyword_registry_service.initialize()
+        with phase("keywords"):
+            keyword_registry_service.initialize()
         keyword_registry = keyword_registry_service.get_keyword_registry()
 
         file_registry_service = FileRegistryService(project_root)
-        file_registry_service.initialize()
+        with phase("files"):
+            file_registry_service.initialize()
         file_registry = file_registry_service.get_file_registry()
 
         robocop_registry_service = RobocopRegistryService(
             project_root,
             robocop_config,
         )
-        robocop_registry_service.initialize()
+        with phase("robocop"):
+            robocop_registry_service.initialize()
         robocop_registry = robocop_registry_service.get_robocop_registry()
 
         # Initialize services
         log("🔧 Initializing analysis services...")
         keyword_usage_service = KeywordUsageService(keyword_registry, file_registry)
 
-        keyword_similarity_service = KeywordSimilarityService(keyword_registry)
-        keyword_similarity_service.calculate_keyword_similarity_matrix()
+        keyword_similarity_service = KeywordSimilarityService(
+            keyword_registry,
+            index_path=get_similarity_index_path(project_root),
+            index_top_k=get_settings().SIMILARITY_INDEX_TOP_K,
+        )
+        with phase("similarity"):
+            keyword_similarity_service.calculate_keyword_similarity_matrix()
 
         robocop_service = RobocopService(robocop_registry)
 
+        if output_xml:
+            log("⏱️  Reading keyword runtimes...")
+            try:
+                with phase("runtime"):
+                    summary = KeywordRuntimeService(keyword_registry).ingest_output_files(output_xml)
+            except (OutputXmlError, OSError) as error:
+                typer.echo(f"❌ Error: {error}", err=True)
+                raise typer.Exit(code=1) from None
+            log(f"   {summary.keyword_calls} keyword calls of {summary.output_files} output files")
+
         reporting_service = ReportingService(
             keyword_registry,
             file_registry,
@@ -192,9 +337,22 @@ def analyze(  # noqa: PLR0915
             project_root,
         )
 
+        if save_snapshot:
+            log("📦 Saving analysis snapshot...")
+            with phase("snapshot"):
+                write_analysis_snapshot(
+                    save_snapshot,
+                    project_root,
+                    keyword_registry=keyword_registry,
+                    file_registry=file_registry,
+                    robocop_registry=robocop_registry,
+                    keyword_similarity_service=keyword_similarity_service,
+                )
+
         # Generate report
         log("📝 Generating summary report...")
-        report = reporting_service.generate_report(author=author)
+        with phase("report"):
+            report = reporting_service.generate_report(author=author)
 
         # Ensure output path has .html extension
         output_path = Path(output)
@@ -206,7 +364,34 @@ def analyze(  # noqa: PLR0915
 
         # Export report
         log("💾 Exporting HTML report...")
-        HTMLExporter.export(report, output_path)
+        with phase("export"):
+            HTMLExporter.export(report, output_path)
+
+        if profile:
+            profiler.write(profile)
+
+        if memory_report:
+            log("🧮 Measuring memory...")
+            project_context = ProjectContext(
+                project_root,
+                keyword_registry=keyword_registry,
+                file_registry=file_registry,
+                robocop_registry=robocop_registry,
+                keyword_usage_service=keyword_usage_service,
+                keyword_similarity_service=keyword_similarity_service,
+                robocop_service=robocop_service,
+                reporting_service=reporting_service,
+            )
+            allocation_tracker.stop()
+            project_memory = project_context.get_memory_usage()
+            report_memory = MemoryReport(
+                project=project_memory,
+                phases=allocation_tracker.phases,
+                process_rss_bytes=get_process_rss_bytes(),
+                peak_rss_bytes=get_peak_rss_bytes(),
+            )
+            memory_report.parent.mkdir(parents=True, exist_ok=True)
+            memory_report.write_text(report_memory.model_dump_json(indent=2), encoding="utf-8")
 
         file_size = output_path.stat().st_size
         size_str = f"{file_size / _KB:.1f} KB" if file_size > _KB else f"{file_size} bytes"
@@ -214,6 +399,12 @@ def analyze(  # noqa: PLR0915
         log("")
         log("✅ Analysis complete!")
         log(f"📄 Report: {output_path.resolve()}")
+        if save_snapshot:
+            log(f"📦 Snapshot: {save_snapshot.resolve()}")
+        if profile:
+            log(f"🔬 Profiles: {profile.resolve()}")
+        if memory_report:
+            log(f"🧮 Memory Report: {memory_report.resolve()}")
         log(f"🏢 Project: {report.metadata.project_name}")
         log(f"📏 Size: {size_str}")
 
@@ -229,6 +420,12 @@ def analyze(  # noqa: PLR0915
         log(f"   • Best Practices Score: {report.best_practices_score:.1f}/100")
         log(f"   • Risk Level: {report.risk_level}")
 
+        if project_memory is not None:
+            log("")
+            log("🧮 Memory by Structure:")
+            for structure in sorted(project_memory.structures, key=lambda item: item.size_bytes, reverse=True):
+                log(f"   • {structure.name}: {structure.size_bytes / _KB:.1f} KB")
+
     except typer.Exit:
         raise
     except Exception:  # noqa: BLE001
@@ -236,5 +433,199 @@ def analyze(  # noqa: PLR0915
         raise typer.Exit(code=1) from None
 
 
+@app.command()
+def impact(  # noqa: C901, PLR0913
+    project_root: Annotated[
+        Path,
+        typer.Option("--project", "-p", help="Project root directory, the top-level suite of the run"),
+    ] = Path(),
+    diff_range: Annotated[
+        str | None,
+        typer.Option("--diff", help="Git commit or range to take the changes from, e.g. origin/main...HEAD"),
+    ] = None,
+    changed: Annotated[
+        list[Path] | None,
+        typer.Option("--changed", "-c", help="Changed .robot or .resource file, can be repeated"),
+    ] = None,
+    output: Annotated[
+        Path | None,
+        typer.Option("--output", "-o", help="Write the Robot Framework argument file here instead of stdout"),
+    ] = None,
+    json_output: Annotated[
+        Path | None,
+        typer.Option("--json", help="Also write the affected keywords, suites and test cases as JSON file"),
+    ] = None,
+    *,
+    quiet: Annotated[
+        bool,
+        typer.Option("--quiet", "-q", help="Suppress output except errors"),
+    ] = False,
+) -> None:
+    """Select the test cases affected by changed files as Robot Framework argument file.
+
+    Changed keywords are followed through the call graph to the test cases reaching them.
+    Changes to settings or variables select whole suites, for resource files all suites
+    importing them. Run Robot Framework on the project root, as suite names start there.
+    Messages are written to stderr, so the argument file can be piped.
+
+    Examples:
+        # Tests affected by the commits of a branch
+        roboview impact --project . --diff origin/main...HEAD --output impact.args
+        robot --argumentfile impact.args .
+
+        # Tests affected by uncommitted changes
+        roboview impact --project . --diff HEAD
+
+        # Tests affected by explicitly listed files
+        roboview impact --project . --changed resources/login.resource --changed tests/cart.robot
+
+    """
+    from roboview.schemas.domain.test_impact import ChangedFile
+    from roboview.services.file_register_service import FileRegistryService
+    from roboview.services.keyword_register_service import KeywordRegistryService
+    from roboview.services.keyword_usage_service import KeywordUsageService
+    from roboview.services.test_impact_service import TestImpactService
+    from roboview.utils.git_diff import GitDiffError, get_changed_files
+
+    def log(message: str) -> None:
+        if not quiet:
+            typer.echo(message, err=True)
+
+    if not project_root.is_dir():
+        typer.echo(f"❌ Error: Project directory does not exist: {project_root}", err=True)
+        raise typer.Exit(code=1)
+    if diff_range is None and not changed:
+        typer.echo("❌ Error: Pass the changes with --diff or --changed", err=True)
+        raise typer.Exit(code=1)
+
+    changed_files = [
+        ChangedFile(path=path.resolve().as_posix(), is_deleted=not path.exists()) for path in changed or ()
+    ]
+    if diff_range is not None:
+        try:
+            changed_files.extend(get_changed_files(project_root, diff_range))
+        except GitDiffError as error:
+            typer.echo(f"❌ Error: {error}", err=True)
+            raise typer.Exit(code=1) from None
+
+    try:
+        log(f"🔍 Analyzing {len(changed_files)} changed files in {project_root.resolve()}...")
+        keyword_registry_service = KeywordRegistryService(project_root)
+        keyword_registry_service.initialize()
+        file_registry_service = FileRegistryService(project_root)
+        file_registry_service.initialize()
+        keyword_usage_service = KeywordUsageService(
+            keyword_registry_service.get_keyword_registry(), file_registry_service.get_file_registry()
+        )
+        impact_service = TestImpactService(keyword_usage_service, project_root)
+        result = impact_service.analyze(changed_files)
+        argument_file = impact_service.to_argument_file(result)
+    except Exception:  # noqa: BLE001
+        typer.echo("❌ Error during test impact analysis", err=True)
+        raise typer.Exit(code=1) from None
+
+    if output is None:
+        typer.echo(argument_file, nl=False)
+    else:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(argument_file, encoding="utf-8")
+    if json_output is not None:
+        json_output.parent.mkdir(parents=True, exist_ok=True)
+        json_output.write_text(result.model_dump_json(indent=2), encoding="utf-8")
+
+    log(f"✏️  Changed Keywords: {len(result.changed_keywords)}")
+    log(f"🧪 Selected: {len(result.suites)} whole suites, {len(result.test_cases)} single test cases")
+    if output is not None:
+        log(f"📄 Argument File: {output.resolve()}")
+
+
+@app.command("generate-project")
+def generate_project(  # noqa: PLR0913, PLR0917
+    output: Annotated[
+        Path,
+        typer.Argument(help="Directory to write the generated project to"),
+    ],
+    resource_files: Annotated[
+        int,
+        typer.Option("--resource-files", help="Number of .resource files", min=1),
+    ] = 10,
+    suite_files: Annotated[
+        int,
+        typer.Option("--suite-files", help="Number of .robot suite files", min=0),
+    ] = 5,
+    keywords_per_file: Annotated[
+        int,
+        typer.Option("--keywords-per-file", help="Number of keywords per .resource file", min=1),
+    ] = 10,
+    tests_per_suite: Annotated[
+        int,
+        typer.Option("--tests-per-suite", help="Number of test cases per .robot file", min=0),
+    ] = 5,
+    call_fan_out: Annotated[
+        int,
+        typer.Option("--call-fan-out", help="Number of user keywords called by each keyword", min=0),
+    ] = 3,
+    import_depth: Annotated[
+        int,
+        typer.Option("--import-depth", help="Number of resource layers importing each other", min=1),
+    ] = 3,
+    duplicate_ratio: Annotated[
+        float,
+        typer.Option("--duplicate-ratio", help="Share of keywords copying another keyword body", min=0, max=1),
+    ] = 0.1,
+    documentation_ratio: Annotated[
+        float,
+        typer.Option("--documentation-ratio", help="Share of documented keywords", min=0, max=1),
+    ] = 0.5,
+    violation_density: Annotated[
+        float,
+        typer.Option("--violation-density", help="Share of keywords with Robocop violations", min=0, max=1),
+    ] = 0.2,
+    seed: Annotated[
+        int,
+        typer.Option("--seed", help="Seed of the generator, equal seeds generate equal projects"),
+    ] = 0,
+) -> None:
+    """Generate a synthetic Robot Framework project for scale testing.
+
+    The project is deterministic for a given seed and shape, so benchmarks can be repeated
+    on the same corpus.
+
+    Examples:
+        # Project with 10k keywords
+        roboview generate-project ./corpus-10k --resource-files 200 --keywords-per-file 50
+
+        # Deep imports and many duplicates
+        roboview generate-project ./corpus --import-depth 8 --duplicate-ratio 0.3
+
+    """
+    from roboview.utils.project_generator import ProjectGenerator, ProjectGeneratorConfig
+
+    if output.exists() and any(output.iterdir()):
+        typer.echo(f"❌ Error: Output directory is not empty: {output}", err=True)
+        raise typer.Exit(code=1)
+
+    config = ProjectGeneratorConfig(
+        resource_files=resource_files,
+        suite_files=suite_files,
+        keywords_per_file=keywords_per_file,
+        tests_per_suite=tests_per_suite,
+        call_fan_out=call_fan_out,
+        import_depth=import_depth,
+        duplicate_ratio=duplicate_ratio,
+        documentation_ratio=documentation_ratio,
+        violation_density=violation_density,
+        seed=seed,
+    )
+    summary = ProjectGenerator(config).generate(output)
+
+    typer.echo(f"✅ Generated project: {output.resolve()}")
+    typer.echo(f"   • Files: {summary.resource_files} resources, {summary.suite_files} suites")
+    typer.echo(f"   • Keywords: {summary.keywords} ({summary.duplicate_keywords} duplicates)")
+    typer.echo(f"   • Documented Keywords: {summary.documented_keywords}")
+    typer.echo(f"   • Keywords with Robocop Violations: {summary.violating_keywords}")
+    typer.echo(f"   • Test Cases: {summary.test_cases}")
+
+
 if __name__ == "__main__":
     app()
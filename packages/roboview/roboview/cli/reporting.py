@@ -5,14 +5,6 @@ from pathlib import Path
 from typing import Annotated
 
 import typer
-from roboview.services.file_register_service import FileRegistryService
-from roboview.services.keyword_register_service import KeywordRegistryService
-from roboview.services.keyword_similarity_service import KeywordSimilarityService
-from roboview.services.keyword_usage_service import KeywordUsageService
-from roboview.services.reporting_service import ReportingService
-from roboview.services.robocop_register_service import RobocopRegistryService
-from roboview.services.robocop_service import RobocopService
-from roboview.utils.exporters.html_exporter import HTMLExporter
 
 logger = logging.getLogger(__name__)
 
@@ -23,7 +15,7 @@ _KB = 1024
 
 
 @app.command()
-def generate(
+def generate(  # noqa: PLR0915
     output: Annotated[
         Path,
         typer.Option("--output", "-o", help="Output file path (HTML format)"),
@@ -40,6 +32,10 @@ def generate(
         Path | None,
         typer.Option("--robocop-config", help="Path to robocop configuration file"),
     ] = None,
+    profile: Annotated[
+        Path | None,
+        typer.Option("--profile", help="Write a pstats and speedscope profile per analysis phase to this directory"),
+    ] = None,
 ) -> None:
     """Generate a comprehensive HTML summary report for a Robot Framework project.
 
@@ -61,7 +57,24 @@ def generate(
         # With author
         roboview report generate --author "QA Team" --output report.html
 
+        # Profile the analysis phases
+        roboview report generate --project . --profile ./profiles
+
     """
+    from roboview.core.config import get_settings
+    from roboview.services.file_register_service import FileRegistryService
+    from roboview.services.keyword_register_service import KeywordRegistryService
+    from roboview.services.keyword_similarity_service import KeywordSimilarityService
+    from roboview.services.keyword_usage_service import KeywordUsageService
+    from roboview.services.reporting_service import ReportingService
+    from roboview.services.robocop_register_service import RobocopRegistryService
+    from roboview.services.robocop_service import RobocopService
+    from roboview.utils.exporters.html_exporter import HTMLExporter
+    from roboview.utils.profiling import PhaseProfiler
+    from roboview.utils.similarity_index import get_similarity_index_path
+
+    profiler = PhaseProfiler(enabled=profile is not None)
+
     try:
         typer.echo("🚀 Generating summary report...")
         typer.echo(f"📁 Project: {project_root}")
@@ -70,26 +83,34 @@ def generate(
         # Initialize registries
         typer.echo("📊 Initializing registries...")
         keyword_registry_service = KeywordRegistryService(project_root)
-        keyword_registry_service.initialize()
+        with profiler.phase("keywords"):
+            keyword_registry_service.initialize()
         keyword_registry = keyword_registry_service.get_keyword_registry()
 
         file_registry_service = FileRegistryService(project_root)
-        file_registry_service.initialize()
+        with profiler.phase("files"):
+            file_registry_service.initialize()
         file_registry = file_registry_service.get_file_registry()
 
         robocop_registry_service = RobocopRegistryService(
             project_root,
             robocop_config,
         )
-        robocop_registry_service.initialize()
+        with profiler.phase("robocop"):
+            robocop_registry_service.initialize()
         robocop_registry = robocop_registry_service.get_robocop_registry()
 
         # Initialize services
         typer.echo("🔧 Initializing services...")
         keyword_usage_service = KeywordUsageService(keyword_registry, file_registry)
 
-        keyword_similarity_service = KeywordSimilarityService(keyword_registry)
-        keyword_similarity_service.calculate_keyword_similarity_matrix()
+        keyword_similarity_service = KeywordSimilarityService(
+            keyword_registry,
+            index_path=get_similarity_index_path(project_root),
+            index_top_k=get_settings().SIMILARITY_INDEX_TOP_K,
+        )
+        with profiler.phase("similarity"):
+            keyword_similarity_service.calculate_keyword_similarity_matrix()
 
         robocop_service = RobocopService(robocop_registry)
 
@@ -105,7 +126,8 @@ def generate(
 
         # Generate report
         typer.echo("📝 Generating report...")
-        report = reporting_service.generate_report(author=author)
+        with profiler.phase("report"):
+            report = reporting_service.generate_report(author=author)
 
         # Ensure output path has .html extension
         output_path = Path(output)
@@ -114,7 +136,11 @@ def generate(
 
         # Export report as HTML
         typer.echo("💾 Exporting report as HTML...")
-        HTMLExporter.export(report, output_path)
+        with profiler.phase("export"):
+            HTMLExporter.export(report, output_path)
+
+        if profile:
+            profiler.write(profile)
 
         file_size = output_path.stat().st_size
         size_str = f"{file_size / _KB:.1f} KB" if file_size > _KB else f"{file_size} bytes"
@@ -122,6 +148,8 @@ def generate(
         typer.echo("")
         typer.echo("✅ Report generated successfully!")
         typer.echo(f"📄 File: {output_path.resolve()}")
+        if profile:
+            typer.echo(f"🔬 Profiles: {profile.resolve()}")
         typer.echo(f"🏢 Project: {report.metadata.project_name}")
         typer.echo(f"📏 File Size: {size_str}")
         typer.echo(f"⚡ Risk Level: {report.risk_level}")
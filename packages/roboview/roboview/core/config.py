@@ -39,6 +39,34 @@ class Settings(BaseSettings):
     BACKEND_CORS_ORIGINS: list[str] = Field(default=["http://localhost:8000"])
     HTTP_METHODS: list[str] = Field(default=["GET", "POST", "PUT", "DELETE"])
 
+    # Report job settings
+    REPORT_OUTPUT_DIR: str | None = Field(default=None)
+    REPORT_MAX_WORKERS: int = Field(default=1, ge=1)
+    REPORT_MAX_PENDING_JOBS: int = Field(default=8, ge=0)
+    REPORT_MAX_STORED_REPORTS: int = Field(default=20, ge=1)
+    REPORT_MAX_STORAGE_BYTES: int = Field(default=200 * 1024 * 1024, ge=0)
+    REPORT_MAX_AGE_SECONDS: int = Field(default=24 * 60 * 60, ge=0)
+
+    # Project pool settings
+    PROJECT_POOL_MAX_PROJECTS: int = Field(default=8, ge=1)
+    PROJECT_POOL_MEMORY_BUDGET_BYTES: int = Field(default=1024 * 1024 * 1024, ge=0)
+
+    # Similarity index settings
+    SIMILARITY_INDEX_ENABLED: bool = Field(default=True)
+    SIMILARITY_INDEX_DIR: str | None = Field(default=None)
+    SIMILARITY_INDEX_TOP_K: int = Field(default=100, ge=1)
+
+    # Profiling settings, the profiling endpoint exposes source paths and timings
+    PROFILING_ENABLED: bool = Field(default=False)
+
+    # Project settings, the project is warmed up at startup unless a snapshot is served
+    PROJECT_ROOT: str | None = Field(default=None)
+    ROBOCOP_CONFIG: str | None = Field(default=None)
+    WARMUP_ENABLED: bool = Field(default=True)
+
+    # Analysis snapshot settings
+    SNAPSHOT_PATH: str | None = Field(default=None)
+
 
 @lru_cache
 def get_settings() -> Settings:
@@ -0,0 +1,399 @@
+"""In-process metrics exposed in the Prometheus text format."""
+
+import bisect
+import math
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TypeVar
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+# Latency buckets in seconds, from cheap cached lookups to full project initializations
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape_label_value(value: str) -> str:
+    """Escape a label value for the text format."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value for the text format."""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(labelnames: tuple[str, ...], labelvalues: tuple[str, ...]) -> str:
+    """Format label pairs as ``{name="value",...}``, empty without labels."""
+    if not labelnames:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape_label_value(value)}"' for name, value in zip(labelnames, labelvalues, strict=True)
+    )
+    return f"{{{pairs}}}"
+
+
+class _Metric:
+    """Base class of a metric family with a fixed set of label names.
+
+    Attributes:
+        name: Metric name.
+        documentation: Help text of the metric.
+        labelnames: Names of the labels, values are passed in the same order.
+        _lock: Lock guarding the samples.
+
+    """
+
+    type_name = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> None:
+        """Initialize the metric family.
+
+        Arguments:
+            name (str): Metric name.
+            documentation (str): Help text of the metric.
+            labelnames (tuple[str, ...]): Names of the labels (default: ()).
+
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._lock = threading.Lock()
+
+    def _check_labels(self, labelvalues: tuple[str, ...]) -> None:
+        """Raise if the number of label values does not match the label names."""
+        if len(labelvalues) != len(self.labelnames):
+            msg = f"{self.name} expects labels {self.labelnames}, got {labelvalues}"
+            raise ValueError(msg)
+
+    def render(self) -> list[str]:
+        """Return the lines of the metric family in the text format."""
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+        lines.extend(self._render_samples())
+        return lines
+
+    def _render_samples(self) -> list[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonically increasing count per label combination."""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> None:
+        """Initialize the counter.
+
+        Arguments:
+            name (str): Metric name, should end with ``_total``.
+            documentation (str): Help text of the metric.
+            labelnames (tuple[str, ...]): Names of the labels (default: ()).
+
+        """
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, *labelvalues: str, amount: float = 1.0) -> None:
+        """Increase the count of a label combination.
+
+        Arguments:
+            *labelvalues (str): Label values in the order of the label names.
+            amount (float): Non-negative increment (default: 1.0).
+
+        """
+        self._check_labels(labelvalues)
+        with self._lock:
+            self._values[labelvalues] = self._values.get(labelvalues, 0.0) + amount
+
+    def get(self, *labelvalues: str) -> float:
+        """Return the count of a label combination, 0.0 if it was never increased."""
+        with self._lock:
+            return self._values.get(labelvalues, 0.0)
+
+    def _render_samples(self) -> list[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, labelvalues)} {_format_value(value)}"
+            for labelvalues, value in values
+        ]
+
+
+class Gauge(_Metric):
+    """Value per label combination that can go up and down."""
+
+    type_name = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> None:
+        """Initialize the gauge.
+
+        Arguments:
+            name (str): Metric name.
+            documentation (str): Help text of the metric.
+            labelnames (tuple[str, ...]): Names of the labels (default: ()).
+
+        """
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def set(self, value: float, *labelvalues: str) -> None:
+        """Set the value of a label combination.
+
+        Arguments:
+            value (float): New value.
+            *labelvalues (str): Label values in the order of the label names.
+
+        """
+        self._check_labels(labelvalues)
+        with self._lock:
+            self._values[labelvalues] = value
+
+    def get(self, *labelvalues: str) -> float | None:
+        """Return the value of a label combination, None if it was never set."""
+        with self._lock:
+            return self._values.get(labelvalues)
+
+    def clear(self) -> None:
+        """Remove all label combinations, e.g. before collecting the current values."""
+        with self._lock:
+            self._values.clear()
+
+    def _render_samples(self) -> list[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, labelvalues)} {_format_value(value)}"
+            for labelvalues, value in values
+        ]
+
+
+class Histogram(_Metric):
+    """Distribution of observed values in fixed cumulative buckets per label combination."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        """Initialize the histogram.
+
+        Arguments:
+            name (str): Metric name.
+            documentation (str): Help text of the metric.
+            labelnames (tuple[str, ...]): Names of the labels (default: ()).
+            buckets (tuple[float, ...]): Ascending upper bounds of the buckets (default: DEFAULT_BUCKETS).
+
+        """
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label combination: observations per bucket with a final +Inf bucket, and the sum
+        self._values: dict[tuple[str, ...], tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, *labelvalues: str) -> None:
+        """Record an observed value.
+
+        Arguments:
+            value (float): Observed value, e.g. a duration in seconds.
+            *labelvalues (str): Label values in the order of the label names.
+
+        """
+        self._check_labels(labelvalues)
+        bucket = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(labelvalues)
+            if entry is None:
+                entry = self._values[labelvalues] = ([0] * (len(self.buckets) + 1), [0.0])
+            entry[0][bucket] += 1
+            entry[1][0] += value
+
+    @contextmanager
+    def time(self, *labelvalues: str) -> Iterator[None]:
+        """Observe the wall clock time of the block in seconds.
+
+        Arguments:
+            *labelvalues (str): Label values in the order of the label names.
+
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, *labelvalues)
+
+    def get_count(self, *labelvalues: str) -> int:
+        """Return the number of observations of a label combination."""
+        with self._lock:
+            entry = self._values.get(labelvalues)
+            return sum(entry[0]) if entry is not None else 0
+
+    def get_sum(self, *labelvalues: str) -> float:
+        """Return the sum of the observations of a label combination."""
+        with self._lock:
+            entry = self._values.get(labelvalues)
+            return entry[1][0] if entry is not None else 0.0
+
+    def _render_samples(self) -> list[str]:
+        with self._lock:
+            values = sorted(
+                (labelvalues, (list(counts), total[0])) for labelvalues, (counts, total) in self._values.items()
+            )
+
+        bucket_labelnames = (*self.labelnames, "le")
+        lines = []
+        for labelvalues, (counts, total) in values:
+            cumulative = 0
+            for upper_bound, count in zip((*self.buckets, math.inf), counts, strict=True):
+                cumulative += count
+                labels = _format_labels(bucket_labelnames, (*labelvalues, _format_value(upper_bound)))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, labelvalues)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+MetricT = TypeVar("MetricT", bound=_Metric)
+
+
+class MetricsRegistry:
+    """Collection of metric families rendered together.
+
+    Attributes:
+        _metrics: Registered metric families by name, in registration order.
+        _lock: Lock guarding the registration.
+
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty metrics registry."""
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: MetricT) -> MetricT:
+        """Register a metric family.
+
+        Arguments:
+            metric (_Metric): Counter, gauge or histogram to register.
+
+        Returns:
+            _Metric: The registered metric family.
+
+        Raises:
+            ValueError: If a metric with the same name is already registered.
+
+        """
+        with self._lock:
+            if metric.name in self._metrics:
+                msg = f"Metric already registered: {metric.name}"
+                raise ValueError(msg)
+            self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        """Render all metric families in the Prometheus text format.
+
+        Returns:
+            str: Metrics text, ending with a newline.
+
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return "".join(f"{line}\n" for metric in metrics for line in metric.render())
+
+
+def get_process_rss_bytes() -> int | None:
+    """Return the current resident set size of the process, None if the platform does not report it.
+
+    Returns:
+        int | None: Resident set size in bytes.
+
+    """
+    try:
+        # Second field of statm is the number of resident pages
+        resident_pages = int(Path("/proc/self/statm").read_text(encoding="ascii").split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return resident_pages * _page_size()
+
+
+def get_peak_rss_bytes() -> int | None:
+    """Return the peak resident set size of the process, None if the platform does not report it.
+
+    Returns:
+        int | None: Peak resident set size in bytes.
+
+    """
+    if resource is None:
+        return None
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in bytes on macOS and in kilobytes elsewhere
+    return peak_rss if sys.platform == "darwin" else peak_rss * 1024
+
+
+def _page_size() -> int:
+    """Return the memory page size of the platform."""
+    return resource.getpagesize() if resource is not None else 4096
+
+
+# Process-wide registry and the metric families recorded by RoboView
+METRICS = MetricsRegistry()
+
+HTTP_REQUESTS = METRICS.register(
+    Counter("roboview_http_requests_total", "HTTP requests by method, route and status", ("method", "route", "status"))
+)
+HTTP_REQUEST_DURATION = METRICS.register(
+    Histogram("roboview_http_request_duration_seconds", "HTTP request latency by method and route", ("method", "route"))
+)
+INITIALIZATION_PHASE_DURATION = METRICS.register(
+    Histogram(
+        "roboview_initialization_phase_duration_seconds", "Duration of the project initialization phases", ("phase",)
+    )
+)
+SIMILARITY_CALCULATIONS = METRICS.register(
+    Counter(
+        "roboview_similarity_calculations_total",
+        "Similarity calculations by mode: reused index, incremental update or full calculation",
+        ("mode",),
+    )
+)
+SIMILARITY_CALCULATION_DURATION = METRICS.register(
+    Histogram("roboview_similarity_calculation_duration_seconds", "Duration of similarity calculations", ("mode",))
+)
+CACHE_LOOKUPS = METRICS.register(
+    Counter("roboview_cache_lookups_total", "Cache lookups by cache and result (hit or miss)", ("cache", "result"))
+)
+PROJECT_REGISTRY_ENTRIES = METRICS.register(
+    Gauge("roboview_registry_entries", "Entries per registry of an initialized project", ("project", "registry"))
+)
+PROJECT_SIMILARITY_KEYWORDS = METRICS.register(
+    Gauge(
+        "roboview_similarity_indexed_keywords",
+        "Keywords with neighbour lists in the similarity engine of a project",
+        ("project", "memory_mapped"),
+    )
+)
+PROJECT_ESTIMATED_SIZE = METRICS.register(
+    Gauge("roboview_project_estimated_size_bytes", "Estimated memory held by an initialized project", ("project",))
+)
+PROCESS_RESIDENT_MEMORY = METRICS.register(
+    Gauge("process_resident_memory_bytes", "Resident memory size of the process in bytes")
+)
+PROCESS_PEAK_RESIDENT_MEMORY = METRICS.register(
+    Gauge("roboview_process_peak_resident_memory_bytes", "Peak resident memory size of the process in bytes")
+)
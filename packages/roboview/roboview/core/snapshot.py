@@ -0,0 +1,82 @@
+"""Snapshot versioning and stable identifiers for registry contents."""
+
+import threading
+from itertools import count
+from pathlib import Path
+from uuid import NAMESPACE_URL, uuid4, uuid5
+
+# Namespace for all deterministic RoboView identifiers
+_ROBOVIEW_NAMESPACE = uuid5(NAMESPACE_URL, "https://github.com/viadee/robotframework-roboview")
+
+_version_counter = count(1)
+_version_lock = threading.Lock()
+# Random identifier of this process, versions restart at 1 in every process
+_BOOT_ID = uuid4().hex
+
+
+def next_snapshot_version() -> int:
+    """Return the next snapshot version.
+
+    Versions are process-wide and strictly increasing, so a registry that has been
+    rebuilt or modified always carries a higher version than any earlier snapshot.
+
+    Returns:
+        int: The next snapshot version.
+
+    """
+    with _version_lock:
+        return next(_version_counter)
+
+
+def get_snapshot_boot_id() -> str:
+    """Return the random identifier of the process issuing the snapshot versions.
+
+    Snapshot versions are only unique within a process, after a restart the same versions
+    are issued again for possibly different data. Together with the boot id they identify
+    a snapshot across restarts.
+
+    Returns:
+        str: Hex string that is the same for all calls within a process.
+
+    """
+    return _BOOT_ID
+
+
+def stable_id(*parts: object) -> str:
+    """Build a deterministic identifier from the given parts.
+
+    The same parts always yield the same identifier, so ids stay stable across
+    re-initializations of the registries.
+
+    Arguments:
+        *parts: Values that uniquely identify the entity, e.g. source path and name.
+
+    Returns:
+        str: UUID5 string derived from the parts.
+
+    """
+    return str(uuid5(_ROBOVIEW_NAMESPACE, "\x1f".join(str(part) for part in parts)))
+
+
+def get_stable_path(path: Path, project_root: Path | None = None) -> str:
+    """Return the form of a path used in stable identifiers.
+
+    Paths inside the project root are made relative to it, so the identifiers do not
+    depend on where the project is checked out, e.g. when a snapshot built in CI is served
+    from another directory.
+
+    Arguments:
+        path (Path): Path of a project file.
+        project_root (Path | None): Root directory of the project, None keeps the path as is.
+
+    Returns:
+        str: POSIX form of the path, relative to the project root if it lies inside it.
+
+    """
+    if project_root is not None:
+        for root in (project_root, project_root.resolve()):
+            try:
+                return path.relative_to(root).as_posix()
+            except ValueError:
+                continue
+    return path.as_posix()
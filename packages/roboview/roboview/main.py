@@ -3,11 +3,16 @@
 import logging
 from collections.abc import Callable
 from contextlib import asynccontextmanager
+from pathlib import Path
 
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.gzip import GZipMiddleware
 from roboview.api.endpoints import api_router
+from roboview.api.metrics import metrics_middleware
+from roboview.api.profiling import profiling_middleware
+from roboview.api.projects import load_snapshot_project
+from roboview.api.warmup import start_project_warmup
 from roboview.core.config import get_settings
 from roboview.core.logging import setup_logging
 from starlette.middleware.cors import CORSMiddleware
@@ -23,18 +28,42 @@ logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager
-async def lifespan(app: FastAPI):  # noqa: ARG001, ANN201
+async def lifespan(app: FastAPI):  # noqa: ANN201
     """FastAPI lifespan context manager."""
     # Startup logs
     logger.info("Starting application in %s environment", settings.ENVIRONMENT)
     logger.info("Log level set to %s", settings.LOG_LEVEL)
     logger.debug("Debug logging is enabled")
 
+    # Serve the project analysis of a snapshot without analyzing the project
+    if settings.SNAPSHOT_PATH:
+        try:
+            load_snapshot_project(
+                app.state,
+                Path(settings.SNAPSHOT_PATH),
+                Path(settings.PROJECT_ROOT) if settings.PROJECT_ROOT else None,
+            )
+        except Exception:
+            logger.exception("Could not load analysis snapshot %s", settings.SNAPSHOT_PATH)
+
+    # Analyze the configured project in the background, readiness is reported by /system/ready
+    elif settings.PROJECT_ROOT and settings.WARMUP_ENABLED:
+        start_project_warmup(
+            app.state,
+            Path(settings.PROJECT_ROOT),
+            Path(settings.ROBOCOP_CONFIG) if settings.ROBOCOP_CONFIG else None,
+        )
+
     yield
 
     # Shutdown logs
     logger.info("Shutting down application")
 
+    # Stop queued report jobs
+    report_job_service = getattr(app.state, "report_job_service", None)
+    if report_job_service is not None:
+        report_job_service.shutdown(wait=False)
+
 
 async def catch_exceptions_middleware(request: Request, call_next: Callable) -> Response:
     """Catch exceptions and handle them.
@@ -55,6 +84,9 @@ async def catch_exceptions_middleware(request: Request, call_next: Callable) ->
 app = FastAPI(title=settings.PROJECT_NAME, lifespan=lifespan, version=settings.APP_VERSION)
 
 app.middleware("http")(catch_exceptions_middleware)
+# Added after the exception middleware, so requests answered with 500 are measured as well
+app.middleware("http")(metrics_middleware)
+app.middleware("http")(profiling_middleware)
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
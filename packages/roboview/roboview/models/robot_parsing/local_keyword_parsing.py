@@ -6,18 +6,83 @@ from pathlib import Path
 
 from robot.api.parsing import (
     ModelVisitor,
+    Token,
+    get_model,
 )
+from robot.errors import DataError
 from robot.parsing.model.blocks import (
     Keyword,
     ModelWriter,
 )
 from robot.parsing.model.statements import (
     Documentation,
+    Statement,
 )
+from roboview.core.snapshot import get_stable_path, stable_id
 from roboview.schemas.domain.keywords import KeywordProperties
 
 logger = logging.getLogger(__name__)
 
+# Token types that only carry layout information
+_LAYOUT_TOKEN_TYPES = frozenset({Token.SEPARATOR, Token.EOL, Token.EOS, Token.CONTINUATION, Token.COMMENT})
+
+
+class KeywordTokenCollector(ModelVisitor):
+    """Visitor that collects the Robot Framework tokens of a keyword as similarity features.
+
+    Every token is stored as ``TYPE:value`` string. Variables inside arguments and embedded
+    in keyword names become separate ``VARIABLE`` tokens, called keyword names are normalized
+    the way Robot Framework matches them and layout tokens as well as documentation are skipped.
+
+    Attributes:
+        tokens (list[str]): Collected ``TYPE:value`` tokens in source order.
+
+    """
+
+    def __init__(self) -> None:
+        """Initialize the KeywordTokenCollector."""
+        self.tokens: list[str] = []
+
+    def visit_Documentation(self, node: Documentation) -> None:  # noqa: N802
+        """Skip documentation, its free text does not describe the keyword structure.
+
+        Arguments:
+            node (Documentation): The documentation setting node.
+
+        """
+
+    def visit_Statement(self, node: Statement) -> None:  # noqa: N802
+        """Visit a statement node and collect its tokens.
+
+        Arguments:
+            node (Statement): Any statement inside the keyword.
+
+        """
+        for token in node.tokens:
+            if token.type in _LAYOUT_TOKEN_TYPES:
+                continue
+
+            try:
+                sub_tokens = list(token.tokenize_variables())
+            except DataError:
+                # Invalid variable syntax, keep the token as written
+                sub_tokens = [token]
+
+            for sub_token in sub_tokens:
+                self.tokens.extend(self._to_features(sub_token))
+
+    @staticmethod
+    def _to_features(token: Token) -> list[str]:
+        """Convert a single token into ``TYPE:value`` features."""
+        value = (token.value or "").strip()
+        if not value:
+            return []
+        if token.type == Token.KEYWORD:
+            return [f"{token.type}:{value.lower().replace(' ', '').replace('_', '')}"]
+        if token.type == Token.KEYWORD_NAME:
+            return [f"{token.type}:{word}" for word in value.lower().split()]
+        return [f"{token.type}:{value}"]
+
 
 class LocalKeywordFinder(ModelVisitor):
     """Visitor that collects local keywords and their properties.
@@ -25,18 +90,27 @@ class LocalKeywordFinder(ModelVisitor):
     Attributes:
         keyword_doc (list[KeywordProperties]): List containing dictionaries of keywords with their properties.
         file_path (str): Path to the Robot Framework file being parsed.
+        project_root (Path | None): Root directory of the project, keyword ids are derived from the
+            file path relative to it.
+        keyword_tokens (dict[str, list[str]]): Similarity tokens of the collected keywords by keyword id.
+        name_occurrences (dict[str, int]): How often each keyword name was seen, used to keep ids of
+            duplicated keyword definitions apart.
 
     """
 
-    def __init__(self, file_path: Path) -> None:
+    def __init__(self, file_path: Path, project_root: Path | None = None) -> None:
         """Initialize the visitor.
 
         Arguments:
             file_path (str): Path to the Robot Framework file being parsed.
+            project_root (Path | None): Root directory of the project (default: None).
 
         """
         self.keyword_doc: list[KeywordProperties] = []
         self.file_path = file_path
+        self.project_root = project_root
+        self.keyword_tokens: dict[str, list[str]] = {}
+        self.name_occurrences: dict[str, int] = {}
 
     def visit_Keyword(self, node: Keyword) -> None:  # noqa: N802
         """Visit a keyword node and collect its name, documentation, and prefix.
@@ -52,9 +126,15 @@ class LocalKeywordFinder(ModelVisitor):
                     documentation = item.value
 
             keyword_name_with_prefix = f"{self.file_path.stem}.{node.name}"
+            occurrence = self.name_occurrences.get(node.name, 0)
+            self.name_occurrences[node.name] = occurrence + 1
 
+            keyword_id = stable_id(
+                get_stable_path(self.file_path, self.project_root), keyword_name_with_prefix, occurrence
+            )
             self.keyword_doc.append(
                 KeywordProperties(
+                    keyword_id=keyword_id,
                     file_name=self.file_path.name,
                     keyword_name_without_prefix=node.name,
                     keyword_name_with_prefix=keyword_name_with_prefix,
@@ -67,11 +147,57 @@ class LocalKeywordFinder(ModelVisitor):
                     line_number=node.lineno,
                 )
             )
+            self.keyword_tokens[keyword_id] = self.collect_keyword_tokens(node)
         except AttributeError:
             logger.exception("Keyword node missing expected attributes")
         except Exception:
             logger.exception("Unexpected error while visiting keyword")
 
+    @staticmethod
+    def collect_keyword_tokens(node: Keyword) -> list[str]:
+        """Collect the Robot Framework tokens of a keyword as similarity features.
+
+        Arguments:
+            node (Keyword): The keyword definition node.
+
+        Returns:
+            list[str]: ``TYPE:value`` tokens of the keyword, empty if collecting fails.
+
+        """
+        try:
+            collector = KeywordTokenCollector()
+            collector.visit(node)
+        except Exception:
+            logger.exception("Failed to collect tokens for keyword")
+            return []
+        else:
+            return collector.tokens
+
+    @classmethod
+    def collect_code_tokens(cls, code: str) -> list[str]:
+        """Collect the similarity features of a keyword from its code.
+
+        Parses the code again, so it is only meant for keywords whose tokens were not
+        collected while parsing their file, e.g. keywords restored from a snapshot.
+
+        Arguments:
+            code (str): Keyword definition as returned by ``convert_keyword_ast_to_string``.
+
+        Returns:
+            list[str]: ``TYPE:value`` tokens of the keyword, empty if the code holds no keyword.
+
+        """
+        try:
+            model = get_model(io.StringIO(f"*** Keywords ***\n{code}"))
+            keyword = next(
+                (item for section in model.sections for item in section.body if isinstance(item, Keyword)),
+                None,
+            )
+        except Exception:
+            logger.exception("Failed to parse keyword code")
+            return []
+        return [] if keyword is None else cls.collect_keyword_tokens(keyword)
+
     @staticmethod
     def convert_keyword_ast_to_string(node: Keyword) -> str:
         """Convert a Robot Framework AST Keyword node to its string representation.
@@ -23,9 +23,11 @@ class ResourceDependencyFinder(ModelVisitor):
 
         Attributes:
             imports (List[str]): List of imported resource file names (without paths).
+            import_paths (List[str]): List of imported resource paths as written, variables unresolved.
 
         """
         self.imports: list[str] = []
+        self.import_paths: list[str] = []
 
     def visit_SettingSection(self, node: SettingSection) -> None:  # noqa: N802
         """Visit the SettingSection and collect all resource import statements.
@@ -51,6 +53,7 @@ class ResourceDependencyFinder(ModelVisitor):
 
                     referenced_filename = PurePosixPath(normalized_import_value).name
                     self.imports.append(referenced_filename)
+                    self.import_paths.append(import_value)
             except AttributeError:
                 logger.exception("Setting item missing, expected attributes")
             except Exception:
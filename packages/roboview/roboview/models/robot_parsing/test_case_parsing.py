@@ -0,0 +1,150 @@
+"""Robot parsing model for parsing the test cases of a Robot Framework file and their calls."""
+
+import logging
+
+from robot.api.parsing import (
+    ModelVisitor,
+)
+from robot.parsing.model.blocks import (
+    TestCase,
+)
+from robot.parsing.model.statements import (
+    Node,
+    Setup,
+    SuiteSetup,
+    SuiteTeardown,
+    Teardown,
+    Template,
+    TestSetup,
+    TestTeardown,
+    TestTemplate,
+)
+from roboview.models.robot_parsing.called_keyword_parsing import CalledKeywordFinder
+from roboview.schemas.domain.files import TestCaseProperties
+
+logger = logging.getLogger(__name__)
+
+# Value disabling a default setup, teardown or template for a single test case
+_NONE_VALUE = "NONE"
+
+
+class TestCaseFinder(ModelVisitor):
+    """Visitor that collects the test cases or tasks of a Robot Framework file and their keyword calls.
+
+    The calls of a test case include its own setup, teardown and template and otherwise the
+    ``Test Setup``, ``Test Teardown`` and ``Test Template`` defaults of the file, regardless of
+    where the settings section is placed.
+
+    Attributes:
+        suite_keywords (list[str]): Keywords called by the ``Suite Setup`` and ``Suite Teardown`` settings.
+
+    """
+
+    # Not a test class, although pytest collects classes named Test*
+    __test__ = False
+
+    def __init__(self) -> None:
+        """Initialize the TestCaseFinder visitor."""
+        self.suite_keywords: list[str] = []
+        self._default_keywords: dict[str, list[str]] = {}
+        self._test_cases: list[tuple[str, int, list[str], set[str]]] = []
+
+    @staticmethod
+    def _collect_calls(node: Node) -> list[str]:
+        """Return the keywords called by a node, including keywords passed to BuiltIn run keywords."""
+        finder = CalledKeywordFinder()
+        finder.visit(node)
+        return [keyword for keyword in finder.called_keywords if keyword and keyword.upper() != _NONE_VALUE]
+
+    def visit_SuiteSetup(self, node: SuiteSetup) -> None:  # noqa: N802
+        """Collect the keywords called by the Suite Setup setting.
+
+        Arguments:
+            node (SuiteSetup): SuiteSetup node in the AST.
+
+        """
+        self.suite_keywords.extend(self._collect_calls(node))
+
+    def visit_SuiteTeardown(self, node: SuiteTeardown) -> None:  # noqa: N802
+        """Collect the keywords called by the Suite Teardown setting.
+
+        Arguments:
+            node (SuiteTeardown): SuiteTeardown node in the AST.
+
+        """
+        self.suite_keywords.extend(self._collect_calls(node))
+
+    def visit_TestSetup(self, node: TestSetup) -> None:  # noqa: N802
+        """Collect the keywords called by the Test Setup default.
+
+        Arguments:
+            node (TestSetup): TestSetup node in the AST.
+
+        """
+        self._default_keywords["setup"] = self._collect_calls(node)
+
+    def visit_TestTeardown(self, node: TestTeardown) -> None:  # noqa: N802
+        """Collect the keywords called by the Test Teardown default.
+
+        Arguments:
+            node (TestTeardown): TestTeardown node in the AST.
+
+        """
+        self._default_keywords["teardown"] = self._collect_calls(node)
+
+    def visit_TestTemplate(self, node: TestTemplate) -> None:  # noqa: N802
+        """Collect the keyword of the Test Template default.
+
+        Arguments:
+            node (TestTemplate): TestTemplate node in the AST.
+
+        """
+        self._default_keywords["template"] = [node.value] if node.value and node.value.upper() != _NONE_VALUE else []
+
+    def visit_TestCase(self, node: TestCase) -> None:  # noqa: N802
+        """Collect the keywords called by a test case or task.
+
+        Arguments:
+            node (TestCase): TestCase node in the AST.
+
+        """
+        try:
+            called_keywords = self._collect_calls(node)
+            overridden = set()
+            for statement in node.body:
+                if isinstance(statement, Setup):
+                    overridden.add("setup")
+                elif isinstance(statement, Teardown):
+                    overridden.add("teardown")
+                elif isinstance(statement, Template):
+                    overridden.add("template")
+                    if statement.value and statement.value.upper() != _NONE_VALUE:
+                        called_keywords.append(statement.value)
+
+            self._test_cases.append((node.name, node.lineno, called_keywords, overridden))
+        except Exception:
+            logger.exception("Unexpected error while visiting test case: %s", getattr(node, "name", "Unknown"))
+
+    def get_test_cases(self) -> list[TestCaseProperties]:
+        """Return the test cases with the defaults of the file they do not override.
+
+        Returns:
+            list[TestCaseProperties]: Test cases in source order.
+
+        """
+        return [
+            TestCaseProperties(
+                name=name,
+                line_number=line_number,
+                called_keywords=[
+                    *called_keywords,
+                    *(
+                        keyword
+                        for kind, keywords in self._default_keywords.items()
+                        if kind not in overridden
+                        for keyword in keywords
+                    ),
+                ],
+            )
+            for name, line_number, called_keywords, overridden in self._test_cases
+        ]
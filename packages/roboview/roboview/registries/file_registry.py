@@ -2,6 +2,7 @@
 
 import logging
 
+from roboview.core.snapshot import next_snapshot_version
 from roboview.schemas.domain.files import FileProperties
 
 logger = logging.getLogger(__name__)
@@ -15,12 +16,16 @@ class FileRegistry:
 
     Attributes:
         _file_registry: Dictionary containing all registered files.
+        _lookup_index: Files by path, built on first lookup.
+        _version: Snapshot version, increased whenever the registry content changes.
 
     """
 
     def __init__(self) -> None:
         """Initialize an empty file registry."""
         self._file_registry: dict[str, FileProperties] = {}
+        self._lookup_index: dict[str, FileProperties] | None = None
+        self._version = next_snapshot_version()
 
     def register(self, file: FileProperties) -> None:
         """Register a file in the registry.
@@ -31,6 +36,8 @@ class FileRegistry:
         """
         try:
             self._file_registry[file.path] = file
+            self._lookup_index = None
+            self._version = next_snapshot_version()
 
         except Exception:
             logger.exception("Failed to register file: %s", file.path)
@@ -50,10 +57,12 @@ class FileRegistry:
             return None
 
         try:
-            if result := next(
-                (file for file in self.get_all_files() if file.path == file_path),
-                None,
-            ):
+            if self._lookup_index is None:
+                self._lookup_index = {}
+                for file in self.get_all_files():
+                    self._lookup_index.setdefault(file.path, file)
+
+            if result := self._lookup_index.get(file_path):
                 return result
 
         except Exception:
@@ -71,9 +80,24 @@ class FileRegistry:
         """
         return list(self._file_registry.values())
 
+    @property
+    def version(self) -> int:
+        """Return the snapshot version of the registry content.
+
+        The version is strictly increasing across all registries of the process and
+        changes whenever an entry is registered or the registry is cleared.
+
+        Returns:
+            int: Current snapshot version.
+
+        """
+        return self._version
+
     def clear(self) -> None:
         """Clear all registered keywords."""
         self._file_registry.clear()
+        self._lookup_index = None
+        self._version = next_snapshot_version()
 
     def __len__(self) -> int:
         """Return the number of registered Robot Framework files."""
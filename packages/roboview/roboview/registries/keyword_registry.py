@@ -2,7 +2,10 @@
 
 import logging
 
+from roboview.core.snapshot import next_snapshot_version
 from roboview.schemas.domain.keywords import KeywordProperties
+from roboview.schemas.domain.runtime import KeywordRuntimeStatistics
+from roboview.utils.embedded_arguments import EmbeddedKeywordMatcher
 
 logger = logging.getLogger(__name__)
 
@@ -19,22 +22,40 @@ class KeywordRegistry:
 
     Attributes:
         _keyword_registry: Dictionary containing all registered keywords.
+        _lookup_index: Keywords by normalized name with and without prefix, built on first lookup.
+        _embedded_matcher: Matcher of the keywords with embedded arguments, built on first lookup.
+        _version: Snapshot version, increased whenever the registry content changes.
+        _similarity_tokens: Tokens collected while parsing, by keyword id, until the similarity
+            service takes them.
 
     """
 
     def __init__(self) -> None:
         """Initialize an empty keyword registry."""
         self._keyword_registry: dict[str, KeywordProperties] = {}
+        self._lookup_index: tuple[dict[str, list[KeywordProperties]], dict[str, list[KeywordProperties]]] | None = None
+        self._embedded_matcher: EmbeddedKeywordMatcher | None = None
+        self._version = next_snapshot_version()
+        self._similarity_tokens: dict[str, list[str]] = {}
 
-    def register(self, keyword: KeywordProperties) -> None:
+    def register(self, keyword: KeywordProperties, tokens: list[str] | None = None) -> None:
         """Register a keyword in the registry.
 
         Arguments:
             keyword: The keyword to register.
+            tokens: Similarity tokens collected while parsing the keyword, kept only until
+                the similarity service takes them (default: None).
 
         """
         try:
             self._keyword_registry[keyword.keyword_id] = keyword
+            if tokens is None:
+                self._similarity_tokens.pop(keyword.keyword_id, None)
+            else:
+                self._similarity_tokens[keyword.keyword_id] = tokens
+            self._lookup_index = None
+            self._embedded_matcher = None
+            self._version = next_snapshot_version()
 
         except Exception:
             logger.exception("Failed to register keyword: %s", keyword.keyword_name_without_prefix)
@@ -55,26 +76,80 @@ class KeywordRegistry:
             logger.warning("Empty keyword_name provided to resolve()")
             return None
 
-        normalized = self._normalize_keyword_name(keyword_name)
-
         try:
-            if result := next(
-                (kw for kw in self.get_all_keywords() if kw.validation_str_with_prefix == normalized),
-                None,
-            ):
-                return result
-
-            if result := next(
-                (kw for kw in self.get_all_keywords() if kw.validation_str_without_prefix == normalized),
-                None,
-            ):
-                return result
-
+            candidates = self._find_candidates(keyword_name)
         except Exception:
             logger.exception("Error while resolving keyword: %s", keyword_name)
             return None
         else:
-            return None
+            return candidates[0] if candidates else None
+
+    def resolve_all(self, keyword_name: str) -> list[KeywordProperties]:
+        """Resolve a keyword name to all keywords it may refer to.
+
+        Several keywords share a name if they are defined in different files or libraries,
+        which one a call refers to depends on the imports of the calling file.
+
+        Arguments:
+            keyword_name: The keyword name to resolve (with or without prefix).
+
+        Returns:
+            list[KeywordProperties]: Keywords matching the prefixed name first, then those matching
+                the unprefixed name, each in registration order, then keywords whose embedded
+                arguments match the name, the most specific first.
+
+        """
+        if not keyword_name:
+            return []
+
+        try:
+            return self._find_candidates(keyword_name)
+        except Exception:
+            logger.exception("Error while resolving keyword: %s", keyword_name)
+            return []
+
+    def _find_candidates(self, keyword_name: str) -> list[KeywordProperties]:
+        """Return the keywords matching a name with prefix, or else without prefix.
+
+        Keywords with embedded arguments matching the name follow the exact matches, as
+        Robot Framework prefers a keyword whose name matches exactly.
+        """
+        normalized = self._normalize_keyword_name(keyword_name)
+        keywords_with_prefix, keywords_without_prefix = self._get_lookup_index()
+        candidates = keywords_with_prefix.get(normalized) or keywords_without_prefix.get(normalized) or []
+
+        if self._embedded_matcher is None:
+            self._embedded_matcher = EmbeddedKeywordMatcher(self.get_all_keywords())
+        if embedded := self._embedded_matcher.match(keyword_name):
+            exact = {id(keyword) for keyword in candidates}
+            candidates = candidates + [keyword for keyword in embedded if id(keyword) not in exact]
+        return candidates
+
+    def _get_lookup_index(self) -> tuple[dict[str, list[KeywordProperties]], dict[str, list[KeywordProperties]]]:
+        """Return the keywords by normalized name with and without prefix.
+
+        Keywords sharing a name are kept in registration order, so the first registered one
+        wins for global lookups. The index is rebuilt after the registry content changed.
+        """
+        if self._lookup_index is None:
+            keywords_with_prefix: dict[str, list[KeywordProperties]] = {}
+            keywords_without_prefix: dict[str, list[KeywordProperties]] = {}
+            for keyword in self.get_all_keywords():
+                keywords_with_prefix.setdefault(keyword.validation_str_with_prefix, []).append(keyword)
+                keywords_without_prefix.setdefault(keyword.validation_str_without_prefix, []).append(keyword)
+            self._lookup_index = (keywords_with_prefix, keywords_without_prefix)
+        return self._lookup_index
+
+    def attach_runtime_statistics(self, statistics: dict[str, KeywordRuntimeStatistics]) -> None:
+        """Attach runtime statistics to the registered keywords, replacing earlier ones.
+
+        Arguments:
+            statistics: Runtime statistics by keyword id, keywords without entry have none afterwards.
+
+        """
+        for keyword in self._keyword_registry.values():
+            keyword.runtime_statistics = statistics.get(keyword.keyword_id)
+        self._version = next_snapshot_version()
 
     def get_prefix_variants(self, keyword_name: str) -> tuple[str, str]:
         """Get both prefix variants of a keyword name.
@@ -107,6 +182,17 @@ class KeywordRegistry:
             logger.warning("Keyword not found in registry: %s", keyword_name)
             return keyword_name, keyword_name
 
+    def take_similarity_tokens(self) -> dict[str, list[str]]:
+        """Return the similarity tokens collected while parsing and release them.
+
+        Returns:
+            dict[str, list[str]]: ``TYPE:value`` tokens by keyword id. Keywords registered
+                without tokens, e.g. restored from a snapshot, are missing.
+
+        """
+        tokens, self._similarity_tokens = self._similarity_tokens, {}
+        return tokens
+
     def get_all_keywords(self) -> list[KeywordProperties]:
         """Get all registered keywords.
 
@@ -139,9 +225,26 @@ class KeywordRegistry:
         """Normalize a keyword name for existence validation."""
         return keyword_name.lower().replace(" ", "").replace("_", "")
 
+    @property
+    def version(self) -> int:
+        """Return the snapshot version of the registry content.
+
+        The version is strictly increasing across all registries of the process and
+        changes whenever an entry is registered or the registry is cleared.
+
+        Returns:
+            int: Current snapshot version.
+
+        """
+        return self._version
+
     def clear(self) -> None:
         """Clear all registered keywords."""
         self._keyword_registry.clear()
+        self._similarity_tokens = {}
+        self._lookup_index = None
+        self._embedded_matcher = None
+        self._version = next_snapshot_version()
 
     def __len__(self) -> int:
         """Return the number of registered keywords."""
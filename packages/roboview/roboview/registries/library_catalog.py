@@ -0,0 +1,72 @@
+"""Library catalog for sharing library keyword metadata between projects."""
+
+import logging
+import threading
+from collections.abc import Callable
+
+from roboview.core.metrics import CACHE_LOOKUPS
+from roboview.schemas.domain.keywords import KeywordProperties
+
+logger = logging.getLogger(__name__)
+
+
+class LibraryCatalog:
+    """Cache of library keyword metadata shared by the keyword registries of all projects.
+
+    Building the metadata of a library requires running LibDoc on it, which is the same for
+    every project. The catalog loads each library once and hands out the same keyword
+    objects to all registries, which must treat them as read-only.
+
+    Attributes:
+        _catalogs: Mapping of library name to its keywords.
+        _lock: Lock serializing library loading.
+
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty library catalog."""
+        self._catalogs: dict[str, tuple[KeywordProperties, ...]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, library_name: str, load: Callable[[], list[KeywordProperties]]) -> tuple[KeywordProperties, ...]:
+        """Return the keywords of a library, loading them on first use.
+
+        Libraries without keywords, e.g. because they are not installed, are not cached, so
+        they are picked up once they become available.
+
+        Arguments:
+            library_name (str): Name of the library.
+            load (Callable[[], list[KeywordProperties]]): Function loading the library keywords.
+
+        Returns:
+            tuple[KeywordProperties, ...]: Shared keywords of the library.
+
+        """
+        with self._lock:
+            catalog = self._catalogs.get(library_name)
+            CACHE_LOOKUPS.inc("library_catalog", "miss" if catalog is None else "hit")
+            if catalog is None:
+                catalog = tuple(load())
+                if catalog:
+                    self._catalogs[library_name] = catalog
+                    logger.debug("Cached %d keywords of library %s", len(catalog), library_name)
+            return catalog
+
+    def keyword_ids(self) -> set[int]:
+        """Return the object ids of all cached keywords, e.g. to exclude them from memory estimates.
+
+        Returns:
+            set[int]: Object ids of the shared keyword objects.
+
+        """
+        with self._lock:
+            return {id(keyword) for catalog in self._catalogs.values() for keyword in catalog}
+
+    def clear(self) -> None:
+        """Drop all cached libraries."""
+        with self._lock:
+            self._catalogs.clear()
+
+    def __len__(self) -> int:
+        """Return the number of cached libraries."""
+        return len(self._catalogs)
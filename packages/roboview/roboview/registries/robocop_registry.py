@@ -2,6 +2,7 @@
 
 import logging
 
+from roboview.core.snapshot import next_snapshot_version
 from roboview.schemas.domain.robocop import RobocopMessage
 
 logger = logging.getLogger(__name__)
@@ -14,12 +15,14 @@ class RobocopRegistry:
 
     Attributes:
         _robocop_registry: Dictionary containing all registered Robocop messages.
+        _version: Snapshot version, increased whenever the registry content changes.
 
     """
 
     def __init__(self) -> None:
         """Initialize an empty Robocop registry."""
         self._robocop_registry: dict[str, RobocopMessage] = {}
+        self._version = next_snapshot_version()
 
     def register(self, error_message: RobocopMessage) -> None:
         """Register an error message in the registry.
@@ -30,6 +33,7 @@ class RobocopRegistry:
         """
         try:
             self._robocop_registry[error_message.message_id] = error_message
+            self._version = next_snapshot_version()
 
         except Exception:
             logger.exception("Failed to register error message: %s", error_message.message)
@@ -70,9 +74,23 @@ class RobocopRegistry:
         """
         return list(self._robocop_registry.values())
 
+    @property
+    def version(self) -> int:
+        """Return the snapshot version of the registry content.
+
+        The version is strictly increasing across all registries of the process and
+        changes whenever an entry is registered or the registry is cleared.
+
+        Returns:
+            int: Current snapshot version.
+
+        """
+        return self._version
+
     def clear(self) -> None:
         """Clear all registered Robocop messages."""
         self._robocop_registry.clear()
+        self._version = next_snapshot_version()
 
     def __len__(self) -> int:
         """Return the number of registered error messages."""
@@ -0,0 +1,87 @@
+"""Domain benchmark schemas for pydantic validation."""
+
+from datetime import UTC, datetime
+from enum import StrEnum
+
+from pydantic import BaseModel, Field
+
+
+class BenchmarkPhaseEnum(StrEnum):
+    """Enum for the timed phases of the analysis pipeline."""
+
+    DISCOVERY = "discovery"
+    PARSING = "parsing"
+    LIBDOC = "libdoc"
+    ROBOCOP = "robocop"
+    USAGE = "usage"
+    SIMILARITY = "similarity"
+    REPORT = "report"
+    HTML_EXPORT = "html_export"
+
+
+class PhaseMeasurement(BaseModel):
+    """Schema containing the resources used by one pipeline phase."""
+
+    phase: BenchmarkPhaseEnum = Field(description="Timed pipeline phase")
+    wall_seconds: float = Field(description="Elapsed wall clock time, the minimum over all repetitions")
+    cpu_seconds: float = Field(description="Process CPU time, the minimum over all repetitions")
+    peak_rss_bytes: int | None = Field(
+        description="High-water mark of the process resident set size at the end of the phase, including "
+        "all earlier phases, None if not available"
+    )
+
+
+class CorpusBenchmark(BaseModel):
+    """Schema containing the phase measurements of one benchmarked project."""
+
+    corpus: str = Field(description="Name identifying the project across benchmark runs")
+    keywords: int = Field(description="Number of user-defined keywords of the project")
+    files: int = Field(description="Number of Robot Framework files of the project")
+    phases: list[PhaseMeasurement] = Field(description="Measurements in pipeline order")
+
+
+class BenchmarkResult(BaseModel):
+    """Schema containing the results of a benchmark run."""
+
+    created_at: datetime = Field(description="Date and time of the run", default_factory=lambda: datetime.now(UTC))
+    python_version: str = Field(description="Version of the Python interpreter")
+    platform: str = Field(description="Platform the benchmark ran on")
+    repetitions: int = Field(description="Number of pipeline runs per project")
+    corpora: list[CorpusBenchmark] = Field(description="Results per benchmarked project")
+
+
+class PhaseRegression(BaseModel):
+    """Schema containing a phase that became slower than in the baseline."""
+
+    corpus: str = Field(description="Name of the benchmarked project")
+    phase: BenchmarkPhaseEnum = Field(description="Regressed pipeline phase")
+    baseline_seconds: float = Field(description="Wall clock time of the baseline")
+    current_seconds: float = Field(description="Wall clock time of the current run")
+    change_percent: float = Field(description="Relative change of the wall clock time in percent")
+
+
+class EndpointLoadStats(BaseModel):
+    """Schema containing the latencies of one endpoint under load."""
+
+    endpoint: str = Field(description="Name of the request scenario")
+    requests: int = Field(description="Number of sent requests")
+    errors: int = Field(description="Number of requests failing or answered with an error status")
+    throughput_rps: float = Field(description="Completed requests per second over the whole run")
+    p50_ms: float = Field(description="Median latency in milliseconds")
+    p95_ms: float = Field(description="95th percentile latency in milliseconds")
+    p99_ms: float = Field(description="99th percentile latency in milliseconds")
+    max_ms: float = Field(description="Maximum latency in milliseconds")
+
+
+class LoadTestResult(BaseModel):
+    """Schema containing the results of a load test run."""
+
+    created_at: datetime = Field(description="Date and time of the run", default_factory=lambda: datetime.now(UTC))
+    target: str = Field(description="Base URL of the server, or 'in-process' for the ASGI application")
+    project_root: str = Field(description="Root directory of the initialized project as POSIX")
+    clients: int = Field(description="Number of concurrent clients")
+    requests: int = Field(description="Number of sent requests over all clients")
+    errors: int = Field(description="Number of failed requests over all clients")
+    duration_seconds: float = Field(description="Wall clock time of the run")
+    throughput_rps: float = Field(description="Completed requests per second over all endpoints")
+    endpoints: list[EndpointLoadStats] = Field(description="Latencies per request scenario")
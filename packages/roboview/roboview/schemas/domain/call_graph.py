@@ -0,0 +1,40 @@
+"""Domain call graph schemas for pydantic validation."""
+
+from enum import StrEnum
+
+from pydantic import BaseModel, Field
+
+
+class CallGraphNodeTypeEnum(StrEnum):
+    """Enum for the kinds of nodes in the keyword call graph."""
+
+    KEYWORD = "keyword"
+    TEST_CASE = "test_case"
+    FILE = "file"
+
+
+class KeywordReachabilityEnum(StrEnum):
+    """Enum for whether test cases and suite settings reach a keyword through the call graph."""
+
+    REACHABLE = "reachable"
+    DIRECTLY_UNUSED = "directly_unused"
+    TRANSITIVELY_DEAD = "transitively_dead"
+
+
+class CallGraphNode(BaseModel):
+    """Schema containing a keyword, test case or file of the call graph."""
+
+    node_type: CallGraphNodeTypeEnum = Field(description="Kind of the node (keyword, test_case, file)")
+    name: str = Field(description="Keyword name with prefix, test case name or file name")
+    source: str = Field(description="Path of the file, where the node is defined as POSIX")
+    line_number: int | None = Field(description="Line number where the node is defined", default=None)
+    keyword_id: str | None = Field(description="Unique identifier of the keyword, None for other nodes", default=None)
+    is_user_defined: bool = Field(description="Whether the node is a user defined keyword, test case or file")
+    depth: int = Field(description="Number of calls between the queried keyword and the node", default=0)
+
+
+class KeywordRecursionGroup(BaseModel):
+    """Schema containing keywords that call themselves directly or through each other."""
+
+    keywords: list[CallGraphNode] = Field(description="Keywords of the calling cycle, ordered by source and line")
+    is_mutually_recursive: bool = Field(description="Whether the cycle spans several keywords")
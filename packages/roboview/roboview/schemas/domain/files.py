@@ -3,6 +3,19 @@
 from pydantic import BaseModel, Field
 
 
+class TestCaseProperties(BaseModel):
+    """Schema containing Robot Framework test case or task properties."""
+
+    # Not a test class, although pytest collects classes named Test*
+    __test__ = False
+
+    name: str = Field(description="Name of the test case")
+    line_number: int | None = Field(description="Line number where the test case is defined", default=None)
+    called_keywords: list[str] = Field(
+        description="Keywords called by the test case, including its setup, teardown and template", default=[]
+    )
+
+
 class FileProperties(BaseModel):
     """Schema containing Robot Framework file properties."""
 
@@ -12,6 +25,14 @@ class FileProperties(BaseModel):
     initialized_keywords: list[str] | None = Field(description="List of initialized keywords", default=None)
     called_keywords: list[str] | None = Field(description="List of called keywords", default=None)
     imported_files: list[str] | None = Field(description="List of imported resource files or Libraries", default=None)
+    resource_imports: list[str] | None = Field(
+        description="Resource import paths as written in the settings, None if imports were not analyzed",
+        default=None,
+    )
+    test_cases: list[TestCaseProperties] | None = Field(description="Test cases or tasks of the file", default=None)
+    setting_keywords: list[str] | None = Field(
+        description="Keywords called by the Suite Setup and Suite Teardown settings", default=None
+    )
 
 
 class FileUsage(BaseModel):
@@ -3,6 +3,8 @@
 from uuid import uuid4
 
 from pydantic import BaseModel, Field
+from roboview.schemas.domain.call_graph import KeywordReachabilityEnum
+from roboview.schemas.domain.runtime import KeywordRuntimeStatistics
 
 
 class KeywordProperties(BaseModel):
@@ -22,6 +24,9 @@ class KeywordProperties(BaseModel):
         description="List of keywords that are called by the actual Keyword", default=[]
     )
     line_number: int | None = Field(description="Line number where the keyword is defined", default=None)
+    runtime_statistics: KeywordRuntimeStatistics | None = Field(
+        description="Runtime of the keyword in the ingested output files, None if it was not executed", default=None
+    )
 
 
 class KeywordUsage(BaseModel):
@@ -36,6 +41,10 @@ class KeywordUsage(BaseModel):
     file_usages: int = Field(description="Usage of the keyword, in the selected file")
     total_usages: int = Field(description="Total usage of the keyword across the whole project")
     line_number: int | None = Field(description="Line number where the keyword is defined", default=None)
+    reachability: KeywordReachabilityEnum | None = Field(
+        description="Whether test cases reach the keyword (reachable, directly_unused, transitively_dead)",
+        default=None,
+    )
 
 
 class SimilarKeyword(BaseModel):
@@ -0,0 +1,54 @@
+"""Domain memory schemas for pydantic validation."""
+
+from datetime import UTC, datetime
+
+from pydantic import BaseModel, Field
+
+
+class StructureSize(BaseModel):
+    """Schema containing the estimated memory held by one structure."""
+
+    name: str = Field(description="Name of the registry, service or field")
+    size_bytes: int = Field(description="Estimated retained size in bytes")
+    entries: int | None = Field(description="Number of entries held by the structure, None if not countable")
+
+
+class ProjectMemory(BaseModel):
+    """Schema containing the memory held by the registries and services of one project."""
+
+    project_key: str = Field(description="Key identifying the project")
+    project_root: str = Field(description="Root directory of the project")
+    structures: list[StructureSize] = Field(
+        description="Registries and services in attribution order, objects shared between them count for the first"
+    )
+    fields: list[StructureSize] = Field(description="Large text fields, already included in the structures")
+    total_bytes: int = Field(description="Estimated memory held by all structures")
+
+
+class AllocationSite(BaseModel):
+    """Schema containing the memory allocated by one source line and still alive."""
+
+    file: str = Field(description="Source file of the allocation")
+    line: int = Field(description="Line of the allocation")
+    size_bytes: int = Field(description="Allocated size in bytes")
+    count: int = Field(description="Number of allocated blocks")
+
+
+class PhaseAllocations(BaseModel):
+    """Schema containing the allocations made by one analysis phase."""
+
+    phase: str = Field(description="Name of the phase")
+    traced_bytes: int = Field(description="Memory traced by tracemalloc at the end of the phase")
+    peak_traced_bytes: int = Field(description="Highest memory traced by tracemalloc during the phase")
+    rss_bytes: int | None = Field(description="Resident set size at the end of the phase, None if not available")
+    top_sites: list[AllocationSite] = Field(description="Sites that allocated the most memory during the phase")
+
+
+class MemoryReport(BaseModel):
+    """Schema containing the memory footprint of an analysis run."""
+
+    created_at: datetime = Field(description="Date and time of the report", default_factory=lambda: datetime.now(UTC))
+    project: ProjectMemory = Field(description="Memory held by the analyzed project")
+    phases: list[PhaseAllocations] = Field(description="Allocations per phase, empty unless allocations are traced")
+    process_rss_bytes: int | None = Field(description="Resident set size at the end, None if not available")
+    peak_rss_bytes: int | None = Field(description="Peak resident set size, None if not available")
@@ -0,0 +1,31 @@
+"""Domain profiling schemas for pydantic validation."""
+
+from enum import StrEnum
+
+from pydantic import BaseModel, Field
+
+
+class ProfilingTargetEnum(StrEnum):
+    """Enum for the work a profiling session records."""
+
+    REQUESTS = "requests"
+    INITIALIZATION = "initialization"
+
+
+class ProfilingStatusEnum(StrEnum):
+    """Enum for the lifecycle states of a profiling session."""
+
+    WAITING = "waiting"
+    RECORDING = "recording"
+    COMPLETED = "completed"
+
+
+class ProfileHotspot(BaseModel):
+    """Schema containing the time spent in one profiled function."""
+
+    function: str = Field(description="Name of the function")
+    file: str | None = Field(description="Source file of the function, None for built-in functions")
+    line: int = Field(description="Line the function is defined on")
+    calls: int = Field(description="Number of calls, including recursive calls")
+    own_seconds: float = Field(description="Time spent in the function itself")
+    cumulative_seconds: float = Field(description="Time spent in the function and the functions it called")
@@ -19,6 +19,31 @@ class ExportFormatEnum(StrEnum):
     HTML = "html"
 
 
+class ReportJobStatusEnum(StrEnum):
+    """Enum for the lifecycle states of a report generation job."""
+
+    GENERATING = "generating"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class ReportJob(BaseModel):
+    """State of a single report generation job."""
+
+    report_id: str = Field(description="Unique identifier for the report", default_factory=lambda: str(uuid4()))
+    status: ReportJobStatusEnum = Field(description="Current job status", default=ReportJobStatusEnum.GENERATING)
+    report_type: ReportTypeEnum = Field(description="Type of the report", default=ReportTypeEnum.SUMMARY)
+    export_format: ExportFormatEnum = Field(description="Export format of the report", default=ExportFormatEnum.HTML)
+    author: str | None = Field(description="Author of the report", default=None)
+    created_at: datetime = Field(
+        description="Date and time the job was queued", default_factory=lambda: datetime.now(UTC)
+    )
+    completed_at: datetime | None = Field(description="Date and time the job finished", default=None)
+    file_path: str | None = Field(description="Path of the generated report file", default=None)
+    file_size: int | None = Field(description="File size in bytes", default=None)
+    error_message: str | None = Field(description="Error message if generation failed", default=None)
+
+
 class ReportMetadata(BaseModel):
     """Metadata for a report."""
 
@@ -101,6 +126,26 @@ class DuplicateKeywordPair(BaseModel):
     similarity_score: float = Field(description="Similarity score (0-100)")
 
 
+class RecursiveKeywordGroupData(BaseModel):
+    """Data for keywords calling themselves directly or through each other."""
+
+    keyword_names: list[str] = Field(description="Names of the keywords in the calling cycle")
+    file_names: list[str] = Field(description="Files of the keywords in the calling cycle")
+    is_mutually_recursive: bool = Field(description="Whether the cycle spans several keywords")
+
+
+class SlowKeywordData(BaseModel):
+    """Runtime data of a keyword for report."""
+
+    keyword_name: str = Field(description="Keyword name as executed")
+    file_name: str | None = Field(description="File where keyword is defined, if it is registered")
+    call_count: int = Field(description="Number of executed calls")
+    failure_count: int = Field(description="Number of calls that failed")
+    total_seconds: float = Field(description="Time spent in all calls in seconds")
+    mean_seconds: float = Field(description="Mean duration of a call in seconds")
+    p95_seconds: float = Field(description="95th percentile of the call durations in seconds")
+
+
 class Report(BaseModel):
     """Base report model."""
 
@@ -130,7 +175,7 @@ class SummaryReport(Report):
         default_factory=list,
     )
     unused_keywords: list[KeywordReportData] = Field(
-        description="Keywords with zero usages (candidates for removal)",
+        description="Keywords no test case reaches (candidates for removal)",
         default_factory=list,
     )
     undocumented_keywords: list[KeywordReportData] = Field(
@@ -141,6 +186,14 @@ class SummaryReport(Report):
         description="Similar/duplicate keyword pairs (refactoring candidates)",
         default_factory=list,
     )
+    recursive_keywords: list[RecursiveKeywordGroupData] = Field(
+        description="Recursive and mutually recursive keyword groups",
+        default_factory=list,
+    )
+    slowest_keywords: list[SlowKeywordData] = Field(
+        description="Executed keywords with the most total time, if output files were ingested",
+        default_factory=list,
+    )
 
     # File Analysis
     files: list[FileReportData] = Field(
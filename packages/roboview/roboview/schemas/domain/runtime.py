@@ -0,0 +1,29 @@
+"""Domain keyword runtime schemas for pydantic validation."""
+
+from pydantic import BaseModel, Field
+
+
+class KeywordRuntimeStatistics(BaseModel):
+    """Schema containing the aggregated runtime of a keyword over executed Robot Framework runs."""
+
+    keyword_name: str = Field(description="Name of the keyword with library or resource prefix as executed")
+    keyword_id: str | None = Field(
+        description="Unique identifier of the registered keyword, if it is known",
+        default=None,
+    )
+    source: str | None = Field(description="Path of the file, where the registered keyword is defined", default=None)
+    call_count: int = Field(description="Number of executed calls")
+    failure_count: int = Field(description="Number of calls that failed")
+    total_seconds: float = Field(description="Time spent in all calls in seconds")
+    mean_seconds: float = Field(description="Mean duration of a call in seconds")
+    p95_seconds: float = Field(description="95th percentile of the call durations in seconds, within 1 percent")
+    max_seconds: float = Field(description="Duration of the longest call in seconds")
+
+
+class RuntimeIngestionSummary(BaseModel):
+    """Schema summarizing the ingestion of Robot Framework output files."""
+
+    output_files: int = Field(description="Number of ingested output files")
+    keyword_calls: int = Field(description="Number of executed keyword calls read from the files")
+    keywords: int = Field(description="Number of distinct executed keywords")
+    matched_keywords: int = Field(description="Number of executed keywords matched to registered keywords")
@@ -0,0 +1,49 @@
+"""Domain test impact analysis schemas for pydantic validation."""
+
+from pydantic import BaseModel, Field
+from roboview.schemas.domain.call_graph import CallGraphNode
+
+
+class ChangedFile(BaseModel):
+    """Schema containing a changed Robot Framework file and the lines that changed."""
+
+    path: str = Field(description="Path of the changed file, absolute or relative to the project root")
+    line_ranges: list[tuple[int, int]] | None = Field(
+        description="First and last changed line of every change in the new file, None if the whole file changed",
+        default=None,
+    )
+    is_deleted: bool = Field(description="Whether the file was deleted", default=False)
+
+
+class ImpactedTestCase(BaseModel):
+    """Schema containing a test case affected by a change."""
+
+    # Not a test class, although pytest collects classes named Test*
+    __test__ = False
+
+    name: str = Field(description="Name of the test case")
+    full_name: str = Field(description="Name of the test case with the names of its parent suites")
+    source: str = Field(description="Path of the suite file of the test case as POSIX")
+    line_number: int | None = Field(description="Line number where the test case is defined", default=None)
+
+
+class ImpactedSuite(BaseModel):
+    """Schema containing a suite of which all test cases are affected by a change."""
+
+    full_name: str = Field(description="Name of the suite with the names of its parent suites")
+    source: str = Field(description="Path of the suite file or of the directory of an __init__ file as POSIX")
+    reason: str = Field(description="Why the whole suite is affected")
+
+
+class TestImpact(BaseModel):
+    """Schema containing the test cases affected by a set of changed files."""
+
+    # Not a test class, although pytest collects classes named Test*
+    __test__ = False
+
+    changed_files: list[str] = Field(description="Registered paths of the changed files as POSIX", default=[])
+    changed_keywords: list[CallGraphNode] = Field(description="Keywords whose definition changed", default=[])
+    suites: list[ImpactedSuite] = Field(description="Suites to run completely", default=[])
+    test_cases: list[ImpactedTestCase] = Field(
+        description="Single test cases to run, outside of the suites to run completely", default=[]
+    )
@@ -0,0 +1,12 @@
+"""Domain warm-up schemas for pydantic validation."""
+
+from enum import StrEnum
+
+
+class WarmupStatusEnum(StrEnum):
+    """Enum for the states of the project warm-up at server startup."""
+
+    DISABLED = "disabled"
+    RUNNING = "running"
+    READY = "ready"
+    FAILED = "failed"
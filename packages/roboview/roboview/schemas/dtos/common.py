@@ -3,6 +3,7 @@
 from pathlib import Path
 
 from pydantic import BaseModel, Field
+from roboview.schemas.domain.warmup import WarmupStatusEnum
 
 
 class HealthCheck(BaseModel):
@@ -11,6 +12,16 @@ class HealthCheck(BaseModel):
     status: str = Field(default="OK", description="Status of the health check")
 
 
+class ReadinessResponse(BaseModel):
+    """Response model to validate and return when checking whether the server is ready."""
+
+    status: WarmupStatusEnum = Field(description="State of the project warm-up (disabled, running, ready, failed)")
+    project_root: str | None = Field(description="Root directory of the warmed up project", default=None)
+    project_key: str | None = Field(description="Key of the warmed up project, once it is ready", default=None)
+    duration_seconds: float | None = Field(description="Duration of the finished warm-up", default=None)
+    error: str | None = Field(description="Error the warm-up failed with", default=None)
+
+
 class Shutdown(BaseModel):
     """Response model to validate and return when performing a shutdown."""
 
@@ -28,3 +39,24 @@ class InitializationResponse(BaseModel):
     """Response model to validate and return when performing an initialization."""
 
     status: str = Field(default="OK", description="Whether the initialization was successful")
+    project_key: str | None = Field(description="Key selecting the initialized project in requests", default=None)
+
+
+class ProjectInfo(BaseModel):
+    """Response model describing a project held by the backend."""
+
+    project_key: str = Field(description="Key selecting the project in requests")
+    project_root_dir: Path = Field(description="Path to the project root directory")
+    num_keywords: int = Field(description="Number of registered keywords, including library keywords")
+    num_files: int = Field(description="Number of registered Robot Framework files")
+    estimated_size_bytes: int = Field(description="Estimated memory held by the project")
+    active_requests: int = Field(description="Number of requests currently using the project")
+    is_default: bool = Field(description="Whether requests without project key are routed to this project")
+
+
+class ProjectListResponse(BaseModel):
+    """Response model to validate and return when listing the projects."""
+
+    projects: list[ProjectInfo] = Field(description="Projects, least recently used first")
+    estimated_size_bytes: int = Field(description="Estimated memory held by all projects")
+    memory_budget_bytes: int = Field(description="Memory budget of the project pool")
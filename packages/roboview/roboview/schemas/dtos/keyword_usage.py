@@ -1,6 +1,7 @@
 """Schemas for keyword usage functionality."""
 
 from pydantic import BaseModel, Field
+from roboview.schemas.domain.call_graph import CallGraphNode, KeywordRecursionGroup
 from roboview.schemas.domain.files import FileUsage
 from roboview.schemas.domain.keywords import KeywordUsage
 
@@ -41,3 +42,23 @@ class KeywordsWithoutUsagesResponse(BaseModel):
     """Response model to fetch the keywords without usages."""
 
     keywords_wo_usages: list[KeywordUsage] = Field(description="List of keywords that have no usages")
+
+
+class KeywordCallersResponse(BaseModel):
+    """Response model to fetch the keywords, test cases and files calling a keyword."""
+
+    keyword: CallGraphNode = Field(description="The requested keyword")
+    callers: list[CallGraphNode] = Field(description="Callers of the keyword, ordered by call distance")
+
+
+class KeywordCalleesResponse(BaseModel):
+    """Response model to fetch the keywords called by a keyword."""
+
+    keyword: CallGraphNode = Field(description="The requested keyword")
+    callees: list[CallGraphNode] = Field(description="Keywords called by the keyword, ordered by call distance")
+
+
+class RecursiveKeywordsResponse(BaseModel):
+    """Response model to fetch the recursive and mutually recursive keyword groups."""
+
+    recursion_groups: list[KeywordRecursionGroup] = Field(description="Groups of keywords calling each other in cycles")
@@ -0,0 +1,19 @@
+"""DTOs for memory endpoints."""
+
+from pydantic import BaseModel, Field
+from roboview.schemas.domain.memory import AllocationSite, ProjectMemory
+
+
+class MemoryResponse(BaseModel):
+    """Response model for the memory held by the backend."""
+
+    projects: list[ProjectMemory] = Field(description="Memory held by each initialized project")
+    library_catalog_bytes: int = Field(
+        description="Estimated memory held by the library catalog shared by all projects"
+    )
+    process_rss_bytes: int | None = Field(description="Resident set size of the process, None if not available")
+    peak_rss_bytes: int | None = Field(description="Peak resident set size of the process, None if not available")
+    tracing_allocations: bool = Field(description="Whether tracemalloc traces the allocations of the process")
+    top_allocation_sites: list[AllocationSite] = Field(
+        description="Source lines holding the most traced memory, empty unless allocations are traced"
+    )
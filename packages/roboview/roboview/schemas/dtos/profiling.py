@@ -0,0 +1,30 @@
+"""DTOs for profiling endpoints."""
+
+from pydantic import BaseModel, Field
+from roboview.schemas.domain.profiling import ProfileHotspot, ProfilingStatusEnum, ProfilingTargetEnum
+
+
+class StartProfilingRequest(BaseModel):
+    """Request model for starting a profiling session."""
+
+    target: ProfilingTargetEnum = Field(
+        description="Profile the next requests or the next initialization", default=ProfilingTargetEnum.REQUESTS
+    )
+    request_count: int = Field(
+        description="Number of requests to profile, ignored for initializations", default=10, ge=1, le=10_000
+    )
+
+
+class ProfilingStatusResponse(BaseModel):
+    """Response model for the state of a profiling session."""
+
+    session_id: str = Field(description="Unique profiling session ID")
+    target: ProfilingTargetEnum = Field(description="Work the session records")
+    status: ProfilingStatusEnum = Field(description="Status of the session (waiting, recording, completed)")
+    request_count: int = Field(description="Number of requests or initializations to profile")
+    profiled_count: int = Field(description="Number of requests or initializations profiled so far")
+    created_at: str = Field(description="Timestamp when the session was started")
+    completed_at: str | None = Field(description="Timestamp when the session completed", default=None)
+    hotspots: list[ProfileHotspot] = Field(
+        description="Functions with the most own time, available once the session completed", default_factory=list
+    )
@@ -22,6 +22,7 @@ class GenerateReportRequest(BaseModel):
 
     author: str | None = Field(description="Author of the report", default=None)
     project_root_dir: str | None = Field(description="Project root directory path", default=None)
+    export_format: str = Field(description="Export format, only html is supported", default=ExportFormatEnum.HTML)
 
 
 class ReportStatusResponse(BaseModel):
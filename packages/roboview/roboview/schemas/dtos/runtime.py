@@ -0,0 +1,26 @@
+"""Keyword runtime schemas for pydantic validation."""
+
+from pathlib import Path
+
+from pydantic import BaseModel, Field
+from roboview.schemas.domain.runtime import KeywordRuntimeStatistics, RuntimeIngestionSummary
+
+
+class OutputIngestionRequest(BaseModel):
+    """Request model to ingest Robot Framework output files."""
+
+    output_files: list[Path] = Field(description="Paths of the output.xml files on the server", min_length=1)
+
+
+class OutputIngestionResponse(BaseModel):
+    """Response model to return the result of an output file ingestion."""
+
+    summary: RuntimeIngestionSummary = Field(description="Number of ingested files, keyword calls and keywords")
+
+
+class SlowestKeywordsResponse(BaseModel):
+    """Response model to fetch the keywords ranked by total time spent in them."""
+
+    slowest_keywords: list[KeywordRuntimeStatistics] = Field(
+        description="Runtime statistics of the executed keywords, the most total time first"
+    )
@@ -0,0 +1,265 @@
+"""Service class to benchmark the phases of the analysis pipeline."""
+
+import logging
+import platform
+import tempfile
+import time
+from collections import defaultdict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TypeVar
+
+from roboview.core.metrics import get_peak_rss_bytes
+from roboview.registries.library_catalog import LibraryCatalog
+from roboview.schemas.domain.benchmarks import (
+    BenchmarkPhaseEnum,
+    BenchmarkResult,
+    CorpusBenchmark,
+    PhaseMeasurement,
+    PhaseRegression,
+)
+from roboview.services.file_register_service import FileRegistryService
+from roboview.services.keyword_register_service import KeywordRegistryService
+from roboview.services.keyword_similarity_service import KeywordSimilarityService
+from roboview.services.keyword_usage_service import KeywordUsageService
+from roboview.services.reporting_service import ReportingService
+from roboview.services.robocop_register_service import RobocopRegistryService
+from roboview.services.robocop_service import RobocopService
+from roboview.utils.directory_parsing import DirectoryParser
+from roboview.utils.exporters.html_exporter import HTMLExporter
+from roboview.utils.project_generator import ProjectGeneratorConfig
+
+logger = logging.getLogger(__name__)
+
+# Keywords per generated resource file, generated corpora differ only in the number of files
+_CORPUS_KEYWORDS_PER_FILE = 50
+
+ResultT = TypeVar("ResultT")
+
+
+class BenchmarkService:
+    """Service class to time the phases of the analysis pipeline on whole projects.
+
+    Each project runs through the same phases as ``roboview analyze``: directory discovery,
+    parsing, LibDoc loading, Robocop, keyword usage, similarity, report build and HTML export.
+    Every phase is measured by wall clock time, process CPU time and the peak resident set
+    size of the process. With several repetitions, the minimum times are reported. The peak
+    resident set size is the high-water mark of the whole process when the phase ends, so it
+    includes all earlier phases and never decreases from one phase to the next.
+
+    Attributes:
+        repetitions: Number of pipeline runs per project.
+        robocop_config_file: Robocop configuration used for all projects.
+
+    """
+
+    def __init__(self, repetitions: int = 1, robocop_config_file: Path | None = None) -> None:
+        """Initialize BenchmarkService.
+
+        Arguments:
+            repetitions (int): Number of pipeline runs per project (default: 1).
+            robocop_config_file (Path | None): Robocop configuration used for all projects (default: None).
+
+        """
+        self.repetitions = max(1, repetitions)
+        self.robocop_config_file = robocop_config_file
+
+    @staticmethod
+    def get_corpus_config(keywords: int, seed: int = 0) -> ProjectGeneratorConfig:
+        """Return the shape of a generated benchmark corpus with about the given number of keywords.
+
+        Arguments:
+            keywords (int): Number of keywords of the corpus.
+            seed (int): Seed of the generator (default: 0).
+
+        Returns:
+            ProjectGeneratorConfig: Shape of the corpus.
+
+        """
+        resource_files = max(1, round(keywords / _CORPUS_KEYWORDS_PER_FILE))
+        return ProjectGeneratorConfig(
+            resource_files=resource_files,
+            suite_files=max(1, resource_files // 4),
+            keywords_per_file=min(keywords, _CORPUS_KEYWORDS_PER_FILE),
+            seed=seed,
+        )
+
+    @staticmethod
+    @contextmanager
+    def _measure(
+        phase: BenchmarkPhaseEnum, measurements: dict[BenchmarkPhaseEnum, list[tuple[float, float]]]
+    ) -> Iterator[None]:
+        """Record wall clock and CPU time of the block as one run of a phase."""
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        yield
+        measurements[phase].append((time.perf_counter() - wall_start, time.process_time() - cpu_start))
+
+    def _run_pipeline(
+        self,
+        project_root: Path,
+        output_dir: Path,
+        measurements: dict[BenchmarkPhaseEnum, list[tuple[float, float]]],
+        peak_rss: dict[BenchmarkPhaseEnum, int | None],
+    ) -> tuple[int, int]:
+        """Run all phases once and return the number of user-defined keywords and files."""
+
+        def measure(phase: BenchmarkPhaseEnum, run: Callable[[], ResultT]) -> ResultT:
+            with self._measure(phase, measurements):
+                result = run()
+            peak_rss[phase] = get_peak_rss_bytes()
+            return result
+
+        directory_parser = DirectoryParser(project_root)
+        measure(
+            BenchmarkPhaseEnum.DISCOVERY,
+            lambda: (directory_parser.get_test_file_paths(), directory_parser.get_resource_file_paths()),
+        )
+
+        # A fresh catalog per run, so LibDoc loading is measured cold
+        keyword_registry_service = KeywordRegistryService(project_root, LibraryCatalog())
+        file_registry_service = FileRegistryService(project_root)
+        measure(
+            BenchmarkPhaseEnum.PARSING,
+            lambda: (keyword_registry_service.load_local_keywords(), file_registry_service.initialize()),
+        )
+        measure(BenchmarkPhaseEnum.LIBDOC, keyword_registry_service.load_library_keywords)
+        keyword_registry = keyword_registry_service.get_keyword_registry()
+        file_registry = file_registry_service.get_file_registry()
+
+        robocop_registry_service = RobocopRegistryService(project_root, self.robocop_config_file)
+        measure(BenchmarkPhaseEnum.ROBOCOP, robocop_registry_service.initialize)
+        robocop_registry = robocop_registry_service.get_robocop_registry()
+
+        keyword_usage_service = KeywordUsageService(keyword_registry, file_registry)
+        measure(
+            BenchmarkPhaseEnum.USAGE,
+            lambda: (
+                keyword_usage_service.get_most_used_user_defined_keywords(10),
+                keyword_usage_service.get_most_used_external_or_builtin_keywords(10),
+                keyword_usage_service.get_keywords_without_usages(),
+            ),
+        )
+
+        # Without a persistent index, so the full calculation is measured
+        keyword_similarity_service = KeywordSimilarityService(keyword_registry)
+        measure(BenchmarkPhaseEnum.SIMILARITY, keyword_similarity_service.calculate_keyword_similarity_matrix)
+
+        reporting_service = ReportingService(
+            keyword_registry,
+            file_registry,
+            robocop_registry,
+            keyword_usage_service,
+            keyword_similarity_service,
+            RobocopService(robocop_registry),
+            project_root,
+        )
+        report = measure(BenchmarkPhaseEnum.REPORT, reporting_service.generate_report)
+        measure(BenchmarkPhaseEnum.HTML_EXPORT, lambda: HTMLExporter.export(report, output_dir / "report.html"))
+
+        return len(keyword_registry.get_user_defined_keywords()), len(file_registry)
+
+    def run_project(self, project_root: Path, corpus: str) -> CorpusBenchmark:
+        """Benchmark all pipeline phases on one project.
+
+        Arguments:
+            project_root (Path): Root directory of the project.
+            corpus (str): Name identifying the project across benchmark runs.
+
+        Returns:
+            CorpusBenchmark: Measurements per phase.
+
+        """
+        measurements: dict[BenchmarkPhaseEnum, list[tuple[float, float]]] = defaultdict(list)
+        peak_rss: dict[BenchmarkPhaseEnum, int | None] = {}
+        keywords, files = 0, 0
+
+        with tempfile.TemporaryDirectory(prefix="roboview-bench-") as output_dir:
+            for repetition in range(self.repetitions):
+                logger.info("Benchmarking %s, run %d of %d", corpus, repetition + 1, self.repetitions)
+                keywords, files = self._run_pipeline(project_root, Path(output_dir), measurements, peak_rss)
+
+        return CorpusBenchmark(
+            corpus=corpus,
+            keywords=keywords,
+            files=files,
+            phases=[
+                PhaseMeasurement(
+                    phase=phase,
+                    wall_seconds=min(wall for wall, _ in measurements[phase]),
+                    cpu_seconds=min(cpu for _, cpu in measurements[phase]),
+                    peak_rss_bytes=peak_rss.get(phase),
+                )
+                for phase in BenchmarkPhaseEnum
+            ],
+        )
+
+    def run(self, projects: list[tuple[str, Path]]) -> BenchmarkResult:
+        """Benchmark all pipeline phases on several projects.
+
+        Arguments:
+            projects (list[tuple[str, Path]]): Pairs of corpus name and project root directory.
+
+        Returns:
+            BenchmarkResult: Measurements per project and phase.
+
+        """
+        return BenchmarkResult(
+            python_version=platform.python_version(),
+            platform=platform.platform(),
+            repetitions=self.repetitions,
+            corpora=[self.run_project(project_root, corpus) for corpus, project_root in projects],
+        )
+
+    @staticmethod
+    def compare(
+        current: BenchmarkResult,
+        baseline: BenchmarkResult,
+        max_regression_percent: float = 20.0,
+        min_seconds: float = 0.05,
+    ) -> list[PhaseRegression]:
+        """Find phases whose wall clock time regressed against a baseline.
+
+        Phases are matched by corpus name and phase. Phases or corpora missing in either
+        result are ignored.
+
+        Arguments:
+            current (BenchmarkResult): Result of the current run.
+            baseline (BenchmarkResult): Stored baseline result.
+            max_regression_percent (float): Allowed slowdown in percent (default: 20.0).
+            min_seconds (float): Slowdowns below this absolute time are treated as noise (default: 0.05).
+
+        Returns:
+            list[PhaseRegression]: Regressed phases in the order of the current result.
+
+        """
+        baseline_times = {
+            (corpus.corpus, measurement.phase): measurement.wall_seconds
+            for corpus in baseline.corpora
+            for measurement in corpus.phases
+        }
+
+        regressions = []
+        for corpus in current.corpora:
+            for measurement in corpus.phases:
+                baseline_seconds = baseline_times.get((corpus.corpus, measurement.phase))
+                if baseline_seconds is None:
+                    continue
+
+                slowdown = measurement.wall_seconds - baseline_seconds
+                if slowdown <= min_seconds or slowdown <= baseline_seconds * max_regression_percent / 100:
+                    continue
+
+                regressions.append(
+                    PhaseRegression(
+                        corpus=corpus.corpus,
+                        phase=measurement.phase,
+                        baseline_seconds=baseline_seconds,
+                        current_seconds=measurement.wall_seconds,
+                        change_percent=round(slowdown / baseline_seconds * 100, 1)
+                        if baseline_seconds
+                        else float("inf"),
+                    )
+                )
+        return regressions
@@ -7,6 +7,7 @@ from robot.parsing import get_model, get_resource_model
 from roboview.models.robot_parsing.called_keyword_parsing import CalledKeywordFinder
 from roboview.models.robot_parsing.local_keyword_parsing import LocalKeywordNameFinder
 from roboview.models.robot_parsing.resource_dependency_parsing import ResourceDependencyFinder
+from roboview.models.robot_parsing.test_case_parsing import TestCaseFinder
 from roboview.registries.file_registry import FileRegistry
 from roboview.schemas.domain.common import FileType
 from roboview.schemas.domain.files import FileProperties
@@ -105,6 +106,9 @@ class FileRegistryService:
             resource_dependency_parser = ResourceDependencyFinder()
             resource_dependency_parser.visit(model)
 
+            test_case_parser = TestCaseFinder()
+            test_case_parser.visit(model)
+
             self.file_registry.register(
                 FileProperties(
                     file_name=file_path.name,
@@ -113,6 +117,9 @@ class FileRegistryService:
                     initialized_keywords=initialized_kw_parser.keywords,
                     called_keywords=called_kw_parser.called_keywords,
                     imported_files=resource_dependency_parser.imports,
+                    resource_imports=resource_dependency_parser.import_paths,
+                    test_cases=test_case_parser.get_test_cases(),
+                    setting_keywords=test_case_parser.suite_keywords,
                 )
             )
 
@@ -6,9 +6,11 @@ from pathlib import Path
 from robot.errors import DataError
 from robot.libdocpkg import LibraryDocumentation
 from robot.parsing import get_model, get_resource_model
+from roboview.core.snapshot import stable_id
 from roboview.models.robot_parsing.keyword_dependency_parsing import KeywordDependencyFinder
 from roboview.models.robot_parsing.local_keyword_parsing import LocalKeywordFinder
 from roboview.registries.keyword_registry import KeywordRegistry
+from roboview.registries.library_catalog import LibraryCatalog
 from roboview.schemas.domain.common import BuiltinLibraryType, ExternalLibraryType, FileType
 from roboview.schemas.domain.keywords import KeywordProperties
 from roboview.utils.directory_parsing import DirectoryParser
@@ -28,18 +30,21 @@ class KeywordRegistryService:
     Attributes:
         directory_parser: Parser for discovering Robot Framework files.
         registry: Central registry for keyword lookup.
+        library_catalog: Shared library keyword metadata, None loads libraries for this registry only.
 
     """
 
-    def __init__(self, project_root_dir: Path) -> None:
+    def __init__(self, project_root_dir: Path, library_catalog: LibraryCatalog | None = None) -> None:
         """Initialize the keyword analysis service.
 
         Arguments:
             project_root_dir (Path): Path to the project root directory.
+            library_catalog (LibraryCatalog | None): Catalog sharing library keywords between projects.
 
         """
         self.directory_parser = DirectoryParser(project_root_dir)
         self.registry = KeywordRegistry()
+        self.library_catalog = library_catalog
 
     def initialize(self) -> None:
         """Initialize the keyword registry by loading all keywords.
@@ -74,6 +79,15 @@ class KeywordRegistryService:
 
         logger.info("Registry initialized with %d keywords", len(self.registry))
 
+    def load_local_keywords(self) -> None:
+        """Register the keywords of the project's .robot and .resource files, the first step of initialize."""
+        self._load_local_keywords()
+
+    def load_library_keywords(self) -> None:
+        """Register the keywords of the built-in and installed external libraries, the last steps of initialize."""
+        self._load_builtin_library_keywords()
+        self._load_external_library_keywords()
+
     def _load_local_keywords(self) -> None:
         """Load local keywords from Robot Framework files."""
         try:
@@ -108,36 +122,56 @@ class KeywordRegistryService:
         try:
             model = get_resource_model(file_path) if file_type.RESOURCE else get_model(file_path)
 
-            local_kw_parser = LocalKeywordFinder(file_path)
+            local_kw_parser = LocalKeywordFinder(file_path, self.directory_parser.project_root_path)
             local_kw_parser.visit(model)
 
             kw_dependency_finder = KeywordDependencyFinder(file_path)
             kw_dependency_finder.visit(model)
 
+            # Built once per file, rebuilding it per keyword is quadratic in the keywords of the file
+            dependency_map = self._get_dependency_map(kw_dependency_finder)
             for keyword in local_kw_parser.keyword_doc:
-                enriched_keyword = self._enrich_with_called_keywords(kw_dependency_finder, keyword)
-                self.registry.register(enriched_keyword)
+                enriched_keyword = self._enrich_with_called_keywords(kw_dependency_finder, keyword, dependency_map)
+                self.registry.register(enriched_keyword, local_kw_parser.keyword_tokens.get(keyword.keyword_id))
 
         except Exception:
             logger.exception("Error parsing file: %s", file_path)
 
+    @staticmethod
+    def _get_dependency_map(keyword_dependency_finder: KeywordDependencyFinder) -> dict[str, list[str]]:
+        """Map the keyword names of a file to their called keywords.
+
+        Arguments:
+            keyword_dependency_finder (KeywordDependencyFinder): Initialized KeywordDependencyFinder instance.
+
+        Returns:
+            dict[str, list[str]]: Called keywords by keyword name.
+
+        """
+        return {
+            item["keyword_name"]: item["called_keywords"] for item in keyword_dependency_finder.get_formatted_result()
+        }
+
     @staticmethod
     def _enrich_with_called_keywords(
-        keyword_dependency_finder: KeywordDependencyFinder, keyword_doc: KeywordProperties
+        keyword_dependency_finder: KeywordDependencyFinder,
+        keyword_doc: KeywordProperties,
+        dependency_map: dict[str, list[str]] | None = None,
     ) -> KeywordProperties:
         """Add found called keywords to an KeywordProperties object.
 
         Arguments:
             keyword_dependency_finder (KeywordDependencyFinder): Initialized KeywordDependencyFinder instance.
             keyword_doc: KeywordProperties object for the particular keyword.
+            dependency_map (dict[str, list[str]] | None): Dependency map of the file, built from the
+                finder if not given (default: None).
 
         Returns:
             KeywordProperties: KeywordProperties object with called keywords.
 
         """
-        dependency_map = {
-            item["keyword_name"]: item["called_keywords"] for item in keyword_dependency_finder.get_formatted_result()
-        }
+        if dependency_map is None:
+            dependency_map = KeywordRegistryService._get_dependency_map(keyword_dependency_finder)
 
         keyword_name = keyword_doc.keyword_name_without_prefix
         keyword_doc.called_keywords = dependency_map.get(keyword_name, [])
@@ -159,7 +193,7 @@ class KeywordRegistryService:
 
         for library_type in libraries:
             try:
-                keyword_doc = self._get_library_keywords(library_type)
+                keyword_doc = self._load_library_keywords(library_type)
                 for keyword in keyword_doc:
                     self.registry.register(keyword)
             except Exception:
@@ -178,7 +212,7 @@ class KeywordRegistryService:
 
         for library_type in libraries:
             try:
-                keyword_doc = self._get_library_keywords(library_type)
+                keyword_doc = self._load_library_keywords(library_type)
                 for keyword in keyword_doc:
                     self.registry.register(keyword)
 
@@ -186,6 +220,22 @@ class KeywordRegistryService:
                 logger.exception("Failed to load library: %s", library_type.value)
                 continue
 
+    def _load_library_keywords(
+        self, library_type: BuiltinLibraryType | ExternalLibraryType
+    ) -> list[KeywordProperties] | tuple[KeywordProperties, ...]:
+        """Get keyword metadata for a library, from the shared library catalog if available.
+
+        Arguments:
+            library_type: The library type to load.
+
+        Returns:
+            Keyword metadata of the library.
+
+        """
+        if self.library_catalog is None:
+            return self._get_library_keywords(library_type)
+        return self.library_catalog.get(library_type.value, lambda: self._get_library_keywords(library_type))
+
     @staticmethod
     def _get_library_keywords(library_type: BuiltinLibraryType | ExternalLibraryType) -> list[KeywordProperties]:
         """Get keyword metadata for a specific library.
@@ -207,6 +257,7 @@ class KeywordRegistryService:
 
                 keywords_metadata.append(
                     KeywordProperties(
+                        keyword_id=stable_id(lib_name, keyword.name),
                         file_name=lib_name,
                         keyword_name_without_prefix=keyword.name,
                         keyword_name_with_prefix=str(keyword_with_prefix),
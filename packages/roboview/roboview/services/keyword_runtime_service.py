@@ -0,0 +1,106 @@
+"""Service class implementing the keyword runtime statistics functionality."""
+
+import logging
+from pathlib import Path
+
+from roboview.registries.keyword_registry import KeywordRegistry
+from roboview.schemas.domain.keywords import KeywordProperties
+from roboview.schemas.domain.runtime import KeywordRuntimeStatistics, RuntimeIngestionSummary
+from roboview.utils.output_xml import ExecutedKeyword, KeywordRuntimeAggregator
+
+logger = logging.getLogger(__name__)
+
+
+class KeywordRuntimeService:
+    """Class to provide the runtime statistics of keywords from Robot Framework output files."""
+
+    def __init__(self, keyword_registry: KeywordRegistry) -> None:
+        """Initialize KeywordRuntimeService.
+
+        Arguments:
+            keyword_registry (KeywordRegistry): Initialized keyword registry object.
+
+        Attributes:
+            keyword_registry (KeywordRegistry): Initialized keyword registry object.
+            _statistics: Runtime statistics of all executed keywords, the most total time first.
+
+        """
+        self.keyword_registry = keyword_registry
+        self._statistics: list[KeywordRuntimeStatistics] = []
+
+    def ingest_output_files(self, output_files: list[Path]) -> RuntimeIngestionSummary:
+        """Aggregate the keyword runtimes of output files and attach them to the registered keywords.
+
+        The statistics replace those of an earlier ingestion. Executed keywords that match no
+        registered keyword, e.g. of libraries that were not analyzed, are kept without keyword id.
+
+        Arguments:
+            output_files (list[Path]): Robot Framework output.xml files, e.g. of the shards of a run.
+
+        Returns:
+            RuntimeIngestionSummary: Number of files, keyword calls and matched keywords.
+
+        Raises:
+            OutputXmlError: If a file is not well-formed XML.
+            OSError: If a file cannot be read.
+
+        """
+        aggregator = KeywordRuntimeAggregator()
+        for output_file in output_files:
+            aggregator.feed(output_file)
+
+        statistics = []
+        attached: dict[str, KeywordRuntimeStatistics] = {}
+        for executed in aggregator.get_executed_keywords():
+            keyword_statistics = executed.statistics
+            keyword = self._find_keyword(executed)
+            if keyword is not None and keyword.keyword_id not in attached:
+                keyword_statistics = keyword_statistics.model_copy(
+                    update={"keyword_id": keyword.keyword_id, "source": keyword.source}
+                )
+                attached[keyword.keyword_id] = keyword_statistics
+            statistics.append(keyword_statistics)
+
+        self.keyword_registry.attach_runtime_statistics(attached)
+        self._statistics = statistics
+        logger.info(
+            "Ingested %d keyword calls of %d keywords, %d are registered",
+            aggregator.call_count,
+            len(statistics),
+            len(attached),
+        )
+        return RuntimeIngestionSummary(
+            output_files=aggregator.file_count,
+            keyword_calls=aggregator.call_count,
+            keywords=len(statistics),
+            matched_keywords=len(attached),
+        )
+
+    def _find_keyword(self, executed: ExecutedKeyword) -> KeywordProperties | None:
+        """Return the registered keyword of an executed keyword.
+
+        Keywords of suite files have no owner in the output, of several keywords sharing the name
+        the one defined in a file named like the suite source is taken.
+        """
+        if executed.owner:
+            return self.keyword_registry.resolve(f"{executed.owner}.{executed.name}")
+
+        candidates = self.keyword_registry.resolve_all(executed.name)
+        if executed.suite_source:
+            suite_file_name = Path(executed.suite_source).name
+            for keyword in candidates:
+                if keyword.is_user_defined and keyword.file_name == suite_file_name:
+                    return keyword
+        return candidates[0] if candidates else None
+
+    def get_slowest_keywords(self, limit: int | None = None) -> list[KeywordRuntimeStatistics]:
+        """Return the executed keywords ranked by the total time spent in them.
+
+        Arguments:
+            limit (int | None): Maximum number of keywords, all if None.
+
+        Returns:
+            list[KeywordRuntimeStatistics]: Runtime statistics, the most total time first.
+
+        """
+        return self._statistics[:limit] if limit is not None else list(self._statistics)
@@ -1,16 +1,45 @@
 """Functionality to cover the KeywordSimilarity."""
 
+import hashlib
+import heapq
 import logging
-from collections import Counter
+import time
+from array import array
+from collections import Counter, defaultdict
+from collections.abc import Iterator
 from math import sqrt
+from pathlib import Path
+from typing import NamedTuple
 
-from pygments import lex
-from pygments.lexers import get_lexer_by_name
+from robot.api.parsing import Token
+from robot.variables import search_variable
+from roboview.core.metrics import CACHE_LOOKUPS, SIMILARITY_CALCULATION_DURATION, SIMILARITY_CALCULATIONS
+from roboview.models.robot_parsing.local_keyword_parsing import LocalKeywordFinder
 from roboview.registries.keyword_registry import KeywordRegistry
 from roboview.schemas.domain.keywords import KeywordProperties, SimilarKeyword
+from roboview.schemas.domain.reports import DuplicateKeywordPair
+from roboview.utils.similarity_index import NeighbourLists, SimilarityIndex
 
 logger = logging.getLogger(__name__)
 
+# Token types whose value is a variable name that can be normalized
+_VARIABLE_TOKEN_TYPES = frozenset({Token.VARIABLE, Token.ASSIGN})
+
+
+class SparseVector(NamedTuple):
+    """Sparse token frequency vector of a keyword.
+
+    Attributes:
+        ids: Ascending token IDs of the vocabulary.
+        counts: Frequency of the token with the same position in ids.
+        norm: Euclidean norm of the vector.
+
+    """
+
+    ids: array
+    counts: array
+    norm: float
+
 
 class KeywordSimilarityService:
     """Class for calculating and querying the similarity between Keywords.
@@ -19,148 +48,584 @@ class KeywordSimilarityService:
     files using token frequency vectors and cosine similarity metrics. It can identify
     similar keywords based on their source code structure and content.
 
+    If an index path is given, the neighbour lists are persisted as memory-mapped similarity
+    index keyed by per-keyword content hashes. Later calculations only re-score new or changed
+    keywords and skip the similarity calculation entirely if no keyword has changed.
+
     Attributes:
         keyword_registry (KeywordRegistry): Initialized KeywordRegistry object.
-        keyword_names_list: List containing all keyword names.
-        similarity_matrix: Similarity matrix containing all keyword similarity scores.
+        normalize_variables (bool): Whether variable names are ignored when comparing keywords.
+        index_path (Path | None): Path of the persistent similarity index, None disables persistence.
+        index_top_k (int): Number of neighbours kept per keyword and stored in the similarity index.
+        keyword_names_list: List containing all keyword names, one entry per row.
+        _keywords: Keyword properties per row.
+        _row_hashes: Content hash per row, None if it has not been calculated yet.
+        _neighbours: Per row, the index_top_k best other rows with a non-zero score sorted by descending score.
+        _row_index: Mapping of keyword name with prefix to its row.
 
     """
 
-    def __init__(self, keyword_registry: KeywordRegistry) -> None:
+    def __init__(
+        self,
+        keyword_registry: KeywordRegistry,
+        *,
+        normalize_variables: bool = False,
+        index_path: Path | None = None,
+        index_top_k: int = 100,
+    ) -> None:
         """Initialize KeywordSimilarity with a project directory path.
 
         Arguments:
             keyword_registry (KeywordRegistry): Initialized KeywordRegistry object.
+            normalize_variables (bool): Replace variable names by their type, so keywords that
+                only differ in variable naming are considered equal (default: False).
+            index_path (Path | None): Path of the persistent similarity index (default: None).
+            index_top_k (int): Number of neighbours kept per keyword and stored in the similarity
+                index (default: 100).
 
         """
         self.keyword_registry = keyword_registry
-        self.keyword_names_list = []
-        self.similarity_matrix: list[list[float]] = []
+        self.normalize_variables = normalize_variables
+        self.index_path = index_path
+        self.index_top_k = index_top_k
+        self.keyword_names_list: list[str] = []
+        self._keywords: list[KeywordProperties] = []
+        self._row_hashes: list[int] | None = []
+        self._neighbours: NeighbourLists = []
+        self._row_index: dict[str, int] = {}
 
     @staticmethod
-    def _calculate_cosine_similarity(
-        vector_a: Counter[str],
-        vector_b: Counter[str],
-        norm_a: float,
-        norm_b: float,
-    ) -> float:
-        """Calculate cosine similarity for two sparse token vectors.
+    def _normalize_variable_token(token: str) -> str:
+        """Replace the variable name of a ``VARIABLE`` or ``ASSIGN`` token by an empty name.
 
         Arguments:
-            vector_a (Counter[str]): Sparse token frequency vector for the first keyword.
-            vector_b (Counter[str]): Sparse token frequency vector for the second keyword.
-            norm_a (float): Precomputed Euclidean norm of vector_a.
-            norm_b (float): Precomputed Euclidean norm of vector_b.
+            token (str): Token as ``TYPE:value`` string.
 
         Returns:
-            float: Cosine similarity score in range [0.0, 1.0]. Returns 0.0 if one
-                of the vectors has a zero norm.
+            str: Token with the variable name removed, e.g. ``ASSIGN:${}=`` for ``ASSIGN:${result}=``.
 
         """
-        if norm_a == 0.0 or norm_b == 0.0:
-            return 0.0
+        token_type, _, value = token.partition(":")
+        if token_type not in _VARIABLE_TOKEN_TYPES:
+            return token
+
+        match = search_variable(value.removesuffix("=").rstrip(), ignore_errors=True)
+        if not match.is_variable():
+            return token
+
+        normalized = f"{match.identifier}{{}}" + "[]" * len(match.items)
+        if value.endswith("="):
+            normalized += "="
+        return f"{token_type}:{normalized}"
+
+    def _get_keyword_tokens(
+        self,
+        keyword: KeywordProperties,
+        parsed_tokens: dict[str, list[str]] | None = None,
+    ) -> list[str]:
+        """Return the similarity tokens of a keyword.
+
+        Uses the Robot Framework tokens collected during parsing. Keywords without collected
+        tokens are parsed again from their code, if that fails as well they fall back to the
+        whitespace-separated words of their code.
 
-        if len(vector_a) > len(vector_b):
-            vector_a, vector_b = vector_b, vector_a
+        Arguments:
+            keyword (KeywordProperties): Keyword to get the tokens for.
+            parsed_tokens (dict[str, list[str]] | None): Tokens collected during parsing by keyword id.
 
-        dot_product = sum(value * vector_b.get(token, 0) for token, value in vector_a.items())
-        return dot_product / (norm_a * norm_b)
+        Returns:
+            list[str]: Tokens of the keyword.
 
-    def _build_similarity_matrix(self, tokenized_keywords: list[str]) -> list[list[float]]:
-        """Build a full pairwise similarity matrix for tokenized keywords.
+        """
+        tokens = (parsed_tokens or {}).get(keyword.keyword_id) or LocalKeywordFinder.collect_code_tokens(keyword.code)
+        if not tokens:
+            return [f"TEXT:{word}" for word in keyword.code.split()]
+        if self.normalize_variables:
+            return [self._normalize_variable_token(token) for token in tokens]
+        return tokens
+
+    @staticmethod
+    def _hash_keyword(keyword: KeywordProperties, tokens: list[str]) -> int:
+        """Return the content hash identifying a keyword in the similarity index.
 
         Arguments:
-            tokenized_keywords (list[str]): List of whitespace-separated token strings,
-                one entry per keyword.
+            keyword (KeywordProperties): Keyword to hash.
+            tokens (list[str]): Similarity tokens of the keyword.
 
         Returns:
-            list[list[float]]: Symmetric cosine similarity matrix where matrix[i][j]
-                represents the similarity between keyword i and keyword j.
+            int: Unsigned 64-bit hash of source, name and tokens of the keyword.
 
         """
-        token_vectors = [Counter(tokens.split()) for tokens in tokenized_keywords]
-        norms = [sqrt(sum(value * value for value in token_vector.values())) for token_vector in token_vectors]
-
-        vector_count = len(token_vectors)
-        similarity_matrix = [[0.0] * vector_count for _ in range(vector_count)]
-
-        for i in range(vector_count):
-            similarity_matrix[i][i] = 1.0
-            for j in range(i + 1, vector_count):
-                similarity = self._calculate_cosine_similarity(
-                    token_vectors[i],
-                    token_vectors[j],
-                    norms[i],
-                    norms[j],
+        digest = hashlib.blake2b(digest_size=8)
+        for part in (keyword.source, keyword.keyword_name_with_prefix, *tokens):
+            digest.update(str(part).encode())
+            digest.update(b"\x1f")
+        return int.from_bytes(digest.digest(), "little")
+
+    def _vectorize_keywords(
+        self,
+        keywords: list[KeywordProperties],
+        parsed_tokens: dict[str, list[str]] | None = None,
+    ) -> list[SparseVector]:
+        """Build integer-ID sparse token frequency vectors for keywords.
+
+        Arguments:
+            keywords (list[KeywordProperties]): Keywords to vectorize.
+            parsed_tokens (dict[str, list[str]] | None): Tokens collected during parsing by keyword id.
+
+        Returns:
+            list[SparseVector]: One vector per keyword, sharing a common vocabulary.
+
+        """
+        return self._vectorize_token_lists([self._get_keyword_tokens(keyword, parsed_tokens) for keyword in keywords])
+
+    @staticmethod
+    def _vectorize_token_lists(token_lists: list[list[str]]) -> list[SparseVector]:
+        """Build integer-ID sparse token frequency vectors from token lists.
+
+        Arguments:
+            token_lists (list[list[str]]): Similarity tokens, one entry per keyword.
+
+        Returns:
+            list[SparseVector]: One vector per token list, sharing a common vocabulary.
+
+        """
+        vocabulary: dict[str, int] = {}
+        vectors = []
+        for tokens in token_lists:
+            counts = Counter(vocabulary.setdefault(token, len(vocabulary)) for token in tokens)
+            token_ids = sorted(counts)
+            vectors.append(
+                SparseVector(
+                    ids=array("I", token_ids),
+                    counts=array("I", (counts[token_id] for token_id in token_ids)),
+                    norm=sqrt(sum(count * count for count in counts.values())),
                 )
-                similarity_matrix[i][j] = similarity
-                similarity_matrix[j][i] = similarity
+            )
+        return vectors
+
+    @staticmethod
+    def _push_neighbour(heap: list[tuple[float, int]], other_row: int, score: float, top_k: int) -> None:
+        """Add a neighbour to the bounded min-heap of a row, keeping only its top_k best neighbours.
+
+        Entries are (score, -row), so the heap root is the worst neighbour: the lowest score and,
+        among equal scores, the highest row.
+        """
+        entry = (score, -other_row)
+        if len(heap) < top_k:
+            heapq.heappush(heap, entry)
+        elif entry > heap[0]:
+            heapq.heapreplace(heap, entry)
+
+    @staticmethod
+    def _to_neighbour_list(heap: list[tuple[float, int]]) -> list[tuple[int, float]]:
+        """Return the (row, score) pairs of a neighbour heap sorted by descending score and ascending row."""
+        return [(-negative_row, score) for score, negative_row in sorted(heap, reverse=True)]
+
+    @staticmethod
+    def _build_neighbour_lists(vectors: list[SparseVector], top_k: int) -> list[list[tuple[int, float]]]:
+        """Build presorted neighbour lists from sparse token vectors.
+
+        Dot products are accumulated through an inverted index from token ID to the keywords
+        containing it, so only pairs sharing at least one token are visited and every pair is
+        scored once. Every row keeps a bounded heap of its top_k best neighbours, so memory
+        grows linearly with the number of keywords although most keywords share common tokens.
+
+        Arguments:
+            vectors (list[SparseVector]): Token vectors, one entry per keyword.
+            top_k (int): Maximum number of neighbours kept per keyword.
+
+        Returns:
+            list[list[tuple[int, float]]]: Per keyword, the (row, score) pairs of the top_k other keywords
+                with a non-zero cosine similarity, sorted by descending score and ascending row.
+
+        """
+        heaps: list[list[tuple[float, int]]] = [[] for _ in vectors]
+        postings: defaultdict[int, list[tuple[int, int]]] = defaultdict(list)
+        push_neighbour = KeywordSimilarityService._push_neighbour
+
+        for row, vector in enumerate(vectors):
+            if vector.norm == 0.0:
+                continue
+
+            dot_products: defaultdict[int, int] = defaultdict(int)
+            for token_id, count in zip(vector.ids, vector.counts, strict=True):
+                token_postings = postings[token_id]
+                for other_row, other_count in token_postings:
+                    dot_products[other_row] += count * other_count
+                token_postings.append((row, count))
+
+            for other_row, dot_product in dot_products.items():
+                similarity = min(1.0, dot_product / (vector.norm * vectors[other_row].norm))
+                push_neighbour(heaps[row], other_row, similarity, top_k)
+                push_neighbour(heaps[other_row], row, similarity, top_k)
+
+        return [KeywordSimilarityService._to_neighbour_list(heap) for heap in heaps]
+
+    @staticmethod
+    def _score_rows(vectors: list[SparseVector], rows: list[int]) -> Iterator[tuple[int, dict[int, float]]]:
+        """Score selected keywords against all other keywords, one row at a time.
+
+        Arguments:
+            vectors (list[SparseVector]): Token vectors, one entry per keyword.
+            rows (list[int]): Rows to score.
+
+        Yields:
+            tuple[int, dict[int, float]]: Scored row and its non-zero cosine similarity to every other row.
+
+        """
+        postings: defaultdict[int, list[tuple[int, int]]] = defaultdict(list)
+        for row, vector in enumerate(vectors):
+            if vector.norm == 0.0:
+                continue
+            for token_id, count in zip(vector.ids, vector.counts, strict=True):
+                postings[token_id].append((row, count))
+
+        for row in rows:
+            vector = vectors[row]
+            dot_products: defaultdict[int, int] = defaultdict(int)
+            if vector.norm != 0.0:
+                for token_id, count in zip(vector.ids, vector.counts, strict=True):
+                    for other_row, other_count in postings[token_id]:
+                        dot_products[other_row] += count * other_count
+            dot_products.pop(row, None)
+
+            yield (
+                row,
+                {
+                    other_row: min(1.0, dot_product / (vector.norm * vectors[other_row].norm))
+                    for other_row, dot_product in dot_products.items()
+                },
+            )
+
+    def _update_neighbour_lists(
+        self,
+        vectors: list[SparseVector],
+        row_hashes: list[int],
+        index: SimilarityIndex,
+    ) -> list[list[tuple[int, float]]]:
+        """Build presorted neighbour lists by re-scoring only new or changed keywords.
+
+        Neighbours of unchanged keywords are taken over from the index and completed with the
+        scores of the changed keywords. An unchanged keyword is re-scored as well if its stored
+        list was cut off at top_k and lost entries, as its further neighbours are unknown.
+
+        Arguments:
+            vectors (list[SparseVector]): Token vectors, one entry per keyword.
+            row_hashes (list[int]): Content hash per keyword.
+            index (SimilarityIndex): Similarity index of an earlier calculation.
+
+        Returns:
+            list[list[tuple[int, float]]]: Per keyword, the (row, score) pairs of the top_k other keywords
+                with a non-zero cosine similarity, sorted by descending score and ascending row.
+
+        """
+        index_row_map = index.row_map
+        new_rows_by_old_row: dict[int, int] = {}
+        for row, row_hash in enumerate(row_hashes):
+            old_row = index_row_map.get(row_hash)
+            if old_row is not None and old_row not in new_rows_by_old_row:
+                new_rows_by_old_row[old_row] = row
+
+        changed_rows = set(range(len(vectors))).difference(new_rows_by_old_row.values())
+        rescored_rows = set(changed_rows)
+        neighbours: list[list[tuple[int, float]]] = [[] for _ in vectors]
+
+        for old_row, row in new_rows_by_old_row.items():
+            stored_neighbours = index[old_row]
+            kept_neighbours = [
+                (new_rows_by_old_row[neighbour_row], score)
+                for neighbour_row, score in stored_neighbours
+                if neighbour_row in new_rows_by_old_row
+            ]
+            if len(stored_neighbours) >= index.top_k and len(kept_neighbours) < len(stored_neighbours):
+                rescored_rows.add(row)
+            else:
+                neighbours[row] = kept_neighbours
+
+        logger.info("Re-scoring %d of %d keywords for similarity", len(rescored_rows), len(vectors))
+
+        self._merge_rescored_rows(vectors, rescored_rows, changed_rows, neighbours)
+        return neighbours
+
+    def _merge_rescored_rows(
+        self,
+        vectors: list[SparseVector],
+        rescored_rows: set[int],
+        changed_rows: set[int],
+        neighbours: list[list[tuple[int, float]]],
+    ) -> None:
+        """Score the rescored rows and add the changed rows to the neighbour lists of unchanged rows.
+
+        Arguments:
+            vectors (list[SparseVector]): Token vectors, one entry per keyword.
+            rescored_rows (set[int]): Rows to score against all other rows.
+            changed_rows (set[int]): New or changed rows, a subset of rescored_rows.
+            neighbours (list[list[tuple[int, float]]]): Presorted neighbour lists, updated in place.
+
+        """
+        top_k = self.index_top_k
+        # Bounded heaps of the rescored rows and of the unchanged rows gaining changed neighbours
+        heaps: dict[int, list[tuple[float, int]]] = {}
+        for row, row_scores in self._score_rows(vectors, sorted(rescored_rows)):
+            heap = heaps[row] = []
+            for other_row, score in row_scores.items():
+                self._push_neighbour(heap, other_row, score, top_k)
+            if row not in changed_rows:
+                continue
+            for other_row, score in row_scores.items():
+                if other_row in rescored_rows:
+                    continue
+                other_heap = heaps.get(other_row)
+                if other_heap is None:
+                    other_heap = heaps[other_row] = [
+                        (neighbour_score, -neighbour_row) for neighbour_row, neighbour_score in neighbours[other_row]
+                    ]
+                    heapq.heapify(other_heap)
+                self._push_neighbour(other_heap, row, score, top_k)
+
+        for row, heap in heaps.items():
+            neighbours[row] = self._to_neighbour_list(heap)
+
+    def _load_index(self) -> SimilarityIndex | None:
+        """Load the persisted similarity index if it matches the current configuration."""
+        if self.index_path is None:
+            return None
+
+        index = SimilarityIndex.load(self.index_path)
+        if index is not None and (
+            index.top_k != self.index_top_k or index.normalize_variables != self.normalize_variables
+        ):
+            logger.info("Similarity index was built with other settings, rebuilding it")
+            index.close()
+            return None
+        return index
+
+    def _reuse_index(self, index: SimilarityIndex, keywords: list[KeywordProperties], row_hashes: list[int]) -> bool:
+        """Use the persisted similarity index as is if it covers exactly the given keywords.
+
+        Arguments:
+            index (SimilarityIndex): Loaded similarity index.
+            keywords (list[KeywordProperties]): Current keywords.
+            row_hashes (list[int]): Content hash per keyword.
+
+        Returns:
+            bool: True if the index is up to date and has been set as neighbour lists.
+
+        """
+        index_row_map = index.row_map
+        if len(index) != len(keywords) or len(index_row_map) != len(index) or len(set(row_hashes)) != len(keywords):
+            return False
+
+        ordered_keywords: list[KeywordProperties | None] = [None] * len(index)
+        for keyword, row_hash in zip(keywords, row_hashes, strict=True):
+            row = index_row_map.get(row_hash)
+            if row is None:
+                return False
+            ordered_keywords[row] = keyword
+
+        keywords_by_row = [keyword for keyword in ordered_keywords if keyword is not None]
+        if len(keywords_by_row) != len(index):
+            return False
+
+        self._set_neighbours(keywords_by_row, index, list(index.row_hashes))
+        return True
+
+    def _store_index(
+        self,
+        keywords: list[KeywordProperties],
+        row_hashes: list[int],
+        neighbours: list[list[tuple[int, float]]],
+    ) -> None:
+        """Persist neighbour lists and serve them from the memory-mapped index.
 
-        return similarity_matrix
+        Arguments:
+            keywords (list[KeywordProperties]): Keyword properties, one entry per row.
+            row_hashes (list[int]): Content hash per row.
+            neighbours (list[list[tuple[int, float]]]): Presorted neighbour lists, one entry per row.
+
+        """
+        if self.index_path is None:
+            return
+
+        try:
+            SimilarityIndex.write(
+                self.index_path,
+                row_hashes,
+                neighbours,
+                self.index_top_k,
+                normalize_variables=self.normalize_variables,
+            )
+        except OSError:
+            logger.warning("Could not write similarity index: %s", self.index_path, exc_info=True)
+            return
+
+        index = SimilarityIndex.load(self.index_path)
+        if index is not None:
+            self._set_neighbours(keywords, index, list(index.row_hashes))
 
     def calculate_keyword_similarity_matrix(self) -> None:
-        """Calculate the keyword similarity matrix using token vectors and cosine similarity.
+        """Calculate the keyword similarities using token vectors and cosine similarity.
 
-        Analyzes keyword source code to compute similarity scores between all keywords
-        in the project using tokenization and vectorization techniques.
+        Compares the Robot Framework tokens collected while parsing the keywords, which are
+        taken from the registry and released afterwards. The scores are stored as presorted
+        neighbour lists per keyword. With a persistent similarity index,
+        only new or changed keywords are re-scored.
 
         Raises:
-            Exception: Logs errors during tokenization, vectorization, or similarity calculation.
+            Exception: Logs errors during vectorization or similarity calculation.
 
         """
         try:
             keywords = self.keyword_registry.get_user_defined_keywords()
+            parsed_tokens = self.keyword_registry.take_similarity_tokens()
 
             if len(keywords) == 0:
                 logger.warning("No keywords found. Similarity matrix cannot be computed.")
                 return
 
-            keyword_names_list = [k.keyword_name_with_prefix for k in keywords]
-            keyword_code_list = [k.code for k in keywords]
-
-            # Tokenize keyword source code
+            # Collect tokens and content hashes
             try:
-                lexer = get_lexer_by_name("text")
-                tokenized_keywords = []
-
-                for keyword_code in keyword_code_list:
-                    try:
-                        tokens = [token[1] for token in lex(keyword_code, lexer) if token[1].strip()]
-                        tokenized_keywords.append(" ".join(tokens))
-                    except Exception:
-                        logger.exception("Failed to tokenize keyword: %s", keyword_code)
-                        tokenized_keywords.append(keyword_code)
+                token_lists = [self._get_keyword_tokens(keyword, parsed_tokens) for keyword in keywords]
+                row_hashes = [
+                    self._hash_keyword(keyword, tokens) for keyword, tokens in zip(keywords, token_lists, strict=True)
+                ]
             except Exception:
-                logger.exception("Failed to initialize lexer or tokenize keywords")
+                logger.exception("Failed to vectorize keyword tokens")
                 return
 
-            # Create similarity matrix
-            try:
-                similarity_matrix = self._build_similarity_matrix(tokenized_keywords)
-            except Exception:
-                logger.exception("Failed to create vectors or calculate similarity matrix")
+            start = time.perf_counter()
+            index = self._load_index()
+            if index is not None and self._reuse_index(index, keywords, row_hashes):
+                logger.info("Similarity index is up to date, skipping similarity calculation")
+                self._record_calculation("reused", start)
                 return
-            else:
-                self.similarity_matrix = similarity_matrix
-                self.keyword_names_list = keyword_names_list
+
+            try:
+                # Build token vectors
+                try:
+                    vectors = self._vectorize_token_lists(token_lists)
+                except Exception:
+                    logger.exception("Failed to vectorize keyword tokens")
+                    return
+
+                # Create presorted neighbour lists
+                try:
+                    if index is None:
+                        neighbours = self._build_neighbour_lists(vectors, self.index_top_k)
+                    else:
+                        neighbours = self._update_neighbour_lists(vectors, row_hashes, index)
+                except Exception:
+                    logger.exception("Failed to create vectors or calculate similarity matrix")
+                    return
+            finally:
+                if index is not None:
+                    index.close()
+
+            self._set_neighbours(keywords, neighbours, row_hashes)
+            self._store_index(keywords, row_hashes, neighbours)
+            self._record_calculation("full" if index is None else "incremental", start)
 
         except Exception:
             logger.exception("Unexpected error during similarity matrix calculation")
             return
 
-    def get_n_most_similar_keywords(self, keyword_name: str, top_n: int) -> list[SimilarKeyword]:  # noqa: C901
-        """Return the n most similar keywords from the similarity matrix.
+    def _record_calculation(self, mode: str, start: float) -> None:
+        """Record a finished similarity calculation and whether the persisted index was reused."""
+        SIMILARITY_CALCULATIONS.inc(mode)
+        SIMILARITY_CALCULATION_DURATION.observe(time.perf_counter() - start, mode)
+        if self.index_path is not None:
+            CACHE_LOOKUPS.inc("similarity_index", "hit" if mode == "reused" else "miss")
+
+    @property
+    def indexed_keyword_count(self) -> int:
+        """Return the number of keywords with neighbour lists."""
+        return len(self._keywords)
+
+    @property
+    def is_memory_mapped(self) -> bool:
+        """Return whether the neighbour lists are served from a memory-mapped similarity index."""
+        return isinstance(self._neighbours, SimilarityIndex)
+
+    def _set_neighbours(
+        self,
+        keywords: list[KeywordProperties],
+        neighbours: NeighbourLists,
+        row_hashes: list[int] | None = None,
+    ) -> None:
+        """Store neighbour lists together with their keywords and the name to row index.
 
         Arguments:
-            keyword_name (str): The target keyword to find similarities for.
-            top_n (int): The number of similar keywords to return.
+            keywords (list[KeywordProperties]): Keyword properties, one entry per row.
+            neighbours (NeighbourLists): Presorted neighbour lists, one entry per row,
+                either in memory or served from a memory-mapped similarity index.
+            row_hashes (list[int] | None): Content hash per row, calculated on export if None (default: None).
+
+        """
+        # The previous index is no longer served, release its mapping so the file can be replaced
+        if isinstance(self._neighbours, SimilarityIndex) and self._neighbours is not neighbours:
+            self._neighbours.close()
+        self._keywords = keywords
+        self._row_hashes = row_hashes
+        self._neighbours = neighbours
+        self.keyword_names_list = [keyword.keyword_name_with_prefix for keyword in keywords]
+        self._row_index = {}
+        for row, keyword_name in enumerate(self.keyword_names_list):
+            self._row_index.setdefault(keyword_name, row)
+
+    def export_neighbours(self) -> tuple[list[KeywordProperties], list[int], NeighbourLists]:
+        """Return the calculated neighbour lists together with their keywords, e.g. to store them.
 
         Returns:
-            dict[str, str | dict[str, float]]: Dictionary containing:
-                - 'keyword': The target keyword name
-                - 'similar_keywords': Dict mapping similar keyword names to similarity scores
+            tuple[list[KeywordProperties], list[int], NeighbourLists]: Keyword
+                properties, content hash and presorted neighbour list, one entry per row.
+
+        """
+        if self._row_hashes is None:
+            self._row_hashes = [
+                self._hash_keyword(keyword, self._get_keyword_tokens(keyword)) for keyword in self._keywords
+            ]
+        return self._keywords, self._row_hashes, self._neighbours
+
+    def restore_neighbours(
+        self,
+        keywords: list[KeywordProperties],
+        neighbours: NeighbourLists,
+    ) -> None:
+        """Use neighbour lists calculated earlier instead of calculating them.
+
+        Arguments:
+            keywords (list[KeywordProperties]): Keyword properties, one entry per row.
+            neighbours (NeighbourLists): Presorted neighbour lists, one entry per row.
+
+        """
+        row_hashes = list(neighbours.row_hashes) if isinstance(neighbours, SimilarityIndex) else None
+        self._set_neighbours(keywords, neighbours, row_hashes)
+
+    def close(self) -> None:
+        """Release the memory-mapped similarity index, so its file can be replaced or removed.
+
+        The neighbour lists are empty afterwards.
+
+        """
+        self._set_neighbours([], [], [])
+
+    def get_n_most_similar_keywords(
+        self,
+        keyword_name: str,
+        top_n: int,
+        min_score: float = 0.0,
+    ) -> list[SimilarKeyword]:
+        """Return the n most similar keywords from the presorted neighbour lists.
 
-            Returns empty similar_keywords dict if keyword not found or on error.
+        Arguments:
+            keyword_name (str): The target keyword to find similarities for.
+            top_n (int): The maximum number of similar keywords to return.
+            min_score (float): Minimum similarity score in range [0.0, 1.0] (default: 0.0).
+
+        Returns:
+            list[SimilarKeyword]: Up to top_n similar keywords sorted by descending score.
+                Returns an empty list if the keyword is not found or on error.
 
         """
         if not keyword_name:
@@ -173,49 +638,34 @@ class KeywordSimilarityService:
             logger.warning("Keyword not found in similarity matrix")
             return []
 
-        try:
-            index = self.keyword_names_list.index(keyword.keyword_name_with_prefix)
-        except ValueError:
+        row = self._row_index.get(keyword.keyword_name_with_prefix)
+        if row is None:
             logger.warning("Keyword '%s' not found in keyword list", keyword_name)
             return []
 
         try:
-            similarities = self.similarity_matrix[index]
-            similar_indices = sorted(
-                range(len(similarities)),
-                key=lambda similarity_index: similarities[similarity_index],
-                reverse=True,
-            )
-
             similar_keywords = []
-            for i in similar_indices:
-                if i == index:
-                    continue
-
-                try:
-                    similarity_score = round(float(similarities[i]), 4)
-                    entry = self.keyword_registry.resolve(self.keyword_names_list[i])
-
-                    if entry is None:
-                        continue
-
-                    similar_keywords.append(
-                        SimilarKeyword(
-                            keyword_id=entry.keyword_id,
-                            keyword_name_without_prefix=entry.keyword_name_without_prefix,
-                            keyword_name_with_prefix=entry.keyword_name_with_prefix,
-                            source=entry.source,
-                            score=similarity_score,
-                        )
+            for neighbour_row, score in self._neighbours[row]:
+                if len(similar_keywords) >= top_n:
+                    break
+
+                similarity_score = round(float(score), 4)
+                if similarity_score < min_score:
+                    break
+
+                entry = self._keywords[neighbour_row]
+                similar_keywords.append(
+                    SimilarKeyword(
+                        keyword_id=entry.keyword_id,
+                        keyword_name_without_prefix=entry.keyword_name_without_prefix,
+                        keyword_name_with_prefix=entry.keyword_name_with_prefix,
+                        source=entry.source,
+                        score=similarity_score,
                     )
-                    if len(similar_keywords) >= top_n:
-                        break
-                except (IndexError, ValueError):
-                    logger.exception("Invalid index or similarity score at position %d", i)
-                    continue
+                )
 
-        except (IndexError, ValueError):
-            logger.exception("Error accessing similarity matrix for keyword: %s", keyword_name)
+        except IndexError:
+            logger.exception("Error accessing similarity neighbours for keyword: %s", keyword_name)
             return []
         except Exception:
             logger.exception("Unexpected error while finding similar keywords for: %s", keyword_name)
@@ -223,9 +673,11 @@ class KeywordSimilarityService:
         else:
             return similar_keywords
 
-    def get_all_similar_keywords_above_threshold(self, threshold: float = 0.80) -> list[KeywordProperties | None]:
+    def get_all_similar_keywords_above_threshold(self, threshold: float = 0.80) -> list[KeywordProperties]:
         """Return all keywords that have at least one similarity score above the given threshold.
 
+        Only the best neighbour of each keyword has to be checked, as the neighbour lists are presorted.
+
         Arguments:
             threshold (float): Minimum similarity score (default: 0.80).
 
@@ -233,33 +685,62 @@ class KeywordSimilarityService:
             list: List of keywords that have high similarity with at least one other keyword.
 
         """
-        if not self.similarity_matrix:
+        if not self._neighbours:
             logger.warning("Similarity matrix is empty")
             return []
 
         try:
-            similar_keyword_indices = set()
-            n = len(self.keyword_names_list)
+            return [
+                self._keywords[row]
+                for row, row_neighbours in enumerate(self._neighbours)
+                if row_neighbours and round(float(row_neighbours[0][1]), 4) >= threshold
+            ]
+        except Exception:
+            logger.exception("Unexpected error while finding similar keywords")
+            return []
 
-            for i in range(n):
-                for j in range(i + 1, n):
-                    similarity_score = round(float(self.similarity_matrix[i][j]), 4)
-                    if similarity_score >= threshold:
-                        similar_keyword_indices.add(i)
-                        similar_keyword_indices.add(j)
+    def get_similar_keyword_pairs(self, threshold: float = 0.80) -> list[DuplicateKeywordPair]:
+        """Return all pairs of keywords whose similarity score reaches the given threshold.
 
-            similar_keywords = []
-            for idx in sorted(similar_keyword_indices):
-                try:
-                    keyword = self.keyword_registry.resolve(self.keyword_names_list[idx])
-                    if keyword:
-                        similar_keywords.append(keyword)
-                except (AttributeError, ValueError, IndexError):
-                    logger.exception("Error resolving keyword at position %d", idx)
-                    continue
+        Walks the presorted neighbour lists once and stops each row at the first score below
+        the threshold, so the cost is linear in the number of keywords plus returned pairs.
 
-        except Exception:
-            logger.exception("Unexpected error while finding similar keywords")
+        Arguments:
+            threshold (float): Minimum similarity score in range [0.0, 1.0] (default: 0.80).
+
+        Returns:
+            list[DuplicateKeywordPair]: Each pair once, sorted by descending similarity. The
+                similarity score of a pair is given as percentage (0-100).
+
+        """
+        if not self._neighbours:
+            logger.warning("Similarity matrix is empty")
             return []
 
-        return similar_keywords
+        try:
+            # A pair may only be listed on one side if neighbour lists are cut off at top_k
+            pair_scores: dict[tuple[int, int], float] = {}
+            for i, row_neighbours in enumerate(self._neighbours):
+                for j, score in row_neighbours:
+                    if round(score, 4) < threshold:
+                        break
+                    pair_scores.setdefault((min(i, j), max(i, j)), score)
+
+            pairs = [(score, i, j) for (i, j), score in pair_scores.items()]
+
+            pairs.sort(key=lambda pair: (-pair[0], pair[1], pair[2]))
+
+            return [
+                DuplicateKeywordPair(
+                    keyword1_name=self._keywords[i].keyword_name_without_prefix,
+                    keyword1_file=self._keywords[i].source,
+                    keyword2_name=self._keywords[j].keyword_name_without_prefix,
+                    keyword2_file=self._keywords[j].source,
+                    similarity_score=round(score * 100, 2),
+                )
+                for score, i, j in pairs
+            ]
+
+        except Exception:
+            logger.exception("Unexpected error while collecting similar keyword pairs")
+            return []
@@ -1,14 +1,18 @@
 """Service class implementing the keyword usage functionality."""
 
 import logging
+from collections import Counter
 from pathlib import Path
 
 from roboview.registries.file_registry import FileRegistry
 from roboview.registries.keyword_registry import KeywordRegistry
+from roboview.schemas.domain.call_graph import CallGraphNode, KeywordReachabilityEnum, KeywordRecursionGroup
 from roboview.schemas.domain.common import FileType, KeywordType
 from roboview.schemas.domain.files import FileUsage
 from roboview.schemas.domain.keywords import KeywordUsage
 from roboview.services.keyword_similarity_service import KeywordSimilarityService
+from roboview.utils.call_graph import KeywordCallGraph
+from roboview.utils.import_graph import ImportGraph, ScopedKeywordResolver
 
 logger = logging.getLogger(__name__)
 
@@ -27,10 +31,152 @@ class KeywordUsageService:
         Attributes:
             keyword_registry (KeywordRegistry): Initialized keyword registry object.
             file_registry (FileRegistry): Initialized file registry object.
+            _usage_counts: Call counts by keyword id per file path and over all files.
+            _usage_counts_versions: Versions of the keyword and file registry the call counts were built from.
+            _resolver: Resolver of calls within the imports of the calling file.
+            _resolver_versions: Versions of the keyword and file registry the resolver was built from.
+            _call_graph: Resolved call graph of the project.
+            _call_graph_versions: Versions of the keyword and file registry the call graph was built from.
 
         """
         self.keyword_registry = keyword_registry
         self.file_registry = file_registry
+        self._usage_counts: tuple[dict[str, Counter[str]], Counter[str]] = ({}, Counter())
+        self._usage_counts_versions: tuple[int, int] | None = None
+        self._resolver: ScopedKeywordResolver | None = None
+        self._resolver_versions: tuple[int, int] | None = None
+        self._call_graph: KeywordCallGraph | None = None
+        self._call_graph_versions: tuple[int, int] | None = None
+
+    def get_keyword_resolver(self) -> ScopedKeywordResolver:
+        """Return the resolver of calls within the imports of the calling file, built once per snapshot.
+
+        Returns:
+            ScopedKeywordResolver: Resolver backed by the import graph of the file registry.
+
+        """
+        versions = (self.keyword_registry.version, self.file_registry.version)
+        if self._resolver is None or self._resolver_versions != versions:
+            self._resolver = ScopedKeywordResolver(self.keyword_registry, ImportGraph.build(self.file_registry))
+            self._resolver_versions = versions
+        return self._resolver
+
+    def get_call_graph(self) -> KeywordCallGraph:
+        """Return the resolved call graph, built once per snapshot of the registries.
+
+        Returns:
+            KeywordCallGraph: Call graph of the keywords, test cases and files.
+
+        """
+        versions = (self.keyword_registry.version, self.file_registry.version)
+        if self._call_graph is None or self._call_graph_versions != versions:
+            self._call_graph = KeywordCallGraph.build(
+                self.keyword_registry, self.file_registry, self.get_keyword_resolver()
+            )
+            self._call_graph_versions = versions
+        return self._call_graph
+
+    def get_keyword_callers(
+        self, keyword_name: str, max_depth: int | None = None
+    ) -> tuple[CallGraphNode, list[CallGraphNode]] | None:
+        """Return the keywords, test cases and files calling a keyword directly or indirectly.
+
+        Arguments:
+            keyword_name (str): Name of the keyword, with or without prefix.
+            max_depth (int | None): Maximum number of calls in between, 1 for direct callers, None for no limit.
+
+        Returns:
+            tuple[CallGraphNode, list[CallGraphNode]] | None: The keyword and its callers, closest first,
+                None if the keyword is not found.
+
+        """
+        return self._query_call_graph(keyword_name, max_depth, callers=True)
+
+    def get_keyword_callees(
+        self, keyword_name: str, max_depth: int | None = None
+    ) -> tuple[CallGraphNode, list[CallGraphNode]] | None:
+        """Return the keywords a keyword calls directly or indirectly.
+
+        Arguments:
+            keyword_name (str): Name of the keyword, with or without prefix.
+            max_depth (int | None): Maximum number of calls in between, 1 for direct callees, None for no limit.
+
+        Returns:
+            tuple[CallGraphNode, list[CallGraphNode]] | None: The keyword and its callees, closest first,
+                None if the keyword is not found.
+
+        """
+        return self._query_call_graph(keyword_name, max_depth, callers=False)
+
+    def _query_call_graph(
+        self, keyword_name: str, max_depth: int | None, *, callers: bool
+    ) -> tuple[CallGraphNode, list[CallGraphNode]] | None:
+        """Traverse the call graph from a keyword towards its callers or callees."""
+        keyword = self.keyword_registry.resolve(keyword_name)
+        if keyword is None:
+            logger.warning("Keyword '%s' not found in registry", keyword_name)
+            return None
+
+        call_graph = self.get_call_graph()
+        node = call_graph.find_keyword(keyword.keyword_id)
+        if node is None:
+            return None
+
+        if callers:
+            reached = call_graph.get_transitive_callers(node, max_depth)
+        else:
+            reached = call_graph.get_transitive_callees(node, max_depth)
+        return call_graph.to_node(node), [call_graph.to_node(other, depth) for other, depth in reached]
+
+    def get_recursive_keyword_groups(self) -> list[KeywordRecursionGroup]:
+        """Return the keywords calling themselves, directly or through other keywords.
+
+        Returns:
+            list[KeywordRecursionGroup]: Recursive keywords and groups of mutually recursive keywords,
+                largest group first.
+
+        """
+        try:
+            call_graph = self.get_call_graph()
+            groups = []
+            for component in call_graph.get_recursive_components():
+                keywords = sorted(
+                    (call_graph.to_node(node) for node in component),
+                    key=lambda keyword: (keyword.source, keyword.line_number or 0, keyword.name),
+                )
+                groups.append(KeywordRecursionGroup(keywords=keywords, is_mutually_recursive=len(keywords) > 1))
+            groups.sort(key=lambda group: (-len(group.keywords), group.keywords[0].source, group.keywords[0].name))
+        except Exception:
+            logger.exception("Failed to get recursive keyword groups")
+            return []
+        else:
+            return groups
+
+    def _get_usage_counts(self) -> tuple[dict[str, Counter[str]], Counter[str]]:
+        """Return the call counts by keyword id per file path and over all files.
+
+        Every distinct call of a file is resolved once within the imports of the file, so
+        keywords sharing a name in different resources are counted separately. Counting once
+        per registry snapshot keeps usage lookups independent of the number of files, instead
+        of scanning all called keywords for every keyword.
+        """
+        versions = (self.keyword_registry.version, self.file_registry.version)
+        if self._usage_counts_versions != versions:
+            resolver = self.get_keyword_resolver()
+            file_counts: dict[str, Counter[str]] = {}
+            global_counts: Counter[str] = Counter()
+            for entry in self.file_registry.get_all_files():
+                if not entry.called_keywords:
+                    continue
+                counts: Counter[str] = Counter()
+                for call, count in Counter(entry.called_keywords).items():
+                    if keyword := resolver.resolve(call, entry.path):
+                        counts[keyword.keyword_id] += count
+                file_counts[entry.path] = counts
+                global_counts.update(counts)
+            self._usage_counts = (file_counts, global_counts)
+            self._usage_counts_versions = versions
+        return self._usage_counts
 
     def get_keywords_with_global_usage_for_file(self, file_path: Path, keyword_type: KeywordType) -> list[KeywordUsage]:
         """Get initialized or called keywords with global usage for a Robot Framework file.
@@ -103,21 +249,18 @@ class KeywordUsageService:
                 logger.warning("Keyword '%s' not found in registry", keyword_name)
                 return []
 
-            unique_keyword_names = {
-                keyword.keyword_name_without_prefix,
-                keyword.keyword_name_with_prefix,
-            }
-
+            file_counts, _ = self._get_usage_counts()
             result = []
             for entry in self.file_registry.get_all_files():
                 try:
                     if entry.is_resource != bool(file_type is FileType.RESOURCE):
                         continue
 
-                    if not entry.called_keywords:
+                    counts = file_counts.get(entry.path)
+                    if not counts:
                         continue
 
-                    count = sum(entry.called_keywords.count(k) for k in unique_keyword_names)
+                    count = counts[keyword.keyword_id]
 
                     if count:
                         result.append(
@@ -177,32 +320,58 @@ class KeywordUsageService:
         else:
             return result
 
+    def get_keyword_reachability(self) -> dict[str, KeywordReachabilityEnum]:
+        """Classify every user defined keyword by whether test cases and suite settings reach it.
+
+        Returns:
+            dict[str, KeywordReachabilityEnum]: Reachability by keyword id.
+
+        """
+        call_graph = self.get_call_graph()
+        reachability = call_graph.get_keyword_reachability()
+        return {
+            keyword.keyword_id: reachability[node]
+            for node, keyword in enumerate(call_graph.keywords)
+            if keyword.is_user_defined
+        }
+
     def get_keywords_without_usages(self) -> list[KeywordUsage]:
-        """Return all keywords that have no usages across the whole project.
+        """Return all user defined keywords that no test case or suite setting reaches.
+
+        One search over the call graph from all test cases and suite settings finds the
+        keywords nothing calls as well as keywords only called by other unreachable keywords.
 
         Returns:
-            list[dict]: List of dictionaries containing keywords that have no usages in the project.
+            list[KeywordUsage]: Unreachable keywords with their reachability and call counts.
 
         """
         try:
+            reachability = self.get_keyword_reachability()
             keywords_wo_usages = []
             for entry in self.keyword_registry.get_user_defined_keywords():
                 try:
-                    total_usages = self._get_global_keyword_usage_for_target_keyword(entry.keyword_name_with_prefix)
-                    if total_usages == 0:
-                        keywords_wo_usages.append(
-                            KeywordUsage(
-                                keyword_id=entry.keyword_id,
-                                file_name=entry.file_name,
-                                keyword_name_without_prefix=entry.keyword_name_without_prefix,
-                                keyword_name_with_prefix=entry.keyword_name_with_prefix,
-                                documentation=entry.description,
-                                source=entry.source,
-                                file_usages=total_usages,
-                                total_usages=total_usages,
-                                line_number=entry.line_number,
-                            )
+                    keyword_reachability = reachability.get(entry.keyword_id)
+                    if keyword_reachability in {None, KeywordReachabilityEnum.REACHABLE}:
+                        continue
+
+                    keywords_wo_usages.append(
+                        KeywordUsage(
+                            keyword_id=entry.keyword_id,
+                            file_name=entry.file_name,
+                            keyword_name_without_prefix=entry.keyword_name_without_prefix,
+                            keyword_name_with_prefix=entry.keyword_name_with_prefix,
+                            documentation=entry.description,
+                            source=entry.source,
+                            file_usages=self._get_keyword_usage_for_target_keyword_in_file(
+                                entry.keyword_name_with_prefix, entry.source
+                            ),
+                            total_usages=self._get_global_keyword_usage_for_target_keyword(
+                                entry.keyword_name_with_prefix
+                            ),
+                            line_number=entry.line_number,
+                            reachability=keyword_reachability,
                         )
+                    )
                 except Exception:
                     logger.exception("Failed to process keyword '%s'", entry.keyword_name_with_prefix)
                     continue
@@ -213,7 +382,9 @@ class KeywordUsageService:
             return keywords_wo_usages
 
     def get_potential_duplicate_keywords(self, keyword_sim_service: KeywordSimilarityService) -> list[KeywordUsage]:
-        """Return keywords that have calling cycles along their usages.
+        """Return keywords that are similar to other keywords along their usages.
+
+        Calling cycles are reported by ``get_recursive_keyword_groups``.
 
         Arguments:
             keyword_sim_service: KeywordSimilarityService instance.
@@ -413,9 +584,8 @@ class KeywordUsageService:
 
         """
         try:
-            for entry in self.file_registry.get_all_files():
-                if entry.path == file_path:
-                    return entry.initialized_keywords or []
+            if entry := self.file_registry.resolve(file_path):
+                return entry.initialized_keywords or []
         except Exception:
             logger.exception("Failed to get initialized keywords for file '%s'", file_path)
             return []
@@ -433,9 +603,8 @@ class KeywordUsageService:
 
         """
         try:
-            for entry in self.file_registry.get_all_files():
-                if entry.path == file_path:
-                    return entry.called_keywords or []
+            if entry := self.file_registry.resolve(file_path):
+                return entry.called_keywords or []
         except Exception:
             logger.exception("Failed to get called keywords for file '%s'", file_path)
             return []
@@ -459,14 +628,9 @@ class KeywordUsageService:
             if keyword is None:
                 return 0
 
-            for entry in self.file_registry.get_all_files():
-                if entry.path == file_path:
-                    called_keywords = entry.called_keywords
-                    if called_keywords is None:
-                        return 0
-                    return called_keywords.count(keyword.keyword_name_with_prefix) + called_keywords.count(
-                        keyword.keyword_name_without_prefix
-                    )
+            file_counts, _ = self._get_usage_counts()
+            if counts := file_counts.get(file_path):
+                return counts[keyword.keyword_id]
         except Exception:
             logger.exception("Failed to get keyword usage for '%s' in file '%s'", keyword_name, file_path)
             return 0
@@ -489,19 +653,8 @@ class KeywordUsageService:
             if keyword is None:
                 return 0
 
-            total_usage = 0
-            unique_keyword_names = {keyword.keyword_name_without_prefix, keyword.keyword_name_with_prefix}
-            for entry in self.file_registry.get_all_files():
-                try:
-                    called_keywords = entry.called_keywords
-                    if called_keywords is None:
-                        continue
-                    count = sum(called_keywords.count(k) for k in unique_keyword_names)
-                    if count > 0:
-                        total_usage += count
-                except Exception:
-                    logger.exception("Failed to process file entry for global keyword usage")
-                    continue
+            _, global_counts = self._get_usage_counts()
+            total_usage = global_counts[keyword.keyword_id]
 
         except Exception:
             logger.exception("Failed to get global keyword usage for '%s'", keyword_name)
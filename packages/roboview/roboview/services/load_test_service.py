@@ -0,0 +1,271 @@
+"""Service class to replay request mixes against the RoboView API."""
+
+import asyncio
+import logging
+import math
+import random
+import time
+from collections import defaultdict
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+import httpx
+from roboview.core.config import get_settings
+from roboview.schemas.domain.benchmarks import EndpointLoadStats, LoadTestResult
+
+logger = logging.getLogger(__name__)
+
+# Relative weights of the request scenarios, modelled on a user browsing the VS Code panel
+DEFAULT_REQUEST_MIX: dict[str, int] = {
+    "keywords-initialized": 30,
+    "keywords-called": 15,
+    "keyword-usage-resource": 10,
+    "keyword-similarity": 20,
+    "robocop-messages-all": 10,
+    "kpis": 10,
+    "report-generate": 5,
+}
+
+# Files whose keywords are collected as targets of the keyword scenarios
+_MAX_TARGET_FILES = 50
+_INITIALIZE_TIMEOUT_SECONDS = 600.0
+_REQUEST_TIMEOUT_SECONDS = 120.0
+# Base URL of requests to the in-process application, only the path is routed
+_IN_PROCESS_BASE_URL = "http://roboview"
+
+
+@dataclass(frozen=True)
+class _RequestSpec:
+    """Method, path and payload of one request."""
+
+    method: str
+    path: str
+    params: dict[str, str] | None = None
+    json: dict | None = None
+
+
+def _percentile(sorted_values: list[float], percent: float) -> float:
+    """Return the nearest-rank percentile of sorted values, 0.0 for no values."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(percent / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class LoadTestService:
+    """Service class to measure the API under concurrent clients.
+
+    The project is initialized once, then the files and keywords of the project are
+    collected as request targets. Every client sends its requests one after another,
+    picking scenarios by their weight in the request mix from a seeded random generator,
+    so equal seeds replay equal request sequences. Requests go to the ASGI application
+    in-process or to a running server.
+
+    Attributes:
+        project_root: Root directory of the initialized project.
+        clients: Number of concurrent clients.
+        requests_per_client: Number of requests sent by each client.
+        request_mix: Relative weights of the request scenarios.
+        seed: Seed of the request sequences.
+
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        project_root: Path,
+        *,
+        app: Callable | None = None,
+        base_url: str | None = None,
+        clients: int = 4,
+        requests_per_client: int = 50,
+        request_mix: dict[str, int] | None = None,
+        seed: int = 0,
+    ) -> None:
+        """Initialize LoadTestService.
+
+        Arguments:
+            project_root (Path): Root directory of the project to initialize.
+            app (Callable | None): ASGI application called in-process (default: None).
+            base_url (str | None): URL of a running server, used if no application is given (default: None).
+            clients (int): Number of concurrent clients (default: 4).
+            requests_per_client (int): Number of requests sent by each client (default: 50).
+            request_mix (dict[str, int] | None): Weights per scenario of DEFAULT_REQUEST_MIX (default: None).
+            seed (int): Seed of the request sequences (default: 0).
+
+        """
+        if app is not None:
+            base_url = _IN_PROCESS_BASE_URL
+        elif base_url is None:
+            msg = "Either an ASGI application or a base URL is required"
+            raise ValueError(msg)
+
+        request_mix = DEFAULT_REQUEST_MIX if request_mix is None else request_mix
+        unknown_scenarios = set(request_mix) - set(DEFAULT_REQUEST_MIX)
+        if unknown_scenarios:
+            msg = f"Unknown request scenarios: {', '.join(sorted(unknown_scenarios))}"
+            raise ValueError(msg)
+
+        self.project_root = project_root.resolve()
+        self.clients = max(1, clients)
+        self.requests_per_client = max(1, requests_per_client)
+        self.request_mix = {scenario: weight for scenario, weight in request_mix.items() if weight > 0}
+        self.seed = seed
+        self._app = app
+        self._base_url = base_url
+
+    def _create_client(self) -> httpx.AsyncClient:
+        """Create an HTTP client for the application or the running server."""
+        transport = httpx.ASGITransport(app=self._app) if self._app is not None else None
+        return httpx.AsyncClient(transport=transport, base_url=self._base_url, timeout=_REQUEST_TIMEOUT_SECONDS)
+
+    async def _initialize(self, client: httpx.AsyncClient, api: str) -> tuple[list[str], list[str]]:
+        """Initialize the project and return the collected file paths and keyword names."""
+        response = await client.post(
+            f"{api}/system/initialize",
+            json={"project_root_dir": self.project_root.as_posix()},
+            timeout=_INITIALIZE_TIMEOUT_SECONDS,
+        )
+        response.raise_for_status()
+
+        response = await client.get(f"{api}/files/all-files", params={"project_root_dir": self.project_root.as_posix()})
+        response.raise_for_status()
+        file_paths = sorted(file["path"] for file in response.json()["all_files"])
+
+        keyword_names = []
+        for file_path in file_paths[:_MAX_TARGET_FILES]:
+            response = await client.get(f"{api}/keyword-usage/keywords-initialized", params={"file_path": file_path})
+            response.raise_for_status()
+            keyword_names.extend(
+                keyword["keyword_name_without_prefix"] for keyword in response.json()["initialized_keywords"]
+            )
+
+        if not file_paths or not keyword_names:
+            msg = f"No files or keywords found in project: {self.project_root}"
+            raise ValueError(msg)
+        return file_paths, sorted(set(keyword_names))
+
+    def _build_request(
+        self, scenario: str, api: str, rng: random.Random, file_paths: list[str], keyword_names: list[str]
+    ) -> _RequestSpec:
+        """Build the request of a scenario with randomly picked targets."""
+        match scenario:
+            case "keywords-initialized" | "keywords-called":
+                return _RequestSpec("GET", f"{api}/keyword-usage/{scenario}", {"file_path": rng.choice(file_paths)})
+            case "keyword-usage-resource" | "keyword-similarity":
+                return _RequestSpec(
+                    "GET", f"{api}/keyword-usage/{scenario}", {"keyword_name": rng.choice(keyword_names)}
+                )
+            case "robocop-messages-all":
+                return _RequestSpec("GET", f"{api}/robocop/robocop-messages-all")
+            case "kpis":
+                return _RequestSpec("GET", f"{api}/overview/kpis", {"project_root_dir": self.project_root.as_posix()})
+            case _:
+                return _RequestSpec("POST", f"{api}/reports/generate", json={"author": None})
+
+    async def _run_client(  # noqa: PLR0913, PLR0917
+        self,
+        client: httpx.AsyncClient,
+        api: str,
+        client_index: int,
+        file_paths: list[str],
+        keyword_names: list[str],
+        latencies: dict[str, list[float]],
+        errors: dict[str, int],
+    ) -> None:
+        """Send the requests of one client one after another."""
+        rng = random.Random(self.seed * 1_000_003 + client_index)  # noqa: S311
+        scenarios = list(self.request_mix)
+        weights = list(self.request_mix.values())
+
+        for _ in range(self.requests_per_client):
+            scenario = rng.choices(scenarios, weights)[0]
+            spec = self._build_request(scenario, api, rng, file_paths, keyword_names)
+
+            start = time.perf_counter()
+            try:
+                response = await client.request(spec.method, spec.path, params=spec.params, json=spec.json)
+                await response.aread()
+                failed = response.is_error
+            except httpx.HTTPError:
+                logger.exception("Request %s %s failed", spec.method, spec.path)
+                failed = True
+
+            latencies[scenario].append(time.perf_counter() - start)
+            errors[scenario] += failed
+
+    async def run_async(self) -> LoadTestResult:
+        """Initialize the project and replay the request mix with all clients concurrently.
+
+        Returns:
+            LoadTestResult: Throughput and latency percentiles per scenario.
+
+        Raises:
+            httpx.HTTPError: If the project could not be initialized.
+            ValueError: If the initialized project has no files or keywords.
+
+        """
+        api = get_settings().API_VERSION_STR
+        latencies: dict[str, list[float]] = defaultdict(list)
+        errors: dict[str, int] = defaultdict(int)
+
+        async with self._create_client() as client:
+            logger.info("Initializing %s", self.project_root)
+            file_paths, keyword_names = await self._initialize(client, api)
+
+            logger.info("Running %d clients with %d requests each", self.clients, self.requests_per_client)
+            start = time.perf_counter()
+            await asyncio.gather(
+                *(
+                    self._run_client(client, api, client_index, file_paths, keyword_names, latencies, errors)
+                    for client_index in range(self.clients)
+                )
+            )
+            duration = time.perf_counter() - start
+
+        endpoints = []
+        for scenario in self.request_mix:
+            scenario_latencies = sorted(latency * 1000 for latency in latencies[scenario])
+            if not scenario_latencies:
+                continue
+            endpoints.append(
+                EndpointLoadStats(
+                    endpoint=scenario,
+                    requests=len(scenario_latencies),
+                    errors=errors[scenario],
+                    throughput_rps=len(scenario_latencies) / duration if duration else 0.0,
+                    p50_ms=_percentile(scenario_latencies, 50),
+                    p95_ms=_percentile(scenario_latencies, 95),
+                    p99_ms=_percentile(scenario_latencies, 99),
+                    max_ms=scenario_latencies[-1],
+                )
+            )
+
+        total_requests = sum(endpoint.requests for endpoint in endpoints)
+        return LoadTestResult(
+            target="in-process" if self._app is not None else self._base_url,
+            project_root=self.project_root.as_posix(),
+            clients=self.clients,
+            requests=total_requests,
+            errors=sum(endpoint.errors for endpoint in endpoints),
+            duration_seconds=duration,
+            throughput_rps=total_requests / duration if duration else 0.0,
+            endpoints=endpoints,
+        )
+
+    def run(self) -> LoadTestResult:
+        """Run the load test in a new event loop.
+
+        Report jobs queued by an in-process application are stopped afterwards.
+
+        Returns:
+            LoadTestResult: Throughput and latency percentiles per scenario.
+
+        """
+        try:
+            return asyncio.run(self.run_async())
+        finally:
+            app_state = getattr(self._app, "state", None)
+            report_job_service = getattr(app_state, "report_job_service", None)
+            if report_job_service is not None:
+                report_job_service.shutdown(wait=False)
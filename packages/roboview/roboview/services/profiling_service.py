@@ -0,0 +1,157 @@
+"""Service class profiling requests and initializations of the live server."""
+
+import cProfile
+import logging
+import pstats
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from uuid import uuid4
+
+from roboview.schemas.domain.profiling import ProfilingStatusEnum, ProfilingTargetEnum
+
+logger = logging.getLogger(__name__)
+
+
+class ProfilingSession:
+    """State of a single profiling session.
+
+    Attributes:
+        session_id: Unique identifier of the session.
+        target: Work the session records.
+        request_count: Number of requests to profile, 1 for initializations.
+        claimed_count: Number of requests or initializations that started recording.
+        active_count: Number of requests or initializations currently recording.
+        profiled_count: Number of requests or initializations profiled so far.
+        status: Lifecycle state of the session.
+        created_at: Date and time the session was started.
+        completed_at: Date and time the last profiled work finished.
+        profiler: Profiler shared by all recorded work.
+
+    """
+
+    def __init__(self, target: ProfilingTargetEnum, request_count: int) -> None:
+        """Initialize ProfilingSession.
+
+        Arguments:
+            target (ProfilingTargetEnum): Work the session records.
+            request_count (int): Number of requests to profile.
+
+        """
+        self.session_id = str(uuid4())
+        self.target = target
+        self.request_count = request_count if target == ProfilingTargetEnum.REQUESTS else 1
+        self.profiled_count = 0
+        self.status = ProfilingStatusEnum.WAITING
+        self.created_at = datetime.now(UTC)
+        self.completed_at: datetime | None = None
+        self.profiler = cProfile.Profile()
+        self.claimed_count = 0
+        self.active_count = 0
+
+    def get_stats(self) -> pstats.Stats | None:
+        """Return the statistics of a completed session.
+
+        Returns:
+            pstats.Stats | None: Recorded statistics, None while the session is not completed.
+
+        """
+        if self.status != ProfilingStatusEnum.COMPLETED:
+            return None
+        return pstats.Stats(self.profiler)
+
+
+class ProfilingService:
+    """Service class to profile the next requests or the next initialization.
+
+    One session is armed at a time, starting a session replaces the previous one unless it is
+    recording work at that moment. Requests
+    are profiled on the event loop, so concurrent requests share one aggregated profile,
+    while work handed off to worker threads, such as queued report generation, is not
+    recorded.
+
+    Attributes:
+        _session: Current profiling session.
+        _lock: Lock guarding the session state.
+
+    """
+
+    def __init__(self) -> None:
+        """Initialize ProfilingService."""
+        self._session: ProfilingSession | None = None
+        self._lock = threading.Lock()
+
+    def start(self, target: ProfilingTargetEnum, request_count: int = 1) -> ProfilingSession:
+        """Arm a new profiling session.
+
+        Arguments:
+            target (ProfilingTargetEnum): Work to profile.
+            request_count (int): Number of requests to profile, ignored for initializations.
+
+        Returns:
+            ProfilingSession: Armed session.
+
+        Raises:
+            RuntimeError: If the current session is recording work at the moment.
+
+        """
+        with self._lock:
+            if self._session is not None and self._session.active_count > 0:
+                msg = "A profiling session is recording"
+                raise RuntimeError(msg)
+            self._session = ProfilingSession(target, request_count)
+            logger.info("Profiling the next %s %s", self._session.request_count, target.value)
+            return self._session
+
+    def get_session(self) -> ProfilingSession | None:
+        """Return the current profiling session.
+
+        Returns:
+            ProfilingSession | None: Current session, None if no session was started.
+
+        """
+        return self._session
+
+    def _claim(self, target: ProfilingTargetEnum) -> ProfilingSession | None:
+        """Claim a slot of the current session for work of a target."""
+        with self._lock:
+            session = self._session
+            if session is None or session.target != target or session.claimed_count >= session.request_count:
+                return None
+
+            session.claimed_count += 1
+            session.status = ProfilingStatusEnum.RECORDING
+            if session.active_count == 0:
+                session.profiler.enable()
+            session.active_count += 1
+            return session
+
+    def _release(self, session: ProfilingSession) -> None:
+        """Release a claimed slot and complete the session after the last one."""
+        with self._lock:
+            session.active_count -= 1
+            session.profiled_count += 1
+            if session.active_count == 0:
+                session.profiler.disable()
+            if session.profiled_count >= session.request_count:
+                session.status = ProfilingStatusEnum.COMPLETED
+                session.completed_at = datetime.now(UTC)
+                logger.info("Profiling session %s completed", session.session_id)
+
+    @contextmanager
+    def profile(self, target: ProfilingTargetEnum) -> Iterator[None]:
+        """Profile the enclosed block if the current session records work of its target.
+
+        Arguments:
+            target (ProfilingTargetEnum): Work the block performs.
+
+        """
+        session = self._claim(target)
+        if session is None:
+            yield
+            return
+        try:
+            yield
+        finally:
+            self._release(session)
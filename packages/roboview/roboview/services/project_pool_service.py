@@ -0,0 +1,431 @@
+"""Service class holding the analysis contexts of several projects."""
+
+import logging
+import sys
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Collection, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from roboview.core.snapshot import stable_id
+from roboview.registries.file_registry import FileRegistry
+from roboview.registries.keyword_registry import KeywordRegistry
+from roboview.registries.library_catalog import LibraryCatalog
+from roboview.registries.robocop_registry import RobocopRegistry
+from roboview.schemas.domain.memory import ProjectMemory, StructureSize
+from roboview.services.keyword_runtime_service import KeywordRuntimeService
+from roboview.services.keyword_similarity_service import KeywordSimilarityService
+from roboview.services.keyword_usage_service import KeywordUsageService
+from roboview.services.reporting_service import ReportingService
+from roboview.services.robocop_service import RobocopService
+from roboview.utils.analysis_snapshot import AnalysisSnapshot
+from roboview.utils.memory import estimate_deep_size, estimate_retained_sizes
+
+logger = logging.getLogger(__name__)
+
+
+class ProjectContext:
+    """Registries and services of one initialized project.
+
+    Exposes the same attribute names as the single-project application state, so endpoints
+    can use either interchangeably.
+
+    Attributes:
+        project_key: Key identifying the project in the pool.
+        project_root: Root directory of the project.
+        keyword_registry: Keyword registry of the project.
+        file_registry: File registry of the project.
+        robocop_registry: Robocop registry of the project.
+        keyword_usage_service: Keyword usage service of the project.
+        keyword_similarity_service: Keyword similarity service of the project.
+        robocop_service: Robocop service of the project.
+        reporting_service: Reporting service of the project.
+        keyword_runtime_service: Runtime statistics of the keywords from ingested output files.
+        estimated_size_bytes: Estimated memory held by the project, excluding shared library keywords.
+        last_used: Monotonic time of the last access.
+        active_requests: Number of requests currently using the project.
+        retired: Whether the project left the pool and is closed once no request uses it.
+
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        project_root: Path,
+        *,
+        keyword_registry: KeywordRegistry,
+        file_registry: FileRegistry,
+        robocop_registry: RobocopRegistry,
+        keyword_usage_service: KeywordUsageService,
+        keyword_similarity_service: KeywordSimilarityService,
+        robocop_service: RobocopService,
+        reporting_service: ReportingService,
+    ) -> None:
+        """Initialize ProjectContext.
+
+        Arguments:
+            project_root (Path): Root directory of the project.
+            keyword_registry (KeywordRegistry): Keyword registry of the project.
+            file_registry (FileRegistry): File registry of the project.
+            robocop_registry (RobocopRegistry): Robocop registry of the project.
+            keyword_usage_service (KeywordUsageService): Keyword usage service of the project.
+            keyword_similarity_service (KeywordSimilarityService): Keyword similarity service of the project.
+            robocop_service (RobocopService): Robocop service of the project.
+            reporting_service (ReportingService): Reporting service of the project.
+
+        """
+        self.project_key = ProjectPoolService.get_project_key(project_root)
+        self.project_root = project_root
+        self.keyword_registry = keyword_registry
+        self.file_registry = file_registry
+        self.robocop_registry = robocop_registry
+        self.keyword_usage_service = keyword_usage_service
+        self.keyword_similarity_service = keyword_similarity_service
+        self.robocop_service = robocop_service
+        self.reporting_service = reporting_service
+        self.keyword_runtime_service = KeywordRuntimeService(keyword_registry)
+        self.estimated_size_bytes = 0
+        self.last_used = time.monotonic()
+        self.active_requests = 0
+        self.retired = False
+
+    @classmethod
+    def from_snapshot(cls, snapshot: AnalysisSnapshot) -> "ProjectContext":
+        """Build a project context from a loaded analysis snapshot instead of analyzing the project.
+
+        The neighbour lists are served from the snapshot, they are only calculated if the
+        snapshot holds none.
+
+        Arguments:
+            snapshot (AnalysisSnapshot): Loaded analysis snapshot.
+
+        Returns:
+            ProjectContext: Context of the project the snapshot was taken from.
+
+        """
+        keyword_registry = KeywordRegistry()
+        for keyword in snapshot.keywords:
+            keyword_registry.register(keyword)
+
+        file_registry = FileRegistry()
+        for file in snapshot.files:
+            file_registry.register(file)
+
+        robocop_registry = RobocopRegistry()
+        for message in snapshot.robocop_messages:
+            robocop_registry.register(message)
+
+        keyword_usage_service = KeywordUsageService(keyword_registry, file_registry)
+
+        similarity_index = snapshot.similarity_index
+        if similarity_index is not None:
+            keyword_similarity_service = KeywordSimilarityService(
+                keyword_registry,
+                normalize_variables=similarity_index.normalize_variables,
+                index_top_k=similarity_index.top_k,
+            )
+            keyword_similarity_service.restore_neighbours(snapshot.similarity_keywords, similarity_index)
+        else:
+            keyword_similarity_service = KeywordSimilarityService(keyword_registry)
+            keyword_similarity_service.calculate_keyword_similarity_matrix()
+
+        robocop_service = RobocopService(robocop_registry)
+        reporting_service = ReportingService(
+            keyword_registry,
+            file_registry,
+            robocop_registry,
+            keyword_usage_service,
+            keyword_similarity_service,
+            robocop_service,
+            snapshot.project_root,
+        )
+
+        return cls(
+            snapshot.project_root,
+            keyword_registry=keyword_registry,
+            file_registry=file_registry,
+            robocop_registry=robocop_registry,
+            keyword_usage_service=keyword_usage_service,
+            keyword_similarity_service=keyword_similarity_service,
+            robocop_service=robocop_service,
+            reporting_service=reporting_service,
+        )
+
+    def close(self) -> None:
+        """Release the resources of the project, such as its memory-mapped similarity index."""
+        if self.keyword_similarity_service is not None:
+            self.keyword_similarity_service.close()
+
+    def get_memory_usage(self, exclude_ids: Collection[int] = ()) -> ProjectMemory:
+        """Estimate the memory held by each registry and service of the project.
+
+        Library keywords are measured first, then the registries and last the services, so
+        a service only counts the caches and indexes it adds on top of the registries.
+
+        Arguments:
+            exclude_ids (Collection[int]): Ids of shared objects, such as library catalog keywords.
+
+        Returns:
+            ProjectMemory: Retained size per structure and of the largest text fields.
+
+        """
+        keywords = self.keyword_registry.get_all_keywords()
+        library_keywords = [keyword for keyword in keywords if not keyword.is_user_defined]
+        user_keywords = [keyword for keyword in keywords if keyword.is_user_defined]
+        robocop_messages = self.robocop_registry.get_all_error_messages()
+        similarity_service = self.keyword_similarity_service
+
+        structures = {
+            "library_keywords": library_keywords,
+            "keyword_registry": self.keyword_registry,
+            "file_registry": self.file_registry,
+            "robocop_registry": self.robocop_registry,
+            "keyword_usage_service": self.keyword_usage_service,
+            "keyword_similarity_service": similarity_service,
+            "robocop_service": self.robocop_service,
+            "reporting_service": self.reporting_service,
+        }
+        entries = {
+            "library_keywords": len(library_keywords),
+            "keyword_registry": len(user_keywords),
+            "file_registry": len(self.file_registry),
+            "robocop_registry": len(robocop_messages),
+            "keyword_similarity_service": similarity_service.indexed_keyword_count if similarity_service else None,
+        }
+        sizes = estimate_retained_sizes(structures, exclude_ids)
+
+        fields = {
+            "keyword.code": [keyword.code for keyword in user_keywords],
+            "keyword.description": [keyword.description for keyword in user_keywords if keyword.description],
+            "robocop_message.code": [message.code for message in robocop_messages],
+            "robocop_message.message": [message.message for message in robocop_messages],
+        }
+
+        return ProjectMemory(
+            project_key=self.project_key,
+            project_root=str(self.project_root),
+            structures=[
+                StructureSize(name=name, size_bytes=size, entries=entries.get(name)) for name, size in sizes.items()
+            ],
+            fields=[
+                StructureSize(name=name, size_bytes=sum(sys.getsizeof(value) for value in values), entries=len(values))
+                for name, values in fields.items()
+            ],
+            total_bytes=sum(sizes.values()),
+        )
+
+
+class ProjectPoolService:
+    """Service class to hold the contexts of several projects in one backend.
+
+    Projects are identified by a key derived from their root directory. All projects share
+    one library catalog, so library keywords are loaded only once. Idle projects are evicted
+    in least-recently-used order once the number of projects or their estimated memory
+    exceeds the configured limits. The default project, which is the most recently
+    initialized one, and projects serving a request are never evicted. Projects leaving the
+    pool are closed as soon as no request uses them any more.
+
+    Attributes:
+        library_catalog: Library keyword catalog shared by all projects.
+        _max_projects: Maximum number of projects to hold.
+        _memory_budget_bytes: Maximum estimated memory of all projects.
+        _projects: Projects in least-recently-used order.
+        _default_key: Key of the most recently initialized project.
+        _lock: Lock guarding the pool state.
+
+    """
+
+    def __init__(
+        self,
+        *,
+        max_projects: int = 8,
+        memory_budget_bytes: int = 1024 * 1024 * 1024,
+        library_catalog: LibraryCatalog | None = None,
+    ) -> None:
+        """Initialize ProjectPoolService.
+
+        Arguments:
+            max_projects (int): Maximum number of projects to hold.
+            memory_budget_bytes (int): Maximum estimated memory of all projects.
+            library_catalog (LibraryCatalog | None): Library catalog to share, a new one is created if None.
+
+        """
+        self.library_catalog = library_catalog if library_catalog is not None else LibraryCatalog()
+        self._max_projects = max_projects
+        self._memory_budget_bytes = memory_budget_bytes
+        self._projects: OrderedDict[str, ProjectContext] = OrderedDict()
+        self._default_key: str | None = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_project_key(project_root: Path | str) -> str:
+        """Return the key identifying a project root directory.
+
+        Arguments:
+            project_root (Path | str): Root directory of the project.
+
+        Returns:
+            str: Stable key of the resolved root directory.
+
+        """
+        return stable_id("project", Path(project_root).resolve())
+
+    def add(self, context: ProjectContext, *, make_default: bool = True) -> None:
+        """Add a project, replacing an earlier context of the same root, and make it the default.
+
+        Arguments:
+            context (ProjectContext): Initialized project context.
+            make_default (bool): Whether the project replaces an existing default project,
+                the project always becomes the default of a pool without one.
+
+        """
+        context.estimated_size_bytes = estimate_deep_size(context, self.library_catalog.keyword_ids())
+        context.last_used = time.monotonic()
+
+        with self._lock:
+            replaced = self._projects.get(context.project_key)
+            if replaced is not None and replaced is not context:
+                self._retire(replaced)
+            self._projects[context.project_key] = context
+            self._projects.move_to_end(context.project_key)
+            if make_default or self._default_key is None:
+                self._default_key = context.project_key
+            self._evict()
+
+        logger.info(
+            "Added project %s (%s), estimated size %d bytes",
+            context.project_key,
+            context.project_root,
+            context.estimated_size_bytes,
+        )
+
+    def get(self, project: str | None = None) -> ProjectContext | None:
+        """Get a project and mark it as recently used.
+
+        Arguments:
+            project (str | None): Project key or project root directory, None selects the default project.
+
+        Returns:
+            ProjectContext | None: The project, or None if it is not held by the pool.
+
+        """
+        with self._lock:
+            if project is None:
+                project_key = self._default_key
+            elif project in self._projects:
+                project_key = project
+            else:
+                project_key = self.get_project_key(project)
+
+            if project_key is None:
+                return None
+            context = self._projects.get(project_key)
+            if context is None:
+                return None
+
+            self._projects.move_to_end(project_key)
+            context.last_used = time.monotonic()
+            return context
+
+    @contextmanager
+    def use(self, context: ProjectContext) -> Iterator[ProjectContext]:
+        """Mark a project as in use while the block runs, protecting it from eviction.
+
+        Arguments:
+            context (ProjectContext): Project to use.
+
+        Yields:
+            ProjectContext: The project.
+
+        """
+        with self._lock:
+            context.active_requests += 1
+        try:
+            yield context
+        finally:
+            with self._lock:
+                context.active_requests -= 1
+                if context.retired and context.active_requests == 0:
+                    context.close()
+
+    def remove(self, project_key: str) -> bool:
+        """Remove a project from the pool.
+
+        Arguments:
+            project_key (str): Key of the project.
+
+        Returns:
+            bool: True if the project was held by the pool, False otherwise.
+
+        """
+        with self._lock:
+            context = self._projects.pop(project_key, None)
+            if context is None:
+                return False
+            self._retire(context)
+            if self._default_key == project_key:
+                self._default_key = next(reversed(self._projects), None)
+            logger.info("Removed project %s", project_key)
+            return True
+
+    def list_projects(self) -> list[ProjectContext]:
+        """List all projects.
+
+        Returns:
+            list[ProjectContext]: Projects, least recently used first.
+
+        """
+        with self._lock:
+            return list(self._projects.values())
+
+    @property
+    def default_project_key(self) -> str | None:
+        """Key of the project used by requests that do not select a project."""
+        return self._default_key
+
+    @property
+    def memory_budget_bytes(self) -> int:
+        """Maximum estimated memory of all projects."""
+        return self._memory_budget_bytes
+
+    @property
+    def estimated_size_bytes(self) -> int:
+        """Estimated memory of all projects, excluding shared library keywords."""
+        with self._lock:
+            return sum(context.estimated_size_bytes for context in self._projects.values())
+
+    def _evict(self) -> None:
+        """Evict idle projects exceeding the configured count or memory budget."""
+        total_size = sum(context.estimated_size_bytes for context in self._projects.values())
+        candidates = [
+            context
+            for project_key, context in self._projects.items()
+            if project_key != self._default_key and context.active_requests == 0
+        ]
+
+        while candidates and (len(self._projects) > self._max_projects or total_size > self._memory_budget_bytes):
+            context = candidates.pop(0)
+            del self._projects[context.project_key]
+            self._retire(context)
+            total_size -= context.estimated_size_bytes
+            logger.info(
+                "Evicted idle project %s (%s) to stay within the project pool limits",
+                context.project_key,
+                context.project_root,
+            )
+
+    @staticmethod
+    def _retire(context: ProjectContext) -> None:
+        """Close a project that left the pool, or defer it until its last request finished."""
+        context.retired = True
+        if context.active_requests == 0:
+            context.close()
+
+    def __len__(self) -> int:
+        """Return the number of projects."""
+        return len(self._projects)
+
+    def __contains__(self, project_key: str) -> bool:
+        """Check if a project is held by the pool."""
+        return project_key in self._projects
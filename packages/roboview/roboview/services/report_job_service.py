@@ -0,0 +1,327 @@
+"""Service class implementing the background report job queue."""
+
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
+from functools import partial
+from pathlib import Path
+
+from roboview.core.metrics import CACHE_LOOKUPS
+from roboview.schemas.domain.reports import Report, ReportJob, ReportJobStatusEnum
+from roboview.utils.exporters.html_exporter import HTMLExporter
+
+logger = logging.getLogger(__name__)
+
+
+class ReportQueueFullError(RuntimeError):
+    """Raised when no further report job can be queued."""
+
+
+class ReportJobService:
+    """Service class to run report generation jobs in the background.
+
+    Jobs are executed by a bounded thread pool. Identical requests, identified by a
+    deduplication key such as snapshot version and author, are coalesced onto the
+    same job. Finished jobs are kept in least-recently-used order and evicted together
+    with their report files once the configured count, storage size or age is exceeded.
+    Report files written by earlier processes are indexed on startup, so the limits hold
+    across restarts.
+
+    Attributes:
+        _output_dir: Directory the report files are written to.
+        _max_pending_jobs: Number of jobs that may wait for a free worker.
+        _max_stored_reports: Maximum number of finished jobs to keep.
+        _max_storage_bytes: Maximum combined size of all stored report files.
+        _max_age: Maximum age of a finished job before it is evicted.
+        _executor: Thread pool running the report generation.
+        _jobs: Jobs in least-recently-used order.
+        _dedup_index: Mapping of deduplication key to report ID.
+        _lock: Lock guarding the job state.
+
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        output_dir: Path,
+        *,
+        max_workers: int = 1,
+        max_pending_jobs: int = 8,
+        max_stored_reports: int = 20,
+        max_storage_bytes: int = 200 * 1024 * 1024,
+        max_age_seconds: int = 24 * 60 * 60,
+    ) -> None:
+        """Initialize ReportJobService.
+
+        Arguments:
+            output_dir: Directory the report files are written to.
+            max_workers: Number of reports generated concurrently.
+            max_pending_jobs: Number of jobs that may wait for a free worker.
+            max_stored_reports: Maximum number of finished jobs to keep.
+            max_storage_bytes: Maximum combined size of all stored report files.
+            max_age_seconds: Maximum age of a finished job before it is evicted.
+
+        """
+        self._output_dir = output_dir
+        self._max_workers = max_workers
+        self._max_pending_jobs = max_pending_jobs
+        self._max_stored_reports = max_stored_reports
+        self._max_storage_bytes = max_storage_bytes
+        self._max_age = timedelta(seconds=max_age_seconds)
+
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="roboview-report")
+        self._jobs: OrderedDict[str, ReportJob] = OrderedDict()
+        self._dedup_index: dict[Hashable, str] = {}
+        self._dedup_keys: dict[str, Hashable] = {}
+        self._lock = threading.Lock()
+
+        self._output_dir.mkdir(parents=True, exist_ok=True)
+        self._index_existing_files()
+
+    def submit(
+        self,
+        build_report: Callable[[], Report],
+        author: str | None = None,
+        dedup_key: Hashable | None = None,
+    ) -> ReportJob:
+        """Queue a report generation job.
+
+        If a job with the same deduplication key is still generating or completed and its
+        file is still available, that job is returned instead of queuing a new one.
+
+        Arguments:
+            build_report: Callable producing the report to export.
+            author: Author of the report.
+            dedup_key: Key identifying identical requests, None disables deduplication.
+
+        Returns:
+            ReportJob: Copy of the new or coalesced job.
+
+        Raises:
+            ReportQueueFullError: If all workers are busy and the pending queue is full.
+
+        """
+        with self._lock:
+            existing_job = self._find_reusable_job(dedup_key)
+            if dedup_key is not None:
+                CACHE_LOOKUPS.inc("report_jobs", "miss" if existing_job is None else "hit")
+            if existing_job is not None:
+                logger.info("Coalescing report request onto job %s", existing_job.report_id)
+                return existing_job.model_copy()
+
+            active_jobs = sum(1 for job in self._jobs.values() if job.status == ReportJobStatusEnum.GENERATING)
+            if active_jobs >= self._max_workers + self._max_pending_jobs:
+                msg = f"Report queue is full ({active_jobs} jobs in progress)"
+                raise ReportQueueFullError(msg)
+
+            job = ReportJob(author=author)
+            self._jobs[job.report_id] = job
+            if dedup_key is not None:
+                self._dedup_index[dedup_key] = job.report_id
+                self._dedup_keys[job.report_id] = dedup_key
+            snapshot = job.model_copy()
+
+        try:
+            future = self._executor.submit(self._run_job, job.report_id, build_report)
+        except RuntimeError:
+            # The worker pool has been shut down
+            self._fail_job(job.report_id, "Report service is shut down")
+            raise
+        future.add_done_callback(partial(self._finish_cancelled_job, job.report_id))
+        future.add_done_callback(self._log_unexpected_error)
+        return snapshot
+
+    def get_job(self, report_id: str) -> ReportJob | None:
+        """Get a job and mark it as recently used.
+
+        Arguments:
+            report_id: ID of the report.
+
+        Returns:
+            ReportJob | None: Copy of the job, or None if it is unknown or has been evicted.
+
+        """
+        with self._lock:
+            self._evict()
+            job = self._jobs.get(report_id)
+            if job is None:
+                return None
+            self._jobs.move_to_end(report_id)
+            return job.model_copy()
+
+    def list_jobs(self, status: ReportJobStatusEnum | None = None) -> list[ReportJob]:
+        """List all jobs, optionally filtered by status.
+
+        Arguments:
+            status: Only return jobs with this status.
+
+        Returns:
+            list[ReportJob]: Copies of the jobs, least recently used first.
+
+        """
+        with self._lock:
+            self._evict()
+            return [job.model_copy() for job in self._jobs.values() if status is None or job.status == status]
+
+    def delete_job(self, report_id: str) -> bool:
+        """Delete a job and its report file.
+
+        Arguments:
+            report_id: ID of the report.
+
+        Returns:
+            bool: True if the job existed, False otherwise.
+
+        """
+        with self._lock:
+            if report_id not in self._jobs:
+                return False
+            self._remove_job(report_id)
+            return True
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        """Stop accepting jobs and shut down the worker pool.
+
+        Jobs still waiting for a worker are cancelled and marked as failed.
+
+        Arguments:
+            wait: Whether to wait for running jobs to finish.
+
+        """
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _run_job(self, report_id: str, build_report: Callable[[], Report]) -> None:
+        """Generate and export a report, then record the result on the job."""
+        output_file = self._output_dir / f"{report_id}.html"
+        try:
+            report = build_report()
+            HTMLExporter.export(report, output_file)
+            file_size = output_file.stat().st_size
+        except Exception:
+            logger.exception("Error generating report %s", report_id)
+            output_file.unlink(missing_ok=True)
+            self._fail_job(report_id, "Internal error")
+            return
+
+        with self._lock:
+            job = self._jobs.get(report_id)
+            if job is None:
+                # Deleted while generating
+                output_file.unlink(missing_ok=True)
+                return
+            job.status = ReportJobStatusEnum.COMPLETED
+            job.file_path = str(output_file)
+            job.file_size = file_size
+            job.completed_at = datetime.now(UTC)
+            self._jobs.move_to_end(report_id)
+            self._evict()
+
+    def _fail_job(self, report_id: str, error_message: str) -> None:
+        """Mark a job as failed, so it is neither polled forever nor reused for identical requests."""
+        with self._lock:
+            job = self._jobs.get(report_id)
+            if job is not None and job.status == ReportJobStatusEnum.GENERATING:
+                job.status = ReportJobStatusEnum.FAILED
+                job.error_message = error_message
+                job.completed_at = datetime.now(UTC)
+                self._forget_dedup_key(report_id)
+
+    def _finish_cancelled_job(self, report_id: str, future: Future) -> None:
+        """Mark a job as failed if it was cancelled before a worker picked it up."""
+        if future.cancelled():
+            logger.info("Report job %s was cancelled", report_id)
+            self._fail_job(report_id, "Report generation was cancelled")
+
+    def _find_reusable_job(self, dedup_key: Hashable | None) -> ReportJob | None:
+        """Return the job registered for a deduplication key if it can be reused."""
+        if dedup_key is None:
+            return None
+
+        report_id = self._dedup_index.get(dedup_key)
+        job = self._jobs.get(report_id) if report_id is not None else None
+        if job is None:
+            return None
+
+        if job.status == ReportJobStatusEnum.COMPLETED and not (job.file_path and Path(job.file_path).exists()):
+            self._remove_job(job.report_id)
+            return None
+
+        self._jobs.move_to_end(job.report_id)
+        return job
+
+    def _evict(self) -> None:
+        """Evict finished jobs exceeding the configured age, count or storage size."""
+        now = datetime.now(UTC)
+        finished_ids = [
+            report_id for report_id, job in self._jobs.items() if job.status != ReportJobStatusEnum.GENERATING
+        ]
+
+        for report_id in list(finished_ids):
+            job = self._jobs[report_id]
+            if now - (job.completed_at or job.created_at) > self._max_age:
+                self._remove_job(report_id)
+                finished_ids.remove(report_id)
+
+        # The most recently used report is always kept, even if it exceeds the storage size on its own
+        storage_bytes = sum(self._jobs[report_id].file_size or 0 for report_id in finished_ids)
+        while len(finished_ids) > self._max_stored_reports or (
+            len(finished_ids) > 1 and storage_bytes > self._max_storage_bytes
+        ):
+            report_id = finished_ids.pop(0)
+            storage_bytes -= self._jobs[report_id].file_size or 0
+            self._remove_job(report_id)
+
+    def _remove_job(self, report_id: str) -> None:
+        """Remove a job, its deduplication entry and its report file."""
+        job = self._jobs.pop(report_id)
+        self._forget_dedup_key(report_id)
+        if job.file_path:
+            try:
+                Path(job.file_path).unlink(missing_ok=True)
+            except OSError:
+                logger.warning("Could not remove report file: %s", job.file_path)
+        logger.debug("Removed report job %s", report_id)
+
+    def _forget_dedup_key(self, report_id: str) -> None:
+        """Drop the deduplication entry pointing to a job."""
+        dedup_key = self._dedup_keys.pop(report_id, None)
+        if dedup_key is not None and self._dedup_index.get(dedup_key) == report_id:
+            del self._dedup_index[dedup_key]
+
+    def _index_existing_files(self) -> None:
+        """Register report files of earlier runs as completed jobs and evict those over the limits.
+
+        The files are added oldest first by modification time, so the reports of earlier runs are
+        evicted in the same least-recently-used order as reports generated by this process.
+
+        """
+        existing_files = []
+        for report_file in self._output_dir.glob("*.html"):
+            try:
+                file_stat = report_file.stat()
+            except OSError:
+                logger.warning("Could not read report file: %s", report_file)
+                continue
+            existing_files.append((file_stat.st_mtime, file_stat.st_size, report_file))
+
+        with self._lock:
+            for modified_at, file_size, report_file in sorted(existing_files):
+                completed_at = datetime.fromtimestamp(modified_at, UTC)
+                self._jobs[report_file.stem] = ReportJob(
+                    report_id=report_file.stem,
+                    status=ReportJobStatusEnum.COMPLETED,
+                    created_at=completed_at,
+                    completed_at=completed_at,
+                    file_path=str(report_file),
+                    file_size=file_size,
+                )
+            self._evict()
+        logger.debug("Indexed %d report files of earlier runs", len(self._jobs))
+
+    @staticmethod
+    def _log_unexpected_error(future: Future) -> None:
+        """Log errors escaping a report job."""
+        if not future.cancelled() and future.exception() is not None:
+            logger.error("Report job failed unexpectedly", exc_info=future.exception())
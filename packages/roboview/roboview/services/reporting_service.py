@@ -7,14 +7,15 @@ from roboview.registries.file_registry import FileRegistry
 from roboview.registries.keyword_registry import KeywordRegistry
 from roboview.registries.robocop_registry import RobocopRegistry
 from roboview.schemas.domain.reports import (
-    DuplicateKeywordPair,
     FileReportData,
     KeywordReportData,
     KPISummary,
     Recommendation,
+    RecursiveKeywordGroupData,
     ReportMetadata,
     ReportTypeEnum,
     RobocopIssueData,
+    SlowKeywordData,
     SummaryReport,
 )
 from roboview.services.keyword_similarity_service import KeywordSimilarityService
@@ -32,6 +33,7 @@ _REUSAGE_RATE_THRESHOLD = 60
 _ISSUE_DENSITY_THRESHOLD = 0.5
 _ROBOCOP_ISSUES_THRESHOLD = 20
 _SIMILARITY_SCORE_THRESHOLD = 70
+_SLOWEST_KEYWORDS_LIMIT = 20
 
 # Risk level score thresholds
 _SCORE_OPTIMAL = 81
@@ -159,6 +161,19 @@ class ReportingService:
                 )
             )
 
+        # Calling cycle recommendations
+        recursive_groups = self.keyword_usage_service.get_recursive_keyword_groups()
+        if recursive_groups:
+            recommendations.append(
+                Recommendation(
+                    priority="LOW",
+                    category="Call Structure",
+                    message=f"Review {len(recursive_groups)} recursive keyword groups",
+                    details="Keywords calling themselves need a reliable exit condition",
+                    affected_items=[group.keywords[0].name for group in recursive_groups[:5]],
+                )
+            )
+
         # Reusability recommendations
         if kpi_summary.reusage_rate < _REUSAGE_RATE_THRESHOLD:
             recommendations.append(
@@ -308,7 +323,7 @@ class ReportingService:
                     file_name=ku.file_name,
                     line_number=ku.line_number,
                     documentation=ku.documentation,
-                    usage_count=0,
+                    usage_count=ku.total_usages,
                     is_user_defined=True,
                     source=ku.source,
                 )
@@ -331,33 +346,40 @@ class ReportingService:
                 for ku in undocumented
             ]
 
-            # Get duplicate/similar keywords
-            duplicates = []
-            # Get keywords that have high similarity with others
-            keywords_with_similarity = self.keyword_similarity_service.get_all_similar_keywords_above_threshold()
-            seen_pairs: set[tuple[str, str]] = set()
-            for kw in keywords_with_similarity:
-                if kw is None:
-                    continue
-                kw_name = kw.keyword_name_without_prefix
-                # Get similar keywords for this keyword
-                similar_list = self.keyword_similarity_service.get_n_most_similar_keywords(kw_name, 10)
-                for similar_kw in similar_list:
-                    if similar_kw.score >= _SIMILARITY_SCORE_THRESHOLD:
-                        # Avoid duplicate pairs
-                        sorted_names = sorted([kw_name, similar_kw.keyword_name_without_prefix])
-                        pair_key: tuple[str, str] = (sorted_names[0], sorted_names[1])
-                        if pair_key not in seen_pairs:
-                            seen_pairs.add(pair_key)
-                            duplicates.append(
-                                DuplicateKeywordPair(
-                                    keyword1_name=kw_name,
-                                    keyword1_file=kw.source,
-                                    keyword2_name=similar_kw.keyword_name_without_prefix,
-                                    keyword2_file=similar_kw.source,
-                                    similarity_score=similar_kw.score,
-                                )
-                            )
+            # Get duplicate/similar keywords, the threshold is given as percentage
+            duplicates = self.keyword_similarity_service.get_similar_keyword_pairs(
+                threshold=_SIMILARITY_SCORE_THRESHOLD / 100,
+            )
+
+            # Get recursive and mutually recursive keywords
+            recursive_keywords = [
+                RecursiveKeywordGroupData(
+                    keyword_names=[keyword.name for keyword in group.keywords],
+                    file_names=[Path(keyword.source).name for keyword in group.keywords],
+                    is_mutually_recursive=group.is_mutually_recursive,
+                )
+                for group in self.keyword_usage_service.get_recursive_keyword_groups()
+            ]
+
+            # Get the executed keywords with the most total time, if output files were ingested
+            executed_keywords = [
+                (keyword, statistics)
+                for keyword in self.keyword_registry.get_all_keywords()
+                if (statistics := keyword.runtime_statistics) is not None
+            ]
+            executed_keywords.sort(key=lambda executed: -executed[1].total_seconds)
+            slowest_keywords = [
+                SlowKeywordData(
+                    keyword_name=keyword.keyword_name_without_prefix,
+                    file_name=keyword.file_name,
+                    call_count=statistics.call_count,
+                    failure_count=statistics.failure_count,
+                    total_seconds=statistics.total_seconds,
+                    mean_seconds=statistics.mean_seconds,
+                    p95_seconds=statistics.p95_seconds,
+                )
+                for keyword, statistics in executed_keywords[:_SLOWEST_KEYWORDS_LIMIT]
+            ]
 
             # Collect file data
             files_data = [
@@ -398,6 +420,8 @@ class ReportingService:
                 unused_keywords=unused_data,
                 undocumented_keywords=undocumented_data,
                 duplicate_keywords=duplicates,
+                recursive_keywords=recursive_keywords,
+                slowest_keywords=slowest_keywords,
                 files=files_data,
                 risk_files=risk_files,
                 robocop_issues=issues_data,
@@ -8,9 +8,11 @@ from pathlib import Path
 
 import click
 from robocop.config.manager import ConfigManager
+from robocop.linter.diagnostics import Diagnostic
 from robocop.linter.fix import FixApplier
 from robocop.linter.runner import RobocopLinter
 from robocop.source_file import SourceFile
+from roboview.core.snapshot import get_stable_path, stable_id
 from roboview.registries.robocop_registry import RobocopRegistry
 from roboview.schemas.domain.robocop import RobocopMessage, RuleCategory
 from roboview.utils.directory_parsing import DirectoryParser
@@ -78,6 +80,7 @@ class RobocopRegistryService:
                     rf_script_path = Path(error.source.path)
                     self.robocop_registry.register(
                         RobocopMessage(
+                            message_id=self._build_message_id(rf_script_path, error),
                             rule_id=self._extract_rule_id(str(error.rule)),
                             rule_message=str(error.rule),
                             message=str(error.message),
@@ -118,6 +121,7 @@ class RobocopRegistryService:
                     for error in diagnostics:
                         self.robocop_registry.register(
                             RobocopMessage(
+                                message_id=self._build_message_id(file, error),
                                 rule_id=self._extract_rule_id(str(error.rule)),
                                 rule_message=str(error.rule),
                                 message=str(error.message),
@@ -140,6 +144,27 @@ class RobocopRegistryService:
         except Exception:
             logger.exception("Error parsing files")
 
+    def _build_message_id(self, file_path: Path, error: Diagnostic) -> str:
+        """Build a message id that stays stable across Robocop runs and project locations.
+
+        Arguments:
+            file_path (Path): File the diagnostic was reported for.
+            error (Diagnostic): Robocop diagnostic.
+
+        Returns:
+            str: Deterministic message id.
+
+        """
+        return stable_id(
+            get_stable_path(file_path, self.project_root_dir),
+            str(error.rule),
+            error.range.start.line,
+            error.range.start.character,
+            error.range.end.line,
+            error.range.end.character,
+            str(error.message),
+        )
+
     @staticmethod
     def _extract_rule_id(rule_text: str) -> str:
         """Extract rule ID from robocop rule text.
@@ -0,0 +1,285 @@
+"""Service class selecting the test cases affected by changed Robot Framework files."""
+
+import logging
+import re
+from bisect import bisect_right
+from pathlib import Path
+
+from robot.running import TestSuite
+from roboview.schemas.domain.call_graph import CallGraphNodeTypeEnum
+from roboview.schemas.domain.files import FileProperties
+from roboview.schemas.domain.test_impact import ChangedFile, ImpactedSuite, ImpactedTestCase, TestImpact
+from roboview.services.keyword_usage_service import KeywordUsageService
+from roboview.utils.call_graph import KeywordCallGraph
+from roboview.utils.import_graph import resolve_import_path
+
+logger = logging.getLogger(__name__)
+
+_INIT_FILE_NAME = "__init__.robot"
+_SUITE_EXTENSIONS = (".robot",)
+_NAME_PATTERN_CHARACTERS = re.compile(r"([*?\[])")
+
+_REASON_SUITE_CHANGED = "Settings or variables of the suite changed"
+_REASON_SUITE_SETTINGS = "Suite setup or teardown reaches a changed keyword"
+_REASON_NO_TEST_CASE_DATA = "Keyword calls of the suite are not known per test case"
+_REASON_RESOURCE_CHANGED = "Imports a resource file whose settings or variables changed"
+_REASON_RESOURCE_DELETED = "Imports a deleted resource file"
+
+
+def _escape_name_pattern(name: str) -> str:
+    """Escape the glob characters of a name for the --test and --suite options."""
+    return _NAME_PATTERN_CHARACTERS.sub(r"[\1]", name)
+
+
+class TestImpactService:
+    """Class to select the test cases affected by changed Robot Framework files.
+
+    Changed lines are mapped to the keyword or test case defined around them. Changed
+    keywords are followed backwards through the resolved call graph to the test cases and
+    suite settings calling them. Changes outside of keywords and test cases, to settings or
+    variables, affect the whole suite, and for resource files every suite importing them
+    through the import graph.
+    """
+
+    # Not a test class, although pytest collects classes named Test*
+    __test__ = False
+
+    def __init__(self, keyword_usage_service: KeywordUsageService, project_root: Path) -> None:
+        """Initialize TestImpactService.
+
+        Arguments:
+            keyword_usage_service (KeywordUsageService): Keyword usage service providing the call graph.
+            project_root (Path): Root directory of the project, the top-level suite of the run.
+
+        Attributes:
+            keyword_usage_service (KeywordUsageService): Keyword usage service providing the call graph.
+            file_registry (FileRegistry): File registry of the project.
+            project_root (Path): Root directory of the project, the top-level suite of the run.
+
+        """
+        self.keyword_usage_service = keyword_usage_service
+        self.file_registry = keyword_usage_service.file_registry
+        self.project_root = project_root
+
+    def analyze(self, changed_files: list[ChangedFile]) -> TestImpact:
+        """Select the suites and test cases affected by changed files.
+
+        Arguments:
+            changed_files (list[ChangedFile]): Changed files, relative paths are relative to the project root.
+
+        Returns:
+            TestImpact: Changed keywords, suites to run completely and single test cases to run.
+
+        """
+        graph = self.keyword_usage_service.get_call_graph()
+        import_graph = self.keyword_usage_service.get_keyword_resolver().import_graph
+        files = {self._normalize_path(file.path): file for file in self.file_registry.get_all_files()}
+        blocks = self._get_definition_blocks(graph)
+
+        changed_paths: list[str] = []
+        changed_nodes: set[int] = set()
+        whole_suites: dict[str, str] = {}
+        changed_resources: list[int] = []
+        deleted_paths: set[str] = set()
+        for change in changed_files:
+            file = files.get(self._normalize_path(change.path))
+            # Files that are not registered anymore count as deleted
+            if change.is_deleted or file is None:
+                deleted_paths.add(self._normalize_path(change.path))
+                continue
+
+            changed_paths.append(file.path)
+            file_blocks = blocks.get(file.path, [])
+            outside_blocks = self._find_changed_definitions(file_blocks, change.line_ranges, changed_nodes)
+            if outside_blocks and not file.is_resource:
+                whole_suites.setdefault(file.path, _REASON_SUITE_CHANGED)
+            elif outside_blocks and (import_node := import_graph.find_file(file.path)) is not None:
+                changed_resources.append(import_node)
+
+        for node in import_graph.get_importers(changed_resources):
+            whole_suites.setdefault(import_graph.paths[node], _REASON_RESOURCE_CHANGED)
+        for path in self._find_importers_of_deleted(deleted_paths):
+            whole_suites.setdefault(path, _REASON_RESOURCE_DELETED)
+
+        keyword_count = len(graph.keywords)
+        changed_keywords = sorted(node for node in changed_nodes if node < keyword_count)
+        test_case_nodes = {node for node in changed_nodes if node >= keyword_count}
+        for node in graph.get_calling_entry_points(changed_keywords):
+            if graph.node_types[node] == CallGraphNodeTypeEnum.TEST_CASE:
+                test_case_nodes.add(node)
+            else:
+                file = files.get(self._normalize_path(graph.sources[node]))
+                reason = _REASON_SUITE_SETTINGS if file is not None and file.test_cases is not None else None
+                whole_suites.setdefault(graph.sources[node], reason or _REASON_NO_TEST_CASE_DATA)
+
+        suites = self._to_suites(whole_suites, files)
+        test_cases = self._to_test_cases(graph, test_case_nodes, suites)
+
+        logger.info(
+            "%d changed files affect %d keywords, %d suites and %d single test cases",
+            len(changed_files),
+            len(changed_keywords),
+            len(suites),
+            len(test_cases),
+        )
+        return TestImpact(
+            changed_files=changed_paths,
+            changed_keywords=[graph.to_node(node) for node in changed_keywords],
+            suites=suites,
+            test_cases=test_cases,
+        )
+
+    @staticmethod
+    def _get_definition_blocks(graph: KeywordCallGraph) -> dict[str, list[tuple[int, int]]]:
+        """Return the line and node of the user keywords and test cases of every file, ordered by line."""
+        blocks: dict[str, list[tuple[int, int]]] = {}
+        for node, node_type in enumerate(graph.node_types):
+            if node_type == CallGraphNodeTypeEnum.FILE:
+                continue
+            if node_type == CallGraphNodeTypeEnum.KEYWORD and not graph.keywords[node].is_user_defined:
+                continue
+            if (line_number := graph.line_numbers[node]) is not None:
+                blocks.setdefault(graph.sources[node], []).append((line_number, node))
+        for file_blocks in blocks.values():
+            file_blocks.sort()
+        return blocks
+
+    @staticmethod
+    def _find_changed_definitions(
+        file_blocks: list[tuple[int, int]], line_ranges: list[tuple[int, int]] | None, changed_nodes: set[int]
+    ) -> bool:
+        """Add the keywords and test cases around the changed lines to changed_nodes.
+
+        A definition reaches from its first line to the line before the next definition, so
+        changes in front of the first definition are in the settings or variables.
+
+        Returns:
+            bool: Whether lines outside of keywords and test cases changed, always if line_ranges is None.
+
+        """
+        if line_ranges is None:
+            changed_nodes.update(node for _, node in file_blocks)
+            return True
+
+        outside_blocks = False
+        lines = [line_number for line_number, _ in file_blocks]
+        for first, last in line_ranges:
+            index = bisect_right(lines, first) - 1
+            if index < 0:
+                outside_blocks = True
+                index = 0
+            while index < len(file_blocks) and file_blocks[index][0] <= last:
+                changed_nodes.add(file_blocks[index][1])
+                index += 1
+        return outside_blocks
+
+    def _to_suites(self, whole_suites: dict[str, str], files: dict[str, FileProperties]) -> list[ImpactedSuite]:
+        """Return the suites of the suite files, without resource files and nested suites."""
+        suites: dict[str, ImpactedSuite] = {}
+        for path, reason in whole_suites.items():
+            file = files.get(self._normalize_path(path))
+            if file is None or file.is_resource:
+                continue
+            source = Path(path).parent.as_posix() if Path(path).name.lower() == _INIT_FILE_NAME else path
+            full_name = self.get_suite_name(path)
+            suites.setdefault(full_name, ImpactedSuite(full_name=full_name, source=source, reason=reason))
+
+        names = sorted(suites)
+        return [
+            suites[name]
+            for name in names
+            if not any(name.startswith(f"{parent}.") for parent in names if parent != name)
+        ]
+
+    def _to_test_cases(
+        self, graph: KeywordCallGraph, test_case_nodes: set[int], suites: list[ImpactedSuite]
+    ) -> list[ImpactedTestCase]:
+        """Return the test cases outside of the suites to run completely, ordered by file and line."""
+        suite_names = [suite.full_name for suite in suites]
+        test_cases = []
+        for node in sorted(test_case_nodes, key=lambda node: (graph.sources[node], graph.line_numbers[node] or 0)):
+            suite_name = self.get_suite_name(graph.sources[node])
+            if any(suite_name == name or suite_name.startswith(f"{name}.") for name in suite_names):
+                continue
+            test_cases.append(
+                ImpactedTestCase(
+                    name=graph.names[node],
+                    full_name=f"{suite_name}.{graph.names[node]}",
+                    source=graph.sources[node],
+                    line_number=graph.line_numbers[node],
+                )
+            )
+        return test_cases
+
+    def _find_importers_of_deleted(self, deleted_paths: set[str]) -> list[str]:
+        """Return the files importing deleted files directly or through other resource files."""
+        if not deleted_paths:
+            return []
+
+        import_graph = self.keyword_usage_service.get_keyword_resolver().import_graph
+        importing_nodes = []
+        for file in self.file_registry.get_all_files():
+            for import_path in file.resource_imports or ():
+                resolved = resolve_import_path(import_path, file.path)
+                if resolved is not None and self._normalize_path(resolved) in deleted_paths:
+                    if (node := import_graph.find_file(file.path)) is not None:
+                        importing_nodes.append(node)
+                    break
+        return [import_graph.paths[node] for node in import_graph.get_importers(importing_nodes)]
+
+    def get_suite_name(self, path: str) -> str:
+        """Return the full name Robot Framework gives the suite of a file when running the project root.
+
+        Arguments:
+            path (str): Path of the suite file, for __init__ files the suite of their directory.
+
+        Returns:
+            str: Names of the suite and its parent suites separated by dots.
+
+        """
+        file_path = Path(path)
+        root = self.project_root.resolve()
+        try:
+            relative = file_path.resolve().relative_to(root)
+        except ValueError:
+            return TestSuite.name_from_source(file_path, _SUITE_EXTENSIONS)
+
+        names = [TestSuite.name_from_source(root)]
+        names.extend(TestSuite.name_from_source(directory) for directory in relative.parent.parts)
+        if file_path.name.lower() != _INIT_FILE_NAME:
+            names.append(TestSuite.name_from_source(file_path, _SUITE_EXTENSIONS))
+        return ".".join(names)
+
+    def _normalize_path(self, path: str) -> str:
+        """Return the absolute normalized POSIX path, relative paths are relative to the project root."""
+        file_path = Path(path)
+        if not file_path.is_absolute():
+            file_path = self.project_root / file_path
+        return file_path.resolve().as_posix()
+
+    @staticmethod
+    def to_argument_file(impact: TestImpact) -> str:
+        """Return a Robot Framework argument file selecting the affected test cases.
+
+        Robot Framework runs only the tests matching --test inside the suites matching --suite,
+        so suites are selected with --suite only if no single test cases are selected, and
+        otherwise with a --test pattern matching all their tests.
+
+        Arguments:
+            impact (TestImpact): Result of the test impact analysis.
+
+        Returns:
+            str: Argument file content for ``robot --argumentfile``.
+
+        """
+        lines = [f"# Test cases affected by {len(impact.changed_files)} changed files"]
+        if not impact.suites and not impact.test_cases:
+            lines.append("# No test case is affected, without selection options Robot Framework runs all tests")
+        for suite in impact.suites:
+            lines.append(f"# {suite.full_name}: {suite.reason}")
+            if impact.test_cases:
+                lines.append(f"--test {_escape_name_pattern(suite.full_name)}.*")
+            else:
+                lines.append(f"--suite {_escape_name_pattern(suite.full_name)}")
+        lines.extend(f"--test {_escape_name_pattern(test_case.full_name)}" for test_case in impact.test_cases)
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,138 @@
+"""Service class warming up the configured project in the background at server startup."""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from roboview.schemas.domain.warmup import WarmupStatusEnum
+from roboview.services.project_pool_service import ProjectContext
+
+logger = logging.getLogger(__name__)
+
+
+class WarmupService:
+    """Service class to initialize the project the server was started for in the background.
+
+    The initialization runs in a daemon thread, so the server answers requests, including
+    liveness checks, while the project is analyzed, and shutting down does not wait for it.
+
+    Attributes:
+        status: State of the warm-up.
+        project_root: Root directory of the project warmed up.
+        robocop_config_file: Robocop configuration the project is analyzed with.
+        project_key: Key of the initialized project once the warm-up is ready.
+        error: Error the warm-up failed with.
+        duration_seconds: Duration of the finished warm-up.
+        _done: Event set once the warm-up finished.
+        _thread: Thread running the initialization.
+
+    """
+
+    def __init__(self) -> None:
+        """Initialize WarmupService."""
+        self.status = WarmupStatusEnum.DISABLED
+        self.project_root: Path | None = None
+        self.robocop_config_file: Path | None = None
+        self.project_key: str | None = None
+        self.error: str | None = None
+        self.duration_seconds: float | None = None
+        self._done = threading.Event()
+        self._done.set()
+        self._thread: threading.Thread | None = None
+
+    def start(
+        self,
+        project_root: Path,
+        robocop_config_file: Path | None,
+        initialize: Callable[[Path, Path | None], ProjectContext],
+    ) -> None:
+        """Start warming up a project in the background.
+
+        Arguments:
+            project_root (Path): Root directory of the project.
+            robocop_config_file (Path | None): Robocop configuration file of the project.
+            initialize (Callable[[Path, Path | None], ProjectContext]): Initializes the project
+                and adds it to the project pool.
+
+        Raises:
+            RuntimeError: If a warm-up is already running.
+
+        """
+        if self.status == WarmupStatusEnum.RUNNING:
+            msg = "A warm-up is already running"
+            raise RuntimeError(msg)
+
+        self.status = WarmupStatusEnum.RUNNING
+        self.project_root = project_root
+        self.robocop_config_file = robocop_config_file
+        self.project_key = None
+        self.error = None
+        self.duration_seconds = None
+        self._done.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(initialize, project_root, robocop_config_file),
+            name="roboview-warmup",
+            daemon=True,
+        )
+        self._thread.start()
+        logger.info("Warming up project %s in the background", project_root)
+
+    def _run(
+        self,
+        initialize: Callable[[Path, Path | None], ProjectContext],
+        project_root: Path,
+        robocop_config_file: Path | None,
+    ) -> None:
+        """Initialize the project and record the outcome."""
+        start = time.perf_counter()
+        try:
+            context = initialize(project_root, robocop_config_file)
+        except Exception as e:
+            logger.exception("Warm-up of project %s failed", project_root)
+            self.error = str(e) or type(e).__name__
+            self.status = WarmupStatusEnum.FAILED
+        else:
+            self.project_key = context.project_key
+            self.status = WarmupStatusEnum.READY
+            logger.info("Project %s is warmed up", project_root)
+        finally:
+            self.duration_seconds = time.perf_counter() - start
+            self._done.set()
+
+    def is_running_for(self, project_root: Path, robocop_config_file: Path | None) -> bool:
+        """Return whether the running warm-up initializes a project the same way.
+
+        Arguments:
+            project_root (Path): Root directory of the project.
+            robocop_config_file (Path | None): Robocop configuration file of the project.
+
+        Returns:
+            bool: True if the warm-up is running for the project and configuration.
+
+        """
+        return (
+            self.status == WarmupStatusEnum.RUNNING
+            and self.project_root is not None
+            and self.project_root.resolve() == project_root.resolve()
+            and _resolve(self.robocop_config_file) == _resolve(robocop_config_file)
+        )
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until the warm-up finished.
+
+        Arguments:
+            timeout (float | None): Maximum number of seconds to wait, None waits indefinitely.
+
+        Returns:
+            bool: True if the warm-up finished or was never started, False on timeout.
+
+        """
+        return self._done.wait(timeout)
+
+
+def _resolve(path: Path | None) -> Path | None:
+    """Resolve an optional path."""
+    return path.resolve() if path is not None else None
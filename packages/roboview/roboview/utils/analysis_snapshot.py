@@ -0,0 +1,586 @@
+"""Compact, versioned binary snapshot of a complete project analysis."""
+
+import json
+import logging
+import mmap
+import os
+import struct
+from array import array
+from collections.abc import Iterable, Sequence
+from datetime import UTC, datetime
+from pathlib import Path, PurePosixPath
+from typing import BinaryIO
+
+from roboview.registries.file_registry import FileRegistry
+from roboview.registries.keyword_registry import KeywordRegistry
+from roboview.registries.robocop_registry import RobocopRegistry
+from roboview.schemas.domain.files import FileProperties, TestCaseProperties
+from roboview.schemas.domain.keywords import KeywordProperties
+from roboview.schemas.domain.robocop import RobocopMessage, RuleCategory
+from roboview.services.keyword_similarity_service import KeywordSimilarityService
+from roboview.utils.similarity_index import SimilarityIndex
+
+logger = logging.getLogger(__name__)
+
+_MAGIC = b"RVSNAPSH"
+_FORMAT_VERSION = 4
+# Written in native byte order, a mismatch on load means the snapshot was built on another platform
+_BYTE_ORDER_MARK = 0x01020304
+# magic, format version, byte order mark, section count
+_HEADER = struct.Struct("=8sIII")
+# section name, offset, length
+_SECTION_ENTRY = struct.Struct("=16sQQ")
+_SECTION_ALIGNMENT = 8
+
+# String ids of keyword_id, file_name, keyword_name_without_prefix, keyword_name_with_prefix, description,
+# code, source, validation_str_without_prefix, validation_str_with_prefix, then is_user_defined,
+# line_number and the (start, count) range of called_keywords in the list section
+_KEYWORD_RECORD = struct.Struct("=9i?3xiIi")
+# String ids of file_name and path, then is_resource, the (start, count) ranges of initialized_keywords,
+# called_keywords, imported_files, resource_imports and setting_keywords in the list section and of test_cases in
+# the test case section
+_FILE_RECORD = struct.Struct("=2i?3xIiIiIiIiIiIi")
+# String id of name, then line_number and the (start, count) range of called_keywords in the list section
+_TEST_CASE_RECORD = struct.Struct("=2iIi")
+# String ids of message_id, rule_id, rule_message, message, category, file_name, source, severity
+# and code, then whether the category is a RuleCategory value
+_ROBOCOP_RECORD = struct.Struct("=9i?3x")
+
+_NONE = -1
+# Prefix of paths stored relative to the project root, which cannot occur in real paths
+_RELATIVE_PATH_MARKER = "\x00"
+
+_META_SECTION = b"meta"
+_STRINGS_SECTION = b"strings"
+_LISTS_SECTION = b"lists"
+_KEYWORDS_SECTION = b"keywords"
+_FILES_SECTION = b"files"
+_TEST_CASES_SECTION = b"test_cases"
+_ROBOCOP_SECTION = b"robocop"
+_SIMILARITY_ROWS_SECTION = b"similarity_rows"
+_SIMILARITY_SECTION = b"similarity"
+
+
+class SnapshotFormatError(ValueError):
+    """Raised if a file is not a readable analysis snapshot."""
+
+
+class AnalysisSnapshot:
+    """Project analysis loaded from a snapshot file.
+
+    Attributes:
+        path: Path of the snapshot file.
+        project_root: Root directory the paths of the analysis are resolved against.
+        created_at: ISO timestamp of the snapshot creation.
+        keywords: Keyword properties of the keyword registry.
+        files: File properties of the file registry.
+        robocop_messages: Messages of the Robocop registry.
+        similarity_keywords: Keyword properties per row of the similarity index.
+        similarity_index: Neighbour lists served from the mapped snapshot, None if not stored.
+
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        path: Path,
+        project_root: Path,
+        created_at: str,
+        *,
+        keywords: list[KeywordProperties],
+        files: list[FileProperties],
+        robocop_messages: list[RobocopMessage],
+        similarity_keywords: list[KeywordProperties],
+        similarity_index: SimilarityIndex | None,
+    ) -> None:
+        """Initialize AnalysisSnapshot.
+
+        Arguments:
+            path (Path): Path of the snapshot file.
+            project_root (Path): Root directory the paths of the analysis are resolved against.
+            created_at (str): ISO timestamp of the snapshot creation.
+            keywords (list[KeywordProperties]): Keyword properties of the keyword registry.
+            files (list[FileProperties]): File properties of the file registry.
+            robocop_messages (list[RobocopMessage]): Messages of the Robocop registry.
+            similarity_keywords (list[KeywordProperties]): Keyword properties per row of the similarity index.
+            similarity_index (SimilarityIndex | None): Neighbour lists, None if not stored.
+
+        """
+        self.path = path
+        self.project_root = project_root
+        self.created_at = created_at
+        self.keywords = keywords
+        self.files = files
+        self.robocop_messages = robocop_messages
+        self.similarity_keywords = similarity_keywords
+        self.similarity_index = similarity_index
+
+
+class _StringTable:
+    """Deduplicating table of the strings referenced by the snapshot records."""
+
+    def __init__(self, project_root: Path) -> None:
+        self._ids: dict[str, int] = {}
+        self._roots = {project_root, project_root.resolve()}
+        self.lists = array("i")
+
+    def add(self, value: str | None) -> int:
+        """Return the id of a string, adding it on first use."""
+        if value is None:
+            return _NONE
+        return self._ids.setdefault(value, len(self._ids))
+
+    def add_path(self, value: str) -> int:
+        """Return the id of a path, stored relative to the project root if it lies inside it.
+
+        The path is normalized with the separators of the platform first, so Windows paths
+        with backslashes are made relative as well.
+
+        """
+        path = Path(value)
+        for root in self._roots:
+            try:
+                relative_path = path.relative_to(root)
+            except ValueError:
+                continue
+            return self.add(f"{_RELATIVE_PATH_MARKER}{relative_path.as_posix()}")
+        return self.add(value)
+
+    def add_list(self, values: Iterable[str] | None) -> tuple[int, int]:
+        """Store a list of strings and return its (start, count) range, count is -1 for None."""
+        if values is None:
+            return 0, _NONE
+        start = len(self.lists)
+        self.lists.extend(self.add(value) for value in values)
+        return start, len(self.lists) - start
+
+    def to_bytes(self) -> bytes:
+        """Encode the strings as count, end offsets and UTF-8 data."""
+        encoded = [value.encode("utf-8", "surrogatepass") for value in self._ids]
+        offsets = array("I", [0])
+        for value in encoded:
+            offsets.append(offsets[-1] + len(value))
+        return struct.pack("=I", len(encoded)) + offsets.tobytes() + b"".join(encoded)
+
+
+def _decode_strings(buffer: memoryview, project_root: Path) -> list[str]:
+    """Decode the string table and resolve relative paths against the project root."""
+    (count,) = struct.unpack_from("=I", buffer)
+    offsets = buffer[4 : 4 + 4 * (count + 1)].cast("I")
+    data = bytes(buffer[4 + 4 * (count + 1) :])
+    root = PurePosixPath(project_root.as_posix())
+
+    strings = []
+    for position in range(count):
+        value = data[offsets[position] : offsets[position + 1]].decode("utf-8", "surrogatepass")
+        if value.startswith(_RELATIVE_PATH_MARKER):
+            value = (root / value[1:]).as_posix()
+        strings.append(value)
+    offsets.release()
+    return strings
+
+
+def _write_section(snapshot_file: BinaryIO, name: bytes, sections: list[tuple[bytes, int, int]], data: bytes) -> None:
+    """Write an aligned section and record its position."""
+    _pad(snapshot_file)
+    offset = snapshot_file.tell()
+    snapshot_file.write(data)
+    sections.append((name, offset, len(data)))
+
+
+def _pad(snapshot_file: BinaryIO) -> None:
+    """Pad the file to the section alignment."""
+    snapshot_file.write(bytes(-snapshot_file.tell() % _SECTION_ALIGNMENT))
+
+
+def write_analysis_snapshot(  # noqa: PLR0913
+    path: Path,
+    project_root: Path,
+    *,
+    keyword_registry: KeywordRegistry,
+    file_registry: FileRegistry,
+    robocop_registry: RobocopRegistry,
+    keyword_similarity_service: KeywordSimilarityService,
+) -> None:
+    """Write a snapshot of a project analysis.
+
+    Strings are deduplicated in a shared table and referenced by fixed-size records. Paths
+    inside the project root are stored relative to it, so the snapshot can be loaded from
+    another checkout. The similarity neighbours are embedded in similarity index format.
+    The file is written next to the target and moved into place.
+
+    Layout (native byte order): header, section table and aligned sections holding the
+    metadata as JSON, the string table, the string lists, the keyword, file, test case and
+    Robocop records, the keyword record per similarity row and the similarity index.
+
+    Arguments:
+        path (Path): Path of the snapshot file.
+        project_root (Path): Root directory of the analyzed project.
+        keyword_registry (KeywordRegistry): Keyword registry of the project.
+        file_registry (FileRegistry): File registry of the project.
+        robocop_registry (RobocopRegistry): Robocop registry of the project.
+        keyword_similarity_service (KeywordSimilarityService): Similarity service with calculated neighbours.
+
+    """
+    strings = _StringTable(project_root)
+
+    keywords = keyword_registry.get_all_keywords()
+    keyword_records = bytearray()
+    for keyword in keywords:
+        keyword_records += _KEYWORD_RECORD.pack(
+            strings.add(keyword.keyword_id),
+            strings.add(keyword.file_name),
+            strings.add(keyword.keyword_name_without_prefix),
+            strings.add(keyword.keyword_name_with_prefix),
+            strings.add(keyword.description),
+            strings.add(keyword.code),
+            strings.add_path(keyword.source) if keyword.is_user_defined else strings.add(keyword.source),
+            strings.add(keyword.validation_str_without_prefix),
+            strings.add(keyword.validation_str_with_prefix),
+            keyword.is_user_defined,
+            keyword.line_number if keyword.line_number is not None else _NONE,
+            *strings.add_list(keyword.called_keywords),
+        )
+
+    file_records = bytearray()
+    test_case_records = bytearray()
+    test_case_count = 0
+    for file in file_registry.get_all_files():
+        test_cases = (0, _NONE) if file.test_cases is None else (test_case_count, len(file.test_cases))
+        for test_case in file.test_cases or []:
+            test_case_records += _TEST_CASE_RECORD.pack(
+                strings.add(test_case.name),
+                test_case.line_number if test_case.line_number is not None else _NONE,
+                *strings.add_list(test_case.called_keywords),
+            )
+            test_case_count += 1
+        file_records += _FILE_RECORD.pack(
+            strings.add(file.file_name),
+            strings.add_path(file.path),
+            file.is_resource,
+            *strings.add_list(file.initialized_keywords),
+            *strings.add_list(file.called_keywords),
+            *strings.add_list(file.imported_files),
+            *strings.add_list(file.resource_imports),
+            *strings.add_list(file.setting_keywords),
+            *test_cases,
+        )
+
+    robocop_records = bytearray()
+    for message in robocop_registry.get_all_error_messages():
+        category = message.category
+        is_rule_category = isinstance(category, RuleCategory)
+        robocop_records += _ROBOCOP_RECORD.pack(
+            strings.add(message.message_id),
+            strings.add(message.rule_id),
+            strings.add(message.rule_message),
+            strings.add(message.message),
+            strings.add(category.value if is_rule_category else category),
+            strings.add(message.file_name),
+            strings.add_path(message.source),
+            strings.add(message.severity),
+            strings.add(message.code),
+            is_rule_category,
+        )
+
+    similarity_keywords, row_hashes, neighbours = keyword_similarity_service.export_neighbours()
+    record_by_keyword = {id(keyword): record for record, keyword in enumerate(keywords)}
+    similarity_rows = array("I", (record_by_keyword[id(keyword)] for keyword in similarity_keywords))
+
+    metadata = {
+        "project_root": project_root.resolve().as_posix(),
+        "created_at": datetime.now(UTC).isoformat(),
+        "keywords": len(keywords),
+        "files": len(file_registry),
+        "robocop_messages": len(robocop_registry),
+        "similarity_rows": len(similarity_rows),
+    }
+
+    sections = [
+        (_META_SECTION, json.dumps(metadata).encode()),
+        (_STRINGS_SECTION, strings.to_bytes()),
+        (_LISTS_SECTION, strings.lists.tobytes()),
+        (_KEYWORDS_SECTION, bytes(keyword_records)),
+        (_FILES_SECTION, bytes(file_records)),
+        (_TEST_CASES_SECTION, bytes(test_case_records)),
+        (_ROBOCOP_SECTION, bytes(robocop_records)),
+        (_SIMILARITY_ROWS_SECTION, similarity_rows.tobytes()),
+    ]
+    section_count = len(sections) + (1 if similarity_keywords else 0)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with temporary_path.open("wb") as snapshot_file:
+            snapshot_file.write(_HEADER.pack(_MAGIC, _FORMAT_VERSION, _BYTE_ORDER_MARK, section_count))
+            table_offset = snapshot_file.tell()
+            snapshot_file.write(bytes(_SECTION_ENTRY.size * section_count))
+
+            written_sections: list[tuple[bytes, int, int]] = []
+            for name, data in sections:
+                _write_section(snapshot_file, name, written_sections, data)
+
+            if similarity_keywords:
+                _pad(snapshot_file)
+                offset = snapshot_file.tell()
+                SimilarityIndex.dump(
+                    snapshot_file,
+                    row_hashes,
+                    neighbours,
+                    keyword_similarity_service.index_top_k,
+                    normalize_variables=keyword_similarity_service.normalize_variables,
+                )
+                written_sections.append((_SIMILARITY_SECTION, offset, snapshot_file.tell() - offset))
+
+            snapshot_file.seek(table_offset)
+            for name, offset, length in written_sections:
+                snapshot_file.write(_SECTION_ENTRY.pack(name, offset, length))
+        temporary_path.replace(path)
+    finally:
+        temporary_path.unlink(missing_ok=True)
+
+    logger.info("Wrote analysis snapshot with %d keywords to %s", len(keywords), path)
+
+
+def _read_sections(buffer: memoryview, path: Path) -> dict[bytes, tuple[int, int]]:
+    """Validate the header and return the (offset, length) of every section."""
+    if len(buffer) < _HEADER.size:
+        msg = f"Truncated analysis snapshot: {path}"
+        raise SnapshotFormatError(msg)
+
+    magic, format_version, byte_order_mark, section_count = _HEADER.unpack_from(buffer)
+    if magic != _MAGIC:
+        msg = f"Not an analysis snapshot: {path}"
+        raise SnapshotFormatError(msg)
+    if format_version != _FORMAT_VERSION or byte_order_mark != _BYTE_ORDER_MARK:
+        msg = f"Unsupported analysis snapshot format version {format_version} or byte order: {path}"
+        raise SnapshotFormatError(msg)
+
+    sections = {}
+    for position in range(section_count):
+        entry_offset = _HEADER.size + position * _SECTION_ENTRY.size
+        if entry_offset + _SECTION_ENTRY.size > len(buffer):
+            msg = f"Truncated analysis snapshot: {path}"
+            raise SnapshotFormatError(msg)
+        name, offset, length = _SECTION_ENTRY.unpack_from(buffer, entry_offset)
+        if offset + length > len(buffer):
+            msg = f"Truncated analysis snapshot: {path}"
+            raise SnapshotFormatError(msg)
+        sections[name.rstrip(b"\x00")] = (offset, length)
+
+    missing_sections = {
+        _META_SECTION,
+        _STRINGS_SECTION,
+        _LISTS_SECTION,
+        _KEYWORDS_SECTION,
+        _FILES_SECTION,
+        _TEST_CASES_SECTION,
+        _ROBOCOP_SECTION,
+        _SIMILARITY_ROWS_SECTION,
+    }.difference(sections)
+    if missing_sections:
+        msg = f"Analysis snapshot is missing sections {sorted(missing_sections)}: {path}"
+        raise SnapshotFormatError(msg)
+    return sections
+
+
+def _resolve_list(strings: list[str], lists: Sequence[int], start: int, count: int) -> list[str] | None:
+    """Return the strings of a (start, count) range of the list section, None for count -1."""
+    if count == _NONE:
+        return None
+    return [strings[string_id] for string_id in lists[start : start + count]]
+
+
+def _read_records(
+    buffer: memoryview,
+    sections: dict[bytes, tuple[int, int]],
+    strings: list[str],
+    lists: Sequence[int],
+) -> tuple[list[KeywordProperties], list[FileProperties], list[RobocopMessage]]:
+    """Build the registry entries from their records, without validating them again."""
+
+    def section(name: bytes) -> memoryview:
+        offset, length = sections[name]
+        return buffer[offset : offset + length]
+
+    def string(string_id: int) -> str | None:
+        return strings[string_id] if string_id != _NONE else None
+
+    keywords = [
+        KeywordProperties.model_construct(
+            keyword_id=strings[keyword_id],
+            file_name=strings[file_name],
+            keyword_name_without_prefix=strings[name_without_prefix],
+            keyword_name_with_prefix=strings[name_with_prefix],
+            description=string(description),
+            is_user_defined=is_user_defined,
+            code=strings[code],
+            source=strings[source],
+            validation_str_without_prefix=strings[validation_without_prefix],
+            validation_str_with_prefix=strings[validation_with_prefix],
+            called_keywords=_resolve_list(strings, lists, called_start, called_count),
+            line_number=line_number if line_number != _NONE else None,
+        )
+        for (
+            keyword_id,
+            file_name,
+            name_without_prefix,
+            name_with_prefix,
+            description,
+            code,
+            source,
+            validation_without_prefix,
+            validation_with_prefix,
+            is_user_defined,
+            line_number,
+            called_start,
+            called_count,
+        ) in _KEYWORD_RECORD.iter_unpack(section(_KEYWORDS_SECTION))
+    ]
+
+    test_cases = [
+        TestCaseProperties.model_construct(
+            name=strings[name],
+            line_number=line_number if line_number != _NONE else None,
+            called_keywords=_resolve_list(strings, lists, called_start, called_count) or [],
+        )
+        for name, line_number, called_start, called_count in _TEST_CASE_RECORD.iter_unpack(section(_TEST_CASES_SECTION))
+    ]
+
+    files = [
+        FileProperties.model_construct(
+            file_name=strings[file_name],
+            path=strings[file_path],
+            is_resource=is_resource,
+            initialized_keywords=_resolve_list(strings, lists, initialized_start, initialized_count),
+            called_keywords=_resolve_list(strings, lists, called_start, called_count),
+            imported_files=_resolve_list(strings, lists, imported_start, imported_count),
+            resource_imports=_resolve_list(strings, lists, resource_imports_start, resource_imports_count),
+            test_cases=test_cases[test_cases_start : test_cases_start + test_cases_count]
+            if test_cases_count != _NONE
+            else None,
+            setting_keywords=_resolve_list(strings, lists, setting_start, setting_count),
+        )
+        for (
+            file_name,
+            file_path,
+            is_resource,
+            initialized_start,
+            initialized_count,
+            called_start,
+            called_count,
+            imported_start,
+            imported_count,
+            resource_imports_start,
+            resource_imports_count,
+            setting_start,
+            setting_count,
+            test_cases_start,
+            test_cases_count,
+        ) in _FILE_RECORD.iter_unpack(section(_FILES_SECTION))
+    ]
+
+    robocop_messages = [
+        RobocopMessage.model_construct(
+            message_id=strings[message_id],
+            rule_id=strings[rule_id],
+            rule_message=strings[rule_message],
+            message=strings[message],
+            category=RuleCategory(strings[category]) if is_rule_category else strings[category],
+            file_name=strings[file_name],
+            source=strings[source],
+            severity=strings[severity],
+            code=strings[code],
+        )
+        for (
+            message_id,
+            rule_id,
+            rule_message,
+            message,
+            category,
+            file_name,
+            source,
+            severity,
+            code,
+            is_rule_category,
+        ) in _ROBOCOP_RECORD.iter_unpack(section(_ROBOCOP_SECTION))
+    ]
+
+    return keywords, files, robocop_messages
+
+
+def read_analysis_snapshot(path: Path, project_root: Path | None = None) -> AnalysisSnapshot:
+    """Load a snapshot of a project analysis.
+
+    Only the similarity neighbours are served from the memory-mapped file without copying
+    them. The string table is decoded and every registry entry is built from its record with
+    ``model_construct``, which skips validating it again but copies the analysis into memory.
+
+    Arguments:
+        path (Path): Path of the snapshot file.
+        project_root (Path | None): Root directory to resolve the stored relative paths against,
+            the root directory of the analyzed project if None.
+
+    Returns:
+        AnalysisSnapshot: The loaded analysis.
+
+    Raises:
+        SnapshotFormatError: If the file is not a snapshot of a supported format version.
+        OSError: If the file cannot be read.
+
+    """
+    with path.open("rb") as snapshot_file:
+        if os.fstat(snapshot_file.fileno()).st_size < _HEADER.size:
+            msg = f"Truncated analysis snapshot: {path}"
+            raise SnapshotFormatError(msg)
+        mapped_file = mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    similarity_index = None
+    buffer = memoryview(mapped_file)
+    try:
+        sections = _read_sections(buffer, path)
+
+        offset, length = sections[_META_SECTION]
+        try:
+            metadata = json.loads(bytes(buffer[offset : offset + length]))
+        except ValueError as e:
+            msg = f"Corrupt analysis snapshot metadata: {path}"
+            raise SnapshotFormatError(msg) from e
+        root = project_root.resolve() if project_root is not None else Path(metadata["project_root"])
+
+        offset, length = sections[_STRINGS_SECTION]
+        strings = _decode_strings(buffer[offset : offset + length], root)
+        offset, length = sections[_LISTS_SECTION]
+        lists = array("i", bytes(buffer[offset : offset + length]))
+        offset, length = sections[_SIMILARITY_ROWS_SECTION]
+        similarity_rows = array("I", bytes(buffer[offset : offset + length]))
+
+        try:
+            keywords, files, robocop_messages = _read_records(buffer, sections, strings, lists)
+            similarity_keywords = [keywords[record] for record in similarity_rows]
+        except (struct.error, IndexError, ValueError) as e:
+            msg = f"Corrupt analysis snapshot: {path}"
+            raise SnapshotFormatError(msg) from e
+
+        if _SIMILARITY_SECTION in sections:
+            offset, length = sections[_SIMILARITY_SECTION]
+            similarity_index = SimilarityIndex.from_buffer(buffer[offset : offset + length], path, mapped_file)
+    finally:
+        buffer.release()
+        if similarity_index is None:
+            mapped_file.close()
+
+    if similarity_index is not None and len(similarity_index) != len(similarity_keywords):
+        similarity_index.close()
+        msg = f"Similarity index of analysis snapshot does not match its keywords: {path}"
+        raise SnapshotFormatError(msg)
+
+    return AnalysisSnapshot(
+        path,
+        root,
+        metadata.get("created_at", ""),
+        keywords=keywords,
+        files=files,
+        robocop_messages=robocop_messages,
+        similarity_keywords=similarity_keywords if similarity_index is not None else [],
+        similarity_index=similarity_index,
+    )
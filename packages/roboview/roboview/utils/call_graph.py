@@ -0,0 +1,424 @@
+"""Resolved call graph of keywords, test cases and files in compressed adjacency form."""
+
+import logging
+from array import array
+from collections.abc import Iterable, Sequence
+
+from roboview.registries.file_registry import FileRegistry
+from roboview.registries.keyword_registry import KeywordRegistry
+from roboview.schemas.domain.call_graph import CallGraphNode, CallGraphNodeTypeEnum, KeywordReachabilityEnum
+from roboview.schemas.domain.keywords import KeywordProperties
+from roboview.utils.graph import strongly_connected_components, to_adjacency
+from roboview.utils.import_graph import ImportGraph, ScopedKeywordResolver
+
+logger = logging.getLogger(__name__)
+
+
+class _CallResolver:
+    """Resolve the calls of every file to keyword nodes, every distinct call of a file once."""
+
+    def __init__(self, resolver: ScopedKeywordResolver, keyword_nodes: dict[int, int]) -> None:
+        self._resolver = resolver
+        self._keyword_nodes = keyword_nodes
+        self._resolved: dict[tuple[str, str], int | None] = {}
+
+    def __call__(self, call: str, source: str) -> int | None:
+        key = (source, call)
+        if key in self._resolved:
+            return self._resolved[key]
+
+        keyword = self._resolver.resolve(call, source)
+        node = self._resolved[key] = self._keyword_nodes.get(id(keyword)) if keyword is not None else None
+        return node
+
+    @property
+    def unresolved_count(self) -> int:
+        """Number of distinct calls per file that resolve to no keyword."""
+        return sum(1 for node in self._resolved.values() if node is None)
+
+
+class KeywordCallGraph:
+    """Call graph with resolved keyword calls of keywords, test cases and files.
+
+    Nodes are numbered consecutively, keywords of the registry first, then test cases and
+    files. A keyword calls the keywords it resolves, a test case the keywords of its body,
+    setup, teardown and template, and a file its test cases and the keywords of its suite
+    setup and teardown. Files registered without test case data call all keywords called in
+    them instead. Calls are resolved within the imports of the calling file once when the
+    graph is built, and both directions are stored as compressed adjacency arrays, so a
+    traversal only touches the nodes it returns and their edges.
+
+    Attributes:
+        keywords: Keyword properties per keyword node.
+        node_types: Kind of every node.
+        names: Name of every node.
+        sources: Source path of every node.
+        line_numbers: Line number of every node, None if unknown.
+        unresolved_calls: Number of distinct calls per file that resolve to no keyword.
+        _keyword_nodes: Node per keyword id.
+        _reachability: Reachability of every keyword node, classified on first use.
+        _callee_offsets: Start of the callees of every node in _callees.
+        _callees: Callee nodes, grouped by caller.
+        _caller_offsets: Start of the callers of every node in _callers.
+        _callers: Caller nodes, grouped by callee.
+
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        keywords: list[KeywordProperties],
+        *,
+        node_types: list[CallGraphNodeTypeEnum],
+        names: list[str],
+        sources: list[str],
+        line_numbers: list[int | None],
+        edges: Iterable[tuple[int, int]],
+        unresolved_calls: int = 0,
+    ) -> None:
+        """Initialize KeywordCallGraph.
+
+        Arguments:
+            keywords (list[KeywordProperties]): Keyword properties of the first nodes.
+            node_types (list[CallGraphNodeTypeEnum]): Kind of every node.
+            names (list[str]): Name of every node.
+            sources (list[str]): Source path of every node.
+            line_numbers (list[int | None]): Line number of every node.
+            edges (Iterable[tuple[int, int]]): Distinct (caller, callee) node pairs.
+            unresolved_calls (int): Number of distinct calls per file that resolve to no keyword.
+
+        """
+        self.keywords = keywords
+        self.node_types = node_types
+        self.names = names
+        self.sources = sources
+        self.line_numbers = line_numbers
+        self.unresolved_calls = unresolved_calls
+        self._keyword_nodes = {keyword.keyword_id: node for node, keyword in enumerate(keywords)}
+        self._reachability: list[KeywordReachabilityEnum] | None = None
+
+        callers = array("I")
+        callees = array("I")
+        for caller, callee in edges:
+            callers.append(caller)
+            callees.append(callee)
+        self._callee_offsets, self._callees = to_adjacency(len(node_types), callers, callees)
+        self._caller_offsets, self._callers = to_adjacency(len(node_types), callees, callers)
+
+    @classmethod
+    def build(
+        cls,
+        keyword_registry: KeywordRegistry,
+        file_registry: FileRegistry,
+        resolver: ScopedKeywordResolver | None = None,
+    ) -> "KeywordCallGraph":
+        """Build the call graph of the registries.
+
+        Arguments:
+            keyword_registry (KeywordRegistry): Keyword registry of the project.
+            file_registry (FileRegistry): File registry of the project.
+            resolver (ScopedKeywordResolver | None): Resolves calls within the imports of the calling
+                file, built from the registries if None.
+
+        Returns:
+            KeywordCallGraph: The call graph.
+
+        """
+        keywords = keyword_registry.get_all_keywords()
+        node_types = [CallGraphNodeTypeEnum.KEYWORD] * len(keywords)
+        names = [keyword.keyword_name_with_prefix or keyword.keyword_name_without_prefix for keyword in keywords]
+        sources = [keyword.source for keyword in keywords]
+        line_numbers = [keyword.line_number for keyword in keywords]
+        if resolver is None:
+            resolver = ScopedKeywordResolver(keyword_registry, ImportGraph.build(file_registry))
+        resolve_call = _CallResolver(resolver, {id(keyword): node for node, keyword in enumerate(keywords)})
+
+        edges: set[tuple[int, int]] = set()
+
+        def add_calls(caller: int, calls: Iterable[str] | None) -> None:
+            source = sources[caller]
+            for call in calls or ():
+                callee = resolve_call(call, source)
+                if callee is not None:
+                    edges.add((caller, callee))
+
+        for node, keyword in enumerate(keywords):
+            add_calls(node, keyword.called_keywords)
+
+        for file in file_registry.get_all_files():
+            test_case_nodes = []
+            for test_case in file.test_cases or ():
+                test_case_node = len(node_types)
+                node_types.append(CallGraphNodeTypeEnum.TEST_CASE)
+                names.append(test_case.name)
+                sources.append(file.path)
+                line_numbers.append(test_case.line_number)
+                add_calls(test_case_node, test_case.called_keywords)
+                test_case_nodes.append(test_case_node)
+
+            file_node = len(node_types)
+            node_types.append(CallGraphNodeTypeEnum.FILE)
+            names.append(file.file_name)
+            sources.append(file.path)
+            line_numbers.append(None)
+            edges.update((file_node, test_case_node) for test_case_node in test_case_nodes)
+            # Without test case data the calls of the file stand in for those of its test cases
+            add_calls(file_node, file.setting_keywords if file.test_cases is not None else file.called_keywords)
+
+        logger.info(
+            "Built call graph with %d nodes and %d edges, %d distinct calls are unresolved",
+            len(node_types),
+            len(edges),
+            resolve_call.unresolved_count,
+        )
+        return cls(
+            keywords,
+            node_types=node_types,
+            names=names,
+            sources=sources,
+            line_numbers=line_numbers,
+            edges=sorted(edges),
+            unresolved_calls=resolve_call.unresolved_count,
+        )
+
+    @property
+    def node_count(self) -> int:
+        """Number of nodes."""
+        return len(self.node_types)
+
+    @property
+    def edge_count(self) -> int:
+        """Number of distinct calls."""
+        return len(self._callees)
+
+    def find_keyword(self, keyword_id: str) -> int | None:
+        """Return the node of a keyword.
+
+        Arguments:
+            keyword_id (str): Unique identifier of the keyword.
+
+        Returns:
+            int | None: Node of the keyword, None if it is not part of the graph.
+
+        """
+        return self._keyword_nodes.get(keyword_id)
+
+    def get_callees(self, node: int) -> Sequence[int]:
+        """Return the nodes a node calls directly.
+
+        Arguments:
+            node (int): Calling node.
+
+        Returns:
+            Sequence[int]: Called nodes.
+
+        """
+        return self._callees[self._callee_offsets[node] : self._callee_offsets[node + 1]]
+
+    def get_callers(self, node: int) -> Sequence[int]:
+        """Return the nodes calling a node directly.
+
+        Arguments:
+            node (int): Called node.
+
+        Returns:
+            Sequence[int]: Calling nodes.
+
+        """
+        return self._callers[self._caller_offsets[node] : self._caller_offsets[node + 1]]
+
+    def get_transitive_callees(self, node: int, max_depth: int | None = None) -> list[tuple[int, int]]:
+        """Return the nodes a node calls directly or indirectly, see ``_traverse``.
+
+        Arguments:
+            node (int): Calling node.
+            max_depth (int | None): Maximum number of calls between the nodes, None for no limit.
+
+        Returns:
+            list[tuple[int, int]]: Called nodes and their call distance, closest first.
+
+        """
+        return self._traverse(node, self._callee_offsets, self._callees, max_depth)
+
+    def get_transitive_callers(self, node: int, max_depth: int | None = None) -> list[tuple[int, int]]:
+        """Return the nodes calling a node directly or indirectly, see ``_traverse``.
+
+        Arguments:
+            node (int): Called node.
+            max_depth (int | None): Maximum number of calls between the nodes, None for no limit.
+
+        Returns:
+            list[tuple[int, int]]: Calling nodes and their call distance, closest first.
+
+        """
+        return self._traverse(node, self._caller_offsets, self._callers, max_depth)
+
+    @staticmethod
+    def _traverse(start: int, offsets: array, adjacency: array, max_depth: int | None) -> list[tuple[int, int]]:
+        """Breadth-first search from a node, visiting every reachable node once.
+
+        The work is proportional to the returned nodes and their edges, the start node is
+        only returned if it is reached through a cycle.
+        """
+        distances = {start: 0}
+        reached = []
+        frontier = [start]
+        depth = 0
+        while frontier and (max_depth is None or depth < max_depth):
+            depth += 1
+            next_frontier = []
+            for node in frontier:
+                for neighbour in adjacency[offsets[node] : offsets[node + 1]]:
+                    if neighbour not in distances:
+                        distances[neighbour] = depth
+                        reached.append((neighbour, depth))
+                        next_frontier.append(neighbour)
+                    elif neighbour == start and distances[start] == 0:
+                        distances[start] = depth
+                        reached.append((start, depth))
+            frontier = next_frontier
+        return reached
+
+    def get_reachable(self, roots: Iterable[int]) -> bytearray:
+        """Return which nodes the roots call directly or indirectly, including the roots.
+
+        A single breadth-first search from all roots at once visits every node and edge at most
+        once, however many roots there are.
+
+        Arguments:
+            roots (Iterable[int]): Nodes to start from.
+
+        Returns:
+            bytearray: 1 for every reached node, 0 otherwise.
+
+        """
+        reached = bytearray(len(self.node_types))
+        frontier = []
+        for root in roots:
+            if not reached[root]:
+                reached[root] = 1
+                frontier.append(root)
+
+        offsets = self._callee_offsets
+        callees = self._callees
+        while frontier:
+            next_frontier = []
+            for node in frontier:
+                for callee in callees[offsets[node] : offsets[node + 1]]:
+                    if not reached[callee]:
+                        reached[callee] = 1
+                        next_frontier.append(callee)
+            frontier = next_frontier
+        return reached
+
+    def get_calling_entry_points(self, keyword_nodes: Iterable[int]) -> list[int]:
+        """Return the test cases and files calling keywords directly or through other keywords.
+
+        Only keyword nodes are followed backwards, so a file is returned if its suite setup or
+        teardown reaches the keywords, not merely because one of its test cases does.
+
+        Arguments:
+            keyword_nodes (Iterable[int]): Keyword nodes to start from.
+
+        Returns:
+            list[int]: Test case and file nodes in the order they are reached.
+
+        """
+        keyword_count = len(self.keywords)
+        reached = bytearray(len(self.node_types))
+        frontier = []
+        for node in keyword_nodes:
+            if not reached[node]:
+                reached[node] = 1
+                frontier.append(node)
+
+        entry_points = []
+        offsets = self._caller_offsets
+        callers = self._callers
+        while frontier:
+            next_frontier = []
+            for node in frontier:
+                for caller in callers[offsets[node] : offsets[node + 1]]:
+                    if reached[caller]:
+                        continue
+                    reached[caller] = 1
+                    if caller < keyword_count:
+                        next_frontier.append(caller)
+                    else:
+                        entry_points.append(caller)
+            frontier = next_frontier
+        return entry_points
+
+    def get_keyword_reachability(self) -> list[KeywordReachabilityEnum]:
+        """Classify every keyword node by whether a test case or suite setting reaches it.
+
+        Test cases, with their setup and teardown, and files, with their suite setup and
+        teardown, are the entry points of a run. Keywords they reach are reachable, keywords
+        nothing calls are directly unused, and keywords only called by unreachable keywords
+        are transitively dead. The result is computed once per graph.
+
+        Returns:
+            list[KeywordReachabilityEnum]: Reachability per keyword node.
+
+        """
+        if self._reachability is None:
+            reached = self.get_reachable(range(len(self.keywords), len(self.node_types)))
+            reachability = []
+            for node in range(len(self.keywords)):
+                if reached[node]:
+                    reachability.append(KeywordReachabilityEnum.REACHABLE)
+                elif self._caller_offsets[node] != self._caller_offsets[node + 1]:
+                    reachability.append(KeywordReachabilityEnum.TRANSITIVELY_DEAD)
+                else:
+                    reachability.append(KeywordReachabilityEnum.DIRECTLY_UNUSED)
+            self._reachability = reachability
+        return self._reachability
+
+    def get_strongly_connected_components(self) -> list[list[int]]:
+        """Return the strongly connected components of the keyword nodes, see ``strongly_connected_components``.
+
+        Keywords only call keywords, while test cases and files are never called by keywords
+        and cannot be part of a cycle, so only keyword nodes are searched.
+
+        Returns:
+            list[list[int]]: Components in reverse topological order, callees before their callers,
+                the nodes of a component ordered by node number.
+
+        """
+        return strongly_connected_components(len(self.keywords), self._callee_offsets, self._callees)
+
+    def get_recursive_components(self) -> list[list[int]]:
+        """Return the groups of keywords that call themselves directly or through each other.
+
+        Returns:
+            list[list[int]]: Strongly connected components with more than one keyword, and single
+                keywords calling themselves.
+
+        """
+        return [
+            component
+            for component in self.get_strongly_connected_components()
+            if len(component) > 1 or component[0] in self.get_callees(component[0])
+        ]
+
+    def to_node(self, node: int, depth: int = 0) -> CallGraphNode:
+        """Return the schema of a node.
+
+        Arguments:
+            node (int): Node of the graph.
+            depth (int): Call distance of the node to the queried node.
+
+        Returns:
+            CallGraphNode: Schema of the node.
+
+        """
+        node_type = self.node_types[node]
+        keyword = self.keywords[node] if node_type == CallGraphNodeTypeEnum.KEYWORD else None
+        return CallGraphNode(
+            node_type=node_type,
+            name=self.names[node],
+            source=self.sources[node],
+            line_number=self.line_numbers[node],
+            keyword_id=keyword.keyword_id if keyword is not None else None,
+            is_user_defined=keyword.is_user_defined if keyword is not None else True,
+            depth=depth,
+        )
@@ -0,0 +1,183 @@
+"""Matching of keyword calls against keywords with embedded arguments."""
+
+import logging
+import re
+from collections.abc import Iterable
+
+from robot.variables import search_variable
+from roboview.schemas.domain.keywords import KeywordProperties
+
+logger = logging.getLogger(__name__)
+
+# Embedded arguments without a custom pattern match anything, like in Robot Framework
+_DEFAULT_ARGUMENT_PATTERN = ".*?"
+
+
+def _normalize(text: str) -> str:
+    """Normalize keyword name text like the validation strings of the keyword registry."""
+    return text.lower().replace(" ", "").replace("_", "")
+
+
+def has_embedded_arguments(keyword_name: str) -> bool:
+    """Return whether a keyword name contains embedded arguments.
+
+    Arguments:
+        keyword_name (str): Keyword name as defined.
+
+    Returns:
+        bool: True if the name contains at least one ``${argument}``.
+
+    """
+    return "${" in keyword_name and bool(search_variable(keyword_name, identifiers="$", ignore_errors=True))
+
+
+def _parse_embedded_name(keyword_name: str) -> tuple[list[str], list[str]]:
+    """Split a keyword name into normalized literal parts and argument patterns.
+
+    Returns:
+        tuple[list[str], list[str]]: One literal more than there are argument patterns.
+
+    """
+    literals = []
+    patterns = []
+    rest = keyword_name
+    while match := search_variable(rest, identifiers="$", ignore_errors=True):
+        if match.base is None:
+            break
+        literals.append(_normalize(match.before))
+        _, separator, custom_pattern = match.base.partition(":")
+        patterns.append(custom_pattern if separator else _DEFAULT_ARGUMENT_PATTERN)
+        rest = match.after
+    literals.append(_normalize(rest))
+    return literals, patterns
+
+
+def _compile(literals: list[str], patterns: list[str]) -> re.Pattern[str]:
+    """Compile the literal parts and argument patterns into one case-insensitive pattern."""
+    parts = [re.escape(literals[0])]
+    for pattern, literal in zip(patterns, literals[1:], strict=True):
+        parts.append(f"(?:{pattern})")
+        parts.append(re.escape(literal))
+    try:
+        return re.compile("".join(parts), re.IGNORECASE)
+    except re.error:
+        # Custom patterns are written for the original name and may be invalid on their own
+        logger.warning("Invalid embedded argument pattern in keyword name, matching anything instead")
+        return _compile(literals, [_DEFAULT_ARGUMENT_PATTERN] * len(patterns))
+
+
+class EmbeddedKeywordMatcher:
+    """Match keyword calls against all keywords with embedded arguments at once.
+
+    Keyword names like ``User "${name}" Logs In`` never equal the calls of the keyword, so
+    every name is compiled into a pattern over the normalized call. Trying every pattern
+    on every call scales with the number of such keywords, instead the patterns are indexed
+    in a trie by the literal text they start with, or, if they start with an argument, in a
+    second trie by the reversed literal text they end with. Walking the normalized call down
+    both tries collects the few patterns whose literal text fits, and only those are matched.
+    Patterns that neither start nor end with literal text are matched against every call.
+
+    Every keyword is indexed by its name with and without prefix, so calls like
+    ``users.User "Bob" Logs In`` match as well.
+
+    Attributes:
+        _keywords: Keyword of every pattern.
+        _patterns: Compiled pattern over the normalized call.
+        _specificity: Length of the literal text of every pattern.
+        _prefix_trie: Nested dicts by character, patterns ending at a node are kept under None.
+        _suffix_trie: Like _prefix_trie, over the reversed trailing literal text.
+        _unanchored: Patterns without leading or trailing literal text.
+
+    """
+
+    def __init__(self, keywords: Iterable[KeywordProperties]) -> None:
+        """Initialize EmbeddedKeywordMatcher.
+
+        Arguments:
+            keywords (Iterable[KeywordProperties]): Keywords to index, those without embedded
+                arguments are skipped.
+
+        """
+        self._keywords: list[KeywordProperties] = []
+        self._patterns: list[re.Pattern[str]] = []
+        self._specificity: list[int] = []
+        self._prefix_trie: dict = {}
+        self._suffix_trie: dict = {}
+        self._unanchored: list[int] = []
+
+        for keyword in keywords:
+            if not has_embedded_arguments(keyword.keyword_name_without_prefix):
+                continue
+            names = {keyword.keyword_name_without_prefix}
+            if keyword.keyword_name_with_prefix:
+                names.add(keyword.keyword_name_with_prefix)
+            for name in sorted(names):
+                self._add(keyword, name)
+
+    def _add(self, keyword: KeywordProperties, name: str) -> None:
+        """Compile a keyword name and index it by its leading or trailing literal text."""
+        literals, patterns = _parse_embedded_name(name)
+        index = len(self._patterns)
+        self._keywords.append(keyword)
+        self._patterns.append(_compile(literals, patterns))
+        self._specificity.append(sum(map(len, literals)))
+
+        if literals[0]:
+            node = self._prefix_trie
+            for character in literals[0]:
+                node = node.setdefault(character, {})
+        elif literals[-1]:
+            node = self._suffix_trie
+            for character in reversed(literals[-1]):
+                node = node.setdefault(character, {})
+        else:
+            self._unanchored.append(index)
+            return
+        node.setdefault(None, []).append(index)
+
+    def __len__(self) -> int:
+        """Return the number of indexed keywords."""
+        return len({id(keyword) for keyword in self._keywords})
+
+    def match(self, call: str) -> list[KeywordProperties]:
+        """Return the keywords whose embedded argument names match a call.
+
+        Arguments:
+            call (str): Called keyword name, with or without prefix.
+
+        Returns:
+            list[KeywordProperties]: Matching keywords, the one with the most literal text first,
+                keywords of equal specificity in registration order.
+
+        """
+        if not self._patterns or not call:
+            return []
+
+        normalized = _normalize(call)
+        candidates = list(self._unanchored)
+        candidates.extend(self._collect(self._prefix_trie, normalized))
+        candidates.extend(self._collect(self._suffix_trie, reversed(normalized)))
+
+        matches = [index for index in candidates if self._patterns[index].fullmatch(normalized)]
+        matches.sort(key=lambda index: (-self._specificity[index], index))
+
+        keywords = []
+        seen = set()
+        for index in matches:
+            keyword = self._keywords[index]
+            if id(keyword) not in seen:
+                seen.add(id(keyword))
+                keywords.append(keyword)
+        return keywords
+
+    @staticmethod
+    def _collect(trie: dict, characters: Iterable[str]) -> list[int]:
+        """Return the patterns stored along the path of the characters down the trie."""
+        found = list(trie.get(None, ()))
+        node = trie
+        for character in characters:
+            node = node.get(character)
+            if node is None:
+                break
+            found.extend(node.get(None, ()))
+        return found
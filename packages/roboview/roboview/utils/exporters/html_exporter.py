@@ -1,12 +1,17 @@
 """HTML report exporter using Jinja2."""
 
 import logging
+from collections.abc import Iterator
 from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from jinja2 import Template
 from roboview.schemas.domain.reports import Report, SummaryReport
 
+if TYPE_CHECKING:
+    from jinja2 import Template
+
 logger = logging.getLogger(__name__)
 
 # Comprehensive HTML template for Summary Report
@@ -749,6 +754,78 @@ HTML_TEMPLATE = """<!DOCTYPE html>
             </div>
             {% endif %}
 
+            <!-- Recursive Keywords -->
+            {% if recursive_keywords %}
+            <div class="section">
+                <div class="section-header">
+                    <h2>Recursive Keywords (Calling Cycles)</h2>
+                    <span class="badge">{{ recursive_keywords|length }} groups</span>
+                </div>
+                <table>
+                    <thead>
+                        <tr>
+                            <th>Keywords</th>
+                            <th style="text-align: center;">Recursion</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+                        {% for group in recursive_keywords %}
+                        <tr>
+                            <td>
+                                {% for name in group.keyword_names %}
+                                <strong>{{ name }}</strong>
+                                <small style="color: #64748b;">{{ group.file_names[loop.index0] }}</small><br>
+                                {% endfor %}
+                            </td>
+                            <td style="text-align: center;">
+                                <span class="badge-count">
+                                    {{- 'Mutual' if group.is_mutually_recursive else 'Direct' -}}
+                                </span>
+                            </td>
+                        </tr>
+                        {% endfor %}
+                    </tbody>
+                </table>
+            </div>
+            {% endif %}
+
+            <!-- Slowest Keywords -->
+            {% if slowest_keywords %}
+            <div class="section">
+                <div class="section-header">
+                    <h2>Slowest Keywords (by Total Time)</h2>
+                    <span class="badge">{{ slowest_keywords|length }} keywords</span>
+                </div>
+                <table>
+                    <thead>
+                        <tr>
+                            <th>Keyword</th>
+                            <th style="text-align: center;">Calls</th>
+                            <th style="text-align: center;">Failures</th>
+                            <th style="text-align: right;">Total</th>
+                            <th style="text-align: right;">Mean</th>
+                            <th style="text-align: right;">P95</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+                        {% for kw in slowest_keywords %}
+                        <tr>
+                            <td>
+                                <strong>{{ kw.keyword_name }}</strong><br>
+                                <small style="color: #64748b;">{{ kw.file_name or '' }}</small>
+                            </td>
+                            <td style="text-align: center;">{{ kw.call_count }}</td>
+                            <td style="text-align: center;">{{ kw.failure_count }}</td>
+                            <td style="text-align: right;">{{ '%.2f'|format(kw.total_seconds) }} s</td>
+                            <td style="text-align: right;">{{ '%.3f'|format(kw.mean_seconds) }} s</td>
+                            <td style="text-align: right;">{{ '%.3f'|format(kw.p95_seconds) }} s</td>
+                        </tr>
+                        {% endfor %}
+                    </tbody>
+                </table>
+            </div>
+            {% endif %}
+
             <!-- Code Quality Issues -->
             {% if robocop_issues_by_category or robocop_issues_by_severity %}
             <div class="section">
@@ -856,8 +933,20 @@ HTML_TEMPLATE = """<!DOCTYPE html>
 """
 
 
+@lru_cache(maxsize=1)
+def _get_template() -> "Template":
+    """Compile the HTML template once per process, importing Jinja2 on first use."""
+    from jinja2 import Template  # noqa: PLC0415
+
+    return Template(HTML_TEMPLATE)
+
+
 class HTMLExporter:
-    """Exporter for generating HTML reports."""
+    """Exporter for generating HTML reports.
+
+    The template is compiled once and rendered incrementally, so the complete HTML
+    document is never held in memory.
+    """
 
     @staticmethod
     def export(report: Report, output_path: Path) -> None:
@@ -871,16 +960,8 @@ class HTMLExporter:
         try:
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Prepare template context
-            context = HTMLExporter._build_context(report)
-
-            # Render template
-            template = Template(HTML_TEMPLATE)
-            html_content = template.render(**context)
-
-            # Write to HTML file
-            with output_path.open("w", encoding="utf-8") as f:
-                f.write(html_content)
+            # Render template chunk by chunk into the HTML file
+            _get_template().stream(**HTMLExporter._build_context(report)).dump(str(output_path), encoding="utf-8")
 
             logger.info("Report exported to HTML: %s", output_path)
 
@@ -888,9 +969,25 @@ class HTMLExporter:
             logger.exception("Error exporting report to HTML")
             raise
 
+    @staticmethod
+    def iter_html(report: Report) -> Iterator[str]:
+        """Render report to HTML chunk by chunk, e.g. for a streaming HTTP response.
+
+        Arguments:
+            report: Report object to render
+
+        Returns:
+            Iterator[str]: Rendered HTML fragments in document order
+
+        """
+        return _get_template().generate(**HTMLExporter._build_context(report))
+
     @staticmethod
     def _build_context(report: Report) -> dict:
-        """Build template context from report."""
+        """Build template context from report.
+
+        Report lists are passed as they are, the template reads the model attributes directly.
+        """
         context = {
             "title": report.title,
             "project_name": report.metadata.project_name,
@@ -928,80 +1025,24 @@ class HTMLExporter:
 
         # SummaryReport specific fields
         if isinstance(report, SummaryReport):
-            context["risk_level"] = report.risk_level
-            context["health_status"] = report.health_status
-            context["best_practices_score"] = report.best_practices_score
-
-            # Recommendations
-            context["recommendations"] = [
-                {
-                    "priority": rec.priority,
-                    "category": rec.category,
-                    "message": rec.message,
-                    "details": rec.details,
-                }
-                for rec in report.recommendations
-            ]
-
-            # Most used keywords
-            context["most_used_keywords"] = [
-                {
-                    "keyword_name": kw.keyword_name,
-                    "file_name": kw.file_name,
-                    "usage_count": kw.usage_count,
-                    "documentation": kw.documentation,
-                    "line_number": kw.line_number,
-                }
-                for kw in report.most_used_keywords
-            ]
-
-            # Unused keywords
-            context["unused_keywords_list"] = [
-                {
-                    "keyword_name": kw.keyword_name,
-                    "file_name": kw.file_name,
-                    "line_number": kw.line_number,
-                }
-                for kw in report.unused_keywords
-            ]
-
-            # Undocumented keywords
-            context["undocumented_keywords"] = [
-                {
-                    "keyword_name": kw.keyword_name,
-                    "file_name": kw.file_name,
-                    "usage_count": kw.usage_count,
-                }
-                for kw in report.undocumented_keywords
-            ]
-
-            # Duplicate keywords
-            context["duplicate_keywords"] = [
+            context.update(
                 {
-                    "keyword1_name": dup.keyword1_name,
-                    "keyword1_file": dup.keyword1_file,
-                    "keyword2_name": dup.keyword2_name,
-                    "keyword2_file": dup.keyword2_file,
-                    "similarity_score": dup.similarity_score,
+                    "risk_level": report.risk_level,
+                    "health_status": report.health_status,
+                    "best_practices_score": report.best_practices_score,
+                    "recommendations": report.recommendations,
+                    "most_used_keywords": report.most_used_keywords,
+                    "unused_keywords_list": report.unused_keywords,
+                    "undocumented_keywords": report.undocumented_keywords,
+                    "duplicate_keywords": report.duplicate_keywords,
+                    "recursive_keywords": report.recursive_keywords,
+                    "slowest_keywords": report.slowest_keywords,
+                    "files": report.files,
+                    # Robocop data
+                    "robocop_issues_by_category": report.robocop_issues_by_category,
+                    "robocop_issues_by_severity": report.robocop_issues_by_severity,
+                    "risk_files": report.risk_files,
                 }
-                for dup in report.duplicate_keywords
-            ]
-
-            # Files
-            context["files"] = [
-                {
-                    "file_name": f.file_name,
-                    "file_path": f.file_path,
-                    "is_resource": f.is_resource,
-                    "keywords_defined": f.keywords_defined,
-                    "keywords_called": f.keywords_called,
-                }
-                for f in report.files
-            ]
-
-            # Robocop data
-            context["robocop_issues_by_category"] = report.robocop_issues_by_category
-            context["robocop_issues_by_severity"] = report.robocop_issues_by_severity
-            context["risk_files"] = report.risk_files
+            )
 
         return context
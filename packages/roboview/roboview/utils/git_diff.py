@@ -0,0 +1,139 @@
+"""Changed Robot Framework files and lines of a git diff."""
+
+import logging
+import re
+import shutil
+import subprocess
+from pathlib import Path
+
+from roboview.schemas.domain.test_impact import ChangedFile
+
+logger = logging.getLogger(__name__)
+
+_ROBOT_PATHSPECS = ("*.robot", "*.resource")
+_HUNK_HEADER = re.compile(r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@")
+_GIT_TIMEOUT_SECONDS = 60
+
+
+class GitDiffError(RuntimeError):
+    """Raised when the changes of a git diff range cannot be determined."""
+
+
+def _parse_diff_path(value: str) -> str | None:
+    """Return the path of a ``---`` or ``+++`` line without its a/ or b/ prefix, None for /dev/null."""
+    value = value.rstrip("\t")
+    if value.startswith('"') and value.endswith('"'):
+        # Git quotes paths with special characters as C strings
+        value = value[1:-1].encode("latin-1", "backslashreplace").decode("unicode_escape")
+        value = value.encode("latin-1").decode("utf-8", "replace")
+    if value == "/dev/null":
+        return None
+    return value[2:] if value[:2] in {"a/", "b/"} else value
+
+
+def parse_unified_diff(diff: str, base_dir: Path) -> list[ChangedFile]:
+    """Parse the changed files and lines of a diff created with ``--unified=0``.
+
+    Changed lines are taken from the new version of every file. A hunk that only removes
+    lines marks the lines around the removal as changed, so the keyword or test case it was
+    removed from is affected.
+
+    Arguments:
+        diff (str): Output of ``git diff --unified=0 --no-renames``.
+        base_dir (Path): Directory the paths of the diff are relative to.
+
+    Returns:
+        list[ChangedFile]: Changed files in the order of the diff.
+
+    """
+    # Path, deletion flag and line ranges per file, the ranges are filled while reading the hunks
+    changes: list[tuple[str, bool, list[tuple[int, int]]]] = []
+    old_path: str | None = None
+    line_ranges: list[tuple[int, int]] | None = None
+    for line in diff.splitlines():
+        if line.startswith("diff --git "):
+            old_path, line_ranges = None, None
+        elif line.startswith("--- ") and line_ranges is None:
+            old_path = _parse_diff_path(line[4:])
+        elif line.startswith("+++ ") and line_ranges is None:
+            new_path = _parse_diff_path(line[4:])
+            path = new_path or old_path
+            if path is None:
+                continue
+            line_ranges = []
+            changes.append(((base_dir / path).as_posix(), new_path is None, line_ranges))
+        elif line_ranges is not None and (match := _HUNK_HEADER.match(line)):
+            start = int(match.group(1))
+            count = int(match.group(2)) if match.group(2) is not None else 1
+            if count:
+                line_ranges.append((start, start + count - 1))
+            else:
+                # Removed lines follow line start of the new version
+                line_ranges.append((max(start, 1), start + 1))
+    return [
+        ChangedFile(path=path, line_ranges=line_ranges, is_deleted=is_deleted)
+        for path, is_deleted, line_ranges in changes
+    ]
+
+
+def get_changed_files(repository_dir: Path, diff_range: str) -> list[ChangedFile]:
+    """Return the Robot Framework files and lines changed in a git diff range.
+
+    The range is passed to ``git diff`` as is, e.g. ``origin/main...HEAD`` for the changes of
+    a branch or ``HEAD`` for the uncommitted changes. Renamed files count as deleted and added.
+
+    Arguments:
+        repository_dir (Path): Directory inside the git working tree, only changes below it are returned.
+        diff_range (str): Commit or range to compare.
+
+    Returns:
+        list[ChangedFile]: Changed .robot and .resource files, with paths below repository_dir.
+
+    Raises:
+        GitDiffError: If git is not installed or the diff fails, e.g. for an unknown revision.
+
+    """
+    git = shutil.which("git")
+    if git is None:
+        msg = "git executable not found"
+        raise GitDiffError(msg)
+    if diff_range.startswith("-"):
+        msg = f"Invalid diff range: {diff_range}"
+        raise GitDiffError(msg)
+
+    command = [
+        git,
+        "-c",
+        "core.quotePath=false",
+        "diff",
+        "--unified=0",
+        "--no-color",
+        "--no-ext-diff",
+        "--no-renames",
+        "--relative",
+        diff_range,
+        "--",
+        *_ROBOT_PATHSPECS,
+    ]
+    try:
+        result = subprocess.run(  # noqa: S603
+            command,
+            cwd=repository_dir,
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            timeout=_GIT_TIMEOUT_SECONDS,
+            check=False,
+        )
+    except (OSError, subprocess.TimeoutExpired) as error:
+        msg = f"Running git diff failed: {error}"
+        raise GitDiffError(msg) from error
+
+    if result.returncode != 0:
+        msg = f"git diff {diff_range} failed: {result.stderr.strip()}"
+        raise GitDiffError(msg)
+
+    changed_files = parse_unified_diff(result.stdout, repository_dir)
+    logger.info("Found %d changed Robot Framework files in %s", len(changed_files), diff_range)
+    return changed_files
@@ -0,0 +1,101 @@
+"""Compressed adjacency arrays and linear-time algorithms shared by the call and import graphs."""
+
+from array import array
+from collections.abc import Sequence
+
+
+def to_adjacency(node_count: int, sources: Sequence[int], targets: Sequence[int]) -> tuple[array, array]:
+    """Sort edges by source into offsets and targets, the targets of node n are targets[offsets[n]:offsets[n + 1]].
+
+    Arguments:
+        node_count (int): Number of nodes.
+        sources (Sequence[int]): Source node of every edge.
+        targets (Sequence[int]): Target node of every edge.
+
+    Returns:
+        tuple[array, array]: Offsets per node and the targets grouped by source.
+
+    """
+    offsets = array("I", bytes(4 * (node_count + 1)))
+    for source in sources:
+        offsets[source + 1] += 1
+    for node in range(node_count):
+        offsets[node + 1] += offsets[node]
+
+    adjacency = array("I", bytes(4 * len(targets)))
+    positions = offsets[:-1]
+    for source, target in zip(sources, targets, strict=True):
+        adjacency[positions[source]] = target
+        positions[source] += 1
+    return offsets, adjacency
+
+
+def strongly_connected_components(node_count: int, offsets: Sequence[int], adjacency: Sequence[int]) -> list[list[int]]:
+    """Return the strongly connected components of a graph with Tarjan's algorithm.
+
+    The depth-first search keeps its own stack instead of recursing, so deep graphs do not hit
+    the recursion limit, and every node and edge is visited once. Only the first node_count
+    nodes are searched, their edges must not lead to other nodes.
+
+    Arguments:
+        node_count (int): Number of nodes to search.
+        offsets (Sequence[int]): Start of the targets of every node in adjacency.
+        adjacency (Sequence[int]): Target nodes, grouped by source.
+
+    Returns:
+        list[list[int]]: Components in reverse topological order, targets before their sources,
+            the nodes of a component ordered by node number.
+
+    """
+    unvisited = -1
+    index = [unvisited] * node_count
+    low_link = [0] * node_count
+    on_stack = [False] * node_count
+    stack: list[int] = []
+    components: list[list[int]] = []
+    next_index = 0
+
+    for root in range(node_count):
+        if index[root] != unvisited:
+            continue
+
+        index[root] = low_link[root] = next_index
+        next_index += 1
+        stack.append(root)
+        on_stack[root] = True
+        # Each frame holds a node and the position of its next target in the adjacency array
+        frames = [(root, offsets[root])]
+        while frames:
+            node, position = frames[-1]
+            end = offsets[node + 1]
+            while position < end:
+                target = adjacency[position]
+                position += 1
+                if index[target] == unvisited:
+                    break
+                if on_stack[target] and index[target] < low_link[node]:
+                    low_link[node] = index[target]
+            else:
+                frames.pop()
+                if low_link[node] == index[node]:
+                    component = []
+                    member = -1
+                    while member != node:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        component.append(member)
+                    component.sort()
+                    components.append(component)
+                if frames:
+                    source = frames[-1][0]
+                    low_link[source] = min(low_link[source], low_link[node])
+                continue
+
+            frames[-1] = (node, position)
+            index[target] = low_link[target] = next_index
+            next_index += 1
+            stack.append(target)
+            on_stack[target] = True
+            frames.append((target, offsets[target]))
+
+    return components
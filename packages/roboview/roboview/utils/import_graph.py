@@ -0,0 +1,324 @@
+"""Resource import graph of the project and keyword resolution within the imports of a file."""
+
+import logging
+import posixpath
+import re
+
+from roboview.registries.file_registry import FileRegistry
+from roboview.registries.keyword_registry import KeywordRegistry
+from roboview.schemas.domain.keywords import KeywordProperties
+from roboview.utils.graph import strongly_connected_components, to_adjacency
+
+logger = logging.getLogger(__name__)
+
+_BDD_PREFIXES = frozenset({"given", "when", "then", "and", "but"})
+_VARIABLE_PATTERN = re.compile(r"[$@&%]\{[^}]*\}")
+
+
+def resolve_import_path(import_path: str, importing_file: str) -> str | None:
+    """Substitute the built-in path variables of a resource import and normalize it.
+
+    ``${CURDIR}`` is the directory of the importing file and ``${/}`` the path separator.
+    Relative paths are resolved against the directory of the importing file, as Robot
+    Framework does before searching the module search path.
+
+    Arguments:
+        import_path (str): Import path as written in the settings.
+        importing_file (str): POSIX path of the importing file.
+
+    Returns:
+        str | None: Normalized POSIX path, None if it contains other variables.
+
+    """
+    directory = posixpath.dirname(importing_file)
+    path = import_path.strip().replace("\\", "/")
+    path = re.sub(r"\$\{/\}", "/", path)
+    path = re.sub(r"\$\{curdir\}", lambda _: directory, path, flags=re.IGNORECASE)
+    if _VARIABLE_PATTERN.search(path):
+        return None
+    return posixpath.normpath(posixpath.join(directory, path))
+
+
+class ImportGraph:
+    """Graph of the resource imports between the registered files.
+
+    Every import is resolved once when the graph is built, relative to the importing file
+    and otherwise, like a module search path lookup, to the registered file whose path ends
+    with the import path. The transitive import closure of every file is computed on first
+    use in one pass over the strongly connected components of the graph and kept as a
+    bitset, so checking whether a file sees another one is a single bit test.
+
+    Attributes:
+        paths: Path of every file node.
+        _file_nodes: Node per file path.
+        _complete: Whether all imports of a file node were resolved.
+        _import_offsets: Start of the imports of every node in _imports.
+        _imports: Imported nodes, grouped by importing node.
+        _closures: Bitset of the files every node sees, including itself.
+        _complete_closures: Whether the imports of all files a node sees were resolved.
+
+    """
+
+    def __init__(self, paths: list[str], edges: list[tuple[int, int]], complete: list[bool]) -> None:
+        """Initialize ImportGraph.
+
+        Arguments:
+            paths (list[str]): Path of every file node.
+            edges (list[tuple[int, int]]): Distinct (importing, imported) node pairs.
+            complete (list[bool]): Whether all imports of a file node were resolved.
+
+        """
+        self.paths = paths
+        self._file_nodes = {path: node for node, path in enumerate(paths)}
+        self._complete = complete
+        self._import_offsets, self._imports = to_adjacency(
+            len(paths), [source for source, _ in edges], [target for _, target in edges]
+        )
+        self._closures: list[int] | None = None
+        self._complete_closures: list[bool] | None = None
+
+    @classmethod
+    def build(cls, file_registry: FileRegistry) -> "ImportGraph":
+        """Build the import graph of the registered files.
+
+        Files registered without import data count as files with unresolved imports.
+
+        Arguments:
+            file_registry (FileRegistry): File registry of the project.
+
+        Returns:
+            ImportGraph: The import graph.
+
+        """
+        files = file_registry.get_all_files()
+        paths = [file.path for file in files]
+        file_nodes = {path: node for node, path in enumerate(paths)}
+        nodes_by_name: dict[str, list[int]] = {}
+        for node, path in enumerate(paths):
+            nodes_by_name.setdefault(posixpath.basename(path), []).append(node)
+
+        edges: set[tuple[int, int]] = set()
+        complete = []
+        unresolved = 0
+        for node, file in enumerate(files):
+            file_complete = file.resource_imports is not None
+            for import_path in file.resource_imports or ():
+                imported = cls._find_imported_node(import_path, file.path, file_nodes, paths, nodes_by_name)
+                if imported is None:
+                    file_complete = False
+                    unresolved += 1
+                elif imported != node:
+                    edges.add((node, imported))
+            complete.append(file_complete)
+
+        logger.info(
+            "Built import graph with %d files and %d imports, %d are unresolved", len(paths), len(edges), unresolved
+        )
+        return cls(paths, sorted(edges), complete)
+
+    @staticmethod
+    def _find_imported_node(
+        import_path: str,
+        importing_file: str,
+        file_nodes: dict[str, int],
+        paths: list[str],
+        nodes_by_name: dict[str, list[int]],
+    ) -> int | None:
+        """Return the node of an imported file, None if it is not registered."""
+        resolved = resolve_import_path(import_path, importing_file)
+        if resolved is None:
+            return None
+        if (node := file_nodes.get(resolved)) is not None:
+            return node
+
+        if _VARIABLE_PATTERN.search(import_path):
+            return None
+
+        # Search path lookup: the closest registered file ending with the import path
+        parts = posixpath.normpath(import_path.strip().replace("\\", "/")).split("/")
+        while parts and parts[0] in {"", ".", ".."}:
+            parts.pop(0)
+        relative = "/".join(parts)
+        candidates = [
+            node
+            for node in nodes_by_name.get(posixpath.basename(relative), ())
+            if paths[node] == relative or paths[node].endswith(f"/{relative}")
+        ]
+        return min(candidates, key=lambda node: (paths[node].count("/"), paths[node])) if candidates else None
+
+    def find_file(self, path: str) -> int | None:
+        """Return the node of a file.
+
+        Arguments:
+            path (str): POSIX path of the file.
+
+        Returns:
+            int | None: Node of the file, None if it is not registered.
+
+        """
+        return self._file_nodes.get(path)
+
+    def get_imports(self, node: int) -> list[int]:
+        """Return the files a file imports directly.
+
+        Arguments:
+            node (int): Importing file node.
+
+        Returns:
+            list[int]: Imported file nodes.
+
+        """
+        return list(self._imports[self._import_offsets[node] : self._import_offsets[node + 1]])
+
+    def get_closure(self, node: int) -> int:
+        """Return the files a file sees through its imports, directly or indirectly.
+
+        Arguments:
+            node (int): File node.
+
+        Returns:
+            int: Bitset with the bit of every visible file node set, including the file itself.
+
+        """
+        closures, _ = self._get_closures()
+        return closures[node]
+
+    def get_importers(self, nodes: list[int]) -> list[int]:
+        """Return the files that see any of the files through their imports, directly or indirectly.
+
+        Arguments:
+            nodes (list[int]): Imported file nodes.
+
+        Returns:
+            list[int]: Importing file nodes in node order, including the given nodes.
+
+        """
+        mask = 0
+        for node in nodes:
+            mask |= 1 << node
+        if not mask:
+            return []
+        closures, _ = self._get_closures()
+        return [node for node, closure in enumerate(closures) if closure & mask]
+
+    def is_closure_complete(self, node: int) -> bool:
+        """Return whether the imports of the file and of all files it sees were resolved.
+
+        Arguments:
+            node (int): File node.
+
+        Returns:
+            bool: True if the visible files of the file are known completely.
+
+        """
+        _, complete_closures = self._get_closures()
+        return complete_closures[node]
+
+    def _get_closures(self) -> tuple[list[int], list[bool]]:
+        """Return the closure of every file and whether it is complete, computed on first use.
+
+        Components are visited in reverse topological order. Files of an import cycle see each
+        other, so a component shares one closure, the union of its own files and the closures of
+        the components it imports, which are complete by the time the component is reached.
+
+        Returns:
+            tuple[list[int], list[bool]]: Closure bitset and completeness per file node.
+
+        """
+        if self._closures is not None and self._complete_closures is not None:
+            return self._closures, self._complete_closures
+
+        node_count = len(self.paths)
+        closures = [0] * node_count
+        complete_closures = [True] * node_count
+        for component in strongly_connected_components(node_count, self._import_offsets, self._imports):
+            closure = 0
+            complete = True
+            for node in component:
+                closure |= 1 << node
+                complete = complete and self._complete[node]
+                for imported in self._imports[self._import_offsets[node] : self._import_offsets[node + 1]]:
+                    closure |= closures[imported]
+                    complete = complete and complete_closures[imported]
+            for node in component:
+                closures[node] = closure
+                complete_closures[node] = complete
+        self._closures = closures
+        self._complete_closures = complete_closures
+        return closures, complete_closures
+
+
+class ScopedKeywordResolver:
+    """Resolve keyword calls within the keywords visible to the calling file.
+
+    A call refers to a keyword of the calling file first, then to a keyword of the resources
+    the file imports directly or indirectly, then to a library keyword. Library imports are not
+    tracked, so library keywords and keywords of unregistered files are visible everywhere.
+    If the imports of the calling file are not completely known, calls that match no visible
+    keyword fall back to the global lookup of the registry.
+
+    Attributes:
+        keyword_registry: Keyword registry of the project.
+        import_graph: Import graph of the project.
+
+    """
+
+    def __init__(self, keyword_registry: KeywordRegistry, import_graph: ImportGraph) -> None:
+        """Initialize ScopedKeywordResolver.
+
+        Arguments:
+            keyword_registry (KeywordRegistry): Keyword registry of the project.
+            import_graph (ImportGraph): Import graph of the project.
+
+        """
+        self.keyword_registry = keyword_registry
+        self.import_graph = import_graph
+
+    def resolve(self, call: str, source: str) -> KeywordProperties | None:
+        """Resolve a call, retrying without a leading BDD prefix.
+
+        Arguments:
+            call (str): Called keyword name, with or without prefix.
+            source (str): POSIX path of the calling file.
+
+        Returns:
+            KeywordProperties | None: The called keyword, None if no visible keyword matches.
+
+        """
+        if not call:
+            return None
+
+        keyword = self._resolve_in_scope(call, source)
+        if keyword is None:
+            # Calls keep their BDD prefix
+            prefix, _, name = call.partition(" ")
+            if name and prefix.lower() in _BDD_PREFIXES:
+                keyword = self._resolve_in_scope(name, source)
+        return keyword
+
+    def _resolve_in_scope(self, call: str, source: str) -> KeywordProperties | None:
+        """Return the visible keyword with the highest priority matching a call."""
+        import_graph = self.import_graph
+        calling_node = import_graph.find_file(source)
+        closure = import_graph.get_closure(calling_node) if calling_node is not None else 0
+
+        best = None
+        best_rank = 3
+        for keyword in self.keyword_registry.resolve_all(call):
+            node = import_graph.find_file(keyword.source) if keyword.is_user_defined else None
+            if node is None:
+                rank = 2
+            elif node == calling_node:
+                rank = 0
+            elif closure >> node & 1:
+                rank = 1
+            else:
+                continue
+            if rank < best_rank:
+                best, best_rank = keyword, rank
+                if rank == 0:
+                    break
+
+        if best is None and (calling_node is None or not import_graph.is_closure_complete(calling_node)):
+            return self.keyword_registry.resolve(call)
+        return best
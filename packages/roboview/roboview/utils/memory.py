@@ -0,0 +1,214 @@
+"""Estimate the memory held by in-memory analysis structures."""
+
+import sys
+import threading
+import tracemalloc
+from collections import deque
+from collections.abc import Collection, Iterator, Mapping
+from contextlib import contextmanager
+from logging import Logger
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+
+from roboview.core.metrics import get_process_rss_bytes
+from roboview.schemas.domain.memory import AllocationSite, PhaseAllocations
+
+# Objects that are shared process-wide and never owned by a single structure
+_SHARED_TYPES = (type, ModuleType, FunctionType, MethodType, BuiltinFunctionType, Logger)
+_LOCK_TYPES = (type(threading.Lock()), type(threading.RLock()))
+_ATOMIC_TYPES = (str, bytes, bytearray, int, float, complex, bool, type(None), memoryview, *_LOCK_TYPES)
+_CONTAINER_TYPES = (list, tuple, set, frozenset, deque)
+
+# Allocations of the import machinery and of tracemalloc itself are not of interest
+_ALLOCATION_FILTERS = (
+    tracemalloc.Filter(inclusive=False, filename_pattern="<frozen importlib._bootstrap*>"),
+    tracemalloc.Filter(inclusive=False, filename_pattern=tracemalloc.__file__),
+    tracemalloc.Filter(inclusive=False, filename_pattern="<unknown>"),
+)
+
+
+def estimate_deep_size(obj: object, exclude_ids: Collection[int] = ()) -> int:
+    """Estimate the memory held by an object and everything it references.
+
+    Follows containers and instance attributes, counting every object once. Classes,
+    modules, functions and loggers are treated as shared and not counted. Memory-mapped
+    data is counted only with its view objects, as its pages are backed by the file.
+
+    Arguments:
+        obj (object): Root object to measure.
+        exclude_ids (Collection[int]): Ids of objects that are shared with other structures
+            and must not be counted, including everything only reachable through them.
+
+    Returns:
+        int: Estimated size in bytes.
+
+    """
+    return _measure(obj, set(exclude_ids))
+
+
+def estimate_retained_sizes(structures: Mapping[str, object], exclude_ids: Collection[int] = ()) -> dict[str, int]:
+    """Estimate the memory held by several structures without counting shared objects twice.
+
+    Structures are measured in the given order. An object reachable from several structures
+    is attributed to the first of them, so services measured after the registries they
+    reference only count their own caches and indexes, and the sizes add up to the total.
+
+    Arguments:
+        structures (Mapping[str, object]): Structures to measure by name, in attribution order.
+        exclude_ids (Collection[int]): Ids of shared objects that must not be counted.
+
+    Returns:
+        dict[str, int]: Estimated size in bytes per structure name.
+
+    """
+    seen = set(exclude_ids)
+    return {name: _measure(structure, seen) for name, structure in structures.items()}
+
+
+def _measure(obj: object, seen: set[int]) -> int:
+    """Return the size of the objects reachable from obj that are not in seen, adding them to seen."""
+    stack = [obj]
+    total_size = 0
+
+    while stack:
+        current = stack.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+
+        if isinstance(current, _SHARED_TYPES):
+            continue
+
+        total_size += sys.getsizeof(current, 0)
+
+        if isinstance(current, _ATOMIC_TYPES):
+            continue
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+            continue
+        if isinstance(current, _CONTAINER_TYPES):
+            stack.extend(current)
+            continue
+
+        attributes = getattr(current, "__dict__", None)
+        if attributes is not None:
+            stack.append(attributes)
+        slots = getattr(type(current), "__slots__", ())
+        for slot in (slots,) if isinstance(slots, str) else slots:
+            value = getattr(current, slot, None)
+            if value is not None:
+                stack.append(value)
+
+    return total_size
+
+
+class AllocationTracker:
+    """Capture the allocation sites of each analysis phase with tracemalloc.
+
+    Tracing starts with the first phase, unless tracemalloc is already tracing, and slows
+    the analysis down considerably. At the end of each phase the memory allocated during the
+    phase and still alive is grouped by source line.
+
+    Attributes:
+        enabled: Whether allocations are traced, a disabled tracker only runs the phases.
+        top: Number of allocation sites kept per phase.
+        phases: Allocations per finished phase.
+
+    """
+
+    def __init__(self, *, enabled: bool = True, top: int = 10) -> None:
+        """Initialize AllocationTracker.
+
+        Arguments:
+            enabled (bool): Whether allocations are traced.
+            top (int): Number of allocation sites kept per phase.
+
+        """
+        self.enabled = enabled
+        self.top = top
+        self.phases: list[PhaseAllocations] = []
+        self._snapshot: tracemalloc.Snapshot | None = None
+        self._started_tracing = False
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Record the allocations of the enclosed block as a phase.
+
+        Arguments:
+            name (str): Name of the phase.
+
+        """
+        if not self.enabled:
+            yield
+            return
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        if self._snapshot is None:
+            self._snapshot = self._take_snapshot()
+        tracemalloc.reset_peak()
+
+        try:
+            yield
+        finally:
+            traced_bytes, peak_traced_bytes = tracemalloc.get_traced_memory()
+            snapshot = self._take_snapshot()
+            differences = snapshot.compare_to(self._snapshot, "lineno")
+            self._snapshot = snapshot
+
+            top_sites = [
+                AllocationSite(
+                    file=difference.traceback[0].filename,
+                    line=difference.traceback[0].lineno,
+                    size_bytes=difference.size_diff,
+                    count=difference.count_diff,
+                )
+                for difference in sorted(differences, key=lambda difference: difference.size_diff, reverse=True)
+                if difference.size_diff > 0
+            ][: self.top]
+            self.phases.append(
+                PhaseAllocations(
+                    phase=name,
+                    traced_bytes=traced_bytes,
+                    peak_traced_bytes=peak_traced_bytes,
+                    rss_bytes=get_process_rss_bytes(),
+                    top_sites=top_sites,
+                )
+            )
+
+    def stop(self) -> None:
+        """Stop tracing if the tracker started it and release the last snapshot."""
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        self._snapshot = None
+
+    def _take_snapshot(self) -> tracemalloc.Snapshot:
+        """Take a filtered snapshot of the traced allocations."""
+        return tracemalloc.take_snapshot().filter_traces(_ALLOCATION_FILTERS)
+
+
+def get_top_allocation_sites(top: int = 10) -> list[AllocationSite]:
+    """Return the source lines holding the most traced memory.
+
+    Arguments:
+        top (int): Number of allocation sites returned.
+
+    Returns:
+        list[AllocationSite]: Largest allocation sites, empty if tracemalloc is not tracing.
+
+    """
+    if not tracemalloc.is_tracing():
+        return []
+
+    statistics = tracemalloc.take_snapshot().filter_traces(_ALLOCATION_FILTERS).statistics("lineno")
+    return [
+        AllocationSite(
+            file=statistic.traceback[0].filename,
+            line=statistic.traceback[0].lineno,
+            size_bytes=statistic.size,
+            count=statistic.count,
+        )
+        for statistic in statistics[:top]
+    ]
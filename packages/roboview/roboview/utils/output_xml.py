@@ -0,0 +1,208 @@
+"""Streaming aggregation of keyword runtimes from Robot Framework output.xml files."""
+
+import logging
+import math
+import xml.etree.ElementTree as ET
+from datetime import datetime
+from pathlib import Path
+from typing import NamedTuple
+
+from roboview.schemas.domain.runtime import KeywordRuntimeStatistics
+
+logger = logging.getLogger(__name__)
+
+# Buckets grow by 2 percent, the geometric middle of a bucket is within 1 percent of all its values
+_BUCKET_BASE = 1.02
+_LOG_BUCKET_BASE = math.log(_BUCKET_BASE)
+_PERCENTILE = 0.95
+
+_EXECUTED_STATUSES = frozenset({"PASS", "FAIL", "SKIP"})
+_FAILED_STATUS = "FAIL"
+# Time stamps of output files written before Robot Framework 7
+_LEGACY_TIME_FORMAT = "%Y%m%d %H:%M:%S.%f"
+
+
+class OutputXmlError(ValueError):
+    """Raised when an output file is not well-formed XML."""
+
+
+class ExecutedKeyword(NamedTuple):
+    """Runtime statistics of a keyword and how the output file identified it."""
+
+    owner: str | None
+    name: str
+    suite_source: str | None
+    statistics: KeywordRuntimeStatistics
+
+
+class _DurationAccumulator:
+    """Call count, failures, total and maximum duration and a log-bucket histogram of one keyword.
+
+    The histogram holds one counter per 2 percent of duration range that occurred, so its size
+    depends on the spread of the durations, not on the number of calls.
+    """
+
+    __slots__ = ("buckets", "call_count", "failure_count", "max_seconds", "total_seconds", "zero_count")
+
+    def __init__(self) -> None:
+        self.call_count = 0
+        self.failure_count = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.zero_count = 0
+        self.buckets: dict[int, int] = {}
+
+    def add(self, seconds: float, *, failed: bool) -> None:
+        self.call_count += 1
+        self.failure_count += failed
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        if seconds <= 0:
+            self.zero_count += 1
+        else:
+            bucket = math.floor(math.log(seconds) / _LOG_BUCKET_BASE)
+            self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+
+    def percentile(self, fraction: float) -> float:
+        """Return the nearest-rank percentile, estimated by the middle of its bucket."""
+        rank = max(1, math.ceil(fraction * self.call_count))
+        seen = self.zero_count
+        if seen >= rank:
+            return 0.0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                return min(_BUCKET_BASE ** (bucket + 0.5), self.max_seconds)
+        return self.max_seconds
+
+
+def _get_elapsed_seconds(status: ET.Element) -> float:
+    """Return the elapsed time of a status element of any output file schema version."""
+    if (elapsed := status.get("elapsed")) is not None:
+        return float(elapsed)
+
+    start, end = status.get("starttime"), status.get("endtime")
+    if start is None or end is None:
+        return 0.0
+    try:
+        started = datetime.strptime(start, _LEGACY_TIME_FORMAT)  # noqa: DTZ007
+        ended = datetime.strptime(end, _LEGACY_TIME_FORMAT)  # noqa: DTZ007
+    except ValueError:
+        # Keywords that did not run have the time stamp N/A
+        return 0.0
+    return max((ended - started).total_seconds(), 0.0)
+
+
+class KeywordRuntimeAggregator:
+    """Aggregate the executed keyword calls of Robot Framework output files.
+
+    Files are parsed incrementally and every element is dropped from the tree once it is
+    complete, so memory is bounded by the nesting depth of the output and the number of
+    distinct keywords, not by the size of the files. Durations are kept in a logarithmic
+    histogram per keyword to estimate the 95th percentile without storing every call.
+
+    Keywords are identified by their library or resource name (owner) and their name, for
+    keywords with embedded arguments the name they are defined with. Keywords of a suite file
+    have no owner in the output and are told apart by the source of their suite.
+
+    Attributes:
+        file_count: Number of ingested files.
+        call_count: Number of executed keyword calls read.
+        _keywords: Duration accumulator by owner, name and suite source.
+
+    """
+
+    def __init__(self) -> None:
+        """Initialize KeywordRuntimeAggregator."""
+        self.file_count = 0
+        self.call_count = 0
+        self._keywords: dict[tuple[str | None, str, str | None], _DurationAccumulator] = {}
+
+    def feed(self, path: Path) -> int:
+        """Read the executed keyword calls of an output file.
+
+        Arguments:
+            path (Path): Path of the output.xml file.
+
+        Returns:
+            int: Number of executed keyword calls read from the file.
+
+        Raises:
+            OutputXmlError: If the file is not well-formed XML.
+            OSError: If the file cannot be read.
+
+        """
+        call_count = self.call_count
+        try:
+            self._parse(path)
+        except ET.ParseError as error:
+            msg = f"Invalid output file {path}: {error}"
+            raise OutputXmlError(msg) from error
+        self.file_count += 1
+        logger.info("Read %d keyword calls from %s", self.call_count - call_count, path)
+        return self.call_count - call_count
+
+    def _parse(self, path: Path) -> None:
+        """Stream the elements of a file, accumulating every keyword call when its element ends."""
+        elements: list[ET.Element] = []
+        suite_sources: list[str | None] = []
+        # Owner, name, status and elapsed seconds of the keywords being read
+        frames: list[list] = []
+        for event, element in ET.iterparse(path, events=("start", "end")):  # noqa: S314
+            tag = element.tag
+            if event == "start":
+                if tag == "kw":
+                    owner = element.get("owner") or element.get("library")
+                    name = element.get("source_name") or element.get("name") or ""
+                    frames.append([owner, name, None, 0.0])
+                elif tag == "suite":
+                    suite_sources.append(element.get("source"))
+                elements.append(element)
+                continue
+
+            elements.pop()
+            if tag == "status" and elements and elements[-1].tag == "kw":
+                frames[-1][2] = element.get("status")
+                frames[-1][3] = _get_elapsed_seconds(element)
+            elif tag == "kw":
+                owner, name, status, seconds = frames.pop()
+                if status in _EXECUTED_STATUSES:
+                    suite_source = suite_sources[-1] if owner is None and suite_sources else None
+                    self._add_call((owner, name, suite_source), seconds, failed=status == _FAILED_STATUS)
+            elif tag == "suite":
+                suite_sources.pop()
+
+            # Drop the completed element, its parent keeps no reference to it
+            element.clear()
+            if elements:
+                elements[-1].remove(element)
+
+    def _add_call(self, key: tuple[str | None, str, str | None], seconds: float, *, failed: bool) -> None:
+        """Add an executed call to the accumulator of its keyword."""
+        accumulator = self._keywords.get(key)
+        if accumulator is None:
+            accumulator = self._keywords[key] = _DurationAccumulator()
+        accumulator.add(seconds, failed=failed)
+        self.call_count += 1
+
+    def get_executed_keywords(self) -> list[ExecutedKeyword]:
+        """Return the runtime statistics of every executed keyword.
+
+        Returns:
+            list[ExecutedKeyword]: Keywords with their statistics, the most total time first.
+
+        """
+        executed = []
+        for (owner, name, suite_source), accumulator in self._keywords.items():
+            statistics = KeywordRuntimeStatistics(
+                keyword_name=f"{owner}.{name}" if owner else name,
+                call_count=accumulator.call_count,
+                failure_count=accumulator.failure_count,
+                total_seconds=accumulator.total_seconds,
+                mean_seconds=accumulator.total_seconds / accumulator.call_count,
+                p95_seconds=accumulator.percentile(_PERCENTILE),
+                max_seconds=accumulator.max_seconds,
+            )
+            executed.append(ExecutedKeyword(owner, name, suite_source, statistics))
+        executed.sort(key=lambda keyword: (-keyword.statistics.total_seconds, keyword.statistics.keyword_name))
+        return executed
@@ -0,0 +1,250 @@
+"""Profile analysis phases with cProfile and export the profiles."""
+
+import cProfile
+import json
+import pstats
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
+from pathlib import Path
+from typing import cast
+
+from roboview.schemas.domain.profiling import ProfileHotspot
+
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+SPEEDSCOPE_FILE_NAME = "profile.speedscope.json"
+
+# Call tree branches below this share of a profile are dropped from the speedscope export
+_MIN_BRANCH_SHARE = 1e-4
+
+FunctionKey = tuple[str, int, str]
+# Raw pstats data, function -> (primitive calls, calls, own time, cumulative time, callers)
+RawStats = dict[FunctionKey, tuple[int, int, float, float, dict[FunctionKey, tuple[int, int, float, float]]]]
+
+
+class PhaseProfiler:
+    """Record one cProfile profile per analysis phase.
+
+    A phase entered several times accumulates into the same profile. Phases must not be
+    nested, as only one profiler can be active per thread.
+
+    Attributes:
+        enabled: Whether phases are profiled, a disabled profiler only runs the phases.
+        profiles: Profile per phase name, in the order the phases were first entered.
+
+    """
+
+    def __init__(self, *, enabled: bool = True) -> None:
+        """Initialize PhaseProfiler.
+
+        Arguments:
+            enabled (bool): Whether phases are profiled.
+
+        """
+        self.enabled = enabled
+        self.profiles: dict[str, cProfile.Profile] = {}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Profile the enclosed block as part of a phase.
+
+        Arguments:
+            name (str): Name of the phase.
+
+        """
+        if not self.enabled:
+            yield
+            return
+
+        profiler = self.profiles.setdefault(name, cProfile.Profile())
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+
+    def write(self, output_dir: Path) -> list[Path]:
+        """Write the recorded profiles, see ``write_profiles``.
+
+        Arguments:
+            output_dir (Path): Directory the profiles are written to.
+
+        Returns:
+            list[Path]: Written files.
+
+        """
+        return write_profiles(output_dir, self.profiles)
+
+
+def write_profiles(output_dir: Path, profiles: Mapping[str, cProfile.Profile | pstats.Stats]) -> list[Path]:
+    """Write a pstats file per profile and one speedscope file holding all profiles.
+
+    Arguments:
+        output_dir (Path): Directory the profiles are written to, created if missing.
+        profiles (Mapping[str, cProfile.Profile | pstats.Stats]): Profile per phase name.
+
+    Returns:
+        list[Path]: Written files, the speedscope file last.
+
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    written = []
+
+    for name, profile in profiles.items():
+        path = output_dir / f"{name}.pstats"
+        _get_stats(profile).dump_stats(path)
+        written.append(path)
+
+    speedscope_path = output_dir / SPEEDSCOPE_FILE_NAME
+    speedscope_path.write_text(json.dumps(to_speedscope(profiles, name=output_dir.name)), encoding="utf-8")
+    written.append(speedscope_path)
+    return written
+
+
+def to_speedscope(profiles: Mapping[str, cProfile.Profile | pstats.Stats], name: str = "roboview") -> dict:
+    """Convert profiles into a speedscope file.
+
+    cProfile records time per caller and callee pair rather than full stacks, so the call
+    tree is rebuilt from these pairs. The time of a function called from several places is
+    split between its callers in proportion to the time each call took, recursive calls are
+    folded into their outermost call and branches below 0.01 % of a profile are dropped.
+
+    Arguments:
+        profiles (Mapping[str, cProfile.Profile | pstats.Stats]): Profile per phase name.
+        name (str): Name of the speedscope file.
+
+    Returns:
+        dict: Speedscope file with one sampled profile per phase, weighted in seconds.
+
+    """
+    frames: list[dict] = []
+    frame_indexes: dict[FunctionKey, int] = {}
+
+    def frame_index(function: FunctionKey) -> int:
+        index = frame_indexes.get(function)
+        if index is None:
+            index = frame_indexes[function] = len(frames)
+            frames.append(_speedscope_frame(function))
+        return index
+
+    speedscope_profiles = []
+    for profile_name, profile in profiles.items():
+        samples, weights = _sample_call_tree(get_raw_stats(profile), frame_index)
+        speedscope_profiles.append(
+            {
+                "type": "sampled",
+                "name": profile_name,
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": sum(weights),
+                "samples": samples,
+                "weights": weights,
+            }
+        )
+
+    return {
+        "$schema": SPEEDSCOPE_SCHEMA,
+        "name": name,
+        "exporter": "roboview",
+        "activeProfileIndex": 0,
+        "shared": {"frames": frames},
+        "profiles": speedscope_profiles,
+    }
+
+
+def _get_stats(profile: cProfile.Profile | pstats.Stats) -> pstats.Stats:
+    """Return the statistics of a profile."""
+    return profile if isinstance(profile, pstats.Stats) else pstats.Stats(profile)
+
+
+def get_raw_stats(profile: cProfile.Profile | pstats.Stats) -> RawStats:
+    """Return the raw pstats data of a profile, the content of a pstats file.
+
+    Arguments:
+        profile (cProfile.Profile | pstats.Stats): Profile to read.
+
+    Returns:
+        RawStats: Timings and callers per function.
+
+    """
+    # The stats attribute is not part of the typed pstats API, but what dump_stats marshals
+    return cast("RawStats", _get_stats(profile).stats)  # pyright: ignore[reportAttributeAccessIssue]
+
+
+def _speedscope_frame(function: FunctionKey) -> dict:
+    """Return the speedscope frame of a pstats function key."""
+    file, line, function_name = function
+    if file == "~":
+        # Built-in functions have no source location
+        return {"name": function_name}
+    return {"name": function_name, "file": file, "line": line}
+
+
+def _sample_call_tree(
+    stats: RawStats, frame_index: Callable[[FunctionKey], int]
+) -> tuple[list[list[int]], list[float]]:
+    """Rebuild the call tree of pstats data as weighted stack samples.
+
+    Arguments:
+        stats (RawStats): Raw pstats data, ``function -> (cc, nc, tt, ct, callers)``.
+        frame_index (Callable[[FunctionKey], int]): Returns the speedscope frame index of a function.
+
+    Returns:
+        tuple[list[list[int]], list[float]]: Stacks of frame indexes and the own time of their top frame.
+
+    """
+    callees: dict[FunctionKey, dict[FunctionKey, float]] = {}
+    for function, (_, _, _, _, callers) in stats.items():
+        for caller, edge in callers.items():
+            # cProfile stores (cc, nc, tt, ct) per caller
+            callees.setdefault(caller, {})[function] = edge[3]
+
+    roots = [function for function, (_, _, _, _, callers) in stats.items() if not callers]
+    total_time = sum(stats[root][3] for root in roots)
+    min_weight = total_time * _MIN_BRANCH_SHARE
+
+    samples: list[list[int]] = []
+    weights: list[float] = []
+    stack: list[tuple[FunctionKey, tuple[FunctionKey, ...], float]] = [
+        (root, (root,), stats[root][3]) for root in reversed(roots)
+    ]
+    while stack:
+        function, path, weight = stack.pop()
+        _, _, own_time, cumulative_time, _ = stats[function]
+        scale = weight / cumulative_time if cumulative_time > 0 else 0.0
+
+        if own_time * scale > 0:
+            samples.append([frame_index(frame) for frame in path])
+            weights.append(own_time * scale)
+
+        for callee, callee_time in reversed(callees.get(function, {}).items()):
+            if callee in path or callee_time * scale < min_weight:
+                continue
+            stack.append((callee, (*path, callee), callee_time * scale))
+
+    return samples, weights
+
+
+def get_hotspots(profile: cProfile.Profile | pstats.Stats, limit: int = 20) -> list[ProfileHotspot]:
+    """Return the functions with the most own time of a profile.
+
+    Arguments:
+        profile (cProfile.Profile | pstats.Stats): Profile to summarize.
+        limit (int): Maximum number of functions returned.
+
+    Returns:
+        list[ProfileHotspot]: Functions ordered by own time, longest first.
+
+    """
+    stats = get_raw_stats(profile)
+    ranked = sorted(stats.items(), key=lambda item: item[1][2], reverse=True)[:limit]
+    return [
+        ProfileHotspot(
+            function=function_name,
+            file=None if file == "~" else file,
+            line=line,
+            calls=calls,
+            own_seconds=own_time,
+            cumulative_seconds=cumulative_time,
+        )
+        for (file, line, function_name), (_, calls, own_time, cumulative_time, _) in ranked
+    ]
@@ -0,0 +1,249 @@
+"""Generate synthetic Robot Framework projects for scale testing."""
+
+import logging
+import random
+from pathlib import Path
+
+from pydantic import BaseModel, Field
+
+logger = logging.getLogger(__name__)
+
+_SEPARATOR = "    "
+_BUILTIN_CALLS = (
+    ("Log", "${value}"),
+    ("Should Be Equal", "${value}", "${value}"),
+    ("Set Test Variable", "${shared}", "${value}"),
+    ("Log Many", "${value}", "done"),
+)
+_VERBS = ("Open", "Close", "Verify", "Submit", "Select", "Create", "Delete", "Update", "Load", "Check")
+_NOUNS = ("Order", "Customer", "Invoice", "Basket", "Account", "Report", "Session", "Product", "Payment", "Address")
+
+
+class ProjectGeneratorConfig(BaseModel):
+    """Schema containing the shape of a synthetic Robot Framework project."""
+
+    resource_files: int = Field(description="Number of .resource files", default=10, ge=1)
+    suite_files: int = Field(description="Number of .robot suite files", default=5, ge=0)
+    keywords_per_file: int = Field(description="Number of keywords per .resource file", default=10, ge=1)
+    tests_per_suite: int = Field(description="Number of test cases per .robot file", default=5, ge=0)
+    call_fan_out: int = Field(description="Number of user keywords called by each keyword", default=3, ge=0)
+    import_depth: int = Field(description="Number of resource layers importing each other", default=3, ge=1)
+    duplicate_ratio: float = Field(
+        description="Share of keywords copying the body of another keyword", default=0.1, ge=0, le=1
+    )
+    documentation_ratio: float = Field(description="Share of keywords with documentation", default=0.5, ge=0, le=1)
+    violation_density: float = Field(description="Share of keywords with Robocop violations", default=0.2, ge=0, le=1)
+    seed: int = Field(description="Seed of the random generator, equal seeds generate equal projects", default=0)
+
+
+class GeneratedProject(BaseModel):
+    """Schema containing the summary of a generated Robot Framework project."""
+
+    project_root: str = Field(description="Root directory of the generated project as POSIX")
+    resource_files: int = Field(description="Number of generated .resource files")
+    suite_files: int = Field(description="Number of generated .robot files")
+    keywords: int = Field(description="Number of generated keywords")
+    test_cases: int = Field(description="Number of generated test cases")
+    duplicate_keywords: int = Field(description="Number of keywords copying the body of another keyword")
+    documented_keywords: int = Field(description="Number of keywords with documentation")
+    violating_keywords: int = Field(description="Number of keywords with injected Robocop violations")
+
+
+class ProjectGenerator:
+    """Class to write deterministic synthetic Robot Framework projects.
+
+    Resource files are spread over import_depth layers. Each resource imports resources of
+    the next layer and its keywords call later keywords of the same file or keywords of the
+    imported resources, so the call graph is acyclic and every call resolves. Suites import
+    the resources of the first layer and their test cases call keywords from them.
+
+    Attributes:
+        config (ProjectGeneratorConfig): Shape of the generated project.
+        _random: Seeded random generator.
+
+    """
+
+    def __init__(self, config: ProjectGeneratorConfig) -> None:
+        """Initialize ProjectGenerator.
+
+        Arguments:
+            config (ProjectGeneratorConfig): Shape of the generated project.
+
+        """
+        self.config = config
+        self._random = random.Random(config.seed)  # noqa: S311
+
+    @staticmethod
+    def _resource_name(file_index: int) -> str:
+        """Return the stem of a resource file."""
+        return f"resource_{file_index:05d}"
+
+    @staticmethod
+    def _keyword_name(file_index: int, keyword_index: int) -> str:
+        """Return a unique, readable keyword name."""
+        verb = _VERBS[keyword_index % len(_VERBS)]
+        noun = _NOUNS[(keyword_index // len(_VERBS)) % len(_NOUNS)]
+        return f"{verb} {noun} {file_index:05d} {keyword_index:04d}"
+
+    def _layers(self) -> list[list[int]]:
+        """Distribute the resource files over the import layers."""
+        depth = min(self.config.import_depth, self.config.resource_files)
+        layers: list[list[int]] = [[] for _ in range(depth)]
+        for file_index in range(self.config.resource_files):
+            layers[file_index % depth].append(file_index)
+        return layers
+
+    def _imported_keywords(self, imports: list[int]) -> list[str]:
+        """Return the names of all keywords of the imported resource files."""
+        return [
+            self._keyword_name(file_index, keyword_index)
+            for file_index in imports
+            for keyword_index in range(self.config.keywords_per_file)
+        ]
+
+    def _keyword_body(self, callees: list[str], *, violating: bool) -> list[str]:
+        """Build the body lines of a keyword calling the given keywords."""
+        body = [f"[Arguments]{_SEPARATOR}${{value}}"]
+        for callee in callees:
+            body.append(f"{callee}{_SEPARATOR}${{value}}")
+            builtin_call = self._random.choice(_BUILTIN_CALLS)
+            body.append(_SEPARATOR.join(builtin_call))
+        if not callees:
+            body.append(f"Log{_SEPARATOR}${{value}}")
+
+        if violating:
+            # Violates the rules on to-do comments, unused variables and trailing whitespace
+            body.insert(1, "# TODO remove workaround")
+            body.append(f"${{unused}}={_SEPARATOR}Set Variable{_SEPARATOR}${{value}}")
+            body[-2] += "  "
+        return body
+
+    def _write_resource(
+        self,
+        path: Path,
+        file_index: int,
+        import_paths: list[str],
+        callable_keywords: list[str],
+        summary: GeneratedProject,
+    ) -> None:
+        """Write one resource file."""
+        lines = ["*** Settings ***"]
+        lines.extend(f"Resource{_SEPARATOR}{import_path}" for import_path in import_paths)
+        lines.extend(["", "*** Variables ***", f"${{shared}}{_SEPARATOR}initial", "", "*** Keywords ***"])
+
+        keyword_names = [self._keyword_name(file_index, i) for i in range(self.config.keywords_per_file)]
+        keyword_indices = {keyword_name: i for i, keyword_name in enumerate(keyword_names)}
+        # Per written keyword, the lowest index of a called keyword of the same file, its body and
+        # whether the body contains violations
+        written_bodies: list[tuple[int, list[str], bool]] = []
+        for keyword_index, keyword_name in enumerate(keyword_names):
+            lines.append(keyword_name)
+            if self._random.random() < self.config.documentation_ratio:
+                lines.append(f"{_SEPARATOR}[Documentation]{_SEPARATOR}{keyword_name} for the generated project.")
+                summary.documented_keywords += 1
+
+            # Only bodies calling keywords defined after this one can be copied without recursion
+            copyable_bodies = [
+                (body, violating) for first_callee, body, violating in written_bodies if first_callee > keyword_index
+            ]
+            if copyable_bodies and self._random.random() < self.config.duplicate_ratio:
+                body, violating = self._random.choice(copyable_bodies)
+                summary.duplicate_keywords += 1
+                summary.violating_keywords += violating
+            else:
+                local_callees = range(keyword_index + 1, len(keyword_names))
+                candidates = [keyword_names[i] for i in local_callees] + callable_keywords
+                callees = self._random.sample(candidates, min(self.config.call_fan_out, len(candidates)))
+                violating = self._random.random() < self.config.violation_density
+                body = self._keyword_body(callees, violating=violating)
+                summary.violating_keywords += violating
+
+                first_callee = min(
+                    (keyword_indices[callee] for callee in callees if callee in keyword_indices),
+                    default=len(keyword_names),
+                )
+                written_bodies.append((first_callee, body, violating))
+
+            lines.extend(f"{_SEPARATOR}{line}" for line in body)
+            lines.append("")
+
+        path.write_text("\n".join(lines), encoding="utf-8")
+        summary.keywords += len(keyword_names)
+        summary.resource_files += 1
+
+    def _write_suite(
+        self, path: Path, imports: list[int], callable_keywords: list[str], summary: GeneratedProject
+    ) -> None:
+        """Write one suite file with test cases calling keywords of the first layer."""
+        lines = ["*** Settings ***"]
+        lines.extend(f"Resource{_SEPARATOR}../resources/layer_0/{self._resource_name(i)}.resource" for i in imports)
+        lines.extend(["", "*** Test Cases ***"])
+
+        for test_index in range(self.config.tests_per_suite):
+            lines.append(f"Generated Test {test_index:04d}")
+            callees = self._random.sample(
+                callable_keywords, min(max(self.config.call_fan_out, 1), len(callable_keywords))
+            )
+            lines.extend(f"{_SEPARATOR}{callee}{_SEPARATOR}{test_index}" for callee in callees)
+            lines.append("")
+
+        path.write_text("\n".join(lines), encoding="utf-8")
+        summary.test_cases += self.config.tests_per_suite
+        summary.suite_files += 1
+
+    def generate(self, project_root: Path) -> GeneratedProject:
+        """Write the project below a directory.
+
+        Resources are written to ``resources/layer_<n>`` and suites to ``tests``. Existing
+        files with the same names are overwritten.
+
+        Arguments:
+            project_root (Path): Root directory of the generated project.
+
+        Returns:
+            GeneratedProject: Summary of the generated project.
+
+        """
+        summary = GeneratedProject(
+            project_root=project_root.as_posix(),
+            resource_files=0,
+            suite_files=0,
+            keywords=0,
+            test_cases=0,
+            duplicate_keywords=0,
+            documented_keywords=0,
+            violating_keywords=0,
+        )
+        layers = self._layers()
+
+        for depth, layer in enumerate(layers):
+            layer_dir = project_root / "resources" / f"layer_{depth}"
+            layer_dir.mkdir(parents=True, exist_ok=True)
+            next_layer = layers[depth + 1] if depth + 1 < len(layers) else []
+
+            for file_index in layer:
+                imports = sorted(self._random.sample(next_layer, min(2, len(next_layer))))
+                callable_keywords = self._imported_keywords(imports)
+                self._write_resource(
+                    layer_dir / f"{self._resource_name(file_index)}.resource",
+                    file_index,
+                    [f"../layer_{depth + 1}/{self._resource_name(i)}.resource" for i in imports],
+                    callable_keywords,
+                    summary,
+                )
+
+        if self.config.suite_files:
+            suite_dir = project_root / "tests"
+            suite_dir.mkdir(parents=True, exist_ok=True)
+            for suite_index in range(self.config.suite_files):
+                imports = sorted(self._random.sample(layers[0], min(2, len(layers[0]))))
+                callable_keywords = self._imported_keywords(imports)
+                self._write_suite(suite_dir / f"suite_{suite_index:05d}.robot", imports, callable_keywords, summary)
+
+        logger.info(
+            "Generated project with %d keywords in %d files at %s",
+            summary.keywords,
+            summary.resource_files + summary.suite_files,
+            project_root,
+        )
+        return summary
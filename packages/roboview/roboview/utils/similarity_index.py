@@ -0,0 +1,344 @@
+"""Persistent, memory-mapped storage of keyword similarity neighbour lists."""
+
+import hashlib
+import logging
+import mmap
+import os
+import struct
+import tempfile
+import time
+from array import array
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from typing import BinaryIO, Protocol
+
+from roboview.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+_MAGIC = b"RVSIMIDX"
+_FORMAT_VERSION = 1
+# Written in native byte order, a mismatch on load means the index was built on another platform
+_BYTE_ORDER_MARK = 0x01020304
+# magic, format version, byte order mark, row count, top k, normalize variables flag
+_HEADER = struct.Struct("=8sIIIII4x")
+
+_NO_ROW = -1
+
+
+class NeighbourLists(Protocol):
+    """Presorted (row, score) neighbour lists per row, in memory or memory-mapped."""
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        ...
+
+    def __getitem__(self, row: int, /) -> list[tuple[int, float]]:
+        """Return the neighbours of a row."""
+        ...
+
+    def __iter__(self) -> Iterator[list[tuple[int, float]]]:
+        """Iterate over the neighbour lists of all rows."""
+        ...
+
+
+def get_similarity_index_path(project_root: Path) -> Path | None:
+    """Return the path of the similarity index file for a project.
+
+    Arguments:
+        project_root (Path): Root directory of the project.
+
+    Returns:
+        Path | None: Path of the index file, or None if the similarity index is disabled.
+
+    """
+    settings = get_settings()
+    if not settings.SIMILARITY_INDEX_ENABLED:
+        return None
+
+    index_dir = (
+        Path(settings.SIMILARITY_INDEX_DIR)
+        if settings.SIMILARITY_INDEX_DIR
+        else Path(tempfile.gettempdir()) / ".roboview" / "similarity"
+    )
+    project_key = hashlib.sha1(str(project_root.resolve()).encode(), usedforsecurity=False).hexdigest()[:16]
+    return index_dir / f"{project_key}.rvsim"
+
+
+class SimilarityIndex:
+    """Read-only, memory-mapped similarity index.
+
+    The index file holds for every row the content hash of its keyword and up to top_k
+    neighbours as float32 scores, presorted by descending score. Rows are read directly
+    from the mapped file, so loading an index costs almost no memory.
+
+    Layout (native byte order): header, row hashes (uint64 per row), neighbour counts
+    (uint32 per row), neighbour rows (int32, top_k per row) and scores (float32, top_k per row).
+
+    Every write creates a new version ``<path>.<version>`` next to the index path and loading
+    maps the newest one. A file that is still mapped is never replaced, which Windows refuses,
+    older versions are removed as soon as no mapping holds them any more.
+
+    Attributes:
+        path: Path of the mapped index file version.
+        top_k: Maximum number of neighbours stored per row.
+        normalize_variables: Whether the scores were calculated with normalized variable names.
+
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        path: Path,
+        buffer: memoryview,
+        row_count: int,
+        top_k: int,
+        *,
+        normalize_variables: bool,
+        mapped_file: mmap.mmap | None = None,
+    ) -> None:
+        """Initialize SimilarityIndex from a validated index buffer.
+
+        Arguments:
+            path (Path): Path of the file holding the index.
+            buffer (memoryview): Bytes of the validated index, starting with its header.
+            row_count (int): Number of rows in the index.
+            top_k (int): Maximum number of neighbours stored per row.
+            normalize_variables (bool): Whether the scores were calculated with normalized variable names.
+            mapped_file (mmap.mmap | None): Memory mapping backing the buffer, closed together with the index.
+
+        """
+        self.path = path
+        self.top_k = top_k
+        self.normalize_variables = normalize_variables
+        self._mmap = mapped_file
+        self._row_count = row_count
+        self._row_map: dict[int, int] | None = None
+
+        self._buffer = buffer
+        offset = _HEADER.size
+        self._hashes = buffer[offset : offset + 8 * row_count].cast("Q")
+        offset += 8 * row_count
+        self._counts = buffer[offset : offset + 4 * row_count].cast("I")
+        offset += 4 * row_count
+        self._rows = buffer[offset : offset + 4 * row_count * top_k].cast("i")
+        offset += 4 * row_count * top_k
+        self._scores = buffer[offset : offset + 4 * row_count * top_k].cast("f")
+
+    @staticmethod
+    def _expected_size(row_count: int, top_k: int) -> int:
+        """Return the file size of an index with the given dimensions."""
+        return _HEADER.size + row_count * (8 + 4 + 8 * top_k)
+
+    @classmethod
+    def from_buffer(
+        cls, buffer: memoryview, path: Path, mapped_file: mmap.mmap | None = None
+    ) -> "SimilarityIndex | None":
+        """Serve an index from a buffer, e.g. a section of a larger memory-mapped file.
+
+        Arguments:
+            buffer (memoryview): Bytes of the index, starting with its header.
+            path (Path): Path of the file holding the index, used for logging.
+            mapped_file (mmap.mmap | None): Memory mapping backing the buffer, closed together with the index.
+
+        Returns:
+            SimilarityIndex | None: The index, or None if the buffer belongs to another format
+                version or is corrupt.
+
+        """
+        if len(buffer) < _HEADER.size:
+            logger.warning("Ignoring truncated similarity index: %s", path)
+            return None
+
+        magic, format_version, byte_order_mark, row_count, top_k, normalize_flag = _HEADER.unpack_from(buffer)
+        if magic != _MAGIC or format_version != _FORMAT_VERSION or byte_order_mark != _BYTE_ORDER_MARK:
+            logger.info("Ignoring similarity index with unsupported format: %s", path)
+            return None
+
+        if len(buffer) != cls._expected_size(row_count, top_k):
+            logger.warning("Ignoring similarity index with unexpected size: %s", path)
+            return None
+
+        return cls(path, buffer, row_count, top_k, normalize_variables=bool(normalize_flag), mapped_file=mapped_file)
+
+    @staticmethod
+    def _get_versions(path: Path) -> list[Path]:
+        """Return the written versions of an index file, oldest first."""
+        prefix = f"{path.name}."
+        try:
+            return sorted(
+                candidate
+                for candidate in path.parent.iterdir()
+                if candidate.name.startswith(prefix) and candidate.suffix != ".tmp"
+            )
+        except OSError:
+            return []
+
+    @classmethod
+    def load(cls, path: Path) -> "SimilarityIndex | None":
+        """Memory-map the newest version of an index file.
+
+        Arguments:
+            path (Path): Path of the index file.
+
+        Returns:
+            SimilarityIndex | None: The mapped index, or None if the file is missing, belongs
+                to another format version or is corrupt.
+
+        """
+        versions = cls._get_versions(path)
+        if not versions:
+            return None
+
+        path = versions[-1]
+        try:
+            with path.open("rb") as index_file:
+                if os.fstat(index_file.fileno()).st_size < _HEADER.size:
+                    logger.warning("Ignoring truncated similarity index: %s", path)
+                    return None
+
+                mapped_file = mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            logger.warning("Could not load similarity index: %s", path, exc_info=True)
+            return None
+
+        index = cls.from_buffer(memoryview(mapped_file), path, mapped_file)
+        if index is None:
+            mapped_file.close()
+        return index
+
+    @classmethod
+    def write(
+        cls,
+        path: Path,
+        row_hashes: Sequence[int],
+        neighbours: NeighbourLists,
+        top_k: int,
+        *,
+        normalize_variables: bool,
+    ) -> None:
+        """Write neighbour lists to an index file.
+
+        The file is written next to the target and moved into place as a new version, so
+        readers never see a partially written index. Older versions are removed unless they
+        are still mapped.
+
+        Arguments:
+            path (Path): Path of the index file.
+            row_hashes (Sequence[int]): Content hash per row as unsigned 64-bit integer.
+            neighbours (NeighbourLists): Presorted (row, score) pairs per row,
+                only the first top_k entries of each row are stored.
+            top_k (int): Maximum number of neighbours stored per row.
+            normalize_variables (bool): Whether the scores were calculated with normalized variable names.
+
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            with temporary_path.open("wb") as index_file:
+                cls.dump(index_file, row_hashes, neighbours, top_k, normalize_variables=normalize_variables)
+            # Fixed-width hex keeps the versions in write order when sorted by name
+            version_path = path.with_name(f"{path.name}.{time.time_ns():016x}")
+            temporary_path.replace(version_path)
+        finally:
+            temporary_path.unlink(missing_ok=True)
+
+        for old_path in cls._get_versions(path):
+            if old_path >= version_path:
+                break
+            try:
+                old_path.unlink(missing_ok=True)
+            except OSError:
+                logger.debug("Keeping similarity index that is still in use: %s", old_path)
+
+    @staticmethod
+    def dump(
+        index_file: BinaryIO,
+        row_hashes: Sequence[int],
+        neighbours: NeighbourLists,
+        top_k: int,
+        *,
+        normalize_variables: bool,
+    ) -> None:
+        """Write neighbour lists in index format to an open binary file.
+
+        Arguments:
+            index_file (BinaryIO): File to write the index to at its current position.
+            row_hashes (Sequence[int]): Content hash per row as unsigned 64-bit integer.
+            neighbours (NeighbourLists): Presorted (row, score) pairs per row,
+                only the first top_k entries of each row are stored.
+            top_k (int): Maximum number of neighbours stored per row.
+            normalize_variables (bool): Whether the scores were calculated with normalized variable names.
+
+        """
+        row_count = len(row_hashes)
+        counts = array("I", bytes(4 * row_count))
+        rows = array("i", [_NO_ROW]) * (row_count * top_k)
+        scores = array("f", bytes(4 * row_count * top_k))
+
+        for row, row_neighbours in enumerate(neighbours):
+            base = row * top_k
+            for position, (neighbour_row, score) in enumerate(row_neighbours[:top_k]):
+                rows[base + position] = neighbour_row
+                scores[base + position] = score
+            counts[row] = min(len(row_neighbours), top_k)
+
+        index_file.write(
+            _HEADER.pack(_MAGIC, _FORMAT_VERSION, _BYTE_ORDER_MARK, row_count, top_k, int(normalize_variables))
+        )
+        array("Q", row_hashes).tofile(index_file)
+        counts.tofile(index_file)
+        rows.tofile(index_file)
+        scores.tofile(index_file)
+
+    @property
+    def row_hashes(self) -> memoryview:
+        """Content hash per row."""
+        return self._hashes
+
+    @property
+    def row_map(self) -> dict[int, int]:
+        """Mapping of content hash to row, built on first access."""
+        if self._row_map is None:
+            self._row_map = {}
+            for row, row_hash in enumerate(self._hashes):
+                self._row_map.setdefault(row_hash, row)
+        return self._row_map
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return self._row_count
+
+    def __getitem__(self, row: int) -> list[tuple[int, float]]:
+        """Return the presorted (row, score) neighbours of a row.
+
+        Arguments:
+            row (int): Row to read.
+
+        Returns:
+            list[tuple[int, float]]: Neighbours sorted by descending score.
+
+        Raises:
+            IndexError: If the row is out of range.
+
+        """
+        if not 0 <= row < self._row_count:
+            msg = f"Row {row} out of range"
+            raise IndexError(msg)
+
+        base = row * self.top_k
+        end = base + self._counts[row]
+        return list(zip(self._rows[base:end], self._scores[base:end], strict=True))
+
+    def __iter__(self) -> Iterator[list[tuple[int, float]]]:
+        """Iterate over the neighbour lists of all rows."""
+        for row in range(self._row_count):
+            yield self[row]
+
+    def close(self) -> None:
+        """Release the memory mapping."""
+        for view in (self._hashes, self._counts, self._rows, self._scores, self._buffer):
+            view.release()
+        if self._mmap is not None:
+            self._mmap.close()
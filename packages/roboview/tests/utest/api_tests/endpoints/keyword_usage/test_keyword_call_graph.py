@@ -0,0 +1,116 @@
+import logging
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from roboview.api.endpoints.keyword_usage.keyword_call_graph import logger, router
+from roboview.schemas.domain.call_graph import CallGraphNode, CallGraphNodeTypeEnum, KeywordRecursionGroup
+from roboview.schemas.dtos.keyword_usage import (
+    KeywordCalleesResponse,
+    KeywordCallersResponse,
+    RecursiveKeywordsResponse,
+)
+
+
+def _node(name: str, node_type: CallGraphNodeTypeEnum = CallGraphNodeTypeEnum.KEYWORD, depth: int = 0):
+    return CallGraphNode(
+        node_type=node_type,
+        name=name,
+        source="/proj/common.resource",
+        keyword_id=f"id-{name}" if node_type == CallGraphNodeTypeEnum.KEYWORD else None,
+        is_user_defined=True,
+        depth=depth,
+    )
+
+
+class FakeKeywordUsageService:
+    def __init__(self) -> None:
+        self.calls = []
+
+    def get_keyword_callers(self, keyword_name, max_depth=None):
+        self.calls.append(("callers", keyword_name, max_depth))
+        if keyword_name == "Missing":
+            return None
+        return _node(keyword_name), [_node("Outer", depth=1), _node("Test", CallGraphNodeTypeEnum.TEST_CASE, 2)]
+
+    def get_keyword_callees(self, keyword_name, max_depth=None):
+        self.calls.append(("callees", keyword_name, max_depth))
+        if keyword_name == "Missing":
+            return None
+        return _node(keyword_name), [_node("Inner", depth=1)]
+
+
+@pytest.fixture
+def test_app() -> FastAPI:
+    app = FastAPI()
+    app.include_router(router, prefix="/call-graph")
+    app.state.keyword_usage_service = FakeKeywordUsageService()
+    return app
+
+
+@pytest.fixture
+def client(test_app: FastAPI) -> TestClient:
+    return TestClient(test_app)
+
+
+def test_get_keyword_callers(client: TestClient, test_app: FastAPI):
+    response = client.get("/call-graph/callers", params={"keyword_name": "Login", "max_depth": 2})
+
+    assert response.status_code == 200
+    parsed = KeywordCallersResponse(**response.json())
+    assert parsed.keyword.name == "Login"
+    assert [(node.name, node.node_type, node.depth) for node in parsed.callers] == [
+        ("Outer", CallGraphNodeTypeEnum.KEYWORD, 1),
+        ("Test", CallGraphNodeTypeEnum.TEST_CASE, 2),
+    ]
+    assert test_app.state.keyword_usage_service.calls == [("callers", "Login", 2)]
+
+
+def test_get_keyword_callees_without_depth_limit(client: TestClient, test_app: FastAPI):
+    response = client.get("/call-graph/callees", params={"keyword_name": "Login"})
+
+    assert response.status_code == 200
+    parsed = KeywordCalleesResponse(**response.json())
+    assert [node.name for node in parsed.callees] == ["Inner"]
+    assert test_app.state.keyword_usage_service.calls == [("callees", "Login", None)]
+
+
+@pytest.mark.parametrize("path", ["/call-graph/callers", "/call-graph/callees"])
+def test_unknown_keyword_returns_404(client: TestClient, path: str):
+    response = client.get(path, params={"keyword_name": "Missing"})
+
+    assert response.status_code == 404
+    assert response.json() == {"detail": "Keyword not found"}
+
+
+def test_invalid_depth_returns_422(client: TestClient):
+    response = client.get("/call-graph/callers", params={"keyword_name": "Login", "max_depth": 0})
+
+    assert response.status_code == 422
+
+
+def test_service_error_returns_500(client: TestClient, test_app: FastAPI, caplog):
+    def _raise(*args, **kwargs):
+        raise RuntimeError("boom")
+
+    test_app.state.keyword_usage_service.get_keyword_callers = _raise
+    caplog.set_level(logging.ERROR, logger=logger.name)
+
+    response = client.get("/call-graph/callers", params={"keyword_name": "Login"})
+
+    assert response.status_code == 500
+    assert response.json() == {"detail": "Internal Server Error"}
+    assert "Error retrieving callers of keyword Login" in caplog.text
+
+
+def test_get_recursive_keywords(client: TestClient, test_app: FastAPI):
+    group = KeywordRecursionGroup(keywords=[_node("Ping"), _node("Pong")], is_mutually_recursive=True)
+    test_app.state.keyword_usage_service.get_recursive_keyword_groups = lambda: [group]
+
+    response = client.get("/call-graph/recursion-groups")
+
+    assert response.status_code == 200
+    parsed = RecursiveKeywordsResponse(**response.json())
+    assert [node.name for node in parsed.recursion_groups[0].keywords] == ["Ping", "Pong"]
+    assert parsed.recursion_groups[0].is_mutually_recursive is True
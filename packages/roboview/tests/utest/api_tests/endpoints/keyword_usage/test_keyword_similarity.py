@@ -24,10 +24,12 @@ def test_app() -> FastAPI:
         def __init__(self) -> None:
             self.called_with_keyword_name = None
             self.called_with_top_n = None
+            self.called_with_min_score = None
 
-        def get_n_most_similar_keywords(self, keyword_name: str, top_n: int):
+        def get_n_most_similar_keywords(self, keyword_name: str, top_n: int, min_score: float = 0.0):
             self.called_with_keyword_name = keyword_name
             self.called_with_top_n = top_n
+            self.called_with_min_score = min_score
             return [
                 {
                     "keyword_id": "k1",
@@ -121,7 +123,7 @@ def test_get_keyword_similarity_happy_path(client: TestClient, test_app: FastAPI
 
 
 def test_get_keyword_similarity_empty_result(client: TestClient, test_app: FastAPI, monkeypatch):
-    def _empty_return(keyword_name: str, top_n: int):
+    def _empty_return(keyword_name: str, top_n: int, min_score: float = 0.0):
         return []
 
     monkeypatch.setattr(
@@ -139,7 +141,7 @@ def test_get_keyword_similarity_empty_result(client: TestClient, test_app: FastA
 
 
 def test_get_keyword_similarity_internal_error(client: TestClient, test_app: FastAPI, monkeypatch, caplog):
-    def _raise_error(keyword_name: str, top_n: int):
+    def _raise_error(keyword_name: str, top_n: int, min_score: float = 0.0):
         raise RuntimeError("boom")
 
     monkeypatch.setattr(
@@ -156,4 +158,29 @@ def test_get_keyword_similarity_internal_error(client: TestClient, test_app: Fas
     assert any(
         "Error retrieving similarity values for keyword Login User" in record.getMessage()
         for record in caplog.records
-    )
\ No newline at end of file
+    )
+
+def test_get_keyword_similarity_passes_top_n_and_min_score(client: TestClient, test_app: FastAPI):
+    response = client.get(
+        "/keyword-similarity",
+        params={"keyword_name": "Login User", "top_n": 3, "min_score": 0.9},
+    )
+    assert response.status_code == 200
+
+    service = test_app.state.keyword_similarity_service
+    assert service.called_with_top_n == 3
+    assert service.called_with_min_score == 0.9
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"top_n": 0},
+        {"top_n": 101},
+        {"min_score": -0.1},
+        {"min_score": 1.5},
+    ],
+)
+def test_get_keyword_similarity_rejects_invalid_parameters(client: TestClient, params: dict):
+    response = client.get("/keyword-similarity", params={"keyword_name": "Login User", **params})
+    assert response.status_code == 422
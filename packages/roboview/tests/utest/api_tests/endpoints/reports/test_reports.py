@@ -2,6 +2,9 @@
 
 import json
 import tempfile
+import threading
+import time
+from collections.abc import Iterator
 from pathlib import Path
 from unittest.mock import MagicMock
 
@@ -18,6 +21,7 @@ from roboview.schemas.domain.reports import (
     ReportTypeEnum,
 )
 from roboview.schemas.dtos.reports import GenerateReportRequest
+from roboview.services.report_job_service import ReportJobService
 
 
 @pytest.fixture
@@ -57,35 +61,48 @@ def test_app() -> FastAPI:
 
 
 @pytest.fixture
-def client(test_app: FastAPI) -> TestClient:
-    """Create a test client."""
-    return TestClient(test_app)
+def client(test_app: FastAPI, tmp_path: Path) -> Iterator[TestClient]:
+    """Create a test client with a report job service writing to a temporary directory."""
+    test_app.state.report_job_service = ReportJobService(tmp_path / "reports")
+    yield TestClient(test_app)
+    test_app.state.report_job_service.shutdown()
+
+
+def _wait_for_report(client: TestClient, report_id: str, timeout: float = 10.0) -> dict:
+    """Poll the status endpoint until the report is no longer generating."""
+    deadline = time.monotonic() + timeout
+    while True:
+        data = client.get(f"/reports/status/{report_id}").json()
+        if data["status"] != "generating" or time.monotonic() > deadline:
+            return data
+        time.sleep(0.01)
 
 
 def test_generate_report_success(client: TestClient) -> None:
     """Test successful report generation."""
     request_data = {
         "report_type": "executive_summary",
-        "export_format": "json",
+        "export_format": "html",
         "author": "Test Author",
     }
 
     response = client.post("/reports/generate", json=request_data)
 
-    assert response.status_code == 200
-    data = response.json()
+    assert response.status_code == 202
+    data = _wait_for_report(client, response.json()["report_id"])
     assert data["status"] == "completed"
     assert data["report_id"] is not None
     assert data["download_url"] is not None
-    assert "json" in data["download_url"]
+    assert data["download_url"].endswith(f"/reports/download/{data['report_id']}")
 
 
 def test_generate_report_with_default_values(client: TestClient) -> None:
     """Test report generation with default values."""
     response = client.post("/reports/generate", json={})
 
-    assert response.status_code == 200
-    data = response.json()
+    assert response.status_code == 202
+    assert response.json()["status"] in {"generating", "completed"}
+    data = _wait_for_report(client, response.json()["report_id"])
     assert data["status"] == "completed"
 
 
@@ -108,10 +125,8 @@ def test_get_report_status(client: TestClient) -> None:
     report_id = response.json()["report_id"]
 
     # Get status
-    response = client.get(f"/reports/status/{report_id}")
+    data = _wait_for_report(client, report_id)
 
-    assert response.status_code == 200
-    data = response.json()
     assert data["report_id"] == report_id
     assert data["status"] == "completed"
 
@@ -129,24 +144,90 @@ def test_download_report(client: TestClient) -> None:
     response = client.post("/reports/generate", json={})
     report_id = response.json()["report_id"]
 
+    _wait_for_report(client, report_id)
+
     # Download report
     response = client.get(f"/reports/download/{report_id}")
 
     assert response.status_code == 200
-    assert response.headers["content-type"] == "application/json"
+    assert response.headers["content-type"].startswith("text/html")
     assert "report_" in response.headers.get("content-disposition", "")
 
 
-def test_download_incomplete_report(client: TestClient) -> None:
+def test_download_incomplete_report(client: TestClient, test_app: FastAPI) -> None:
     """Test downloading a report that is still generating."""
-    # This would require mocking an ongoing generation
-    # For now, we'll skip since our implementation completes immediately
+    release = threading.Event()
+    sample_report = test_app.state.reporting_service.generate_report.return_value
+
+    def _blocking_generate_report(**_: object) -> SummaryReport:
+        release.wait(timeout=10)
+        return sample_report
+
+    test_app.state.reporting_service.generate_report.side_effect = _blocking_generate_report
+
+    response = client.post("/reports/generate", json={})
+    report_id = response.json()["report_id"]
+
+    assert response.json()["status"] == "generating"
+    assert client.get(f"/reports/download/{report_id}").status_code == 400
+
+    release.set()
+    assert _wait_for_report(client, report_id)["status"] == "completed"
+    assert client.get(f"/reports/download/{report_id}").status_code == 200
+
+
+def test_generate_report_failure_is_reported(client: TestClient, test_app: FastAPI) -> None:
+    """Test that a failing report generation ends in the failed state."""
+    test_app.state.reporting_service.generate_report.side_effect = RuntimeError("boom")
+
+    response = client.post("/reports/generate", json={})
+    data = _wait_for_report(client, response.json()["report_id"])
+
+    assert data["status"] == "failed"
+    assert data["error_message"] == "Internal error"
+    assert data["download_url"] is None
+
+
+def test_generate_report_coalesces_identical_requests(client: TestClient, test_app: FastAPI) -> None:
+    """Test that identical requests for the same snapshot share one report."""
+    for registry_name, version in (("keyword_registry", 1), ("file_registry", 2), ("robocop_registry", 3)):
+        setattr(test_app.state, registry_name, MagicMock(version=version))
+
+    first = client.post("/reports/generate", json={"author": "Alice"}).json()
+    second = client.post("/reports/generate", json={"author": "Alice"}).json()
+    other_author = client.post("/reports/generate", json={"author": "Bob"}).json()
+
+    assert first["report_id"] == second["report_id"]
+    assert other_author["report_id"] != first["report_id"]
+
+    _wait_for_report(client, first["report_id"])
+    test_app.state.keyword_registry.version = 4
+    after_change = client.post("/reports/generate", json={"author": "Alice"}).json()
+
+    assert after_change["report_id"] != first["report_id"]
+
+
+def test_generate_report_queue_full(test_app: FastAPI, tmp_path: Path) -> None:
+    """Test that requests are rejected once the report queue is full."""
+    release = threading.Event()
+    test_app.state.reporting_service.generate_report.side_effect = lambda **_: release.wait(timeout=10)
+    test_app.state.report_job_service = ReportJobService(tmp_path, max_workers=1, max_pending_jobs=1)
+    client = TestClient(test_app)
+
+    try:
+        assert client.post("/reports/generate", json={}).status_code == 202
+        assert client.post("/reports/generate", json={}).status_code == 202
+        assert client.post("/reports/generate", json={}).status_code == 503
+    finally:
+        release.set()
+        test_app.state.report_job_service.shutdown()
 
 
 def test_get_available_reports(client: TestClient) -> None:
     """Test getting list of available reports."""
     # Generate a report first
-    client.post("/reports/generate", json={})
+    response = client.post("/reports/generate", json={})
+    _wait_for_report(client, response.json()["report_id"])
 
     # Get available reports
     response = client.get("/reports/available-reports")
@@ -164,6 +245,7 @@ def test_delete_report(client: TestClient) -> None:
     # Generate a report
     response = client.post("/reports/generate", json={})
     report_id = response.json()["report_id"]
+    _wait_for_report(client, report_id)
 
     # Delete report
     response = client.delete(f"/reports/{report_id}")
@@ -193,12 +275,35 @@ def test_generate_multiple_reports(client: TestClient) -> None:
             "/reports/generate",
             json={"report_type": "executive_summary"},
         )
-        assert response.status_code == 200
+        assert response.status_code == 202
         report_ids.append(response.json()["report_id"])
 
+    for report_id in report_ids:
+        _wait_for_report(client, report_id)
+
     # Verify all reports are available
     response = client.get("/reports/available-reports")
     available_ids = [r["report_id"] for r in response.json()]
 
     for report_id in report_ids:
         assert report_id in available_ids
+
+
+def test_stream_report(client: TestClient, test_app: FastAPI) -> None:
+    """Test streaming a rendered report directly into the response."""
+    response = client.get("/reports/stream", params={"author": "Test Author"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/html")
+    assert response.text.startswith("<!DOCTYPE html>")
+    assert "Test Summary Report" in response.text
+    test_app.state.reporting_service.generate_report.assert_called_once_with(author="Test Author")
+
+
+def test_stream_report_error(client: TestClient, test_app: FastAPI) -> None:
+    """Test that errors while building the streamed report return 500."""
+    test_app.state.reporting_service.generate_report.side_effect = RuntimeError("boom")
+
+    response = client.get("/reports/stream")
+
+    assert response.status_code == 500
@@ -118,4 +118,11 @@ def test_get_robocop_message_internal_error(client: TestClient, test_app: FastAP
     assert any(
         "Error retrieving keywords without usages." in record.getMessage()
         for record in caplog.records
-    )
\ No newline at end of file
+    )
+
+def test_get_robocop_message_unknown_uuid_returns_404(client: TestClient, test_app: FastAPI, monkeypatch):
+    monkeypatch.setattr(test_app.state.robocop_service, "get_robocop_message_by_id", lambda message_uuid: None)
+
+    response = client.get("/robocop-message", params={"message_uuid": "unknown"})
+    assert response.status_code == 404
+    assert response.json() == {"detail": "Robocop message not found"}
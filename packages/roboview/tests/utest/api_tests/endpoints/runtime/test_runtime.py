@@ -0,0 +1,115 @@
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from roboview.api.endpoints.runtime import api_router
+from roboview.registries.keyword_registry import KeywordRegistry
+from roboview.schemas.domain.keywords import KeywordProperties
+from roboview.schemas.dtos.runtime import OutputIngestionResponse, SlowestKeywordsResponse
+from roboview.services.keyword_runtime_service import KeywordRuntimeService
+
+_OUTPUT_XML = """\
+<robot generator="Robot 7.0" schemaversion="5">
+<suite name="Shop" source="/project/tests/shop.robot">
+<test name="Buy">
+<kw name="Login As" owner="users"><status status="PASS" elapsed="2.000"/></kw>
+<kw name="Log" owner="BuiltIn"><status status="FAIL" elapsed="0.100"/></kw>
+<kw name="Login As" owner="users"><status status="PASS" elapsed="1.000"/></kw>
+<status status="FAIL" elapsed="3.100"/>
+</test>
+<status status="FAIL" elapsed="3.100"/>
+</suite>
+</robot>
+"""
+
+
+@pytest.fixture
+def test_app() -> FastAPI:
+    app = FastAPI()
+    app.include_router(api_router, prefix="/runtime")
+
+    keyword_registry = KeywordRegistry()
+    keyword_registry.register(
+        KeywordProperties(
+            keyword_id="k1",
+            file_name="users.resource",
+            keyword_name_without_prefix="Login As",
+            keyword_name_with_prefix="users.Login As",
+            is_user_defined=True,
+            code="",
+            source="/project/res/users.resource",
+            validation_str_without_prefix="loginas",
+            validation_str_with_prefix="users.loginas",
+        )
+    )
+    app.state.keyword_registry = keyword_registry
+    app.state.keyword_runtime_service = KeywordRuntimeService(keyword_registry)
+    return app
+
+
+@pytest.fixture
+def client(test_app: FastAPI) -> TestClient:
+    return TestClient(test_app)
+
+
+def test_ingest_output_files_and_get_slowest_keywords(client: TestClient, tmp_path: Path):
+    output_file = tmp_path / "output.xml"
+    output_file.write_text(_OUTPUT_XML, encoding="utf-8")
+
+    response = client.post("/runtime/output-files", json={"output_files": [str(output_file)]})
+
+    assert response.status_code == 200
+    summary = OutputIngestionResponse(**response.json()).summary
+    assert (summary.output_files, summary.keyword_calls, summary.keywords, summary.matched_keywords) == (1, 3, 2, 1)
+
+    response = client.get("/runtime/slowest-keywords", params={"limit": 1})
+
+    assert response.status_code == 200
+    [login] = SlowestKeywordsResponse(**response.json()).slowest_keywords
+    assert login.keyword_name == "users.Login As"
+    assert login.keyword_id == "k1"
+    assert login.call_count == 2
+    assert login.total_seconds == pytest.approx(3.0)
+
+
+def test_get_slowest_keywords_is_empty_before_ingestion(client: TestClient):
+    response = client.get("/runtime/slowest-keywords")
+
+    assert response.status_code == 200
+    assert response.json() == {"slowest_keywords": []}
+
+
+def test_ingest_output_files_rejects_missing_file(client: TestClient, tmp_path: Path):
+    response = client.post("/runtime/output-files", json={"output_files": [str(tmp_path / "missing.xml")]})
+
+    assert response.status_code == 400
+    assert "Output file not found" in response.json()["detail"]
+
+
+def test_ingest_output_files_rejects_invalid_xml(client: TestClient, tmp_path: Path):
+    output_file = tmp_path / "output.xml"
+    output_file.write_text("<robot><suite>", encoding="utf-8")
+
+    response = client.post("/runtime/output-files", json={"output_files": [str(output_file)]})
+
+    assert response.status_code == 400
+    assert "Invalid output file" in response.json()["detail"]
+
+
+def test_ingest_output_files_returns_500_on_unexpected_error(
+    client: TestClient, test_app: FastAPI, tmp_path: Path, monkeypatch
+):
+    output_file = tmp_path / "output.xml"
+    output_file.write_text(_OUTPUT_XML, encoding="utf-8")
+
+    def fail(_output_files):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(test_app.state.keyword_runtime_service, "ingest_output_files", fail)
+
+    response = client.post("/runtime/output-files", json={"output_files": [str(output_file)]})
+
+    assert response.status_code == 500
+    assert response.json() == {"detail": "Internal Server Error"}
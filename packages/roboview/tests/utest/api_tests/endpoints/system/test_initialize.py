@@ -34,7 +34,7 @@ def test_post_initialize_roboview_happy_path_direct(monkeypatch, test_app: FastA
     caplog.set_level(logging.INFO, logger=logger.name)
 
     class FakeKeywordRegistryService:
-        def __init__(self, root: Path) -> None:
+        def __init__(self, root: Path, library_catalog=None) -> None:
             self.root = root
             self.initialized = False
 
@@ -73,8 +73,10 @@ def test_post_initialize_roboview_happy_path_direct(monkeypatch, test_app: FastA
             self.file_registry = file_registry
 
     class FakeKeywordSimilarityService:
-        def __init__(self, keyword_registry) -> None:
+        def __init__(self, keyword_registry, index_path=None, index_top_k=100) -> None:
             self.keyword_registry = keyword_registry
+            self.index_path = index_path
+            self.index_top_k = index_top_k
             self.calculated = False
 
         def calculate_keyword_similarity_matrix(self) -> None:
@@ -130,12 +132,17 @@ def test_post_initialize_roboview_happy_path_direct(monkeypatch, test_app: FastA
     assert isinstance(result, InitializationResponse)
     assert result.status == "success"
 
-    assert hasattr(test_app.state, "keyword_registry")
-    assert hasattr(test_app.state, "file_registry")
-    assert hasattr(test_app.state, "robocop_registry")
-    assert hasattr(test_app.state, "keyword_usage_service")
-    assert hasattr(test_app.state, "keyword_similarity_service")
-    assert hasattr(test_app.state, "robocop_service")
+    project = test_app.state.project_pool.get(result.project_key)
+    assert project is not None
+    assert project.project_root == Path("/path/to/project")
+    assert hasattr(project, "keyword_registry")
+    assert hasattr(project, "file_registry")
+    assert hasattr(project, "robocop_registry")
+    assert hasattr(project, "keyword_usage_service")
+    assert hasattr(project, "keyword_similarity_service")
+    assert hasattr(project, "robocop_service")
+    assert hasattr(project, "reporting_service")
+    assert test_app.state.project_pool.default_project_key == result.project_key
 
     assert any("Initialization Requested" in record.getMessage() for record in caplog.records)
     assert any("Initialize Keyword Usage Service" in record.getMessage() for record in caplog.records)
@@ -148,7 +155,7 @@ def test_post_initialize_roboview_happy_path_endpoint(monkeypatch, client: TestC
     from roboview.api.endpoints.system import initialize as initialize_module
 
     class FakeKeywordRegistryService:
-        def __init__(self, root: Path) -> None:
+        def __init__(self, root: Path, library_catalog=None) -> None:
             self.root = root
 
         def initialize(self) -> None:
@@ -184,8 +191,10 @@ def test_post_initialize_roboview_happy_path_endpoint(monkeypatch, client: TestC
             self.file_registry = file_registry
 
     class FakeKeywordSimilarityService:
-        def __init__(self, keyword_registry) -> None:
+        def __init__(self, keyword_registry, index_path=None, index_top_k=100) -> None:
             self.keyword_registry = keyword_registry
+            self.index_path = index_path
+            self.index_top_k = index_top_k
 
         def calculate_keyword_similarity_matrix(self) -> None:
             pass
@@ -238,6 +247,7 @@ def test_post_initialize_roboview_happy_path_endpoint(monkeypatch, client: TestC
 
     assert isinstance(parsed, InitializationResponse)
     assert parsed.status == "success"
+    assert parsed.project_key
 
 
 def test_post_initialize_roboview_internal_error(monkeypatch, client: TestClient, caplog):
@@ -265,4 +275,44 @@ def test_post_initialize_roboview_internal_error(monkeypatch, client: TestClient
     assert any(
         "Error initializing Keyword List" in record.getMessage()
         for record in caplog.records
-    )
\ No newline at end of file
+    )
+
+def test_post_initialize_roboview_records_waiting_profiling_session(
+    client: TestClient, test_app: FastAPI, tmp_path: Path
+):
+    from roboview.api.profiling import get_profiling_service
+    from roboview.schemas.domain.profiling import ProfilingStatusEnum, ProfilingTargetEnum
+    from roboview.utils.project_generator import ProjectGenerator, ProjectGeneratorConfig
+
+    ProjectGenerator(ProjectGeneratorConfig(resource_files=1, suite_files=1, keywords_per_file=3)).generate(tmp_path)
+    session = get_profiling_service(test_app.state).start(ProfilingTargetEnum.INITIALIZATION)
+
+    response = client.post("/initialize", json={"project_root_dir": str(tmp_path)})
+
+    assert response.status_code == 200
+    assert session.status == ProfilingStatusEnum.COMPLETED
+    profiled_functions = {function[2] for function in session.get_stats().stats}
+    assert "calculate_keyword_similarity_matrix" in profiled_functions
+
+
+def test_post_initialize_roboview_joins_running_warmup(monkeypatch, client: TestClient, test_app: FastAPI, tmp_path: Path):
+    import threading
+    from types import SimpleNamespace
+
+    from roboview.api.endpoints.system import initialize as initialize_module
+    from roboview.api.warmup import get_warmup_service
+
+    release = threading.Event()
+    warmup_service = get_warmup_service(test_app.state)
+    warmup_service.start(tmp_path, None, lambda *_: release.wait(5) and SimpleNamespace(project_key="warm"))
+
+    def _fail_initialize(*args, **kwargs):
+        raise AssertionError("project initialized twice")
+
+    monkeypatch.setattr(initialize_module, "initialize_project", _fail_initialize)
+    threading.Timer(0.05, release.set).start()
+
+    response = client.post("/initialize", json={"project_root_dir": str(tmp_path)})
+
+    assert response.status_code == 200
+    assert response.json()["project_key"] == "warm"
@@ -0,0 +1,68 @@
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from roboview.api.endpoints.system.memory import router
+from roboview.registries.file_registry import FileRegistry
+from roboview.registries.keyword_registry import KeywordRegistry
+from roboview.registries.robocop_registry import RobocopRegistry
+from roboview.schemas.dtos.memory import MemoryResponse
+from roboview.services.project_pool_service import ProjectContext, ProjectPoolService
+
+
+@pytest.fixture
+def test_app() -> FastAPI:
+    app = FastAPI()
+    app.include_router(router, prefix="/memory")
+    app.state.project_pool = ProjectPoolService()
+    return app
+
+
+@pytest.fixture
+def client(test_app: FastAPI) -> TestClient:
+    return TestClient(test_app)
+
+
+def test_get_memory_reports_structures_per_project(test_app: FastAPI, client: TestClient, tmp_path: Path):
+    context = ProjectContext(
+        tmp_path,
+        keyword_registry=KeywordRegistry(),
+        file_registry=FileRegistry(),
+        robocop_registry=RobocopRegistry(),
+        keyword_usage_service=None,
+        keyword_similarity_service=None,
+        robocop_service=None,
+        reporting_service=None,
+    )
+    test_app.state.project_pool.add(context)
+
+    response = client.get("/memory")
+
+    assert response.status_code == 200
+    parsed = MemoryResponse(**response.json())
+    assert [project.project_key for project in parsed.projects] == [context.project_key]
+    assert [structure.name for structure in parsed.projects[0].structures][:2] == [
+        "library_keywords",
+        "keyword_registry",
+    ]
+    assert parsed.library_catalog_bytes > 0
+    assert parsed.tracing_allocations is False
+    assert parsed.top_allocation_sites == []
+
+
+def test_get_memory_rejects_invalid_top(client: TestClient):
+    assert client.get("/memory", params={"top": 0}).status_code == 422
+
+
+def test_get_memory_returns_500_on_error(client: TestClient, monkeypatch: pytest.MonkeyPatch):
+    def fail(*_args: object) -> None:
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr("roboview.api.endpoints.system.memory.collect_memory_usage", fail)
+
+    response = client.get("/memory")
+
+    assert response.status_code == 500
+    assert response.json() == {"detail": "Internal Server Error"}
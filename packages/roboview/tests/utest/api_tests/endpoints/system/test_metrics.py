@@ -0,0 +1,69 @@
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from roboview.api.endpoints.system.metrics import router
+from roboview.core.metrics import CONTENT_TYPE
+from roboview.registries.file_registry import FileRegistry
+from roboview.registries.keyword_registry import KeywordRegistry
+from roboview.registries.robocop_registry import RobocopRegistry
+from roboview.services.project_pool_service import ProjectContext, ProjectPoolService
+
+
+@pytest.fixture
+def test_app() -> FastAPI:
+    app = FastAPI()
+    app.include_router(router, prefix="/metrics")
+    app.state.project_pool = ProjectPoolService()
+    return app
+
+
+@pytest.fixture
+def client(test_app: FastAPI) -> TestClient:
+    return TestClient(test_app)
+
+
+def test_get_metrics_returns_prometheus_text(client: TestClient):
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == CONTENT_TYPE
+    assert "# TYPE roboview_http_request_duration_seconds histogram" in response.text
+    assert "# TYPE roboview_initialization_phase_duration_seconds histogram" in response.text
+
+
+def test_get_metrics_reports_registry_sizes_per_project(test_app: FastAPI, client: TestClient, tmp_path: Path):
+    context = ProjectContext(
+        tmp_path,
+        keyword_registry=KeywordRegistry(),
+        file_registry=FileRegistry(),
+        robocop_registry=RobocopRegistry(),
+        keyword_usage_service=None,
+        keyword_similarity_service=None,
+        robocop_service=None,
+        reporting_service=None,
+    )
+    test_app.state.project_pool.add(context)
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert f'roboview_registry_entries{{project="{context.project_key}",registry="keywords"}} 0' in response.text
+    assert f'roboview_project_estimated_size_bytes{{project="{context.project_key}"}}' in response.text
+
+    test_app.state.project_pool.remove(context.project_key)
+    assert context.project_key not in client.get("/metrics").text
+
+
+def test_get_metrics_returns_500_on_error(test_app: FastAPI, client: TestClient, monkeypatch: pytest.MonkeyPatch):
+    def fail(*_args: object) -> None:
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr("roboview.api.endpoints.system.metrics.collect_project_metrics", fail)
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 500
+    assert response.json() == {"detail": "Internal Server Error"}
@@ -0,0 +1,90 @@
+import pstats
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from roboview.api.endpoints.system.profile import router
+from roboview.api.profiling import profiling_middleware
+from roboview.core.config import get_settings
+from roboview.schemas.dtos.profiling import ProfilingStatusResponse
+
+
+@pytest.fixture
+def profiling_enabled(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    monkeypatch.setenv("PROFILING_ENABLED", "true")
+    get_settings.cache_clear()
+    yield
+    monkeypatch.delenv("PROFILING_ENABLED")
+    get_settings.cache_clear()
+
+
+@pytest.fixture
+def test_app() -> FastAPI:
+    app = FastAPI()
+    app.include_router(router, prefix="/api/v1/system/profile")
+
+    @app.get("/api/v1/work")
+    async def work():
+        return {"result": sum(range(1_000))}
+
+    app.middleware("http")(profiling_middleware)
+    return app
+
+
+@pytest.fixture
+def client(test_app: FastAPI) -> TestClient:
+    return TestClient(test_app)
+
+
+def test_profiling_is_disabled_by_default(client: TestClient):
+    assert client.post("/api/v1/system/profile", json={}).status_code == 403
+    assert client.get("/api/v1/system/profile").status_code == 403
+
+
+@pytest.mark.usefixtures("profiling_enabled")
+def test_get_profile_without_session(client: TestClient):
+    response = client.get("/api/v1/system/profile")
+
+    assert response.status_code == 404
+    assert response.json() == {"detail": "No profiling session"}
+
+
+@pytest.mark.usefixtures("profiling_enabled")
+def test_profile_next_requests(client: TestClient, tmp_path: Path):
+    response = client.post("/api/v1/system/profile", json={"target": "requests", "request_count": 2})
+    assert response.status_code == 202
+    assert ProfilingStatusResponse(**response.json()).status == "waiting"
+
+    client.get("/api/v1/work")
+    # Polling the session does not use up profiled requests
+    status = ProfilingStatusResponse(**client.get("/api/v1/system/profile").json())
+    assert status.status == "recording"
+    assert status.profiled_count == 1
+    assert client.get("/api/v1/system/profile/speedscope").status_code == 409
+
+    client.get("/api/v1/work")
+    status = ProfilingStatusResponse(**client.get("/api/v1/system/profile").json())
+    assert status.status == "completed"
+    assert status.profiled_count == 2
+    assert status.hotspots
+
+    speedscope = client.get("/api/v1/system/profile/speedscope")
+    assert speedscope.status_code == 200
+    assert speedscope.json()["profiles"][0]["name"] == "requests"
+    assert "attachment" in speedscope.headers["content-disposition"]
+
+    pstats_response = client.get("/api/v1/system/profile/pstats")
+    assert pstats_response.status_code == 200
+    pstats_path = tmp_path / "requests.pstats"
+    pstats_path.write_bytes(pstats_response.content)
+    assert "work" in {function[2] for function in pstats.Stats(str(pstats_path)).stats}
+
+
+@pytest.mark.usefixtures("profiling_enabled")
+def test_post_profile_rejects_invalid_request_count(client: TestClient):
+    response = client.post("/api/v1/system/profile", json={"request_count": 0})
+
+    assert response.status_code == 422
@@ -0,0 +1,86 @@
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from roboview.api.endpoints.system.projects import router
+from roboview.registries.file_registry import FileRegistry
+from roboview.registries.keyword_registry import KeywordRegistry
+from roboview.registries.robocop_registry import RobocopRegistry
+from roboview.schemas.dtos.common import ProjectListResponse
+from roboview.services.project_pool_service import ProjectContext, ProjectPoolService
+
+
+def _context(project_root: Path) -> ProjectContext:
+    return ProjectContext(
+        project_root,
+        keyword_registry=KeywordRegistry(),
+        file_registry=FileRegistry(),
+        robocop_registry=RobocopRegistry(),
+        keyword_usage_service=None,
+        keyword_similarity_service=None,
+        robocop_service=None,
+        reporting_service=None,
+    )
+
+
+@pytest.fixture
+def test_app() -> FastAPI:
+    app = FastAPI()
+    app.include_router(router, prefix="/projects")
+    app.state.project_pool = ProjectPoolService(memory_budget_bytes=123_456_789)
+    return app
+
+
+@pytest.fixture
+def client(test_app: FastAPI) -> TestClient:
+    return TestClient(test_app)
+
+
+def test_get_projects_lists_pool(test_app: FastAPI, client: TestClient, tmp_path: Path):
+    first = _context(tmp_path / "first")
+    second = _context(tmp_path / "second")
+    test_app.state.project_pool.add(first)
+    test_app.state.project_pool.add(second)
+
+    response = client.get("/projects")
+
+    assert response.status_code == 200
+    parsed = ProjectListResponse(**response.json())
+    assert [project.project_key for project in parsed.projects] == [first.project_key, second.project_key]
+    assert [project.is_default for project in parsed.projects] == [False, True]
+    assert parsed.projects[0].project_root_dir == tmp_path / "first"
+    assert parsed.estimated_size_bytes == first.estimated_size_bytes + second.estimated_size_bytes
+    assert parsed.memory_budget_bytes == 123_456_789
+
+
+def test_get_projects_empty(client: TestClient):
+    response = client.get("/projects")
+
+    assert response.status_code == 200
+    assert response.json()["projects"] == []
+
+
+def test_delete_project(test_app: FastAPI, client: TestClient, tmp_path: Path):
+    context = _context(tmp_path)
+    test_app.state.project_pool.add(context)
+
+    response = client.delete(f"/projects/{context.project_key}")
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "success", "message": "Project removed"}
+    assert len(test_app.state.project_pool) == 0
+    assert client.delete(f"/projects/{context.project_key}").status_code == 404
+
+
+def test_get_projects_internal_error(test_app: FastAPI, client: TestClient, monkeypatch):
+    def _raise_error():
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(test_app.state.project_pool, "list_projects", _raise_error)
+
+    response = client.get("/projects")
+
+    assert response.status_code == 500
+    assert response.json() == {"detail": "Internal Server Error"}
@@ -0,0 +1,81 @@
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from roboview.api.endpoints.system.ready import router
+from roboview.api.warmup import get_warmup_service, start_project_warmup
+from roboview.utils.project_generator import ProjectGenerator, ProjectGeneratorConfig
+
+
+@pytest.fixture
+def test_app() -> FastAPI:
+    app = FastAPI()
+    app.include_router(router, prefix="/ready")
+    return app
+
+
+@pytest.fixture
+def client(test_app: FastAPI) -> TestClient:
+    return TestClient(test_app)
+
+
+def test_ready_without_configured_project(client: TestClient):
+    response = client.get("/ready")
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "disabled"
+
+
+def test_not_ready_while_warming_up_then_ready(client: TestClient, test_app: FastAPI, tmp_path: Path):
+    release = threading.Event()
+
+    def initialize(project_root, robocop_config_file):
+        release.wait(5)
+        return SimpleNamespace(project_key="key")
+
+    service = get_warmup_service(test_app.state)
+    service.start(tmp_path, None, initialize)
+
+    response = client.get("/ready")
+    assert response.status_code == 503
+    assert response.json()["status"] == "running"
+    assert response.json()["project_root"] == str(tmp_path)
+
+    release.set()
+    assert service.wait(timeout=5)
+
+    response = client.get("/ready")
+    assert response.status_code == 200
+    assert response.json()["status"] == "ready"
+    assert response.json()["project_key"] == "key"
+
+
+def test_not_ready_after_failed_warmup(client: TestClient, test_app: FastAPI, tmp_path: Path):
+    def initialize(project_root, robocop_config_file):
+        raise ValueError("broken project")
+
+    service = get_warmup_service(test_app.state)
+    service.start(tmp_path, None, initialize)
+    assert service.wait(timeout=5)
+
+    response = client.get("/ready")
+
+    assert response.status_code == 503
+    assert response.json()["status"] == "failed"
+    assert response.json()["error"] == "broken project"
+
+
+def test_project_warmup_adds_project_to_pool(test_app: FastAPI, tmp_path: Path):
+    ProjectGenerator(ProjectGeneratorConfig(resource_files=1, suite_files=1, keywords_per_file=3)).generate(tmp_path)
+
+    service = start_project_warmup(test_app.state, tmp_path)
+
+    assert service.wait(timeout=60)
+    assert service.status == "ready"
+    project = test_app.state.project_pool.get(service.project_key)
+    assert project is not None
+    assert test_app.state.project_pool.default_project_key == service.project_key
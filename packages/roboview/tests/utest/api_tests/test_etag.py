@@ -0,0 +1,172 @@
+import subprocess
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from fastapi import APIRouter, Depends, FastAPI
+from fastapi.testclient import TestClient
+
+import roboview
+from roboview.api.etag import build_etag, conditional_get, etag_matches, get_snapshot_versions
+
+
+class FakeRegistry:
+    def __init__(self, version: int) -> None:
+        self.version = version
+
+
+def _state(keyword_version: int = 1, file_version: int = 2, robocop_version: int = 3) -> SimpleNamespace:
+    return SimpleNamespace(
+        keyword_registry=FakeRegistry(keyword_version),
+        file_registry=FakeRegistry(file_version),
+        robocop_registry=FakeRegistry(robocop_version),
+    )
+
+
+@pytest.fixture
+def test_app() -> tuple[FastAPI, dict]:
+    app = FastAPI()
+    calls = {"count": 0}
+    router = APIRouter()
+
+    @router.get("/kpis")
+    async def kpis(project_root_dir: str = ""):
+        calls["count"] += 1
+        return {"project_root_dir": project_root_dir}
+
+    @router.post("/kpis")
+    async def post_kpis():
+        calls["count"] += 1
+        return {"status": "ok"}
+
+    app.include_router(router, prefix="/overview", dependencies=[Depends(conditional_get)])
+    for name, registry in vars(_state()).items():
+        setattr(app.state, name, registry)
+    return app, calls
+
+
+def test_get_snapshot_versions_returns_none_without_registries():
+    assert get_snapshot_versions(SimpleNamespace()) is None
+    assert get_snapshot_versions(SimpleNamespace(keyword_registry={}, file_registry={}, robocop_registry={})) is None
+
+
+def test_get_snapshot_versions_returns_registry_versions():
+    assert get_snapshot_versions(_state(4, 5, 6)) == (4, 5, 6)
+
+
+def test_etag_matches_handles_lists_wildcards_and_weak_tags():
+    etag = 'W/"abc"'
+    assert etag_matches('"abc"', etag)
+    assert etag_matches('W/"xyz", W/"abc"', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"xyz"', etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches("", etag)
+
+
+def test_response_carries_etag_and_conditional_request_returns_304(test_app):
+    app, calls = test_app
+    client = TestClient(app)
+
+    response = client.get("/overview/kpis", params={"project_root_dir": "/proj"})
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert etag.startswith('W/"')
+    assert calls["count"] == 1
+
+    cached = client.get("/overview/kpis", params={"project_root_dir": "/proj"}, headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == etag
+    assert calls["count"] == 1
+
+
+def test_etag_depends_on_query_parameters(test_app):
+    app, _ = test_app
+    client = TestClient(app)
+
+    first = client.get("/overview/kpis", params={"project_root_dir": "/a"}).headers["etag"]
+    second = client.get("/overview/kpis", params={"project_root_dir": "/b"}).headers["etag"]
+    assert first != second
+
+    response = client.get("/overview/kpis", params={"project_root_dir": "/b"}, headers={"If-None-Match": first})
+    assert response.status_code == 200
+
+
+def test_etag_changes_after_reinitialization(test_app):
+    app, calls = test_app
+    client = TestClient(app)
+
+    etag = client.get("/overview/kpis").headers["etag"]
+    app.state.keyword_registry = FakeRegistry(42)
+
+    response = client.get("/overview/kpis", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert calls["count"] == 2
+
+
+def test_no_etag_before_initialization():
+    app = FastAPI()
+
+    @app.get("/kpis", dependencies=[Depends(conditional_get)])
+    async def kpis():
+        return {"ok": True}
+
+    response = TestClient(app).get("/kpis", headers={"If-None-Match": "*"})
+    assert response.status_code == 200
+    assert "etag" not in response.headers
+
+
+def test_non_get_requests_are_not_conditional(test_app):
+    app, calls = test_app
+    response = TestClient(app).post("/overview/kpis", headers={"If-None-Match": "*"})
+    assert response.status_code == 200
+    assert "etag" not in response.headers
+    assert calls["count"] == 1
+
+
+def test_build_etag_accepts_explicit_state():
+    from starlette.requests import Request
+
+    request = Request({"type": "http", "method": "GET", "path": "/x", "query_string": b"", "headers": []})
+    assert build_etag(request, _state(1, 2, 3)) != build_etag(request, _state(1, 2, 4))
+
+
+def _build_etag_in_new_process() -> str:
+    script = (
+        "from types import SimpleNamespace\n"
+        "from starlette.requests import Request\n"
+        "from roboview.api.etag import build_etag\n"
+        "registry = SimpleNamespace(version=1)\n"
+        "state = SimpleNamespace(keyword_registry=registry, file_registry=registry, robocop_registry=registry)\n"
+        "request = Request({'type': 'http', 'method': 'GET', 'path': '/x', 'query_string': b'', 'headers': []})\n"
+        "print(build_etag(request, state))\n"
+    )
+    package_root = Path(roboview.__file__).parents[1]
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True, cwd=package_root
+    )
+    return result.stdout.strip()
+
+
+def test_build_etag_differs_between_processes_with_equal_versions():
+    first = _build_etag_in_new_process()
+    second = _build_etag_in_new_process()
+
+    assert first.startswith('W/"')
+    assert first != second
+
+
+def test_build_etag_mixes_in_boot_id(monkeypatch):
+    from starlette.requests import Request
+
+    import roboview.api.etag as etag_module
+
+    request = Request({"type": "http", "method": "GET", "path": "/x", "query_string": b"", "headers": []})
+    monkeypatch.setattr(etag_module, "get_snapshot_boot_id", lambda: "first-boot")
+    first = build_etag(request, _state())
+    monkeypatch.setattr(etag_module, "get_snapshot_boot_id", lambda: "second-boot")
+
+    assert build_etag(request, _state()) != first
@@ -0,0 +1,46 @@
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from roboview.api.metrics import UNMATCHED_ROUTE, RouteTemplateResolver, metrics_middleware
+from roboview.core.metrics import HTTP_REQUEST_DURATION, HTTP_REQUESTS
+
+
+def _test_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/items/latest")
+    async def latest_item():
+        return {"id": "latest"}
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: str):
+        if item_id == "missing":
+            raise HTTPException(status_code=404)
+        return {"id": item_id}
+
+    app.middleware("http")(metrics_middleware)
+    return app
+
+
+def test_resolver_maps_paths_to_route_templates():
+    resolver = RouteTemplateResolver(_test_app())
+
+    assert resolver.resolve("/items/latest") == "/items/latest"
+    assert resolver.resolve("/items/42") == "/items/{item_id}"
+    assert resolver.resolve("/items/42/details") == UNMATCHED_ROUTE
+    assert resolver.resolve("/other") == UNMATCHED_ROUTE
+
+
+def test_middleware_counts_requests_per_route_template():
+    client = TestClient(_test_app())
+    ok_before = HTTP_REQUESTS.get("GET", "/items/{item_id}", "200")
+    missing_before = HTTP_REQUESTS.get("GET", "/items/{item_id}", "404")
+    observed_before = HTTP_REQUEST_DURATION.get_count("GET", "/items/{item_id}")
+
+    client.get("/items/1")
+    client.get("/items/2")
+    client.get("/items/missing")
+
+    assert HTTP_REQUESTS.get("GET", "/items/{item_id}", "200") == ok_before + 2
+    assert HTTP_REQUESTS.get("GET", "/items/{item_id}", "404") == missing_before + 1
+    assert HTTP_REQUEST_DURATION.get_count("GET", "/items/{item_id}") == observed_before + 3
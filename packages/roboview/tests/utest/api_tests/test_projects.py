@@ -0,0 +1,143 @@
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from fastapi import APIRouter, Depends, FastAPI
+from fastapi.testclient import TestClient
+from starlette.requests import Request
+
+from roboview.api.etag import conditional_get
+from roboview.api.projects import (
+    PROJECT_HEADER,
+    get_project,
+    get_project_pool,
+    load_snapshot_project,
+    project_scope,
+)
+from roboview.registries.file_registry import FileRegistry
+from roboview.registries.keyword_registry import KeywordRegistry
+from roboview.registries.robocop_registry import RobocopRegistry
+from roboview.services.keyword_similarity_service import KeywordSimilarityService
+from roboview.services.project_pool_service import ProjectContext, ProjectPoolService
+from roboview.utils.analysis_snapshot import write_analysis_snapshot
+
+
+def _context(project_root: Path) -> ProjectContext:
+    return ProjectContext(
+        project_root,
+        keyword_registry=KeywordRegistry(),
+        file_registry=FileRegistry(),
+        robocop_registry=RobocopRegistry(),
+        keyword_usage_service=SimpleNamespace(name=project_root.name),
+        keyword_similarity_service=None,
+        robocop_service=None,
+        reporting_service=None,
+    )
+
+
+@pytest.fixture
+def test_app() -> FastAPI:
+    app = FastAPI()
+    router = APIRouter()
+
+    @router.get("/name")
+    async def name(request: Request):
+        return {"name": get_project(request).keyword_usage_service.name}
+
+    app.include_router(router, prefix="/keyword-usage", dependencies=[Depends(project_scope), Depends(conditional_get)])
+    return app
+
+
+@pytest.fixture
+def client(test_app: FastAPI) -> TestClient:
+    return TestClient(test_app)
+
+
+def test_falls_back_to_app_state_without_projects(test_app: FastAPI, client: TestClient):
+    test_app.state.keyword_usage_service = SimpleNamespace(name="single")
+
+    response = client.get("/keyword-usage/name")
+
+    assert response.status_code == 200
+    assert response.json() == {"name": "single"}
+
+
+def test_routes_requests_by_project_key_root_or_default(test_app: FastAPI, client: TestClient, tmp_path: Path):
+    test_app.state.project_pool = ProjectPoolService()
+    first = _context(tmp_path / "first")
+    second = _context(tmp_path / "second")
+    test_app.state.project_pool.add(first)
+    test_app.state.project_pool.add(second)
+
+    assert client.get("/keyword-usage/name").json() == {"name": "second"}
+    assert client.get("/keyword-usage/name", params={"project": first.project_key}).json() == {"name": "first"}
+    assert client.get("/keyword-usage/name", params={"project": str(tmp_path / "first")}).json() == {"name": "first"}
+    assert client.get("/keyword-usage/name", headers={PROJECT_HEADER: first.project_key}).json() == {"name": "first"}
+
+
+def test_unknown_project_returns_404(test_app: FastAPI, client: TestClient, tmp_path: Path):
+    test_app.state.project_pool = ProjectPoolService()
+    test_app.state.project_pool.add(_context(tmp_path))
+
+    response = client.get("/keyword-usage/name", params={"project": "unknown"})
+
+    assert response.status_code == 404
+    assert response.json() == {"detail": "Project not initialized"}
+
+
+def test_etag_differs_per_project(test_app: FastAPI, client: TestClient, tmp_path: Path):
+    test_app.state.project_pool = ProjectPoolService()
+    first = _context(tmp_path / "first")
+    second = _context(tmp_path / "second")
+    test_app.state.project_pool.add(first)
+    test_app.state.project_pool.add(second)
+
+    first_etag = client.get("/keyword-usage/name", headers={PROJECT_HEADER: first.project_key}).headers["ETag"]
+    second_etag = client.get("/keyword-usage/name", headers={PROJECT_HEADER: second.project_key}).headers["ETag"]
+
+    assert first_etag != second_etag
+    response = client.get(
+        "/keyword-usage/name", headers={PROJECT_HEADER: first.project_key, "If-None-Match": first_etag}
+    )
+    assert response.status_code == 304
+
+
+def test_project_is_in_use_during_request(test_app: FastAPI, tmp_path: Path):
+    router = APIRouter()
+
+    @router.get("/active")
+    async def active(request: Request):
+        return {"active_requests": get_project(request).active_requests}
+
+    test_app.include_router(router, dependencies=[Depends(project_scope)])
+    test_app.state.project_pool = ProjectPoolService()
+    context = _context(tmp_path)
+    test_app.state.project_pool.add(context)
+
+    assert TestClient(test_app).get("/active").json() == {"active_requests": 1}
+    assert context.active_requests == 0
+
+
+def test_get_project_pool_is_created_once(test_app: FastAPI):
+    request = Request({"type": "http", "app": test_app})
+
+    pool = get_project_pool(request)
+
+    assert isinstance(pool, ProjectPoolService)
+    assert get_project_pool(request) is pool
+
+
+def test_load_snapshot_project_adds_default_project(test_app: FastAPI, tmp_path: Path):
+    write_analysis_snapshot(
+        tmp_path / "snap.rvsnap",
+        tmp_path / "ci",
+        keyword_registry=KeywordRegistry(),
+        file_registry=FileRegistry(),
+        robocop_registry=RobocopRegistry(),
+        keyword_similarity_service=KeywordSimilarityService(KeywordRegistry()),
+    )
+
+    context = load_snapshot_project(test_app.state, tmp_path / "snap.rvsnap", tmp_path / "checkout")
+
+    assert context.project_root == (tmp_path / "checkout").resolve()
+    assert test_app.state.project_pool.default_project_key == context.project_key
@@ -0,0 +1,72 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import roboview
+
+HEAVY_MODULES = (
+    "fastapi",
+    "httpx",
+    "jinja2",
+    "pydantic_settings",
+    "robocop",
+    "robot",
+    "starlette",
+    "uvicorn",
+)
+
+PACKAGE_ROOT = Path(roboview.__file__).parents[1]
+
+# Relative to typer measured in the same interpreter, so the budget holds on slow or busy machines.
+# The CLI takes about 1.3 times as long as typer, with the server and analysis pipeline it took over 10 times.
+IMPORT_BUDGET_TYPER_FACTOR = 3
+
+
+def _import_times(module: str) -> dict[str, int]:
+    """Import a module in a fresh interpreter and return the cumulative import time per module in us."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=PACKAGE_ROOT,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line.removeprefix("import time:").split("|"))
+        times[name] = int(cumulative)
+    return times
+
+
+def test_cli_does_not_import_heavy_dependencies():
+    imported = _import_times("roboview.cli.main")
+
+    heavy = sorted(name for name in imported if name.split(".")[0] in HEAVY_MODULES)
+    services = sorted(name for name in imported if name.startswith("roboview.services"))
+    assert heavy == []
+    assert services == []
+
+
+def test_cli_import_time_within_budget_relative_to_typer():
+    imported = _import_times("roboview.cli.main")
+
+    assert imported["roboview.cli.main"] < IMPORT_BUDGET_TYPER_FACTOR * imported["typer"]
+
+
+def test_version_command_runs_without_importing_the_server():
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; from roboview.cli.main import app; app(['version'], standalone_mode=False); "
+            "print('uvicorn' in sys.modules, 'roboview.services' in sys.modules)",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=PACKAGE_ROOT,
+    )
+
+    assert result.stdout.strip().endswith("False False")
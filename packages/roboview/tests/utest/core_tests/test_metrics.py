@@ -0,0 +1,91 @@
+import pytest
+
+from roboview.core.metrics import (
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    get_peak_rss_bytes,
+    get_process_rss_bytes,
+)
+
+
+def test_counter_renders_samples_per_label_combination():
+    counter = Counter("test_requests_total", "Requests", ("method", "status"))
+    counter.inc("GET", "200")
+    counter.inc("GET", "200", amount=2)
+    counter.inc("POST", "500")
+
+    assert counter.get("GET", "200") == 3
+    assert counter.get("PUT", "200") == 0
+    assert counter.render() == [
+        "# HELP test_requests_total Requests",
+        "# TYPE test_requests_total counter",
+        'test_requests_total{method="GET",status="200"} 3',
+        'test_requests_total{method="POST",status="500"} 1',
+    ]
+
+
+def test_metric_rejects_wrong_number_of_labels():
+    counter = Counter("test_total", "Test", ("method",))
+
+    with pytest.raises(ValueError, match="expects labels"):
+        counter.inc()
+
+
+def test_gauge_set_and_clear_escapes_label_values():
+    gauge = Gauge("test_entries", "Entries", ("project",))
+    gauge.set(1.5, 'a "quoted"\\path\n')
+
+    assert gauge.render()[-1] == 'test_entries{project="a \\"quoted\\"\\\\path\\n"} 1.5'
+
+    gauge.clear()
+    assert gauge.get('a "quoted"\\path\n') is None
+    assert gauge.render() == ["# HELP test_entries Entries", "# TYPE test_entries gauge"]
+
+
+def test_histogram_renders_cumulative_buckets_sum_and_count():
+    histogram = Histogram("test_duration_seconds", "Duration", ("route",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value, "/a")
+
+    assert histogram.get_count("/a") == 4
+    assert histogram.get_sum("/a") == pytest.approx(3.65)
+    assert histogram.render()[2:] == [
+        'test_duration_seconds_bucket{route="/a",le="0.1"} 2',
+        'test_duration_seconds_bucket{route="/a",le="1"} 3',
+        'test_duration_seconds_bucket{route="/a",le="+Inf"} 4',
+        'test_duration_seconds_sum{route="/a"} 3.65',
+        'test_duration_seconds_count{route="/a"} 4',
+    ]
+
+
+def test_histogram_time_observes_block_even_on_error():
+    histogram = Histogram("test_phase_seconds", "Phase", ("phase",))
+
+    with pytest.raises(RuntimeError), histogram.time("parse"):
+        raise RuntimeError("boom")
+
+    assert histogram.get_count("parse") == 1
+    assert histogram.get_sum("parse") >= 0
+
+
+def test_registry_renders_all_metrics_and_rejects_duplicates():
+    registry = MetricsRegistry()
+    counter = registry.register(Counter("test_a_total", "A"))
+    registry.register(Gauge("test_b", "B")).set(2)
+    counter.inc()
+
+    assert registry.render() == (
+        "# HELP test_a_total A\n# TYPE test_a_total counter\ntest_a_total 1\n# HELP test_b B\n# TYPE test_b gauge\ntest_b 2\n"
+    )
+    with pytest.raises(ValueError, match="already registered"):
+        registry.register(Counter("test_a_total", "A"))
+
+
+def test_process_memory_is_reported_where_available():
+    rss = get_process_rss_bytes()
+    peak_rss = get_peak_rss_bytes()
+
+    assert rss is None or rss > 0
+    assert peak_rss is None or peak_rss > 0
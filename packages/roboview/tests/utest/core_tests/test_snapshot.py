@@ -0,0 +1,53 @@
+from pathlib import Path
+
+from roboview.core.snapshot import get_snapshot_boot_id, get_stable_path, next_snapshot_version, stable_id
+from roboview.registries.file_registry import FileRegistry
+from roboview.registries.keyword_registry import KeywordRegistry
+from roboview.registries.robocop_registry import RobocopRegistry
+from roboview.schemas.domain.files import FileProperties
+
+
+def test_next_snapshot_version_is_strictly_increasing():
+    first = next_snapshot_version()
+    second = next_snapshot_version()
+    assert second > first
+
+
+def test_stable_id_is_deterministic_and_distinguishes_parts():
+    assert stable_id("/proj/a.resource", "a.Login", 0) == stable_id("/proj/a.resource", "a.Login", 0)
+    assert stable_id("/proj/a.resource", "a.Login", 0) != stable_id("/proj/b.resource", "b.Login", 0)
+    assert stable_id("ab", "c") != stable_id("a", "bc")
+
+
+def test_registries_carry_increasing_versions():
+    keyword_registry = KeywordRegistry()
+    file_registry = FileRegistry()
+    robocop_registry = RobocopRegistry()
+
+    assert keyword_registry.version < file_registry.version < robocop_registry.version
+
+    before = file_registry.version
+    file_registry.register(FileProperties(file_name="a.robot", path="/proj/a.robot", is_resource=False))
+    after_register = file_registry.version
+    file_registry.clear()
+
+    assert before < after_register < file_registry.version
+
+
+def test_new_registry_snapshot_supersedes_older_one():
+    old_registry = KeywordRegistry()
+    new_registry = KeywordRegistry()
+    assert new_registry.version > old_registry.version
+
+
+def test_get_snapshot_boot_id_is_constant_within_process():
+    assert get_snapshot_boot_id() == get_snapshot_boot_id()
+    assert len(get_snapshot_boot_id()) == 32
+
+
+def test_get_stable_path_is_relative_to_project_root(tmp_path: Path):
+    file_path = tmp_path / "resources" / "common.resource"
+
+    assert get_stable_path(file_path, tmp_path) == "resources/common.resource"
+    assert get_stable_path(file_path, tmp_path / "other") == file_path.as_posix()
+    assert get_stable_path(file_path) == file_path.as_posix()
@@ -281,4 +281,73 @@ def test_local_keyword_name_finder_logs_unexpected_error(monkeypatch, caplog):
     assert any(
         "Unexpected error while visiting keyword" in record.getMessage()
         for record in caplog.records
-    )
\ No newline at end of file
+    )
+
+def test_local_keyword_finder_collects_robot_tokens(tmp_path: Path):
+    from robot.api import get_resource_model
+
+    resource = tmp_path / "common.resource"
+    resource.write_text(
+        "*** Keywords ***\n"
+        "Open ${page} Page\n"
+        "    [Documentation]    Opens a page\n"
+        "    [Arguments]    ${url}\n"
+        "    ${result}=    Go_To    ${url}/login    # navigate\n"
+        "    IF    ${result}\n"
+        "        Log    done\n"
+        "    END\n",
+        encoding="utf-8",
+    )
+    finder = LocalKeywordFinder(resource)
+
+    finder.visit(get_resource_model(resource))
+
+    keyword = finder.keyword_doc[0]
+    assert finder.keyword_tokens[keyword.keyword_id] == [
+        "KEYWORD NAME:open",
+        "VARIABLE:${page}",
+        "KEYWORD NAME:page",
+        "ARGUMENTS:[Arguments]",
+        "VARIABLE:${url}",
+        "ASSIGN:${result}=",
+        "KEYWORD:goto",
+        "VARIABLE:${url}",
+        "ARGUMENT:/login",
+        "IF:IF",
+        "VARIABLE:${result}",
+        "KEYWORD:log",
+        "ARGUMENT:done",
+        "END:END",
+    ]
+    assert LocalKeywordFinder.collect_code_tokens(keyword.code) == finder.keyword_tokens[keyword.keyword_id]
+    assert "tokens" not in keyword.model_dump()
+
+
+def test_keyword_token_collector_keeps_invalid_variable_syntax(tmp_path: Path):
+    from robot.api import get_resource_model
+
+    resource = tmp_path / "broken.resource"
+    resource.write_text("*** Keywords ***\nBroken\n    Log    ${unclosed\n", encoding="utf-8")
+
+    tokens = LocalKeywordFinder.collect_keyword_tokens(get_resource_model(resource).sections[0].body[0])
+
+    assert tokens == ["KEYWORD NAME:broken", "KEYWORD:log", "ARGUMENT:${unclosed"]
+
+
+def test_collect_code_tokens_without_keyword_returns_empty():
+    assert LocalKeywordFinder.collect_code_tokens("") == []
+
+
+def test_local_keyword_finder_ids_do_not_depend_on_project_location(tmp_path: Path):
+    from robot.api import get_resource_model
+
+    keyword_ids = []
+    for checkout in ("ci", "local"):
+        resource = tmp_path / checkout / "resources" / "common.resource"
+        resource.parent.mkdir(parents=True)
+        resource.write_text("*** Keywords ***\nOpen Shop\n    Log    shop\n", encoding="utf-8")
+        finder = LocalKeywordFinder(resource, tmp_path / checkout)
+        finder.visit(get_resource_model(resource))
+        keyword_ids.append(finder.keyword_doc[0].keyword_id)
+
+    assert keyword_ids[0] == keyword_ids[1]
@@ -46,6 +46,7 @@ def test_collects_simple_resource_imports():
     finder.visit_SettingSection(section)  # type: ignore[arg-type]
 
     assert finder.imports == ["common.resource", "other.resource"]
+    assert finder.import_paths == ["common.resource", "sub/other.resource"]
 
 
 def test_ignores_non_resource_settings():
@@ -76,6 +77,7 @@ def test_normalizes_variable_separators():
     finder.visit_SettingSection(section)  # type: ignore[arg-type]
 
     assert finder.imports == ["file.resource", "lib.resource"]
+    assert finder.import_paths == ["${/}path${/}to${/}file.resource", "{/}another{/}dir{/}lib.resource"]
 
 
 def test_logs_when_import_value_is_none(caplog):
@@ -0,0 +1,78 @@
+from pathlib import Path
+
+from robot.parsing import get_model
+
+from roboview.models.robot_parsing.test_case_parsing import TestCaseFinder
+
+SUITE = """\
+*** Test Cases ***
+First
+    [Setup]    Open Thing
+    Given Do Something    1
+    Run Keyword If    ${x}    Other Thing
+
+Second
+    [Template]    Check Value
+    1
+
+Third
+    [Setup]    NONE
+    Log    hi
+
+*** Settings ***
+Suite Setup    Start All
+Suite Teardown    Run Keywords    Stop A    AND    Stop B
+Test Setup    Default Setup
+Test Teardown    Default Teardown
+"""
+
+
+def _find(tmp_path: Path, content: str) -> TestCaseFinder:
+    path = tmp_path / "suite.robot"
+    path.write_text(content, encoding="utf-8")
+    finder = TestCaseFinder()
+    finder.visit(get_model(path))
+    return finder
+
+
+def test_test_case_finder_collects_test_cases_with_defaults(tmp_path: Path):
+    finder = _find(tmp_path, SUITE)
+
+    test_cases = finder.get_test_cases()
+
+    assert [(test_case.name, test_case.line_number) for test_case in test_cases] == [
+        ("First", 2),
+        ("Second", 7),
+        ("Third", 11),
+    ]
+    assert test_cases[0].called_keywords == [
+        "Open Thing",
+        "Do Something",
+        "Run Keyword If",
+        "Other Thing",
+        "Default Teardown",
+    ]
+    assert test_cases[1].called_keywords == ["Check Value", "Default Setup", "Default Teardown"]
+    assert test_cases[2].called_keywords == ["Log", "Default Teardown"]
+
+
+def test_test_case_finder_collects_suite_keywords(tmp_path: Path):
+    finder = _find(tmp_path, SUITE)
+
+    assert finder.suite_keywords == ["Start All", "Run Keywords", "Stop A", "Stop B"]
+
+
+def test_test_case_finder_applies_test_template_default(tmp_path: Path):
+    finder = _find(
+        tmp_path,
+        "*** Settings ***\nTest Template    Check Value\n\n*** Test Cases ***\nRow\n    1    2\n",
+    )
+
+    assert finder.get_test_cases()[0].called_keywords == ["Check Value"]
+
+
+def test_test_case_finder_without_test_cases(tmp_path: Path):
+    finder = _find(tmp_path, "*** Keywords ***\nHelper\n    Log    x\n")
+
+    assert finder.get_test_cases() == []
+    assert finder.suite_keywords == []
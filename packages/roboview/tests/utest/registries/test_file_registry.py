@@ -65,6 +65,19 @@ def test_resolve_returns_matching_file_by_path():
     assert registry.resolve("/proj/missing.robot") is None
 
 
+def test_resolve_sees_files_registered_after_lookup():
+    registry = FileRegistry()
+    registry.register(_make_file("a.robot", "/proj/a.robot"))
+    assert registry.resolve("/proj/b.robot") is None
+
+    f = _make_file("b.robot", "/proj/b.robot")
+    registry.register(f)
+    assert registry.resolve("/proj/b.robot") is f
+
+    registry.clear()
+    assert registry.resolve("/proj/b.robot") is None
+
+
 def test_resolve_handles_empty_path_and_logs_warning(caplog):
     registry = FileRegistry()
 
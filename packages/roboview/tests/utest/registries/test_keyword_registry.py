@@ -4,6 +4,7 @@ import pytest
 
 from roboview.registries.keyword_registry import KeywordRegistry, logger
 from roboview.schemas.domain.keywords import KeywordProperties
+from roboview.schemas.domain.runtime import KeywordRuntimeStatistics
 
 
 def _make_keyword(
@@ -75,6 +76,17 @@ def test_register_overwrites_existing_same_id():
     assert all_keywords[0].keyword_name_without_prefix == "New Name"
 
 
+def test_take_similarity_tokens_returns_tokens_once():
+    registry = KeywordRegistry()
+
+    registry.register(_make_keyword("k1"), ["KEYWORD:log"])
+    registry.register(_make_keyword("k2"), ["KEYWORD:sleep"])
+    registry.register(_make_keyword("k2"))
+
+    assert registry.take_similarity_tokens() == {"k1": ["KEYWORD:log"]}
+    assert registry.take_similarity_tokens() == {}
+
+
 def test_resolve_by_prefixed_and_unprefixed_name():
     registry = KeywordRegistry()
 
@@ -111,6 +123,59 @@ def test_resolve_is_case_insensitive_and_ignores_spaces_and_underscores():
     assert registry.resolve("LOGIN USER") is k
 
 
+def test_resolve_prefers_first_registered_keyword_for_shared_name():
+    registry = KeywordRegistry()
+    first = _make_keyword("k1", keyword_name_with_prefix="a.My Keyword")
+    second = _make_keyword("k2", keyword_name_with_prefix="b.My Keyword")
+    registry.register(first)
+    registry.register(second)
+
+    assert registry.resolve("My Keyword") is first
+    assert registry.resolve("b.My Keyword") is second
+
+
+def test_resolve_all_returns_every_keyword_sharing_a_name():
+    registry = KeywordRegistry()
+    first = _make_keyword("k1", keyword_name_with_prefix="a.My Keyword")
+    second = _make_keyword("k2", keyword_name_with_prefix="b.My Keyword")
+    registry.register(first)
+    registry.register(second)
+
+    assert registry.resolve_all("my_keyword") == [first, second]
+    assert registry.resolve_all("b.My Keyword") == [second]
+    assert registry.resolve_all("Other") == []
+    assert registry.resolve_all("") == []
+
+
+def test_resolve_matches_embedded_arguments_after_exact_names():
+    registry = KeywordRegistry()
+    embedded = _make_keyword(
+        "k1", keyword_name_without_prefix='User "${name}" Logs In', keyword_name_with_prefix='users.User "${name}" Logs In'
+    )
+    exact = _make_keyword("k2", keyword_name_without_prefix='User "Admin" Logs In', keyword_name_with_prefix='admin.User "Admin" Logs In')
+    registry.register(embedded)
+    registry.register(exact)
+
+    assert registry.resolve('User "Bob" Logs In') is embedded
+    assert registry.resolve('users.User "Bob" Logs In') is embedded
+    assert registry.resolve('User "Admin" Logs In') is exact
+    assert registry.resolve_all('User "Admin" Logs In') == [exact, embedded]
+    assert registry.resolve('User "Bob" Logs Out') is None
+
+
+def test_resolve_sees_keywords_registered_after_lookup():
+    registry = KeywordRegistry()
+    registry.register(_make_keyword("k1", keyword_name_without_prefix="Login"))
+    assert registry.resolve("Logout") is None
+
+    logout = _make_keyword("k2", keyword_name_without_prefix="Logout", keyword_name_with_prefix="file.Logout")
+    registry.register(logout)
+    assert registry.resolve("Logout") is logout
+
+    registry.clear()
+    assert registry.resolve("Logout") is None
+
+
 def test_resolve_returns_none_for_unknown_keyword():
     registry = KeywordRegistry()
 
@@ -289,4 +354,26 @@ def test_register_logs_exception_on_failure(monkeypatch, caplog):
     assert any(
         "Failed to register keyword: Fail KW" in record.getMessage()
         for record in caplog.records
-    )
\ No newline at end of file
+    )
+
+def test_attach_runtime_statistics_replaces_statistics_and_bumps_version():
+    registry = KeywordRegistry()
+    registry.register(_make_keyword("k1"))
+    registry.register(_make_keyword("k2", keyword_name_without_prefix="Other", keyword_name_with_prefix="file.Other"))
+    statistics = KeywordRuntimeStatistics(
+        keyword_name="file.My Keyword",
+        call_count=1,
+        failure_count=0,
+        total_seconds=1.0,
+        mean_seconds=1.0,
+        p95_seconds=1.0,
+        max_seconds=1.0,
+    )
+    registry.attach_runtime_statistics({"k2": statistics})
+    version = registry.version
+
+    registry.attach_runtime_statistics({"k1": statistics})
+
+    assert registry.version != version
+    assert registry.resolve("file.My Keyword").runtime_statistics == statistics
+    assert registry.resolve("file.Other").runtime_statistics is None
@@ -0,0 +1,58 @@
+from roboview.registries.library_catalog import LibraryCatalog
+from roboview.schemas.domain.keywords import KeywordProperties
+
+
+def _keyword(name: str) -> KeywordProperties:
+    return KeywordProperties(
+        keyword_id=name,
+        file_name="Lib",
+        keyword_name_without_prefix=name,
+        keyword_name_with_prefix=f"Lib.{name}",
+        description=None,
+        is_user_defined=False,
+        code="",
+        source="Lib",
+        validation_str_without_prefix=name.lower(),
+        validation_str_with_prefix=f"lib.{name.lower()}",
+    )
+
+
+def test_get_loads_library_once_and_shares_keywords():
+    catalog = LibraryCatalog()
+    calls = []
+
+    def load():
+        calls.append(1)
+        return [_keyword("Open"), _keyword("Close")]
+
+    first = catalog.get("Lib", load)
+    second = catalog.get("Lib", load)
+
+    assert len(calls) == 1
+    assert first is second
+    assert len(catalog) == 1
+    assert catalog.keyword_ids() == {id(keyword) for keyword in first}
+
+
+def test_get_does_not_cache_empty_libraries():
+    catalog = LibraryCatalog()
+    calls = []
+
+    def load():
+        calls.append(1)
+        return []
+
+    assert catalog.get("Missing", load) == ()
+    assert catalog.get("Missing", load) == ()
+    assert len(calls) == 2
+    assert len(catalog) == 0
+
+
+def test_clear_drops_cached_libraries():
+    catalog = LibraryCatalog()
+    catalog.get("Lib", lambda: [_keyword("Open")])
+
+    catalog.clear()
+
+    assert len(catalog) == 0
+    assert catalog.keyword_ids() == set()
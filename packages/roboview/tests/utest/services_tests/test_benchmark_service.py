@@ -0,0 +1,93 @@
+"""Tests for the BenchmarkService class.
+
+The scaled pipeline benchmarks only run with ``ROBOVIEW_BENCHMARK=1``. With
+``ROBOVIEW_BENCHMARK_BASELINE`` pointing to a stored result, they fail on regressed phases.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from roboview.schemas.domain.benchmarks import (
+    BenchmarkPhaseEnum,
+    BenchmarkResult,
+    CorpusBenchmark,
+    PhaseMeasurement,
+)
+from roboview.services.benchmark_service import BenchmarkService
+from roboview.utils.project_generator import ProjectGenerator, ProjectGeneratorConfig
+
+
+def _result(wall_seconds: dict[BenchmarkPhaseEnum, float], corpus: str = "generated-1000") -> BenchmarkResult:
+    return BenchmarkResult(
+        python_version="3.11.0",
+        platform="test",
+        repetitions=1,
+        corpora=[
+            CorpusBenchmark(
+                corpus=corpus,
+                keywords=1000,
+                files=25,
+                phases=[
+                    PhaseMeasurement(phase=phase, wall_seconds=seconds, cpu_seconds=seconds, peak_rss_bytes=None)
+                    for phase, seconds in wall_seconds.items()
+                ],
+            )
+        ],
+    )
+
+
+def test_get_corpus_config_scales_number_of_files():
+    config = BenchmarkService.get_corpus_config(10_000)
+
+    assert config.resource_files * config.keywords_per_file == 10_000
+    assert BenchmarkService.get_corpus_config(20).keywords_per_file == 20
+
+
+def test_run_project_measures_every_phase(tmp_path: Path):
+    ProjectGenerator(ProjectGeneratorConfig(resource_files=2, suite_files=1, keywords_per_file=5)).generate(tmp_path)
+
+    result = BenchmarkService(repetitions=2).run([("tiny", tmp_path)])
+
+    assert result.repetitions == 2
+    corpus = result.corpora[0]
+    assert corpus.corpus == "tiny"
+    assert corpus.keywords == 10
+    assert corpus.files == 3
+    assert [measurement.phase for measurement in corpus.phases] == list(BenchmarkPhaseEnum)
+    assert all(measurement.wall_seconds >= 0 for measurement in corpus.phases)
+    assert BenchmarkResult.model_validate_json(result.model_dump_json()) == result
+
+
+def test_compare_reports_phases_beyond_threshold():
+    baseline = _result({BenchmarkPhaseEnum.PARSING: 1.0, BenchmarkPhaseEnum.SIMILARITY: 1.0})
+    current = _result({BenchmarkPhaseEnum.PARSING: 1.1, BenchmarkPhaseEnum.SIMILARITY: 1.5})
+
+    regressions = BenchmarkService.compare(current, baseline, max_regression_percent=20)
+
+    assert [(regression.phase, regression.change_percent) for regression in regressions] == [
+        (BenchmarkPhaseEnum.SIMILARITY, 50.0)
+    ]
+
+
+def test_compare_ignores_noise_and_unknown_corpora():
+    baseline = _result({BenchmarkPhaseEnum.DISCOVERY: 0.001, BenchmarkPhaseEnum.PARSING: 1.0})
+    current = _result({BenchmarkPhaseEnum.DISCOVERY: 0.01, BenchmarkPhaseEnum.PARSING: 1.0})
+
+    assert BenchmarkService.compare(current, baseline, max_regression_percent=20, min_seconds=0.05) == []
+    assert BenchmarkService.compare(_result({BenchmarkPhaseEnum.PARSING: 5.0}, corpus="other"), baseline) == []
+
+
+@pytest.mark.skipif(not os.environ.get("ROBOVIEW_BENCHMARK"), reason="Set ROBOVIEW_BENCHMARK=1 to run benchmarks")
+@pytest.mark.parametrize("keywords", [1_000, 10_000])
+def test_pipeline_benchmark(tmp_path: Path, keywords: int):
+    ProjectGenerator(BenchmarkService.get_corpus_config(keywords)).generate(tmp_path)
+
+    result = BenchmarkService().run([(f"generated-{keywords}", tmp_path)])
+
+    baseline_path = os.environ.get("ROBOVIEW_BENCHMARK_BASELINE")
+    if baseline_path:
+        baseline = BenchmarkResult.model_validate_json(Path(baseline_path).read_text(encoding="utf-8"))
+        max_regression = float(os.environ.get("ROBOVIEW_BENCHMARK_MAX_REGRESSION", "20"))
+        assert BenchmarkService.compare(result, baseline, max_regression) == []
@@ -3,7 +3,7 @@ from pathlib import Path
 
 from roboview.services.file_register_service import FileRegistryService, logger
 from roboview.schemas.domain.common import FileType
-from roboview.schemas.domain.files import FileProperties
+from roboview.schemas.domain.files import FileProperties, TestCaseProperties
 
 
 class FakeDirectoryParser:
@@ -42,9 +42,22 @@ class FakeCalledKeywordFinder:
 class FakeResourceDependencyFinder:
     def __init__(self) -> None:
         self.imports: list[str] = []
+        self.import_paths: list[str] = []
 
     def visit(self, model) -> None:
         self.imports = ["common.resource", "lib.resource"]
+        self.import_paths = ["${CURDIR}/common.resource", "../lib.resource"]
+
+
+class FakeTestCaseFinder:
+    def __init__(self) -> None:
+        self.suite_keywords: list[str] = []
+
+    def visit(self, model) -> None:
+        self.suite_keywords = ["Suite Setup Keyword"]
+
+    def get_test_cases(self) -> list[TestCaseProperties]:
+        return [TestCaseProperties(name="Test 1", line_number=3, called_keywords=["Call 1"])]
 
 
 def _make_paths(tmp_path: Path) -> tuple[Path, Path]:
@@ -111,6 +124,11 @@ def test_initialize_loads_robot_and_resource_files(tmp_path, monkeypatch):
         FakeResourceDependencyFinder,
         raising=True,
     )
+    monkeypatch.setattr(
+        "roboview.services.file_register_service.TestCaseFinder",
+        FakeTestCaseFinder,
+        raising=True,
+    )
 
     svc.initialize()
 
@@ -130,6 +148,9 @@ def test_initialize_loads_robot_and_resource_files(tmp_path, monkeypatch):
     assert robot_props.initialized_keywords == ["Init 1", "Init 2"]
     assert robot_props.called_keywords == ["Call 1", "Call 2"]
     assert robot_props.imported_files == ["common.resource", "lib.resource"]
+    assert robot_props.resource_imports == ["${CURDIR}/common.resource", "../lib.resource"]
+    assert robot_props.test_cases == [TestCaseProperties(name="Test 1", line_number=3, called_keywords=["Call 1"])]
+    assert robot_props.setting_keywords == ["Suite Setup Keyword"]
 
 
 def test_initialize_logs_error_if_any_step_fails(tmp_path, monkeypatch, caplog):
@@ -277,6 +298,11 @@ def test__parse_and_register_file_happy_path(tmp_path, monkeypatch):
         FakeResourceDependencyFinder,
         raising=True,
     )
+    monkeypatch.setattr(
+        "roboview.services.file_register_service.TestCaseFinder",
+        FakeTestCaseFinder,
+        raising=True,
+    )
 
     svc._parse_and_register_file(robot_file, FileType.ROBOT)
 
@@ -290,6 +316,7 @@ def test__parse_and_register_file_happy_path(tmp_path, monkeypatch):
     assert f.initialized_keywords == ["Init 1", "Init 2"]
     assert f.called_keywords == ["Call 1", "Call 2"]
     assert f.imported_files == ["common.resource", "lib.resource"]
+    assert f.resource_imports == ["${CURDIR}/common.resource", "../lib.resource"]
 
 
 def test__parse_and_register_file_logs_error_on_exception(tmp_path, monkeypatch, caplog):
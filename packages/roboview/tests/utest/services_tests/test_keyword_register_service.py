@@ -1,6 +1,7 @@
 import logging
 from pathlib import Path
 
+from roboview.registries.library_catalog import LibraryCatalog
 from roboview.services.keyword_register_service import (
     KeywordRegistryService,
     logger,
@@ -13,6 +14,7 @@ class FakeDirectoryParser:
     def __init__(self, tests: list[Path] | None = None, resources: list[Path] | None = None):
         self._tests = tests or []
         self._resources = resources or []
+        self.project_root_path = None
 
     def get_test_file_paths(self) -> list[Path]:
         return self._tests
@@ -26,9 +28,10 @@ class FakeModel:
 
 
 class FakeLocalKeywordFinder:
-    def __init__(self, file_path: Path) -> None:
+    def __init__(self, file_path: Path, project_root: Path | None = None) -> None:
         self.file_path = file_path
         self.keyword_doc: list[KeywordProperties] = []
+        self.keyword_tokens: dict[str, list[str]] = {}
 
     def visit(self, model) -> None:
         self.keyword_doc = [
@@ -55,6 +58,7 @@ class FakeLocalKeywordFinder:
                 validation_str_with_prefix=f"{self.file_path.stem}.kwtwo",
             ),
         ]
+        self.keyword_tokens = {keyword.keyword_id: ["KEYWORD:log"] for keyword in self.keyword_doc}
 
 
 class FakeKeywordDependencyFinder:
@@ -300,9 +304,39 @@ def test__parse_and_register_file_happy_path(tmp_path, monkeypatch):
     assert "KW Two" in by_name
 
     assert by_name["KW One"].called_keywords == ["Lib KW", "KW Two"]
+    assert svc.registry.take_similarity_tokens() == {k.keyword_id: ["KEYWORD:log"] for k in kws}
     assert by_name["KW Two"].called_keywords == []
 
 
+def test__parse_and_register_file_builds_dependency_map_once_per_file(tmp_path, monkeypatch):
+    robot_file, _ = _make_paths(tmp_path)
+    svc = KeywordRegistryService(tmp_path)
+    calls = []
+
+    class CountingKeywordDependencyFinder(FakeKeywordDependencyFinder):
+        def get_formatted_result(self) -> list[dict]:
+            calls.append(self.file_path)
+            return super().get_formatted_result()
+
+    monkeypatch.setattr("roboview.services.keyword_register_service.get_model", lambda p: FakeModel(), raising=True)
+    monkeypatch.setattr(
+        "roboview.services.keyword_register_service.get_resource_model", lambda p: FakeModel(), raising=True
+    )
+    monkeypatch.setattr(
+        "roboview.services.keyword_register_service.LocalKeywordFinder", FakeLocalKeywordFinder, raising=True
+    )
+    monkeypatch.setattr(
+        "roboview.services.keyword_register_service.KeywordDependencyFinder",
+        CountingKeywordDependencyFinder,
+        raising=True,
+    )
+
+    svc._parse_and_register_file(robot_file, FileType.ROBOT)
+
+    assert len(svc.get_keyword_info_list()) == 2
+    assert calls == [robot_file]
+
+
 def test__enrich_with_called_keywords_uses_dependency_map(monkeypatch):
     dummy_path = Path("/proj/file.robot")
     finder = FakeKeywordDependencyFinder(dummy_path)
@@ -456,4 +490,41 @@ def test_get_keyword_registry_returns_internal_registry(tmp_path):
     svc = KeywordRegistryService(tmp_path)
     reg = svc.get_keyword_registry()
 
-    assert reg is svc.registry
\ No newline at end of file
+    assert reg is svc.registry
+
+def test__load_external_library_keywords_shares_keywords_through_library_catalog(tmp_path, monkeypatch):
+    calls: list[ExternalLibraryType] = []
+
+    def fake_get_library_keywords(library_type: BuiltinLibraryType | ExternalLibraryType) -> list[KeywordProperties]:
+        calls.append(library_type)
+        if library_type is not ExternalLibraryType.BROWSER:
+            return []
+        return [
+            KeywordProperties(
+                file_name="Browser",
+                keyword_name_without_prefix="Click",
+                keyword_name_with_prefix="Browser.Click",
+                description="Click",
+                is_user_defined=False,
+                code="",
+                source="Browser",
+                validation_str_without_prefix="click",
+                validation_str_with_prefix="browser.click",
+            )
+        ]
+
+    monkeypatch.setattr(
+        "roboview.services.keyword_register_service.KeywordRegistryService._get_library_keywords",
+        staticmethod(fake_get_library_keywords),  # type: ignore[arg-type]
+        raising=False,
+    )
+
+    catalog = LibraryCatalog()
+    first = KeywordRegistryService(tmp_path / "first", catalog)
+    second = KeywordRegistryService(tmp_path / "second", catalog)
+
+    first._load_external_library_keywords()
+    second._load_external_library_keywords()
+
+    assert calls.count(ExternalLibraryType.BROWSER) == 1
+    assert first.get_keyword_info_list()[0] is second.get_keyword_info_list()[0]
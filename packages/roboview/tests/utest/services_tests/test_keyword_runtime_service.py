@@ -0,0 +1,90 @@
+from pathlib import Path
+
+import pytest
+
+from roboview.registries.keyword_registry import KeywordRegistry
+from roboview.schemas.domain.keywords import KeywordProperties
+from roboview.services.keyword_runtime_service import KeywordRuntimeService
+
+
+def _kw(keyword_id: str, name: str, source: str) -> KeywordProperties:
+    prefix = Path(source).stem
+    return KeywordProperties(
+        keyword_id=keyword_id,
+        file_name=Path(source).name,
+        keyword_name_without_prefix=name,
+        keyword_name_with_prefix=f"{prefix}.{name}",
+        is_user_defined=True,
+        code="",
+        source=source,
+        validation_str_without_prefix=name.lower().replace(" ", ""),
+        validation_str_with_prefix=f"{prefix}.{name}".lower().replace(" ", ""),
+    )
+
+
+def _output(suite_source: str, calls: str) -> str:
+    return f'<robot><suite name="S" source="{suite_source}"><test name="T">{calls}</test></suite></robot>'
+
+
+def _call(name: str, elapsed: float, owner: str | None = None, status: str = "PASS") -> str:
+    owner_attribute = f' owner="{owner}"' if owner else ""
+    return f'<kw name="{name}"{owner_attribute}><status status="{status}" elapsed="{elapsed}"/></kw>'
+
+
+@pytest.fixture
+def registry() -> KeywordRegistry:
+    keyword_registry = KeywordRegistry()
+    for keyword in (
+        _kw("users", "Login As", "/project/res/users.resource"),
+        _kw("a-helper", "Helper", "/project/tests/a.robot"),
+        _kw("b-helper", "Helper", "/project/tests/b.robot"),
+    ):
+        keyword_registry.register(keyword)
+    return keyword_registry
+
+
+def test_ingest_attaches_statistics_to_registered_keywords(registry: KeywordRegistry, tmp_path: Path):
+    first = tmp_path / "a.xml"
+    first.write_text(
+        _output("/project/tests/a.robot", _call("Login As", 1.0, "users") + _call("Helper", 0.5)),
+        encoding="utf-8",
+    )
+    second = tmp_path / "b.xml"
+    second.write_text(
+        _output("/project/tests/b.robot", _call("Login As", 2.0, "users", "FAIL") + _call("Helper", 4.0)),
+        encoding="utf-8",
+    )
+    service = KeywordRuntimeService(registry)
+    version = registry.version
+
+    summary = service.ingest_output_files([first, second])
+
+    assert (summary.output_files, summary.keyword_calls, summary.keywords, summary.matched_keywords) == (2, 4, 3, 3)
+    assert registry.version != version
+    login = registry.resolve("users.Login As").runtime_statistics
+    assert login.call_count == 2
+    assert login.failure_count == 1
+    assert login.total_seconds == pytest.approx(3.0)
+    assert login.source == "/project/res/users.resource"
+    assert registry.resolve("a.Helper").runtime_statistics.total_seconds == pytest.approx(0.5)
+    assert registry.resolve("b.Helper").runtime_statistics.total_seconds == pytest.approx(4.0)
+    assert [statistics.keyword_id for statistics in service.get_slowest_keywords(2)] == ["b-helper", "users"]
+
+
+def test_ingest_keeps_unregistered_keywords_and_replaces_earlier_statistics(
+    registry: KeywordRegistry, tmp_path: Path
+):
+    first = tmp_path / "first.xml"
+    first.write_text(_output("/project/tests/a.robot", _call("Login As", 1.0, "users")), encoding="utf-8")
+    second = tmp_path / "second.xml"
+    second.write_text(_output("/project/tests/a.robot", _call("Sleep", 1.0, "BuiltIn")), encoding="utf-8")
+    service = KeywordRuntimeService(registry)
+
+    service.ingest_output_files([first])
+    summary = service.ingest_output_files([second])
+
+    assert summary.matched_keywords == 0
+    assert registry.resolve("users.Login As").runtime_statistics is None
+    [sleep] = service.get_slowest_keywords()
+    assert sleep.keyword_name == "BuiltIn.Sleep"
+    assert sleep.keyword_id is None
@@ -1,8 +1,8 @@
 import logging
+from math import sqrt
 from typing import Iterable
 
 import pytest
-from pygments.lexers import get_lexer_by_name
 
 from roboview.registries.keyword_registry import KeywordRegistry
 from roboview.schemas.domain.keywords import KeywordProperties, SimilarKeyword
@@ -36,14 +36,28 @@ def _kw(
     )
 
 
+def _neighbours_from_matrix(matrix: list[list[float]]) -> list[list[tuple[int, float]]]:
+    return [
+        sorted(
+            ((j, score) for j, score in enumerate(row) if j != i and score > 0.0),
+            key=lambda neighbour: (-neighbour[1], neighbour[0]),
+        )
+        for i, row in enumerate(matrix)
+    ]
+
+
 class FakeKeywordRegistry(KeywordRegistry):
     """Thin wrapper so we can easily inject predefined keywords."""
 
-    def __init__(self, keywords: list[KeywordProperties] | None = None) -> None:
+    def __init__(
+        self,
+        keywords: list[KeywordProperties] | None = None,
+        tokens: dict[str, list[str]] | None = None,
+    ) -> None:
         super().__init__()
         if keywords:
             for k in keywords:
-                self.register(k)
+                self.register(k, (tokens or {}).get(k.keyword_id))
 
 
 def test_calculate_similarity_matrix_no_user_keywords_logs_warning_and_does_nothing(caplog):
@@ -54,7 +68,7 @@ def test_calculate_similarity_matrix_no_user_keywords_logs_warning_and_does_noth
 
     svc.calculate_keyword_similarity_matrix()
 
-    assert svc.similarity_matrix == []
+    assert svc._neighbours == []
     assert svc.keyword_names_list == []
     assert any(
         "No keywords found. Similarity matrix cannot be computed." in r.getMessage()
@@ -70,44 +84,36 @@ def test_calculate_similarity_matrix_builds_matrix_and_names(monkeypatch):
     reg = FakeKeywordRegistry(kws)
     svc = KeywordSimilarityService(reg)
 
-    monkeypatch.setattr(
-        "roboview.services.keyword_similarity_service.get_lexer_by_name",
-        lambda name: get_lexer_by_name("text"),
-        raising=True,
-    )
-
     svc.calculate_keyword_similarity_matrix()
 
-    assert len(svc.similarity_matrix) == 2
-    assert len(svc.similarity_matrix[0]) == 2
+    assert len(svc._neighbours) == 2
     assert svc.keyword_names_list == ["file.KW One", "file.KW Two"]
-    assert pytest.approx(svc.similarity_matrix[0][0], rel=1e-5) == 1.0
-    assert pytest.approx(svc.similarity_matrix[1][1], rel=1e-5) == 1.0
+    assert svc._row_index == {"file.KW One": 0, "file.KW Two": 1}
+    # Keywords are never listed as their own neighbour
+    assert [row for row, _ in svc._neighbours[0]] == [1]
+    assert [row for row, _ in svc._neighbours[1]] == [0]
+    assert pytest.approx(svc._neighbours[0][0][1], rel=1e-5) == svc._neighbours[1][0][1]
 
 
-def test_calculate_similarity_matrix_logs_and_returns_when_lexer_init_fails(monkeypatch, caplog):
+def test_calculate_similarity_matrix_logs_and_returns_when_vectorization_fails(monkeypatch, caplog):
     kws = [
         _kw("k1", "KW", "file.KW", "KW\n    Log    Something"),
     ]
     reg = FakeKeywordRegistry(kws)
     svc = KeywordSimilarityService(reg)
 
-    def broken_get_lexer(name: str):
+    def broken_vectorize(_: list[list[str]]):
         raise RuntimeError("boom")
 
-    monkeypatch.setattr(
-        "roboview.services.keyword_similarity_service.get_lexer_by_name",
-        broken_get_lexer,
-        raising=True,
-    )
+    monkeypatch.setattr(svc, "_vectorize_token_lists", broken_vectorize, raising=True)
 
     caplog.set_level(logging.ERROR, logger=logger.name)
 
     svc.calculate_keyword_similarity_matrix()
 
-    assert svc.similarity_matrix == []
+    assert svc._neighbours == []
     assert any(
-        "Failed to initialize lexer or tokenize keywords" in r.getMessage()
+        "Failed to vectorize keyword tokens" in r.getMessage()
         for r in caplog.records
     )
 
@@ -120,19 +126,13 @@ def test_calculate_similarity_matrix_logs_and_returns_when_vectorizer_fails(monk
     reg = FakeKeywordRegistry(kws)
     svc = KeywordSimilarityService(reg)
 
-    monkeypatch.setattr(
-        "roboview.services.keyword_similarity_service.get_lexer_by_name",
-        lambda name: get_lexer_by_name("text"),
-        raising=True,
-    )
-
-    def broken_build_similarity_matrix(_: Iterable[str]):
+    def broken_build_neighbour_lists(_: Iterable[str], __: int):
         raise RuntimeError("boom")
 
     monkeypatch.setattr(
         svc,
-        "_build_similarity_matrix",
-        broken_build_similarity_matrix,
+        "_build_neighbour_lists",
+        broken_build_neighbour_lists,
         raising=True,
     )
 
@@ -140,7 +140,7 @@ def test_calculate_similarity_matrix_logs_and_returns_when_vectorizer_fails(monk
 
     svc.calculate_keyword_similarity_matrix()
 
-    assert svc.similarity_matrix == []
+    assert svc._neighbours == []
     assert any(
         "Failed to create vectors or calculate similarity matrix" in r.getMessage()
         for r in caplog.records
@@ -182,8 +182,7 @@ def test_get_n_most_similar_keywords_keyword_not_in_keyword_names_list_logs_warn
     reg = FakeKeywordRegistry(kws)
     svc = KeywordSimilarityService(reg)
 
-    svc.similarity_matrix = [[1.0]]
-    svc.keyword_names_list = ["some.other.Name"]
+    svc._set_neighbours([_kw("k9", "Name", "some.other.Name", "code")], [[]])
 
     caplog.set_level(logging.WARNING, logger=logger.name)
 
@@ -204,12 +203,16 @@ def test_get_n_most_similar_keywords_happy_path(monkeypatch):
     reg = FakeKeywordRegistry(kws)
     svc = KeywordSimilarityService(reg)
 
-    svc.keyword_names_list = ["file.KW One", "file.KW Two", "file.KW Three"]
-    svc.similarity_matrix = [
-        [1.0, 0.9, 0.1],
-        [0.9, 1.0, 0.2],
-        [0.1, 0.2, 1.0],
-    ]
+    svc._set_neighbours(
+        kws,
+        _neighbours_from_matrix(
+            [
+                [1.0, 0.9, 0.1],
+                [0.9, 1.0, 0.2],
+                [0.1, 0.2, 1.0],
+            ]
+        ),
+    )
 
     result = svc.get_n_most_similar_keywords("file.KW One", top_n=2)
 
@@ -231,8 +234,8 @@ def test_get_n_most_similar_keywords_handles_invalid_index_and_continues(caplog)
     reg = FakeKeywordRegistry(kws)
     svc = KeywordSimilarityService(reg)
 
-    svc.keyword_names_list = ["file.KW One"]
-    svc.similarity_matrix = [[1.0, 0.5], [0.5, 1.0]]
+    # Neighbour row without keyword properties
+    svc._set_neighbours(kws[:1], [[(1, 0.5)]])
 
     caplog.set_level(logging.ERROR, logger=logger.name)
 
@@ -240,7 +243,7 @@ def test_get_n_most_similar_keywords_handles_invalid_index_and_continues(caplog)
 
     assert result == []
     assert any(
-        "Invalid index or similarity score at position" in r.getMessage()
+        "Error accessing similarity neighbours for keyword" in r.getMessage()
         for r in caplog.records
     )
 
@@ -268,12 +271,16 @@ def test_get_all_similar_keywords_above_threshold_happy_path():
     reg = FakeKeywordRegistry(kws)
     svc = KeywordSimilarityService(reg)
 
-    svc.keyword_names_list = ["file.KW One", "file.KW Two", "file.KW Three"]
-    svc.similarity_matrix = [
-        [1.0, 0.85, 0.2],
-        [0.85, 1.0, 0.3],
-        [0.2, 0.3, 1.0],
-    ]
+    svc._set_neighbours(
+        kws,
+        _neighbours_from_matrix(
+            [
+                [1.0, 0.85, 0.2],
+                [0.85, 1.0, 0.3],
+                [0.2, 0.3, 1.0],
+            ]
+        ),
+    )
 
     result = svc.get_all_similar_keywords_above_threshold(threshold=0.8)
 
@@ -282,7 +289,7 @@ def test_get_all_similar_keywords_above_threshold_happy_path():
     assert names == {"file.KW One", "file.KW Two"}
 
 
-def test_get_all_similar_keywords_above_threshold_handles_resolve_errors(monkeypatch, caplog):
+def test_get_all_similar_keywords_above_threshold_handles_errors(caplog):
     kws = [
         _kw("k1", "KW One", "file.KW One", "code1"),
         _kw("k2", "KW Two", "file.KW Two", "code2"),
@@ -290,18 +297,8 @@ def test_get_all_similar_keywords_above_threshold_handles_resolve_errors(monkeyp
     reg = FakeKeywordRegistry(kws)
     svc = KeywordSimilarityService(reg)
 
-    svc.keyword_names_list = ["file.KW One", "file.KW Two"]
-    svc.similarity_matrix = [[1.0, 0.9], [0.9, 1.0]]
-
-    def broken_resolve(name: str):
-        raise RuntimeError("boom")
-
-    monkeypatch.setattr(
-        reg,
-        "resolve",
-        broken_resolve,
-        raising=True,
-    )
+    # Row without keyword properties
+    svc._set_neighbours(kws[:1], [[(1, 0.9)], [(0, 0.9)]])
 
     caplog.set_level(logging.ERROR, logger=logger.name)
 
@@ -311,4 +308,380 @@ def test_get_all_similar_keywords_above_threshold_handles_resolve_errors(monkeyp
     assert any(
         "Unexpected error while finding similar keywords" in r.getMessage()
         for r in caplog.records
-    )
\ No newline at end of file
+    )
+
+
+def test_build_neighbour_lists_sorts_by_score_and_skips_zero_scores():
+    svc = KeywordSimilarityService(FakeKeywordRegistry([]))
+    kws = [_kw(f"k{i}", f"KW {i}", f"file.KW {i}", code) for i, code in enumerate(["a b", "a c", "d", "a b b"])]
+
+    neighbours = svc._build_neighbour_lists(svc._vectorize_keywords(kws), 100)
+
+    assert [[row for row, _ in row_neighbours] for row_neighbours in neighbours] == [
+        [3, 1],
+        [0, 3],
+        [],
+        [0, 1],
+    ]
+    assert neighbours[0][0][1] == pytest.approx(3 / (sqrt(2) * sqrt(5)))
+    assert neighbours[0][1][1] == pytest.approx(0.5)
+    assert neighbours[0][0][1] == neighbours[3][0][1]
+
+
+def test_build_neighbour_lists_keeps_top_k_neighbours_per_row():
+    svc = KeywordSimilarityService(FakeKeywordRegistry([]))
+    kws = [_kw(f"k{i}", f"KW {i}", f"file.KW {i}", code) for i, code in enumerate(["a b", "a c", "d", "a b b"])]
+    vectors = svc._vectorize_keywords(kws)
+
+    neighbours = svc._build_neighbour_lists(vectors, 1)
+
+    assert neighbours == [row_neighbours[:1] for row_neighbours in svc._build_neighbour_lists(vectors, 100)]
+
+
+def test_calculate_similarity_without_index_keeps_top_k_neighbours():
+    kws = [_kw(f"k{i}", f"KW {i}", f"file.KW {i}", f"KW {i}\n    Log    shared {i % 3}") for i in range(12)]
+    svc = KeywordSimilarityService(FakeKeywordRegistry(kws), index_top_k=3)
+
+    svc.calculate_keyword_similarity_matrix()
+
+    assert not svc.is_memory_mapped
+    assert all(len(row_neighbours) == 3 for row_neighbours in svc._neighbours)
+
+
+def test_vectorize_keywords_uses_integer_ids_of_shared_vocabulary():
+    svc = KeywordSimilarityService(FakeKeywordRegistry([]))
+    kws = [
+        _kw("k1", "KW One", "file.KW One", "unused"),
+        _kw("k2", "KW Two", "file.KW Two", "unused"),
+    ]
+    tokens = {"k1": ["KEYWORD:log", "ARGUMENT:a", "KEYWORD:log"], "k2": ["ARGUMENT:b", "KEYWORD:log"]}
+
+    first, second = svc._vectorize_keywords(kws, tokens)
+
+    assert list(first.ids) == [0, 1]
+    assert list(first.counts) == [2, 1]
+    assert first.norm == pytest.approx(sqrt(5))
+    assert list(second.ids) == [0, 2]
+    assert list(second.counts) == [1, 1]
+
+
+def test_vectorize_keywords_without_tokens_parses_code():
+    svc = KeywordSimilarityService(FakeKeywordRegistry([]))
+    kws = [_kw("k1", "KW One", "file.KW One", "KW One\n    Log    Log")]
+
+    assert svc._get_keyword_tokens(kws[0]) == ["KEYWORD NAME:kw", "KEYWORD NAME:one", "KEYWORD:log", "ARGUMENT:Log"]
+    (vector,) = svc._vectorize_keywords(kws)
+
+    assert list(vector.counts) == [1, 1, 1, 1]
+
+
+def test_vectorize_keywords_without_parsable_code_falls_back_to_code_words():
+    svc = KeywordSimilarityService(FakeKeywordRegistry([]))
+    kws = [_kw("k1", "KW One", "file.KW One", "# Log    Log")]
+
+    (vector,) = svc._vectorize_keywords(kws)
+
+    assert list(vector.counts) == [1, 2]
+
+
+def test_calculate_similarity_releases_parsed_tokens():
+    registry = FakeKeywordRegistry(_indexed_kws(), _INDEXED_TOKENS)
+    svc = KeywordSimilarityService(registry)
+
+    svc.calculate_keyword_similarity_matrix()
+
+    assert registry.take_similarity_tokens() == {}
+    assert [r.keyword_id for r in svc.get_n_most_similar_keywords("Open Page", top_n=1)] == ["k2"]
+
+
+@pytest.mark.parametrize(
+    ("token", "expected"),
+    [
+        ("VARIABLE:${value}", "VARIABLE:${}"),
+        ("VARIABLE:@{items}[0]", "VARIABLE:@{}[]"),
+        ("ASSIGN:${result}=", "ASSIGN:${}="),
+        ("ASSIGN:&{mapping}", "ASSIGN:&{}"),
+        ("KEYWORD:log", "KEYWORD:log"),
+        ("ARGUMENT:${value}", "ARGUMENT:${value}"),
+        ("VARIABLE:${unclosed", "VARIABLE:${unclosed"),
+    ],
+)
+def test_normalize_variable_token(token, expected):
+    assert KeywordSimilarityService._normalize_variable_token(token) == expected
+
+
+def test_normalize_variables_makes_renamed_keywords_identical():
+    kws = [_kw("k1", "KW One", "file.KW One", "unused"), _kw("k2", "KW Two", "file.KW Two", "unused")]
+    tokens = {
+        "k1": ["ASSIGN:${a}=", "KEYWORD:setvariable", "VARIABLE:${x}", "KEYWORD:log", "VARIABLE:${a}"],
+        "k2": ["ASSIGN:${b}=", "KEYWORD:setvariable", "VARIABLE:${y}", "KEYWORD:log", "VARIABLE:${b}"],
+    }
+
+    plain = KeywordSimilarityService(FakeKeywordRegistry(kws, tokens))
+    plain.calculate_keyword_similarity_matrix()
+    normalized = KeywordSimilarityService(FakeKeywordRegistry(kws, tokens), normalize_variables=True)
+    normalized.calculate_keyword_similarity_matrix()
+
+    assert plain._neighbours[0][0][1] < 1.0
+    assert normalized._neighbours[0][0][1] == pytest.approx(1.0)
+
+
+def test_get_similar_keyword_pairs_empty_logs_warning_and_returns_empty(caplog):
+    svc = KeywordSimilarityService(FakeKeywordRegistry([]))
+
+    caplog.set_level(logging.WARNING, logger=logger.name)
+
+    assert svc.get_similar_keyword_pairs(0.8) == []
+    assert any("Similarity matrix is empty" in r.getMessage() for r in caplog.records)
+
+
+def test_get_similar_keyword_pairs_returns_each_pair_once_as_percentage():
+    kws = [
+        _kw("k1", "Open Login Page", "login.Open Login Page", "Open Login Page\n    Go To    ${URL}\n    Log    a", "/proj/login.resource"),
+        _kw("k2", "Open Login Site", "common.Open Login Site", "Open Login Site\n    Go To    ${URL}\n    Log    a", "/proj/common.resource"),
+        _kw("k3", "Close Browser Now", "common.Close Browser Now", "Close Browser Now\n    Close All Browsers", "/proj/common.resource"),
+    ]
+    svc = KeywordSimilarityService(FakeKeywordRegistry(kws))
+    svc.calculate_keyword_similarity_matrix()
+
+    pairs = svc.get_similar_keyword_pairs(threshold=0.5)
+
+    assert len(pairs) == 1
+    pair = pairs[0]
+    assert {pair.keyword1_name, pair.keyword2_name} == {"Open Login Page", "Open Login Site"}
+    assert {pair.keyword1_file, pair.keyword2_file} == {"/proj/login.resource", "/proj/common.resource"}
+    expected = svc._neighbours[0][0][1] * 100
+    assert pair.similarity_score == pytest.approx(expected, abs=0.01)
+    assert 50 <= pair.similarity_score <= 100
+
+
+def test_get_similar_keyword_pairs_sorted_by_descending_score():
+    kws = [
+        _kw("k1", "KW One", "file.KW One", "code1"),
+        _kw("k2", "KW Two", "file.KW Two", "code2"),
+        _kw("k3", "KW Three", "file.KW Three", "code3"),
+    ]
+    svc = KeywordSimilarityService(FakeKeywordRegistry(kws))
+    svc._set_neighbours(
+        kws,
+        _neighbours_from_matrix(
+            [
+                [1.0, 0.85, 0.95],
+                [0.85, 1.0, 0.3],
+                [0.95, 0.3, 1.0],
+            ]
+        ),
+    )
+
+    pairs = svc.get_similar_keyword_pairs(threshold=0.8)
+
+    assert [(p.keyword1_name, p.keyword2_name, p.similarity_score) for p in pairs] == [
+        ("KW One", "KW Three", 95.0),
+        ("KW One", "KW Two", 85.0),
+    ]
+
+
+def test_get_n_most_similar_keywords_respects_top_n_and_min_score():
+    kws = [
+        _kw("k1", "KW One", "file.KW One", "code1"),
+        _kw("k2", "KW Two", "file.KW Two", "code2"),
+        _kw("k3", "KW Three", "file.KW Three", "code3"),
+        _kw("k4", "KW Four", "file.KW Four", "code4"),
+    ]
+    svc = KeywordSimilarityService(FakeKeywordRegistry(kws))
+    svc._set_neighbours(
+        kws,
+        _neighbours_from_matrix(
+            [
+                [1.0, 0.9, 0.6, 0.3],
+                [0.9, 1.0, 0.0, 0.0],
+                [0.6, 0.0, 1.0, 0.0],
+                [0.3, 0.0, 0.0, 1.0],
+            ]
+        ),
+    )
+
+    assert [r.keyword_id for r in svc.get_n_most_similar_keywords("KW One", top_n=1)] == ["k2"]
+    assert [r.keyword_id for r in svc.get_n_most_similar_keywords("KW One", top_n=5)] == ["k2", "k3", "k4"]
+    assert [r.keyword_id for r in svc.get_n_most_similar_keywords("KW One", top_n=5, min_score=0.5)] == ["k2", "k3"]
+    # Keywords without any shared tokens are never returned
+    assert [r.keyword_id for r in svc.get_n_most_similar_keywords("KW Two", top_n=5)] == ["k1"]
+
+
+_INDEXED_TOKENS = {
+    "k1": ["KEYWORD:openbrowser", "ARGUMENT:url", "KEYWORD:log"],
+    "k2": ["KEYWORD:openbrowser", "ARGUMENT:url", "KEYWORD:sleep"],
+    "k3": ["KEYWORD:closebrowser", "KEYWORD:log"],
+    "k4": ["KEYWORD:noop"],
+}
+
+
+def _indexed_kws() -> list[KeywordProperties]:
+    return [
+        _kw("k1", "Open Page", "a.Open Page", ""),
+        _kw("k2", "Open Site", "a.Open Site", ""),
+        _kw("k3", "Close Page", "a.Close Page", ""),
+        _kw("k4", "Unrelated", "a.Unrelated", ""),
+    ]
+
+
+def _neighbour_names(svc: KeywordSimilarityService) -> dict[str, list[tuple[str, float]]]:
+    return {
+        svc.keyword_names_list[row]: [
+            (svc.keyword_names_list[other], round(score, 4)) for other, score in svc._neighbours[row]
+        ]
+        for row in range(len(svc._neighbours))
+    }
+
+
+def test_calculate_similarity_persists_and_reuses_index(monkeypatch, tmp_path, caplog):
+    index_path = tmp_path / "index.rvsim"
+    kws = _indexed_kws()
+    svc = KeywordSimilarityService(FakeKeywordRegistry(kws, _INDEXED_TOKENS), index_path=index_path)
+    svc.calculate_keyword_similarity_matrix()
+
+    assert svc.is_memory_mapped
+    assert svc._neighbours.path.name.startswith("index.rvsim.")
+    expected = _neighbour_names(svc)
+    assert expected["a.Open Page"][0] == ("a.Open Site", pytest.approx(2 / 3, abs=1e-4))
+
+    def fail(*_args, **_kwargs):
+        raise AssertionError("similarity must not be recalculated")
+
+    reloaded = KeywordSimilarityService(FakeKeywordRegistry(list(reversed(kws)), _INDEXED_TOKENS), index_path=index_path)
+    monkeypatch.setattr(reloaded, "_vectorize_token_lists", fail)
+    caplog.set_level(logging.INFO, logger=logger.name)
+
+    reloaded.calculate_keyword_similarity_matrix()
+
+    assert any("Similarity index is up to date" in r.getMessage() for r in caplog.records)
+    assert _neighbour_names(reloaded) == expected
+    assert [r.keyword_id for r in reloaded.get_n_most_similar_keywords("Open Page", top_n=1)] == ["k2"]
+
+
+def test_calculate_similarity_rescores_only_changed_keywords(monkeypatch, tmp_path):
+    index_path = tmp_path / "index.rvsim"
+    kws = _indexed_kws()
+    KeywordSimilarityService(FakeKeywordRegistry(kws, _INDEXED_TOKENS), index_path=index_path).calculate_keyword_similarity_matrix()
+
+    changed_kws = [
+        kws[0],
+        kws[1],
+        _kw("k3", "Close Page", "a.Close Page", ""),
+        _kw("k5", "Open Again", "a.Open Again", ""),
+    ]
+    changed_tokens = {
+        **_INDEXED_TOKENS,
+        "k3": ["KEYWORD:closebrowser", "ARGUMENT:url"],
+        "k5": ["KEYWORD:openbrowser", "KEYWORD:log"],
+    }
+    svc = KeywordSimilarityService(FakeKeywordRegistry(changed_kws, changed_tokens), index_path=index_path)
+    scored_rows = []
+    original_score_rows = svc._score_rows
+
+    def recording_score_rows(vectors, rows):
+        scored_rows.extend(rows)
+        return original_score_rows(vectors, rows)
+
+    monkeypatch.setattr(svc, "_score_rows", recording_score_rows)
+
+    svc.calculate_keyword_similarity_matrix()
+
+    assert sorted(svc.keyword_names_list[row] for row in scored_rows) == ["a.Close Page", "a.Open Again"]
+    full = KeywordSimilarityService(FakeKeywordRegistry(changed_kws, changed_tokens))
+    full.calculate_keyword_similarity_matrix()
+    assert _neighbour_names(svc) == _neighbour_names(full)
+
+
+def test_calculate_similarity_rescores_truncated_rows_that_lost_neighbours(tmp_path):
+    index_path = tmp_path / "index.rvsim"
+    kws = _indexed_kws()
+    KeywordSimilarityService(
+        FakeKeywordRegistry(kws, _INDEXED_TOKENS), index_path=index_path, index_top_k=1
+    ).calculate_keyword_similarity_matrix()
+
+    # Removing the best neighbour of "Open Page" requires re-scoring it to find the next one
+    remaining_kws = [kws[0], kws[2], kws[3]]
+    svc = KeywordSimilarityService(FakeKeywordRegistry(remaining_kws, _INDEXED_TOKENS), index_path=index_path, index_top_k=1)
+    svc.calculate_keyword_similarity_matrix()
+
+    assert [r.keyword_id for r in svc.get_n_most_similar_keywords("Open Page", top_n=5)] == ["k3"]
+
+
+def test_calculate_similarity_incremental_top_k_matches_full_calculation(tmp_path):
+    index_path = tmp_path / "index.rvsim"
+    kws = _indexed_kws()
+    KeywordSimilarityService(
+        FakeKeywordRegistry(kws, _INDEXED_TOKENS), index_path=index_path, index_top_k=1
+    ).calculate_keyword_similarity_matrix()
+
+    changed_kws = [
+        *kws,
+        _kw("k5", "Open Again", "a.Open Again", ""),
+    ]
+    changed_tokens = {**_INDEXED_TOKENS, "k5": ["KEYWORD:openbrowser", "ARGUMENT:url", "KEYWORD:log"]}
+    svc = KeywordSimilarityService(FakeKeywordRegistry(changed_kws, changed_tokens), index_path=index_path, index_top_k=1)
+    svc.calculate_keyword_similarity_matrix()
+
+    full = KeywordSimilarityService(FakeKeywordRegistry(changed_kws, changed_tokens), index_top_k=1)
+    full.calculate_keyword_similarity_matrix()
+    assert _neighbour_names(svc) == _neighbour_names(full)
+
+
+def test_calculate_similarity_rebuilds_index_with_other_settings(tmp_path):
+    index_path = tmp_path / "index.rvsim"
+    kws = _indexed_kws()
+    KeywordSimilarityService(FakeKeywordRegistry(kws, _INDEXED_TOKENS), index_path=index_path).calculate_keyword_similarity_matrix()
+
+    svc = KeywordSimilarityService(FakeKeywordRegistry(kws, _INDEXED_TOKENS), index_path=index_path, index_top_k=1)
+    svc.calculate_keyword_similarity_matrix()
+
+    assert all(len(row_neighbours) <= 1 for row_neighbours in svc._neighbours)
+    assert svc._neighbours.top_k == 1
+
+
+def test_calculate_similarity_keeps_results_when_index_cannot_be_written(tmp_path, caplog):
+    blocked_dir = tmp_path / "blocked"
+    blocked_dir.write_text("not a directory")
+    kws = _indexed_kws()
+    svc = KeywordSimilarityService(FakeKeywordRegistry(kws, _INDEXED_TOKENS), index_path=blocked_dir / "index.rvsim")
+    caplog.set_level(logging.WARNING, logger=logger.name)
+
+    svc.calculate_keyword_similarity_matrix()
+
+    assert any("Could not write similarity index" in r.getMessage() for r in caplog.records)
+    assert [r.keyword_id for r in svc.get_n_most_similar_keywords("Open Page", top_n=1)] == ["k2"]
+
+
+def test_close_releases_memory_mapped_index_so_it_can_be_rewritten(tmp_path):
+    index_path = tmp_path / "index.rvsim"
+    kws = _indexed_kws()
+    svc = KeywordSimilarityService(FakeKeywordRegistry(kws, _INDEXED_TOKENS), index_path=index_path)
+    svc.calculate_keyword_similarity_matrix()
+    mapped_path = svc._neighbours.path
+
+    svc.close()
+
+    assert not svc.is_memory_mapped
+    assert svc.keyword_names_list == []
+    changed = KeywordSimilarityService(FakeKeywordRegistry(kws[:3], _INDEXED_TOKENS), index_path=index_path)
+    changed.calculate_keyword_similarity_matrix()
+    assert changed.is_memory_mapped
+    assert sorted(tmp_path.iterdir()) == [changed._neighbours.path]
+    assert changed._neighbours.path != mapped_path
+    changed.close()
+    changed.close()
+
+
+def test_recalculation_closes_replaced_memory_mapped_index(tmp_path):
+    index_path = tmp_path / "index.rvsim"
+    svc = KeywordSimilarityService(FakeKeywordRegistry(_indexed_kws(), _INDEXED_TOKENS), index_path=index_path)
+    svc.calculate_keyword_similarity_matrix()
+    previous_index = svc._neighbours
+
+    svc.keyword_registry = FakeKeywordRegistry(_indexed_kws()[:3], _INDEXED_TOKENS)
+    svc.calculate_keyword_similarity_matrix()
+
+    assert svc._neighbours is not previous_index
+    assert previous_index._mmap.closed
+    svc.close()
@@ -367,4 +367,135 @@ def test__get_keyword_usage_for_target_keyword_in_file_and_global_usage():
     assert per_file == 2
 
     total = svc._get_global_keyword_usage_for_target_keyword("file.KW")
-    assert total == 3
\ No newline at end of file
+    assert total == 3
+
+def test_usage_counts_follow_file_registry_changes():
+    kw = _kw("k1", "KW", "file.KW")
+    kreg, freg = _make_registries([_file("a.robot", "/proj/a.robot", called_keywords=["KW"])], [kw])
+    svc = KeywordUsageService(kreg, freg)
+    assert svc._get_global_keyword_usage_for_target_keyword("KW") == 1
+
+    freg.register(_file("b.robot", "/proj/b.robot", called_keywords=["file.KW", "KW"]))
+
+    assert svc._get_global_keyword_usage_for_target_keyword("KW") == 3
+    assert svc._get_keyword_usage_for_target_keyword_in_file("KW", "/proj/b.robot") == 2
+
+
+def test_keyword_callers_and_callees_use_call_graph():
+    from roboview.schemas.domain.files import TestCaseProperties
+
+    outer = _kw("k1", "Outer", "file.Outer")
+    outer.called_keywords = ["Inner"]
+    inner = _kw("k2", "Inner", "file.Inner")
+    suite = _file("a.robot", "/proj/a.robot")
+    suite.test_cases = [TestCaseProperties(name="Test", line_number=2, called_keywords=["Outer"])]
+    kreg, freg = _make_registries([suite], [outer, inner])
+    svc = KeywordUsageService(kreg, freg)
+
+    keyword, callers = svc.get_keyword_callers("Inner")
+    assert keyword.keyword_id == "k2"
+    assert [(node.name, node.node_type, node.depth) for node in callers] == [
+        ("file.Outer", "keyword", 1),
+        ("Test", "test_case", 2),
+        ("a.robot", "file", 3),
+    ]
+    assert [node.name for node in svc.get_keyword_callers("Inner", max_depth=1)[1]] == ["file.Outer"]
+    assert [node.name for node in svc.get_keyword_callees("Outer")[1]] == ["file.Inner"]
+    assert svc.get_keyword_callers("Missing") is None
+
+
+def test_call_graph_is_rebuilt_after_registry_changes():
+    kw = _kw("k1", "KW", "file.KW")
+    kreg, freg = _make_registries([], [kw])
+    svc = KeywordUsageService(kreg, freg)
+
+    graph = svc.get_call_graph()
+    assert svc.get_call_graph() is graph
+
+    kreg.register(_kw("k2", "Other", "file.Other"))
+
+    assert svc.get_call_graph() is not graph
+    assert svc.get_call_graph().node_count == 2
+
+
+def test_get_recursive_keyword_groups():
+    ping = _kw("k1", "Ping", "file.Ping")
+    ping.called_keywords = ["Pong"]
+    ping.line_number = 1
+    pong = _kw("k2", "Pong", "file.Pong")
+    pong.called_keywords = ["file.Ping", "Retry"]
+    pong.line_number = 5
+    retry = _kw("k3", "Retry", "file.Retry")
+    retry.called_keywords = ["Retry"]
+    plain = _kw("k4", "Plain", "file.Plain")
+    plain.called_keywords = ["Ping"]
+    kreg, freg = _make_registries([], [retry, pong, ping, plain])
+    svc = KeywordUsageService(kreg, freg)
+
+    groups = svc.get_recursive_keyword_groups()
+
+    assert [([node.name for node in group.keywords], group.is_mutually_recursive) for group in groups] == [
+        (["file.Ping", "file.Pong"], True),
+        (["file.Retry"], False),
+    ]
+
+
+def test_get_keywords_without_usages_includes_transitively_dead_keywords():
+    from roboview.schemas.domain.call_graph import KeywordReachabilityEnum
+    from roboview.schemas.domain.files import TestCaseProperties
+
+    used = _kw("k1", "Used", "file.Used")
+    old_flow = _kw("k2", "Old Flow", "file.Old Flow")
+    old_flow.called_keywords = ["Old Step", "Used"]
+    old_step = _kw("k3", "Old Step", "file.Old Step")
+    library = _kw("k4", "Log", "BuiltIn.Log", is_user_defined=False)
+    suite = _file("a.robot", "/proj/a.robot", called_keywords=["Used", "Old Step", "Used"])
+    suite.test_cases = [TestCaseProperties(name="Test", line_number=2, called_keywords=["Used"])]
+    kreg, freg = _make_registries([suite], [used, old_flow, old_step, library])
+    svc = KeywordUsageService(kreg, freg)
+
+    assert svc.get_keyword_reachability() == {
+        "k1": KeywordReachabilityEnum.REACHABLE,
+        "k2": KeywordReachabilityEnum.DIRECTLY_UNUSED,
+        "k3": KeywordReachabilityEnum.TRANSITIVELY_DEAD,
+    }
+    without_usages = svc.get_keywords_without_usages()
+    assert [(k.keyword_id, k.reachability, k.total_usages) for k in without_usages] == [
+        ("k2", KeywordReachabilityEnum.DIRECTLY_UNUSED, 0),
+        ("k3", KeywordReachabilityEnum.TRANSITIVELY_DEAD, 1),
+    ]
+
+
+def test_usages_of_same_named_keywords_follow_the_imports_of_the_calling_file():
+    login_a = _kw("ka", "Login", "a.Login", source="/proj/a.resource")
+    login_b = _kw("kb", "Login", "b.Login", source="/proj/b.resource")
+    suite_a = _file("suite_a.robot", "/proj/suite_a.robot", called_keywords=["Login", "Login"])
+    suite_a.resource_imports = ["a.resource"]
+    suite_b = _file("suite_b.robot", "/proj/suite_b.robot", called_keywords=["Login"])
+    suite_b.resource_imports = ["${CURDIR}/b.resource"]
+    resources = [_file(f"{name}.resource", f"/proj/{name}.resource", is_resource=True) for name in ("a", "b")]
+    for resource in resources:
+        resource.resource_imports = []
+    kreg, freg = _make_registries([suite_a, suite_b, *resources], [login_a, login_b])
+    svc = KeywordUsageService(kreg, freg)
+
+    assert svc._get_global_keyword_usage_for_target_keyword("a.Login") == 2
+    assert svc._get_global_keyword_usage_for_target_keyword("b.Login") == 1
+    assert [(usage.file_name, usage.usages) for usage in svc.get_keyword_usage_in_files_for_target_keyword("b.Login", FileType.ROBOT)] == [
+        ("suite_b.robot", 1)
+    ]
+
+
+def test_usages_of_embedded_argument_keywords_are_counted_per_call():
+    login = _kw("k1", 'User "${name}" Logs In', 'users.User "${name}" Logs In', source="/proj/users.resource")
+    suite = _file(
+        "suite.robot",
+        "/proj/suite.robot",
+        called_keywords=['User "Bob" Logs In', 'Given User "Ann" Logs In', 'users.User "Eve" Logs In'],
+    )
+    kreg, freg = _make_registries([suite], [login])
+    svc = KeywordUsageService(kreg, freg)
+
+    assert svc._get_global_keyword_usage_for_target_keyword('User "${name}" Logs In') == 3
+    assert svc._get_keyword_usage_for_target_keyword_in_file('User "Bob" Logs In', "/proj/suite.robot") == 3
+    assert svc.get_keywords_without_usages() == []
@@ -0,0 +1,59 @@
+from pathlib import Path
+
+import pytest
+
+from roboview.main import app
+from roboview.services.load_test_service import DEFAULT_REQUEST_MIX, LoadTestService, _percentile
+from roboview.utils.project_generator import ProjectGenerator, ProjectGeneratorConfig
+
+
+@pytest.fixture(scope="module")
+def project_root(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    project_root = tmp_path_factory.mktemp("load") / "project"
+    ProjectGenerator(ProjectGeneratorConfig(resource_files=2, suite_files=1, keywords_per_file=5)).generate(
+        project_root
+    )
+    return project_root
+
+
+def test_percentile_uses_nearest_rank():
+    values = [float(value) for value in range(1, 101)]
+
+    assert _percentile(values, 50) == 50.0
+    assert _percentile(values, 95) == 95.0
+    assert _percentile(values, 99) == 99.0
+    assert _percentile([7.0], 99) == 7.0
+    assert _percentile([], 50) == 0.0
+
+
+def test_requires_app_or_base_url(tmp_path: Path):
+    with pytest.raises(ValueError, match="base URL"):
+        LoadTestService(tmp_path)
+
+
+def test_rejects_unknown_scenarios(tmp_path: Path):
+    with pytest.raises(ValueError, match="unknown-endpoint"):
+        LoadTestService(tmp_path, app=app, request_mix={"unknown-endpoint": 1})
+
+
+def test_run_reports_latencies_per_endpoint(project_root: Path):
+    result = LoadTestService(project_root, app=app, clients=3, requests_per_client=20).run()
+
+    assert result.target == "in-process"
+    assert result.clients == 3
+    assert result.requests == 60
+    assert result.errors == 0
+    assert result.throughput_rps > 0
+    assert {endpoint.endpoint for endpoint in result.endpoints} <= set(DEFAULT_REQUEST_MIX)
+    assert sum(endpoint.requests for endpoint in result.endpoints) == 60
+    for endpoint in result.endpoints:
+        assert 0 < endpoint.p50_ms <= endpoint.p95_ms <= endpoint.p99_ms <= endpoint.max_ms
+
+
+def test_run_replays_only_weighted_scenarios(project_root: Path):
+    result = LoadTestService(
+        project_root, app=app, clients=2, requests_per_client=5, request_mix={"kpis": 1, "report-generate": 0}
+    ).run()
+
+    assert [endpoint.endpoint for endpoint in result.endpoints] == ["kpis"]
+    assert result.endpoints[0].requests == 10
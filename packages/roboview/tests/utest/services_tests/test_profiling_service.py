@@ -0,0 +1,80 @@
+import pytest
+
+from roboview.schemas.domain.profiling import ProfilingStatusEnum, ProfilingTargetEnum
+from roboview.services.profiling_service import ProfilingService
+
+
+def _work() -> int:
+    return sum(range(1_000))
+
+
+def test_no_session_profiles_nothing():
+    profiling_service = ProfilingService()
+
+    with profiling_service.profile(ProfilingTargetEnum.REQUESTS):
+        _work()
+
+    assert profiling_service.get_session() is None
+
+
+def test_session_profiles_the_next_requests():
+    profiling_service = ProfilingService()
+    session = profiling_service.start(ProfilingTargetEnum.REQUESTS, request_count=2)
+    assert session.status == ProfilingStatusEnum.WAITING
+    assert session.get_stats() is None
+
+    with profiling_service.profile(ProfilingTargetEnum.REQUESTS):
+        _work()
+    assert session.status == ProfilingStatusEnum.RECORDING
+    assert session.profiled_count == 1
+
+    for _ in range(2):
+        with profiling_service.profile(ProfilingTargetEnum.REQUESTS):
+            _work()
+
+    assert session.status == ProfilingStatusEnum.COMPLETED
+    assert session.profiled_count == 2
+    assert session.completed_at is not None
+    work_calls = [values[1] for function, values in session.get_stats().stats.items() if function[2] == "_work"]
+    assert work_calls == [2]
+
+
+def test_overlapping_requests_share_one_profile():
+    profiling_service = ProfilingService()
+    session = profiling_service.start(ProfilingTargetEnum.REQUESTS, request_count=2)
+
+    with profiling_service.profile(ProfilingTargetEnum.REQUESTS):
+        with profiling_service.profile(ProfilingTargetEnum.REQUESTS):
+            _work()
+        assert session.status == ProfilingStatusEnum.RECORDING
+        _work()
+
+    assert session.status == ProfilingStatusEnum.COMPLETED
+    work_calls = [values[1] for function, values in session.get_stats().stats.items() if function[2] == "_work"]
+    assert work_calls == [2]
+
+
+def test_initialization_session_ignores_requests():
+    profiling_service = ProfilingService()
+    session = profiling_service.start(ProfilingTargetEnum.INITIALIZATION, request_count=5)
+    assert session.request_count == 1
+
+    with profiling_service.profile(ProfilingTargetEnum.REQUESTS):
+        _work()
+    assert session.status == ProfilingStatusEnum.WAITING
+
+    with profiling_service.profile(ProfilingTargetEnum.INITIALIZATION):
+        _work()
+    assert session.status == ProfilingStatusEnum.COMPLETED
+
+
+def test_start_replaces_idle_session_but_not_recording_one():
+    profiling_service = ProfilingService()
+    first = profiling_service.start(ProfilingTargetEnum.REQUESTS, request_count=3)
+
+    with profiling_service.profile(ProfilingTargetEnum.REQUESTS), pytest.raises(RuntimeError, match="recording"):
+        profiling_service.start(ProfilingTargetEnum.INITIALIZATION)
+
+    second = profiling_service.start(ProfilingTargetEnum.INITIALIZATION)
+    assert profiling_service.get_session() is second
+    assert second.session_id != first.session_id
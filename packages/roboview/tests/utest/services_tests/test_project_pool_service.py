@@ -0,0 +1,303 @@
+"""Tests for the ProjectPoolService class."""
+
+from pathlib import Path
+
+import pytest
+
+from roboview.registries.file_registry import FileRegistry
+from roboview.registries.keyword_registry import KeywordRegistry
+from roboview.registries.library_catalog import LibraryCatalog
+from roboview.registries.robocop_registry import RobocopRegistry
+from roboview.schemas.domain.keywords import KeywordProperties
+from roboview.schemas.domain.robocop import RobocopMessage
+from roboview.services.keyword_similarity_service import KeywordSimilarityService
+from roboview.services.project_pool_service import ProjectContext, ProjectPoolService
+from roboview.utils.analysis_snapshot import read_analysis_snapshot, write_analysis_snapshot
+
+
+def _library_keyword(name: str) -> KeywordProperties:
+    return KeywordProperties(
+        keyword_id=f"lib-{name}",
+        file_name="Lib",
+        keyword_name_without_prefix=name,
+        keyword_name_with_prefix=f"Lib.{name}",
+        description="x" * 10_000,
+        is_user_defined=False,
+        code="",
+        source="Lib",
+        validation_str_without_prefix=name.lower(),
+        validation_str_with_prefix=f"lib.{name.lower()}",
+    )
+
+
+def _context(project_root: Path, keywords: tuple[KeywordProperties, ...] = ()) -> ProjectContext:
+    keyword_registry = KeywordRegistry()
+    for keyword in keywords:
+        keyword_registry.register(keyword)
+    return ProjectContext(
+        project_root,
+        keyword_registry=keyword_registry,
+        file_registry=FileRegistry(),
+        robocop_registry=RobocopRegistry(),
+        keyword_usage_service=None,
+        keyword_similarity_service=None,
+        robocop_service=None,
+        reporting_service=None,
+    )
+
+
+def test_get_project_key_is_stable_per_root(tmp_path: Path):
+    assert ProjectPoolService.get_project_key(tmp_path) == ProjectPoolService.get_project_key(str(tmp_path))
+    assert ProjectPoolService.get_project_key(tmp_path / "a") != ProjectPoolService.get_project_key(tmp_path / "b")
+
+
+def test_add_and_get_by_key_root_or_default(tmp_path: Path):
+    pool = ProjectPoolService()
+    first = _context(tmp_path / "first")
+    second = _context(tmp_path / "second")
+
+    pool.add(first)
+    pool.add(second)
+
+    assert len(pool) == 2
+    assert pool.get(first.project_key) is first
+    assert pool.get(str(tmp_path / "first")) is first
+    assert pool.get() is second
+    assert pool.default_project_key == second.project_key
+    assert pool.get("unknown") is None
+
+
+def test_add_without_make_default_keeps_existing_default(tmp_path: Path):
+    pool = ProjectPoolService()
+    first = _context(tmp_path / "first")
+    second = _context(tmp_path / "second")
+
+    pool.add(first, make_default=False)
+    pool.add(second, make_default=False)
+
+    assert pool.default_project_key == first.project_key
+    assert pool.get(second.project_key) is second
+
+
+def test_add_replaces_project_with_same_root(tmp_path: Path):
+    pool = ProjectPoolService()
+    pool.add(_context(tmp_path))
+    replacement = _context(tmp_path)
+
+    pool.add(replacement)
+
+    assert pool.list_projects() == [replacement]
+
+
+def test_evicts_least_recently_used_projects_beyond_max_projects(tmp_path: Path):
+    pool = ProjectPoolService(max_projects=2)
+    first = _context(tmp_path / "first")
+    second = _context(tmp_path / "second")
+    pool.add(first)
+    pool.add(second)
+
+    # Touch the first project so the second becomes least recently used
+    pool.get(first.project_key)
+    pool.add(_context(tmp_path / "third"))
+
+    assert second.project_key not in pool
+    assert first.project_key in pool
+
+
+def test_evicts_projects_exceeding_memory_budget_but_keeps_default(tmp_path: Path):
+    pool = ProjectPoolService(memory_budget_bytes=1)
+    first = _context(tmp_path / "first")
+    pool.add(first)
+
+    # The default project is kept even if it exceeds the budget on its own
+    assert first.project_key in pool
+    assert first.estimated_size_bytes > 0
+
+    second = _context(tmp_path / "second")
+    pool.add(second)
+
+    assert pool.list_projects() == [second]
+
+
+def test_does_not_evict_projects_in_use(tmp_path: Path):
+    pool = ProjectPoolService(max_projects=1)
+    first = _context(tmp_path / "first")
+    pool.add(first)
+
+    with pool.use(first):
+        pool.add(_context(tmp_path / "second"))
+        assert first.project_key in pool
+        assert first.active_requests == 1
+
+    assert first.active_requests == 0
+
+
+class _ClosingSimilarityService:
+    def __init__(self) -> None:
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _closing_context(project_root: Path) -> ProjectContext:
+    context = _context(project_root)
+    context.keyword_similarity_service = _ClosingSimilarityService()
+    return context
+
+
+def test_closes_replaced_evicted_and_removed_projects(tmp_path: Path):
+    pool = ProjectPoolService(max_projects=1)
+    replaced = _closing_context(tmp_path / "first")
+    pool.add(replaced)
+    first = _closing_context(tmp_path / "first")
+    pool.add(first)
+    second = _closing_context(tmp_path / "second")
+    pool.add(second)
+
+    assert replaced.keyword_similarity_service.closed
+    assert first.keyword_similarity_service.closed
+    assert not second.keyword_similarity_service.closed
+
+    pool.remove(second.project_key)
+
+    assert second.keyword_similarity_service.closed
+
+
+def test_closes_retired_project_after_its_last_request(tmp_path: Path):
+    pool = ProjectPoolService()
+    first = _closing_context(tmp_path)
+    pool.add(first)
+
+    with pool.use(first):
+        pool.add(_closing_context(tmp_path))
+        assert first.retired
+        assert not first.keyword_similarity_service.closed
+
+    assert first.keyword_similarity_service.closed
+
+
+def test_remove_project_updates_default(tmp_path: Path):
+    pool = ProjectPoolService()
+    first = _context(tmp_path / "first")
+    second = _context(tmp_path / "second")
+    pool.add(first)
+    pool.add(second)
+
+    assert pool.remove(second.project_key) is True
+    assert pool.remove(second.project_key) is False
+    assert pool.default_project_key == first.project_key
+    assert pool.get() is first
+
+
+def test_shared_library_keywords_are_not_counted_per_project(tmp_path: Path):
+    catalog = LibraryCatalog()
+    library_keywords = catalog.get("Lib", lambda: [_library_keyword(f"Keyword {i}") for i in range(10)])
+    pool = ProjectPoolService(library_catalog=catalog)
+    with_library = _context(tmp_path / "with", library_keywords)
+    without_library = _context(tmp_path / "without")
+
+    pool.add(with_library)
+    pool.add(without_library)
+
+    # Only the registry entries referencing the shared keywords are counted
+    assert with_library.estimated_size_bytes - without_library.estimated_size_bytes < 10_000
+    assert pool.estimated_size_bytes == with_library.estimated_size_bytes + without_library.estimated_size_bytes
+
+
+@pytest.mark.parametrize("max_projects", [1, 3])
+def test_pool_never_exceeds_max_idle_projects(tmp_path: Path, max_projects: int):
+    pool = ProjectPoolService(max_projects=max_projects)
+    for index in range(5):
+        pool.add(_context(tmp_path / str(index)))
+
+    assert len(pool) == max_projects
+
+
+def test_context_from_snapshot_serves_stored_analysis(tmp_path: Path):
+    keyword_registry = KeywordRegistry()
+    for name, tokens in (("Open Shop", ["KEYWORD:Log", "ARGUMENT:shop"]), ("Open Store", ["KEYWORD:Log"])):
+        keyword_registry.register(
+            KeywordProperties(
+                file_name="common",
+                keyword_name_without_prefix=name,
+                keyword_name_with_prefix=f"common.{name}",
+                is_user_defined=True,
+                code=" ".join(tokens),
+                source=(tmp_path / "common.resource").as_posix(),
+                validation_str_without_prefix=name.lower().replace(" ", ""),
+                validation_str_with_prefix=f"common.{name.lower().replace(' ', '')}",
+            ),
+            tokens,
+        )
+    similarity_service = KeywordSimilarityService(keyword_registry)
+    similarity_service.calculate_keyword_similarity_matrix()
+    write_analysis_snapshot(
+        tmp_path / "snap.rvsnap",
+        tmp_path,
+        keyword_registry=keyword_registry,
+        file_registry=FileRegistry(),
+        robocop_registry=RobocopRegistry(),
+        keyword_similarity_service=similarity_service,
+    )
+
+    context = ProjectContext.from_snapshot(read_analysis_snapshot(tmp_path / "snap.rvsnap"))
+
+    assert context.project_key == ProjectPoolService.get_project_key(tmp_path)
+    assert len(context.keyword_registry) == 2
+    assert context.keyword_usage_service.keyword_registry is context.keyword_registry
+    assert context.reporting_service.project_root == tmp_path.resolve()
+    similar_keywords = context.keyword_similarity_service.get_n_most_similar_keywords("Open Shop", 1)
+    assert [keyword.keyword_name_without_prefix for keyword in similar_keywords] == ["Open Store"]
+    assert similar_keywords == similarity_service.get_n_most_similar_keywords("Open Shop", 1)
+
+
+def test_get_memory_usage_attributes_shared_objects_to_first_structure(tmp_path: Path):
+    user_keyword = _library_keyword("User").model_copy(
+        update={"keyword_id": "user", "is_user_defined": True, "code": "y" * 20_000, "description": None}
+    )
+    library_keyword = _library_keyword("Library")
+    context = _context(tmp_path, (library_keyword, user_keyword))
+    context.robocop_registry.register(
+        RobocopMessage(
+            rule_id="LEN01",
+            rule_message="Too long",
+            message="Keyword is too long",
+            category="Lengths",
+            file_name="a.resource",
+            source="a.resource",
+            severity="WARNING",
+            code="z" * 5_000,
+        )
+    )
+    context.reporting_service = context.keyword_registry
+
+    memory = context.get_memory_usage()
+
+    sizes = {structure.name: structure for structure in memory.structures}
+    assert list(sizes)[:4] == ["library_keywords", "keyword_registry", "file_registry", "robocop_registry"]
+    assert sizes["library_keywords"].entries == 1
+    assert sizes["library_keywords"].size_bytes > 10_000
+    assert sizes["keyword_registry"].entries == 1
+    assert 20_000 < sizes["keyword_registry"].size_bytes
+    assert sizes["robocop_registry"].size_bytes > 5_000
+    # Already counted for the keyword registry
+    assert sizes["reporting_service"].size_bytes == 0
+    assert memory.total_bytes == sum(structure.size_bytes for structure in memory.structures)
+
+    fields = {field.name: field for field in memory.fields}
+    assert fields["keyword.code"].size_bytes > 20_000
+    assert fields["keyword.description"].entries == 0
+    assert fields["robocop_message.code"].size_bytes > 5_000
+
+
+def test_get_memory_usage_excludes_shared_library_keywords(tmp_path: Path):
+    catalog = LibraryCatalog()
+    library_keywords = catalog.get("Lib", lambda: [_library_keyword(f"Keyword {i}") for i in range(10)])
+    context = _context(tmp_path, library_keywords)
+
+    memory = context.get_memory_usage(catalog.keyword_ids())
+
+    library = next(structure for structure in memory.structures if structure.name == "library_keywords")
+    assert library.entries == 10
+    assert library.size_bytes < 10_000
@@ -0,0 +1,245 @@
+"""Tests for the ReportJobService class."""
+
+import os
+import threading
+import time
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from roboview.schemas.domain.reports import (
+    KPISummary,
+    ReportJob,
+    ReportJobStatusEnum,
+    ReportMetadata,
+    ReportTypeEnum,
+    SummaryReport,
+)
+from roboview.services.report_job_service import ReportJobService, ReportQueueFullError
+
+
+def _build_report() -> SummaryReport:
+    return SummaryReport(
+        metadata=ReportMetadata(project_name="Test Project", project_root="/test/project"),
+        title="Test Summary Report",
+        report_type=ReportTypeEnum.SUMMARY,
+        summary=KPISummary(
+            total_keywords=1,
+            unused_keywords=0,
+            reusage_rate=100.0,
+            documentation_coverage=100.0,
+            robocop_issues=0,
+            total_files=1,
+        ),
+        risk_level="LOW",
+        health_status="Good project health.",
+    )
+
+
+def _wait(service: ReportJobService, report_id: str, timeout: float = 10.0) -> ReportJob | None:
+    deadline = time.monotonic() + timeout
+    while True:
+        job = service.get_job(report_id)
+        if job is None or job.status != ReportJobStatusEnum.GENERATING or time.monotonic() > deadline:
+            return job
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def service(tmp_path: Path) -> Iterator[ReportJobService]:
+    report_job_service = ReportJobService(tmp_path, max_stored_reports=2)
+    yield report_job_service
+    report_job_service.shutdown()
+
+
+def test_submit_generates_report_file(service: ReportJobService) -> None:
+    job = service.submit(_build_report, author="Alice")
+
+    assert job.status == ReportJobStatusEnum.GENERATING
+    finished = _wait(service, job.report_id)
+    assert finished is not None
+    assert finished.status == ReportJobStatusEnum.COMPLETED
+    assert finished.author == "Alice"
+    assert finished.completed_at is not None
+    assert Path(finished.file_path).exists()
+    assert finished.file_size == Path(finished.file_path).stat().st_size
+
+
+def test_submit_failure_marks_job_failed(service: ReportJobService) -> None:
+    def _failing_report() -> SummaryReport:
+        msg = "boom"
+        raise RuntimeError(msg)
+
+    job = service.submit(_failing_report, dedup_key="key")
+    finished = _wait(service, job.report_id)
+
+    assert finished.status == ReportJobStatusEnum.FAILED
+    assert finished.error_message == "Internal error"
+    assert finished.file_path is None
+    # Failed jobs are not reused for identical requests
+    assert service.submit(_build_report, dedup_key="key").report_id != job.report_id
+
+
+def test_submit_coalesces_by_dedup_key(service: ReportJobService) -> None:
+    first = service.submit(_build_report, dedup_key=((1, 2, 3), "Alice"))
+    second = service.submit(_build_report, dedup_key=((1, 2, 3), "Alice"))
+    other = service.submit(_build_report, dedup_key=((1, 2, 4), "Alice"))
+    undeduplicated = service.submit(_build_report)
+
+    assert first.report_id == second.report_id
+    assert other.report_id != first.report_id
+    assert undeduplicated.report_id not in {first.report_id, other.report_id}
+
+
+def test_submit_does_not_reuse_job_with_missing_file(service: ReportJobService) -> None:
+    job = service.submit(_build_report, dedup_key="key")
+    finished = _wait(service, job.report_id)
+    Path(finished.file_path).unlink()
+
+    new_job = service.submit(_build_report, dedup_key="key")
+
+    assert new_job.report_id != job.report_id
+    assert service.get_job(job.report_id) is None
+
+
+def test_submit_raises_when_queue_is_full(tmp_path: Path) -> None:
+    release = threading.Event()
+
+    def _blocking_report() -> SummaryReport:
+        release.wait(timeout=10)
+        return _build_report()
+
+    service = ReportJobService(tmp_path, max_workers=1, max_pending_jobs=1)
+    try:
+        service.submit(_blocking_report)
+        service.submit(_blocking_report)
+        with pytest.raises(ReportQueueFullError):
+            service.submit(_blocking_report)
+    finally:
+        release.set()
+        service.shutdown()
+
+
+def test_shutdown_marks_queued_jobs_failed(tmp_path: Path) -> None:
+    started = threading.Event()
+    release = threading.Event()
+
+    def _blocking_report() -> SummaryReport:
+        started.set()
+        release.wait(timeout=10)
+        return _build_report()
+
+    service = ReportJobService(tmp_path, max_workers=1, max_pending_jobs=1)
+    running = service.submit(_blocking_report)
+    assert started.wait(timeout=10)
+    queued = service.submit(_build_report, dedup_key="key")
+
+    service.shutdown(wait=False)
+    release.set()
+
+    cancelled = service.get_job(queued.report_id)
+    assert cancelled.status == ReportJobStatusEnum.FAILED
+    assert cancelled.error_message == "Report generation was cancelled"
+    assert _wait(service, running.report_id).status == ReportJobStatusEnum.COMPLETED
+
+
+def test_submit_after_shutdown_does_not_leave_generating_job(tmp_path: Path) -> None:
+    service = ReportJobService(tmp_path)
+    service.shutdown()
+
+    with pytest.raises(RuntimeError):
+        service.submit(_build_report)
+
+    assert service.list_jobs(ReportJobStatusEnum.GENERATING) == []
+
+
+def test_evicts_least_recently_used_reports(service: ReportJobService) -> None:
+    first = _wait(service, service.submit(_build_report).report_id)
+    second = _wait(service, service.submit(_build_report).report_id)
+
+    # Touch the first report so the second becomes least recently used
+    service.get_job(first.report_id)
+    third = _wait(service, service.submit(_build_report).report_id)
+
+    remaining_ids = {job.report_id for job in service.list_jobs()}
+    assert remaining_ids == {first.report_id, third.report_id}
+    assert not Path(second.file_path).exists()
+
+
+def test_evicts_reports_exceeding_storage_size(tmp_path: Path) -> None:
+    service = ReportJobService(tmp_path, max_storage_bytes=1)
+    try:
+        first = _wait(service, service.submit(_build_report).report_id)
+
+        # The most recent report is kept even if it exceeds the storage size on its own
+        assert service.get_job(first.report_id) is not None
+
+        second = _wait(service, service.submit(_build_report).report_id)
+
+        assert service.get_job(first.report_id) is None
+        assert not Path(first.file_path).exists()
+        assert service.get_job(second.report_id) is not None
+    finally:
+        service.shutdown()
+
+
+def test_evicts_reports_exceeding_maximum_age(service: ReportJobService) -> None:
+    job = _wait(service, service.submit(_build_report).report_id)
+    service._jobs[job.report_id].completed_at = datetime.now(UTC) - timedelta(days=2)
+
+    assert service.get_job(job.report_id) is None
+    assert not Path(job.file_path).exists()
+
+
+def test_removes_stale_files_on_startup(tmp_path: Path) -> None:
+    stale_file = tmp_path / "stale.html"
+    stale_file.write_text("old report")
+    old_timestamp = (datetime.now(UTC) - timedelta(days=2)).timestamp()
+    os.utime(stale_file, (old_timestamp, old_timestamp))
+    fresh_file = tmp_path / "fresh.html"
+    fresh_file.write_text("new report")
+
+    ReportJobService(tmp_path).shutdown()
+
+    assert not stale_file.exists()
+    assert fresh_file.exists()
+
+
+def test_indexes_files_of_earlier_runs_on_startup(tmp_path: Path) -> None:
+    now = datetime.now(UTC).timestamp()
+    for age_seconds, name in enumerate(["newest", "middle", "oldest"]):
+        report_file = tmp_path / f"{name}.html"
+        report_file.write_text(f"{name} report")
+        os.utime(report_file, (now - age_seconds, now - age_seconds))
+
+    service = ReportJobService(tmp_path, max_stored_reports=2)
+    try:
+        assert [job.report_id for job in service.list_jobs()] == ["middle", "newest"]
+        assert not (tmp_path / "oldest.html").exists()
+        assert service.get_job("newest").file_size == len("newest report")
+
+        job = _wait(service, service.submit(_build_report).report_id)
+
+        # The least recently used report of the earlier run makes room for the new one
+        assert {job.report_id for job in service.list_jobs()} == {"newest", job.report_id}
+        assert not (tmp_path / "middle.html").exists()
+    finally:
+        service.shutdown()
+
+
+def test_delete_job_removes_file(service: ReportJobService) -> None:
+    job = _wait(service, service.submit(_build_report).report_id)
+
+    assert service.delete_job(job.report_id) is True
+    assert service.delete_job(job.report_id) is False
+    assert service.get_job(job.report_id) is None
+    assert not Path(job.file_path).exists()
+
+
+def test_list_jobs_filters_by_status(service: ReportJobService) -> None:
+    job = _wait(service, service.submit(_build_report).report_id)
+
+    assert [j.report_id for j in service.list_jobs(ReportJobStatusEnum.COMPLETED)] == [job.report_id]
+    assert service.list_jobs(ReportJobStatusEnum.FAILED) == []
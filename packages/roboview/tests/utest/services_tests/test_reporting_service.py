@@ -6,7 +6,9 @@ from unittest.mock import MagicMock
 from roboview.registries.file_registry import FileRegistry
 from roboview.registries.keyword_registry import KeywordRegistry
 from roboview.registries.robocop_registry import RobocopRegistry
-from roboview.schemas.domain.reports import ReportTypeEnum
+from roboview.schemas.domain.keywords import KeywordProperties
+from roboview.schemas.domain.reports import DuplicateKeywordPair, ReportTypeEnum
+from roboview.schemas.domain.runtime import KeywordRuntimeStatistics
 from roboview.services.keyword_similarity_service import KeywordSimilarityService
 from roboview.services.keyword_usage_service import KeywordUsageService
 from roboview.services.reporting_service import ReportingService
@@ -163,3 +165,120 @@ def test_risk_level_determination():
     # Risk level should be determined
     assert report.risk_level in ["CRITICAL", "HIGH", "MEDIUM", "LOW", "OPTIMAL"]
     assert report.risk_level in ["MEDIUM", "LOW", "OPTIMAL"]  # Score should be around 50
+
+
+def test_generate_summary_report_uses_similar_keyword_pairs():
+    """Test that duplicate keywords are taken from the similarity pairs query with a 0-1 threshold."""
+    keyword_registry = MagicMock(spec=KeywordRegistry)
+    keyword_registry.get_user_defined_keywords.return_value = [MagicMock()] * 10
+
+    file_registry = MagicMock(spec=FileRegistry)
+    file_registry.get_all_files.return_value = []
+    robocop_registry = MagicMock(spec=RobocopRegistry)
+
+    keyword_usage_service = MagicMock(spec=KeywordUsageService)
+    keyword_usage_service.get_keyword_reusage_rate.return_value = 50.0
+    keyword_usage_service.get_documentation_coverage.return_value = 50.0
+    keyword_usage_service.get_keywords_without_usages.return_value = []
+    keyword_usage_service.get_most_used_user_defined_keywords.return_value = []
+    keyword_usage_service.get_keywords_without_documentation.return_value = []
+
+    pair = DuplicateKeywordPair(
+        keyword1_name="Open Page",
+        keyword1_file="/test/project/a.resource",
+        keyword2_name="Open Site",
+        keyword2_file="/test/project/b.resource",
+        similarity_score=92.5,
+    )
+    keyword_similarity_service = MagicMock(spec=KeywordSimilarityService)
+    keyword_similarity_service.get_similar_keyword_pairs.return_value = [pair]
+
+    robocop_service = MagicMock(spec=RobocopService)
+    robocop_service.get_robocop_error_messages.return_value = []
+
+    service = ReportingService(
+        keyword_registry=keyword_registry,
+        file_registry=file_registry,
+        robocop_registry=robocop_registry,
+        keyword_usage_service=keyword_usage_service,
+        keyword_similarity_service=keyword_similarity_service,
+        robocop_service=robocop_service,
+        project_root=Path("/test/project"),
+    )
+
+    report = service.generate_summary_report()
+
+    assert report.duplicate_keywords == [pair]
+    keyword_similarity_service.get_similar_keyword_pairs.assert_called_once_with(threshold=0.7)
+    keyword_similarity_service.get_n_most_similar_keywords.assert_not_called()
+
+
+def test_generate_summary_report_ranks_slowest_keywords_by_total_time():
+    """Test that keywords with runtime statistics are listed, the most total time first."""
+    keyword_registry = KeywordRegistry()
+    for keyword_id, name, total_seconds in (("k1", "Quick", 1.0), ("k2", "Slow", 9.0), ("k3", "Never Run", None)):
+        keyword_registry.register(
+            KeywordProperties(
+                keyword_id=keyword_id,
+                file_name="common.resource",
+                keyword_name_without_prefix=name,
+                keyword_name_with_prefix=f"common.{name}",
+                is_user_defined=True,
+                code="",
+                source="/test/project/common.resource",
+                validation_str_without_prefix=name.lower().replace(" ", ""),
+                validation_str_with_prefix=f"common.{name}".lower().replace(" ", ""),
+            )
+        )
+    keyword_registry.attach_runtime_statistics(
+        {
+            "k1": KeywordRuntimeStatistics(
+                keyword_name="common.Quick",
+                call_count=4,
+                failure_count=0,
+                total_seconds=1.0,
+                mean_seconds=0.25,
+                p95_seconds=0.3,
+                max_seconds=0.3,
+            ),
+            "k2": KeywordRuntimeStatistics(
+                keyword_name="common.Slow",
+                call_count=3,
+                failure_count=1,
+                total_seconds=9.0,
+                mean_seconds=3.0,
+                p95_seconds=4.0,
+                max_seconds=4.0,
+            ),
+        }
+    )
+
+    file_registry = MagicMock(spec=FileRegistry)
+    file_registry.get_all_files.return_value = []
+    keyword_usage_service = MagicMock(spec=KeywordUsageService)
+    keyword_usage_service.get_keyword_reusage_rate.return_value = 50.0
+    keyword_usage_service.get_documentation_coverage.return_value = 50.0
+    keyword_usage_service.get_keywords_without_usages.return_value = []
+    keyword_usage_service.get_most_used_user_defined_keywords.return_value = []
+    keyword_usage_service.get_keywords_without_documentation.return_value = []
+    keyword_similarity_service = MagicMock(spec=KeywordSimilarityService)
+    keyword_similarity_service.get_similar_keyword_pairs.return_value = []
+    robocop_service = MagicMock(spec=RobocopService)
+    robocop_service.get_robocop_error_messages.return_value = []
+
+    service = ReportingService(
+        keyword_registry=keyword_registry,
+        file_registry=file_registry,
+        robocop_registry=MagicMock(spec=RobocopRegistry),
+        keyword_usage_service=keyword_usage_service,
+        keyword_similarity_service=keyword_similarity_service,
+        robocop_service=robocop_service,
+        project_root=Path("/test/project"),
+    )
+
+    report = service.generate_summary_report()
+
+    assert [keyword.keyword_name for keyword in report.slowest_keywords] == ["Slow", "Quick"]
+    assert report.slowest_keywords[0].file_name == "common.resource"
+    assert report.slowest_keywords[0].failure_count == 1
+    assert report.slowest_keywords[0].p95_seconds == 4.0
@@ -0,0 +1,160 @@
+"""Scaling tests guarding the hot paths against super-linear growth.
+
+Each test times an operation at doubling input sizes and fits the growth exponent k of
+``time ~ size^k`` on a log-log scale. Linear operations measure about 1.0, accidental
+quadratic ones about 2.0. Process CPU time is measured, so other processes on the machine
+do not skew the result, and the best of several runs is used per size. A measurement above
+the bound is retried, since quadratic paths exceed it on every attempt while noise does not.
+
+The measurements take several seconds, so the tests are marked ``slow`` and excluded from the
+default run. Run them with ``pytest -m slow``.
+"""
+
+import math
+import time
+import timeit
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from roboview.registries.file_registry import FileRegistry
+from roboview.registries.keyword_registry import KeywordRegistry
+from roboview.registries.library_catalog import LibraryCatalog
+from roboview.schemas.domain.common import KeywordType
+from roboview.schemas.domain.files import FileProperties
+from roboview.schemas.domain.keywords import KeywordProperties
+from roboview.services.keyword_register_service import KeywordRegistryService
+from roboview.services.keyword_usage_service import KeywordUsageService
+from roboview.utils.project_generator import ProjectGenerator, ProjectGeneratorConfig
+
+pytestmark = pytest.mark.slow
+
+MAX_LINEAR_EXPONENT = 1.2
+MAX_ATTEMPTS = 3
+KEYWORDS_PER_FILE = 20
+
+
+def _growth_exponent(prepare: Callable[[int], Callable[[], object]], sizes: list[int], repeats: int = 3) -> float:
+    """Return the least-squares slope of log(time) over log(size).
+
+    ``prepare`` builds the input of a size untimed and returns the operation to time.
+    """
+    log_sizes = []
+    log_times = []
+    for size in sizes:
+        timer = timeit.Timer(prepare(size), timer=time.process_time)
+        # Warms up lazy indexes and repeats fast operations until a run takes 0.2 s
+        number, _ = timer.autorange()
+        best = min(timer.repeat(repeat=repeats, number=number)) / number
+        log_sizes.append(math.log(size))
+        log_times.append(math.log(max(best, 1e-9)))
+
+    mean_size = sum(log_sizes) / len(log_sizes)
+    mean_time = sum(log_times) / len(log_times)
+    covariance = sum((s - mean_size) * (t - mean_time) for s, t in zip(log_sizes, log_times, strict=True))
+    variance = sum((s - mean_size) ** 2 for s in log_sizes)
+    return covariance / variance
+
+
+def _assert_linear(prepare: Callable[[int], Callable[[], object]], sizes: list[int], repeats: int = 3) -> None:
+    """Assert that the growth exponent of an operation stays below MAX_LINEAR_EXPONENT."""
+    exponents = []
+    for _ in range(MAX_ATTEMPTS):
+        exponents.append(_growth_exponent(prepare, sizes, repeats))
+        if exponents[-1] < MAX_LINEAR_EXPONENT:
+            return
+    msg = f"Growth exponents {', '.join(f'{e:.2f}' for e in exponents)} exceed {MAX_LINEAR_EXPONENT}"
+    raise AssertionError(msg)
+
+
+def _registries(keyword_count: int) -> tuple[KeywordRegistry, FileRegistry]:
+    """Build registries with resource files of KEYWORDS_PER_FILE keywords calling each other."""
+    keyword_registry = KeywordRegistry()
+    file_registry = FileRegistry()
+
+    for file_index in range(max(1, keyword_count // KEYWORDS_PER_FILE)):
+        path = f"/proj/resource_{file_index}.resource"
+        names = [f"Keyword {file_index} {i}" for i in range(KEYWORDS_PER_FILE)]
+        for keyword_index, name in enumerate(names):
+            keyword_registry.register(
+                KeywordProperties(
+                    keyword_id=f"{file_index}-{keyword_index}",
+                    file_name=f"resource_{file_index}.resource",
+                    keyword_name_without_prefix=name,
+                    keyword_name_with_prefix=f"resource_{file_index}.{name}",
+                    is_user_defined=True,
+                    code="",
+                    source=path,
+                    validation_str_without_prefix=name.lower().replace(" ", ""),
+                    validation_str_with_prefix=f"resource_{file_index}.{name}".lower().replace(" ", ""),
+                    description="Documented" if keyword_index % 2 else None,
+                )
+            )
+
+        previous_names = [f"Keyword {file_index - 1} {i}" for i in range(KEYWORDS_PER_FILE)] if file_index else []
+        file_registry.register(
+            FileProperties(
+                file_name=f"resource_{file_index}.resource",
+                path=path,
+                is_resource=True,
+                initialized_keywords=names,
+                called_keywords=names[1:] + previous_names + ["Log"] * KEYWORDS_PER_FILE,
+                imported_files=[],
+            )
+        )
+    return keyword_registry, file_registry
+
+
+def test_parsing_grows_linearly_with_keywords_per_file(tmp_path: Path):
+    def prepare(keyword_count: int) -> Callable[[], object]:
+        project_root = tmp_path / f"project-{keyword_count}"
+        ProjectGenerator(
+            ProjectGeneratorConfig(
+                resource_files=1, suite_files=0, keywords_per_file=keyword_count, import_depth=1, violation_density=0
+            )
+        ).generate(project_root)
+        # Keywords of a single file, the dependency map was once rebuilt for each of them
+        return lambda: KeywordRegistryService(project_root, LibraryCatalog()).load_local_keywords()
+
+    _assert_linear(prepare, [200, 400, 800], repeats=2)
+
+
+def test_keyword_resolution_grows_linearly():
+    def prepare(keyword_count: int) -> Callable[[], object]:
+        keyword_registry, _ = _registries(keyword_count)
+        names = [keyword.keyword_name_without_prefix for keyword in keyword_registry.get_all_keywords()]
+        return lambda: [keyword_registry.resolve(name) for name in names]
+
+    _assert_linear(prepare, [500, 1000, 2000])
+
+
+def test_usage_statistics_grow_linearly():
+    def prepare(keyword_count: int) -> Callable[[], object]:
+        keyword_registry, file_registry = _registries(keyword_count)
+
+        def run() -> None:
+            keyword_usage_service = KeywordUsageService(keyword_registry, file_registry)
+            keyword_usage_service.get_keywords_without_usages()
+            keyword_usage_service.get_keywords_without_documentation()
+            keyword_usage_service.get_most_used_user_defined_keywords(10)
+
+        return run
+
+    _assert_linear(prepare, [400, 800, 1600])
+
+
+def test_per_file_keyword_views_grow_linearly():
+    def prepare(keyword_count: int) -> Callable[[], object]:
+        keyword_registry, file_registry = _registries(keyword_count)
+        keyword_usage_service = KeywordUsageService(keyword_registry, file_registry)
+        paths = [Path(file.path) for file in file_registry.get_all_files()]
+
+        def run() -> None:
+            for path in paths:
+                keyword_usage_service.get_keywords_with_global_usage_for_file(path, KeywordType.INITIALIZED)
+                keyword_usage_service.get_keywords_with_global_usage_for_file(path, KeywordType.CALLED)
+
+        return run
+
+    _assert_linear(prepare, [400, 800, 1600])
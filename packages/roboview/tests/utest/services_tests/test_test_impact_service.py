@@ -0,0 +1,162 @@
+from pathlib import Path
+
+from roboview.registries.file_registry import FileRegistry
+from roboview.registries.keyword_registry import KeywordRegistry
+from roboview.schemas.domain.files import FileProperties, TestCaseProperties
+from roboview.schemas.domain.keywords import KeywordProperties
+from roboview.schemas.domain.test_impact import ChangedFile
+from roboview.services.keyword_usage_service import KeywordUsageService
+from roboview.services.test_impact_service import TestImpactService
+
+
+def _kw(root: Path, name: str, file: str, line_number: int, called_keywords: list[str] | None = None) -> KeywordProperties:
+    prefix = Path(file).stem
+    return KeywordProperties(
+        keyword_id=f"id-{name}",
+        file_name=Path(file).name,
+        keyword_name_without_prefix=name,
+        keyword_name_with_prefix=f"{prefix}.{name}",
+        is_user_defined=True,
+        code="",
+        source=(root / file).as_posix(),
+        validation_str_without_prefix=name.lower().replace(" ", ""),
+        validation_str_with_prefix=f"{prefix}.{name}".lower().replace(" ", ""),
+        called_keywords=called_keywords,
+        line_number=line_number,
+    )
+
+
+def _file(
+        root: Path,
+        file: str,
+        resource_imports: list[str],
+        test_cases: list[TestCaseProperties] | None = None,
+        setting_keywords: list[str] | None = None,
+) -> FileProperties:
+    return FileProperties(
+        file_name=Path(file).name,
+        path=(root / file).as_posix(),
+        is_resource=file.endswith(".resource"),
+        resource_imports=resource_imports,
+        test_cases=test_cases if not file.endswith(".resource") else None,
+        setting_keywords=setting_keywords,
+    )
+
+
+def _service(root: Path) -> TestImpactService:
+    keyword_registry = KeywordRegistry()
+    for keyword in (
+        _kw(root, "Login As", "res/users.resource", 5),
+        _kw(root, "Logout", "res/users.resource", 9),
+        _kw(root, "Unused Helper", "res/users.resource", 12),
+        _kw(root, "Add Item", "res/cart.resource", 5, ["Login As"]),
+        _kw(root, "Empty Cart", "res/cart.resource", 9),
+    ):
+        keyword_registry.register(keyword)
+
+    file_registry = FileRegistry()
+    for file in (
+        _file(root, "res/users.resource", []),
+        _file(root, "res/cart.resource", ["users.resource"]),
+        _file(
+            root,
+            "login_tests.robot",
+            ["res/users.resource"],
+            [
+                TestCaseProperties(name="Valid Login", line_number=5, called_keywords=["Login As"]),
+                TestCaseProperties(name="Logout [Works]", line_number=8, called_keywords=["Logout"]),
+            ],
+        ),
+        _file(
+            root,
+            "cart/01__cart_tests.robot",
+            ["../res/cart.resource"],
+            [
+                TestCaseProperties(name="Add One Item", line_number=6, called_keywords=["Add Item"]),
+                TestCaseProperties(name="Nothing", line_number=9, called_keywords=[]),
+            ],
+            ["Empty Cart"],
+        ),
+    ):
+        file_registry.register(file)
+    return TestImpactService(KeywordUsageService(keyword_registry, file_registry), root)
+
+
+def test_changed_keyword_selects_the_test_cases_reaching_it(tmp_path: Path):
+    root = tmp_path / "my_project"
+    service = _service(root)
+
+    impact = service.analyze([ChangedFile(path="res/users.resource", line_ranges=[(10, 10)])])
+
+    assert [keyword.name for keyword in impact.changed_keywords] == ["users.Logout"]
+    assert impact.suites == []
+    assert [test_case.full_name for test_case in impact.test_cases] == ["My Project.Login Tests.Logout [Works]"]
+    assert service.to_argument_file(impact).splitlines()[1:] == ["--test My Project.Login Tests.Logout [[]Works]"]
+
+
+def test_indirect_calls_and_suite_settings_select_tests_and_suites(tmp_path: Path):
+    root = tmp_path / "my_project"
+    service = _service(root)
+
+    impact = service.analyze(
+        [
+            ChangedFile(path=(root / "res/users.resource").as_posix(), line_ranges=[(6, 7), (13, 13)]),
+            ChangedFile(path="res/cart.resource", line_ranges=[(10, 11)]),
+        ]
+    )
+
+    assert [keyword.name for keyword in impact.changed_keywords] == [
+        "users.Login As",
+        "users.Unused Helper",
+        "cart.Empty Cart",
+    ]
+    assert [(suite.full_name, suite.source) for suite in impact.suites] == [
+        ("My Project.Cart.Cart Tests", (root / "cart/01__cart_tests.robot").as_posix())
+    ]
+    # Add One Item reaches Login As, but runs with its whole suite
+    assert [test_case.name for test_case in impact.test_cases] == ["Valid Login"]
+    assert service.to_argument_file(impact).splitlines()[1:] == [
+        "# My Project.Cart.Cart Tests: Suite setup or teardown reaches a changed keyword",
+        "--test My Project.Cart.Cart Tests.*",
+        "--test My Project.Login Tests.Valid Login",
+    ]
+
+
+def test_changed_settings_of_a_resource_select_all_importing_suites(tmp_path: Path):
+    root = tmp_path / "my_project"
+    service = _service(root)
+
+    impact = service.analyze([ChangedFile(path="res/users.resource", line_ranges=[(2, 2)])])
+
+    assert [suite.full_name for suite in impact.suites] == ["My Project.Cart.Cart Tests", "My Project.Login Tests"]
+    assert impact.test_cases == []
+    assert "--suite My Project.Login Tests" in service.to_argument_file(impact).splitlines()
+
+
+def test_changed_test_case_and_deleted_resource(tmp_path: Path):
+    root = tmp_path / "my_project"
+    service = _service(root)
+
+    impact = service.analyze(
+        [
+            ChangedFile(path="login_tests.robot", line_ranges=[(6, 6)]),
+            ChangedFile(path="res/cart.resource", is_deleted=True),
+        ]
+    )
+
+    assert impact.changed_files == [(root / "login_tests.robot").as_posix()]
+    assert impact.changed_keywords == []
+    assert [(suite.full_name, suite.reason) for suite in impact.suites] == [
+        ("My Project.Cart.Cart Tests", "Imports a deleted resource file")
+    ]
+    assert [test_case.name for test_case in impact.test_cases] == ["Valid Login"]
+
+
+def test_unused_keyword_change_selects_nothing(tmp_path: Path):
+    service = _service(tmp_path / "my_project")
+
+    impact = service.analyze([ChangedFile(path="res/users.resource", line_ranges=[(13, 14)])])
+
+    assert impact.suites == []
+    assert impact.test_cases == []
+    assert "No test case is affected" in service.to_argument_file(impact)
@@ -0,0 +1,69 @@
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from roboview.schemas.domain.warmup import WarmupStatusEnum
+from roboview.services.warmup_service import WarmupService
+
+
+def test_warmup_service_is_disabled_until_started():
+    service = WarmupService()
+
+    assert service.status == WarmupStatusEnum.DISABLED
+    assert service.wait(timeout=0)
+    assert not service.is_running_for(Path(), None)
+
+
+def test_warmup_runs_initialization_in_background(tmp_path: Path):
+    release = threading.Event()
+    calls = []
+
+    def initialize(project_root, robocop_config_file):
+        calls.append((project_root, robocop_config_file))
+        release.wait(5)
+        return SimpleNamespace(project_key="key")
+
+    service = WarmupService()
+    service.start(tmp_path, None, initialize)
+
+    assert service.status == WarmupStatusEnum.RUNNING
+    assert service.is_running_for(tmp_path / ".", None)
+    assert not service.is_running_for(tmp_path, tmp_path / "robocop.toml")
+    assert not service.wait(timeout=0.01)
+
+    release.set()
+
+    assert service.wait(timeout=5)
+    assert service.status == WarmupStatusEnum.READY
+    assert service.project_key == "key"
+    assert service.duration_seconds is not None
+    assert calls == [(tmp_path, None)]
+    assert not service.is_running_for(tmp_path, None)
+
+
+def test_warmup_records_failure(tmp_path: Path, caplog):
+    def initialize(project_root, robocop_config_file):
+        raise ValueError("broken project")
+
+    service = WarmupService()
+    service.start(tmp_path, None, initialize)
+
+    assert service.wait(timeout=5)
+    assert service.status == WarmupStatusEnum.FAILED
+    assert service.error == "broken project"
+    assert service.project_key is None
+    assert "Warm-up of project" in caplog.text
+
+
+def test_warmup_cannot_start_while_running(tmp_path: Path):
+    release = threading.Event()
+    service = WarmupService()
+    service.start(tmp_path, None, lambda *_: release.wait(5) and SimpleNamespace(project_key="key"))
+
+    with pytest.raises(RuntimeError):
+        service.start(tmp_path, None, lambda *_: SimpleNamespace(project_key="key"))
+
+    release.set()
+    assert service.wait(timeout=5)
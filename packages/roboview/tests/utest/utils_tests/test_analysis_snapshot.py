@@ -0,0 +1,214 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+from roboview.registries.file_registry import FileRegistry
+from roboview.registries.keyword_registry import KeywordRegistry
+from roboview.registries.robocop_registry import RobocopRegistry
+from roboview.schemas.domain.files import FileProperties, TestCaseProperties
+from roboview.schemas.domain.keywords import KeywordProperties
+from roboview.schemas.domain.robocop import RobocopMessage, RuleCategory
+from roboview.services.keyword_similarity_service import KeywordSimilarityService
+from roboview.utils.analysis_snapshot import (
+    SnapshotFormatError,
+    _decode_strings,
+    _StringTable,
+    read_analysis_snapshot,
+    write_analysis_snapshot,
+)
+
+
+def _keyword(project_root: Path, name: str, body: str, **kwargs) -> KeywordProperties:
+    return KeywordProperties(
+        keyword_id=f"id-{name}",
+        file_name="common",
+        keyword_name_without_prefix=name,
+        keyword_name_with_prefix=f"common.{name}",
+        is_user_defined=True,
+        code=f"{name}\n    {body}\n",
+        source=(project_root / "resources" / "common.resource").as_posix(),
+        validation_str_without_prefix=name.lower(),
+        validation_str_with_prefix=f"common.{name.lower()}",
+        **kwargs,
+    )
+
+
+def _write_snapshot(path: Path, project_root: Path) -> tuple[KeywordRegistry, FileRegistry, RobocopRegistry]:
+    keyword_registry = KeywordRegistry()
+    keyword_registry.register(
+        _keyword(
+            project_root,
+            "Open Shop",
+            "Log    shop",
+            description="Opens the shop",
+            called_keywords=["Log"],
+            line_number=3,
+        )
+    )
+    keyword_registry.register(_keyword(project_root, "Open Store", "Log    store"))
+    keyword_registry.register(_keyword(project_root, "Close Shop", "Close    shop"))
+    keyword_registry.register(
+        KeywordProperties(
+            keyword_id="id-log",
+            file_name="BuiltIn",
+            keyword_name_without_prefix="Log",
+            keyword_name_with_prefix="BuiltIn.Log",
+            is_user_defined=False,
+            code="",
+            source="BuiltIn",
+            validation_str_without_prefix="log",
+            validation_str_with_prefix="builtin.log",
+            called_keywords=None,
+        )
+    )
+
+    file_registry = FileRegistry()
+    file_registry.register(
+        FileProperties(
+            file_name="common.resource",
+            path=(project_root / "resources" / "common.resource").as_posix(),
+            is_resource=True,
+            initialized_keywords=["Open Shop", "Open Store", "Close Shop"],
+            called_keywords=["Log", "Log", "Close"],
+            imported_files=["BuiltIn"],
+        )
+    )
+    file_registry.register(
+        FileProperties(
+            file_name="suite.robot",
+            path=(project_root / "tests" / "suite.robot").as_posix(),
+            is_resource=False,
+            resource_imports=["${CURDIR}${/}..${/}resources${/}common.resource"],
+            test_cases=[
+                TestCaseProperties(name="Buy Item", line_number=5, called_keywords=["Open Shop", "Close Shop"]),
+                TestCaseProperties(name="Empty", called_keywords=[]),
+            ],
+            setting_keywords=["Open Store"],
+        )
+    )
+
+    robocop_registry = RobocopRegistry()
+    for category in (RuleCategory.DOC, "Custom"):
+        robocop_registry.register(
+            RobocopMessage(
+                message_id=f"id-{category}",
+                rule_id="DOC01",
+                rule_message="Missing documentation",
+                message="Missing documentation in 'Open Store' keyword",
+                category=category,
+                file_name="common.resource",
+                source=(project_root / "resources" / "common.resource").as_posix(),
+                severity="WARNING",
+                code="Open Store",
+            )
+        )
+
+    similarity_service = KeywordSimilarityService(keyword_registry, index_top_k=4)
+    similarity_service.calculate_keyword_similarity_matrix()
+
+    write_analysis_snapshot(
+        path,
+        project_root,
+        keyword_registry=keyword_registry,
+        file_registry=file_registry,
+        robocop_registry=robocop_registry,
+        keyword_similarity_service=similarity_service,
+    )
+    return keyword_registry, file_registry, robocop_registry
+
+
+def test_write_and_read_round_trip(tmp_path: Path):
+    path = tmp_path / "snap.rvsnap"
+    keyword_registry, file_registry, robocop_registry = _write_snapshot(path, tmp_path / "project")
+
+    snapshot = read_analysis_snapshot(path)
+
+    assert snapshot.project_root == (tmp_path / "project").resolve()
+    assert snapshot.created_at
+    assert snapshot.keywords == keyword_registry.get_all_keywords()
+    assert snapshot.files == file_registry.get_all_files()
+    assert snapshot.robocop_messages == robocop_registry.get_all_error_messages()
+    assert snapshot.robocop_messages[0].category is RuleCategory.DOC
+    assert [keyword.keyword_name_without_prefix for keyword in snapshot.similarity_keywords] == [
+        "Open Shop",
+        "Open Store",
+        "Close Shop",
+    ]
+    assert snapshot.similarity_index is not None
+    assert snapshot.similarity_index.top_k == 4
+    assert [row for row, _ in snapshot.similarity_index[0]] == [1, 2]
+    snapshot.similarity_index.close()
+
+
+def test_read_resolves_paths_against_other_project_root(tmp_path: Path):
+    path = tmp_path / "snap.rvsnap"
+    _write_snapshot(path, tmp_path / "ci" / "project")
+
+    snapshot = read_analysis_snapshot(path, tmp_path / "checkout")
+
+    checkout = (tmp_path / "checkout").resolve().as_posix()
+    assert snapshot.project_root == (tmp_path / "checkout").resolve()
+    assert {keyword.source for keyword in snapshot.keywords} == {f"{checkout}/resources/common.resource", "BuiltIn"}
+    assert [file.path for file in snapshot.files] == [
+        f"{checkout}/resources/common.resource",
+        f"{checkout}/tests/suite.robot",
+    ]
+    assert snapshot.robocop_messages[0].source == f"{checkout}/resources/common.resource"
+    snapshot.similarity_index.close()
+
+
+def test_string_table_stores_normalized_paths_relative_to_root(tmp_path: Path):
+    strings = _StringTable(tmp_path)
+
+    path_id = strings.add_path(f"{tmp_path.as_posix()}//resources/./common.resource")
+
+    assert path_id == strings.add_path((tmp_path / "resources" / "common.resource").as_posix())
+    assert _decode_strings(memoryview(strings.to_bytes()), Path("/checkout")) == ["/checkout/resources/common.resource"]
+
+
+@pytest.mark.skipif(sys.platform != "win32", reason="Backslashes only separate paths on Windows")
+def test_string_table_stores_windows_paths_relative_to_root(tmp_path: Path):
+    strings = _StringTable(tmp_path)
+
+    path_id = strings.add_path(str(tmp_path / "resources" / "common.resource"))
+
+    assert _decode_strings(memoryview(strings.to_bytes()), Path("/checkout"))[path_id].endswith(
+        "checkout/resources/common.resource"
+    )
+
+
+def test_snapshot_without_user_keywords_has_no_similarity_index(tmp_path: Path):
+    path = tmp_path / "snap.rvsnap"
+    write_analysis_snapshot(
+        path,
+        tmp_path,
+        keyword_registry=KeywordRegistry(),
+        file_registry=FileRegistry(),
+        robocop_registry=RobocopRegistry(),
+        keyword_similarity_service=KeywordSimilarityService(KeywordRegistry()),
+    )
+
+    snapshot = read_analysis_snapshot(path)
+
+    assert snapshot.keywords == []
+    assert snapshot.similarity_index is None
+    assert snapshot.similarity_keywords == []
+
+
+@pytest.mark.parametrize("content", [b"", b"RVSNAPSH", b"NOTASNAP" + bytes(24)])
+def test_read_rejects_invalid_file(tmp_path: Path, content: bytes):
+    path = tmp_path / "snap.rvsnap"
+    path.write_bytes(content)
+
+    with pytest.raises(SnapshotFormatError):
+        read_analysis_snapshot(path)
+
+
+def test_read_rejects_truncated_file(tmp_path: Path):
+    path = tmp_path / "snap.rvsnap"
+    _write_snapshot(path, tmp_path)
+    path.write_bytes(path.read_bytes()[:-16])
+
+    with pytest.raises(SnapshotFormatError):
+        read_analysis_snapshot(path)
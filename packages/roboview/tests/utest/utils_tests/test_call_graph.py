@@ -0,0 +1,296 @@
+import time
+
+from roboview.registries.file_registry import FileRegistry
+from roboview.registries.keyword_registry import KeywordRegistry
+from roboview.schemas.domain.call_graph import CallGraphNodeTypeEnum, KeywordReachabilityEnum
+from roboview.schemas.domain.files import FileProperties, TestCaseProperties
+from roboview.schemas.domain.keywords import KeywordProperties
+from roboview.utils.call_graph import KeywordCallGraph
+
+
+def _keyword(name: str, called_keywords: list[str] | None = None, *, is_user_defined: bool = True) -> KeywordProperties:
+    prefix = "common" if is_user_defined else "BuiltIn"
+    return KeywordProperties(
+        keyword_id=f"id-{name}",
+        file_name=f"{prefix}.resource",
+        keyword_name_without_prefix=name,
+        keyword_name_with_prefix=f"{prefix}.{name}",
+        is_user_defined=is_user_defined,
+        code="",
+        source=f"/project/{prefix}.resource",
+        validation_str_without_prefix=name.lower().replace(" ", ""),
+        validation_str_with_prefix=f"{prefix}.{name}".lower().replace(" ", ""),
+        called_keywords=called_keywords,
+    )
+
+
+def _graph() -> KeywordCallGraph:
+    keyword_registry = KeywordRegistry()
+    for keyword in (
+        _keyword("Open Shop", ["Login", "Log"]),
+        _keyword("Login", ["Given Enter Credentials", "Unknown Keyword"]),
+        _keyword("Enter Credentials", ["Log", "Log"]),
+        _keyword("Close Shop", ["common.Open Shop"]),
+        _keyword("Log", None, is_user_defined=False),
+    ):
+        keyword_registry.register(keyword)
+
+    file_registry = FileRegistry()
+    file_registry.register(
+        FileProperties(
+            file_name="suite.robot",
+            path="/project/suite.robot",
+            is_resource=False,
+            test_cases=[
+                TestCaseProperties(name="Buy", line_number=4, called_keywords=["Open Shop", "Log"]),
+                TestCaseProperties(name="Leave", line_number=9, called_keywords=["Close Shop"]),
+            ],
+            setting_keywords=["Login"],
+        )
+    )
+    file_registry.register(FileProperties(file_name="common.resource", path="/project/common.resource", is_resource=True))
+    return KeywordCallGraph.build(keyword_registry, file_registry)
+
+
+def _names(graph: KeywordCallGraph, reached: list[tuple[int, int]]) -> list[tuple[str, int]]:
+    return [(graph.names[node], depth) for node, depth in reached]
+
+
+def test_build_resolves_calls_of_keywords_test_cases_and_files():
+    graph = _graph()
+
+    assert graph.node_count == 5 + 2 + 2
+    assert graph.node_types[5:] == [
+        CallGraphNodeTypeEnum.TEST_CASE,
+        CallGraphNodeTypeEnum.TEST_CASE,
+        CallGraphNodeTypeEnum.FILE,
+        CallGraphNodeTypeEnum.FILE,
+    ]
+    # Duplicate calls are stored once, calls of unknown keywords are dropped
+    assert sorted(graph.names[node] for node in graph.get_callees(graph.find_keyword("id-Enter Credentials"))) == [
+        "BuiltIn.Log"
+    ]
+    assert graph.unresolved_calls == 1
+    # Calls keep their BDD prefix in keyword bodies
+    assert [graph.names[node] for node in graph.get_callees(graph.find_keyword("id-Login"))] == [
+        "common.Enter Credentials"
+    ]
+    suite = graph.names.index("suite.robot")
+    assert sorted(graph.names[node] for node in graph.get_callees(suite)) == ["Buy", "Leave", "common.Login"]
+
+
+def test_transitive_callers_with_depth():
+    graph = _graph()
+    login = graph.find_keyword("id-Login")
+
+    assert _names(graph, graph.get_transitive_callers(login, max_depth=1)) == [
+        ("common.Open Shop", 1),
+        ("suite.robot", 1),
+    ]
+    assert sorted(_names(graph, graph.get_transitive_callers(login))) == [
+        ("Buy", 2),
+        ("Leave", 3),
+        ("common.Close Shop", 2),
+        ("common.Open Shop", 1),
+        ("suite.robot", 1),
+    ]
+
+
+def test_calling_entry_points_stop_at_test_cases_and_files():
+    graph = _graph()
+
+    entry_points = graph.get_calling_entry_points([graph.find_keyword("id-Enter Credentials")])
+    assert sorted(_names(graph, [(node, 0) for node in entry_points])) == [
+        ("Buy", 0),
+        ("Leave", 0),
+        ("suite.robot", 0),
+    ]
+    entry_points = graph.get_calling_entry_points([graph.find_keyword("id-Close Shop")])
+    assert [graph.names[node] for node in entry_points] == ["Leave"]
+    assert graph.get_calling_entry_points([]) == []
+
+
+def test_transitive_callees_with_depth():
+    graph = _graph()
+    close_shop = graph.find_keyword("id-Close Shop")
+
+    assert _names(graph, graph.get_transitive_callees(close_shop)) == [
+        ("common.Open Shop", 1),
+        ("common.Login", 2),
+        ("BuiltIn.Log", 2),
+        ("common.Enter Credentials", 3),
+    ]
+    assert _names(graph, graph.get_transitive_callees(close_shop, max_depth=2))[-1] == ("BuiltIn.Log", 2)
+
+
+def test_traversal_returns_start_node_only_through_a_cycle():
+    keyword_registry = KeywordRegistry()
+    keyword_registry.register(_keyword("Ping", ["Pong"]))
+    keyword_registry.register(_keyword("Pong", ["Ping"]))
+    keyword_registry.register(_keyword("Alone"))
+    graph = KeywordCallGraph.build(keyword_registry, FileRegistry())
+
+    assert _names(graph, graph.get_transitive_callees(graph.find_keyword("id-Ping"))) == [
+        ("common.Pong", 1),
+        ("common.Ping", 2),
+    ]
+    assert graph.get_transitive_callees(graph.find_keyword("id-Alone")) == []
+
+
+def test_to_node_describes_keywords_and_test_cases():
+    graph = _graph()
+
+    keyword = graph.to_node(graph.find_keyword("id-Log"), depth=2)
+    test_case = graph.to_node(graph.names.index("Buy"))
+
+    assert keyword.keyword_id == "id-Log"
+    assert keyword.is_user_defined is False
+    assert keyword.depth == 2
+    assert test_case.node_type == CallGraphNodeTypeEnum.TEST_CASE
+    assert test_case.source == "/project/suite.robot"
+    assert test_case.line_number == 4
+    assert test_case.keyword_id is None
+
+
+def test_traversal_time_follows_answer_size():
+    # A long chain with a large unrelated part: querying the chain end must not scan the whole graph
+    keyword_registry = KeywordRegistry()
+    for position in range(20_000):
+        keyword_registry.register(_keyword(f"Keyword {position}", [f"Keyword {position + 1}"]))
+    graph = KeywordCallGraph.build(keyword_registry, FileRegistry())
+
+    start = time.perf_counter()
+    for _ in range(1_000):
+        graph.get_transitive_callers(graph.find_keyword("id-Keyword 10"))
+    elapsed = time.perf_counter() - start
+
+    assert len(graph.get_transitive_callers(graph.find_keyword("id-Keyword 10"))) == 10
+    assert elapsed < 1.0
+
+
+def test_strongly_connected_components_group_calling_cycles():
+    keyword_registry = KeywordRegistry()
+    keyword_registry.register(_keyword("Ping", ["Pong", "Log"]))
+    keyword_registry.register(_keyword("Pong", ["Pang"]))
+    keyword_registry.register(_keyword("Pang", ["Ping"]))
+    keyword_registry.register(_keyword("Retry", ["Retry", "Ping"]))
+    keyword_registry.register(_keyword("Log", None, is_user_defined=False))
+    file_registry = FileRegistry()
+    file_registry.register(
+        FileProperties(
+            file_name="suite.robot",
+            path="/project/suite.robot",
+            is_resource=False,
+            test_cases=[TestCaseProperties(name="Play", line_number=2, called_keywords=["Retry"])],
+        )
+    )
+    graph = KeywordCallGraph.build(keyword_registry, file_registry)
+
+    components = [[graph.names[node] for node in component] for component in graph.get_strongly_connected_components()]
+    recursive = [[graph.names[node] for node in component] for component in graph.get_recursive_components()]
+
+    assert components == [
+        ["BuiltIn.Log"],
+        ["common.Ping", "common.Pong", "common.Pang"],
+        ["common.Retry"],
+    ]
+    assert recursive == [["common.Ping", "common.Pong", "common.Pang"], ["common.Retry"]]
+
+
+def test_strongly_connected_components_in_linear_time():
+    # 10k cycles of 5 keywords, every keyword also calls its peer in the next cycle: 100k edges,
+    # and a 10k deep search that must not hit the recursion limit
+    node_count = 50_000
+    edges = [(node, node - node % 5 + (node + 1) % 5) for node in range(node_count)]
+    edges += [(node, node + 5) for node in range(node_count - 5)]
+    keyword = _keyword("Keyword")
+    graph = KeywordCallGraph(
+        [keyword] * node_count,
+        node_types=[CallGraphNodeTypeEnum.KEYWORD] * node_count,
+        names=[keyword.keyword_name_with_prefix] * node_count,
+        sources=[keyword.source] * node_count,
+        line_numbers=[None] * node_count,
+        edges=sorted(set(edges)),
+    )
+
+    start = time.perf_counter()
+    components = graph.get_recursive_components()
+    elapsed = time.perf_counter() - start
+
+    assert graph.edge_count == 99_995
+    assert len(components) == node_count // 5
+    assert all(len(component) == 5 for component in components)
+    assert elapsed < 1.0
+
+
+def test_keyword_reachability_from_test_cases_and_suite_settings():
+    keyword_registry = KeywordRegistry()
+    for keyword in (
+        _keyword("Open Shop", ["Login"]),
+        _keyword("Login"),
+        _keyword("Prepare Suite"),
+        _keyword("Old Flow", ["Old Step", "Login"]),
+        _keyword("Old Step"),
+        _keyword("Loop", ["Loop"]),
+    ):
+        keyword_registry.register(keyword)
+    file_registry = FileRegistry()
+    file_registry.register(
+        FileProperties(
+            file_name="suite.robot",
+            path="/project/suite.robot",
+            is_resource=False,
+            test_cases=[TestCaseProperties(name="Buy", line_number=4, called_keywords=["Open Shop"])],
+            setting_keywords=["Prepare Suite"],
+        )
+    )
+    graph = KeywordCallGraph.build(keyword_registry, file_registry)
+
+    reachability = dict(zip(graph.names, graph.get_keyword_reachability(), strict=False))
+
+    assert reachability == {
+        "common.Open Shop": KeywordReachabilityEnum.REACHABLE,
+        "common.Login": KeywordReachabilityEnum.REACHABLE,
+        "common.Prepare Suite": KeywordReachabilityEnum.REACHABLE,
+        "common.Old Flow": KeywordReachabilityEnum.DIRECTLY_UNUSED,
+        "common.Old Step": KeywordReachabilityEnum.TRANSITIVELY_DEAD,
+        "common.Loop": KeywordReachabilityEnum.TRANSITIVELY_DEAD,
+    }
+    assert graph.get_keyword_reachability() is graph.get_keyword_reachability()
+
+
+def test_files_without_test_case_data_reach_their_calls():
+    keyword_registry = KeywordRegistry()
+    keyword_registry.register(_keyword("Login", ["Enter Credentials"]))
+    keyword_registry.register(_keyword("Enter Credentials"))
+    file_registry = FileRegistry()
+    file_registry.register(
+        FileProperties(file_name="suite.robot", path="/project/suite.robot", is_resource=False, called_keywords=["Login"])
+    )
+    graph = KeywordCallGraph.build(keyword_registry, file_registry)
+
+    assert graph.get_keyword_reachability() == [KeywordReachabilityEnum.REACHABLE] * 2
+    assert _names(graph, graph.get_transitive_callers(graph.find_keyword("id-Login"))) == [("suite.robot", 1)]
+
+
+def test_reachability_in_linear_time():
+    # 100k keywords in one call chain from a single test case, plus 100k keywords nothing reaches
+    node_count = 200_000
+    keyword = _keyword("Keyword")
+    graph = KeywordCallGraph(
+        [keyword] * node_count,
+        node_types=[CallGraphNodeTypeEnum.KEYWORD] * node_count + [CallGraphNodeTypeEnum.TEST_CASE],
+        names=[keyword.keyword_name_with_prefix] * (node_count + 1),
+        sources=[keyword.source] * (node_count + 1),
+        line_numbers=[None] * (node_count + 1),
+        edges=[(node_count, 0)] + [(node, node + 1) for node in range(node_count - 1) if node != node_count // 2 - 1],
+    )
+
+    start = time.perf_counter()
+    reachability = graph.get_keyword_reachability()
+    elapsed = time.perf_counter() - start
+
+    assert reachability.count(KeywordReachabilityEnum.REACHABLE) == node_count // 2
+    assert reachability.count(KeywordReachabilityEnum.DIRECTLY_UNUSED) == 1
+    assert reachability.count(KeywordReachabilityEnum.TRANSITIVELY_DEAD) == node_count // 2 - 1
+    assert elapsed < 1.0
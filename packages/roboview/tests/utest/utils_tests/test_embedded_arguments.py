@@ -0,0 +1,79 @@
+import time
+
+import pytest
+
+from roboview.schemas.domain.keywords import KeywordProperties
+from roboview.utils.embedded_arguments import EmbeddedKeywordMatcher, has_embedded_arguments
+
+
+def _keyword(keyword_id: str, name: str, prefix: str = "users") -> KeywordProperties:
+    return KeywordProperties(
+        keyword_id=keyword_id,
+        file_name=f"{prefix}.resource",
+        keyword_name_without_prefix=name,
+        keyword_name_with_prefix=f"{prefix}.{name}",
+        is_user_defined=True,
+        code="",
+        source=f"/proj/{prefix}.resource",
+        validation_str_without_prefix=name.lower().replace(" ", ""),
+        validation_str_with_prefix=f"{prefix}.{name}".lower().replace(" ", ""),
+    )
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [
+        ('User "${name}" Logs In', True),
+        ("${count} Items", True),
+        ("Log Message", False),
+        ("Price Is 10 ${", False),
+    ],
+)
+def test_has_embedded_arguments(name: str, expected: bool):
+    assert has_embedded_arguments(name) is expected
+
+
+def test_match_embedded_arguments_anywhere_in_the_name():
+    login = _keyword("k1", 'User "${name}" Logs In')
+    cart = _keyword("k2", "${count} Items Are In The Cart")
+    both = _keyword("k3", "${user} Buys ${item}")
+    plain = _keyword("k4", "Open Shop")
+    matcher = EmbeddedKeywordMatcher([login, cart, both, plain])
+
+    assert len(matcher) == 3
+    assert matcher.match('User "Bob" Logs In') == [login]
+    assert matcher.match('user  "Bob Smith"  logs_in') == [login]
+    assert matcher.match('users.User "Bob" Logs In') == [login]
+    assert matcher.match("3 Items Are In The Cart") == [cart]
+    assert matcher.match("Bob Buys Milk") == [both]
+    assert matcher.match("Open Shop") == []
+    assert matcher.match('User "Bob" Logs Out') == []
+    assert matcher.match("") == []
+
+
+def test_match_honours_custom_patterns_and_prefers_the_most_specific_keyword():
+    any_code = _keyword("k1", "Enter Code ${code}")
+    digits = _keyword("k2", "Enter Code ${code:\\d+} Twice")
+    any_twice = _keyword("k3", "Enter Code ${code} Twice")
+    invalid = _keyword("k4", "Select ${option:[a-} Option")
+    matcher = EmbeddedKeywordMatcher([any_code, digits, any_twice, invalid])
+
+    assert matcher.match("Enter Code 123 Twice") == [digits, any_twice, any_code]
+    assert matcher.match("Enter Code abc Twice") == [any_twice, any_code]
+    assert matcher.match("Select First Option") == [invalid]
+
+
+def test_matching_many_embedded_keywords_stays_fast():
+    keywords = [_keyword(f"k{i}", f'Step {i} Uses "${{value}}" In Area {i % 50}', f"res{i % 40}") for i in range(5000)]
+    keywords += [_keyword(f"s{i}", f"${{count}} Items In Basket {i}") for i in range(1000)]
+    matcher = EmbeddedKeywordMatcher(keywords)
+    calls = [f'Step {i} Uses "x" In Area {i % 50}' for i in range(0, 5000, 5)]
+    calls += [f"{i} Items In Basket {i}" for i in range(1000)]
+    calls += [f"Unknown Keyword {i}" for i in range(1000)]
+
+    start = time.perf_counter()
+    matched = sum(1 for call in calls if matcher.match(call))
+    elapsed = time.perf_counter() - start
+
+    assert matched == 2000
+    assert elapsed < 1.0
@@ -0,0 +1,82 @@
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from roboview.utils.git_diff import GitDiffError, get_changed_files, parse_unified_diff
+
+_DIFF = """\
+diff --git a/res/users.resource b/res/users.resource
+index 1111111..2222222 100644
+--- a/res/users.resource
++++ b/res/users.resource
+@@ -7 +7 @@ Login As
+-    Log    bye
++    Log    goodbye
+@@ -12,2 +12,0 @@ Logout
+--- removed comment
+-    Log    twice
+@@ -20,0 +19,3 @@ Logout
++New Keyword
++    Log    new
++
+diff --git a/old.robot b/old.robot
+deleted file mode 100644
+index 3333333..0000000
+--- a/old.robot
++++ /dev/null
+@@ -1,3 +0,0 @@
+-*** Test Cases ***
+-Old
+-    Log    old
+diff --git "a/my \\"quoted\\".robot" "b/my \\"quoted\\".robot"
+new file mode 100644
+--- /dev/null
++++ "b/my \\"quoted\\".robot"
+@@ -0,0 +1,2 @@
++*** Test Cases ***
++Quoted
+"""
+
+
+def test_parse_unified_diff_collects_changed_lines_of_the_new_files():
+    changed_files = parse_unified_diff(_DIFF, Path("/p"))
+
+    assert [(file.path, file.line_ranges, file.is_deleted) for file in changed_files] == [
+        ("/p/res/users.resource", [(7, 7), (12, 13), (19, 21)], False),
+        ("/p/old.robot", [(1, 1)], True),
+        ('/p/my "quoted".robot', [(1, 2)], False),
+    ]
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+def test_get_changed_files_of_a_git_range(tmp_path: Path):
+    def git(*args: str) -> None:
+        subprocess.run(
+            ["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+            cwd=tmp_path,
+            check=True,
+            capture_output=True,
+        )
+
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "suite.robot").write_text("*** Test Cases ***\nFirst\n    Log    one\n", encoding="utf-8")
+    (tmp_path / "outside.robot").write_text("*** Test Cases ***\nOutside\n    Log    one\n", encoding="utf-8")
+    (project / "notes.txt").write_text("notes\n", encoding="utf-8")
+    git("init", "-q")
+    git("add", ".")
+    git("commit", "-q", "-m", "init")
+
+    (project / "suite.robot").write_text("*** Test Cases ***\nFirst\n    Log    two\n", encoding="utf-8")
+    (tmp_path / "outside.robot").write_text("changed\n", encoding="utf-8")
+    (project / "notes.txt").write_text("changed\n", encoding="utf-8")
+
+    changed_files = get_changed_files(project, "HEAD")
+    assert [(file.path, file.line_ranges) for file in changed_files] == [((project / "suite.robot").as_posix(), [(3, 3)])]
+
+    with pytest.raises(GitDiffError):
+        get_changed_files(project, "unknown-revision")
+    with pytest.raises(GitDiffError):
+        get_changed_files(project, "--output=/tmp/x")
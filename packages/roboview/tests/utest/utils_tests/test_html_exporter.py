@@ -7,12 +7,16 @@ import pytest
 
 from roboview.schemas.domain.reports import (
     SummaryReport,
+    DuplicateKeywordPair,
+    FileReportData,
     KPISummary,
     ReportMetadata,
     ReportTypeEnum,
     Recommendation,
+    RecursiveKeywordGroupData,
+    SlowKeywordData,
 )
-from roboview.utils.exporters.html_exporter import HTMLExporter
+from roboview.utils.exporters.html_exporter import HTMLExporter, _get_template
 
 
 def test_html_export_summary_report() -> None:
@@ -288,3 +292,137 @@ def test_html_export_is_valid_html() -> None:
         assert "</body>" in content
         assert "<style>" in content
         assert "</style>" in content
+
+
+def _build_listing_report() -> SummaryReport:
+    return SummaryReport(
+        metadata=ReportMetadata(project_name="Stream Test", project_root="/test"),
+        title="Streamed Report",
+        report_type=ReportTypeEnum.SUMMARY,
+        summary=KPISummary(
+            total_keywords=20,
+            unused_keywords=2,
+            reusage_rate=75.0,
+            documentation_coverage=90.0,
+            robocop_issues=5,
+            total_files=40,
+        ),
+        risk_level="LOW",
+        health_status="Good project health.",
+        duplicate_keywords=[
+            DuplicateKeywordPair(
+                keyword1_name="Open Login Page",
+                keyword1_file="login.resource",
+                keyword2_name="Open Login Site",
+                keyword2_file="common.resource",
+                similarity_score=92.4,
+            )
+        ],
+        files=[
+            FileReportData(
+                file_name=f"suite_{index}.robot",
+                file_path=f"/test/suite_{index}.robot",
+                is_resource=False,
+                keywords_defined=index,
+                keywords_called=index,
+                total_lines=10,
+            )
+            for index in range(40)
+        ],
+    )
+
+
+def test_html_iter_html_matches_export() -> None:
+    """Test that streamed rendering yields several chunks and the same document as the file export."""
+    report = _build_listing_report()
+
+    chunks = list(HTMLExporter.iter_html(report))
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output_file = Path(temp_dir) / "streamed.html"
+        HTMLExporter.export(report, output_file)
+        content = output_file.read_text(encoding="utf-8")
+
+    streamed = "".join(chunks)
+    assert len(chunks) > 1
+    assert streamed.startswith("<!DOCTYPE html>")
+    # The footer contains the render time, compare the document up to it
+    assert streamed.split("Report generated on")[0] == content.split("Report generated on")[0]
+
+
+def test_html_export_renders_report_models_directly() -> None:
+    """Test that list entries are read from the report models without intermediate copies."""
+    report = _build_listing_report()
+
+    content = "".join(HTMLExporter.iter_html(report))
+
+    assert "Open Login Page" in content
+    assert "common.resource" in content
+    assert "92%" in content
+    assert "suite_29.robot" in content
+    assert "suite_30.robot" not in content
+    assert "... and 10 more files" in content
+
+
+def test_html_template_is_compiled_once() -> None:
+    """Test that the template is compiled once and reused."""
+    assert _get_template() is _get_template()
+
+
+def test_html_export_recursive_keywords() -> None:
+    """Test that recursive keyword groups are listed with their kind of recursion."""
+    report = _build_listing_report()
+    report.recursive_keywords = [
+        RecursiveKeywordGroupData(
+            keyword_names=["common.Ping", "login.Pong"],
+            file_names=["common.resource", "login.resource"],
+            is_mutually_recursive=True,
+        ),
+        RecursiveKeywordGroupData(keyword_names=["common.Retry"], file_names=["common.resource"], is_mutually_recursive=False),
+    ]
+
+    content = "".join(HTMLExporter.iter_html(report))
+
+    assert "Recursive Keywords (Calling Cycles)" in content
+    assert "2 groups" in content
+    assert "login.Pong" in content
+    assert "Mutual" in content
+    assert "Direct" in content
+
+
+def test_html_export_without_recursive_keywords() -> None:
+    """Test that the recursive keyword section is omitted without calling cycles."""
+    content = "".join(HTMLExporter.iter_html(_build_listing_report()))
+
+    assert "Recursive Keywords (Calling Cycles)" not in content
+
+
+def test_html_export_slowest_keywords() -> None:
+    """Test that the slowest keywords are listed with their durations."""
+    report = _build_listing_report()
+    report.slowest_keywords = [
+        SlowKeywordData(
+            keyword_name="Open Browser To Login Page",
+            file_name="common.resource",
+            call_count=40,
+            failure_count=2,
+            total_seconds=120.5,
+            mean_seconds=3.0125,
+            p95_seconds=4.5,
+        ),
+    ]
+
+    content = "".join(HTMLExporter.iter_html(report))
+
+    assert "Slowest Keywords (by Total Time)" in content
+    assert "Open Browser To Login Page" in content
+    assert "120.50 s" in content
+    assert "3.013 s" in content
+    assert "4.500 s" in content
+
+
+def test_html_export_without_slowest_keywords() -> None:
+    """Test that the slowest keyword section is omitted without ingested output files."""
+    content = "".join(HTMLExporter.iter_html(_build_listing_report()))
+
+    assert "Slowest Keywords (by Total Time)" not in content
@@ -0,0 +1,145 @@
+import time
+
+import pytest
+
+from roboview.registries.file_registry import FileRegistry
+from roboview.registries.keyword_registry import KeywordRegistry
+from roboview.schemas.domain.files import FileProperties
+from roboview.schemas.domain.keywords import KeywordProperties
+from roboview.utils.import_graph import ImportGraph, ScopedKeywordResolver, resolve_import_path
+
+
+def _file(path: str, resource_imports: list[str] | None = None) -> FileProperties:
+    return FileProperties(
+        file_name=path.rsplit("/", 1)[-1],
+        path=path,
+        is_resource=path.endswith(".resource"),
+        resource_imports=resource_imports,
+    )
+
+
+def _keyword(keyword_id: str, name: str, source: str, *, is_user_defined: bool = True) -> KeywordProperties:
+    prefix = source.rsplit("/", 1)[-1].rsplit(".", 1)[0]
+    return KeywordProperties(
+        keyword_id=keyword_id,
+        file_name=source.rsplit("/", 1)[-1],
+        keyword_name_without_prefix=name,
+        keyword_name_with_prefix=f"{prefix}.{name}",
+        is_user_defined=is_user_defined,
+        code="",
+        source=source,
+        validation_str_without_prefix=name.lower().replace(" ", ""),
+        validation_str_with_prefix=f"{prefix}.{name}".lower().replace(" ", ""),
+    )
+
+
+def _graph(*files: FileProperties) -> ImportGraph:
+    file_registry = FileRegistry()
+    for file in files:
+        file_registry.register(file)
+    return ImportGraph.build(file_registry)
+
+
+@pytest.mark.parametrize(
+    ("import_path", "expected"),
+    [
+        ("common.resource", "/p/tests/common.resource"),
+        ("../resources/common.resource", "/p/resources/common.resource"),
+        ("${CURDIR}/../resources/common.resource", "/p/resources/common.resource"),
+        ("${curdir}${/}..${/}resources${/}common.resource", "/p/resources/common.resource"),
+        ("..\\resources\\common.resource", "/p/resources/common.resource"),
+        ("/abs/common.resource", "/abs/common.resource"),
+        ("${RESOURCES}/common.resource", None),
+    ],
+)
+def test_resolve_import_path(import_path: str, expected: str | None):
+    assert resolve_import_path(import_path, "/p/tests/suite.robot") == expected
+
+
+def test_import_closures_follow_transitive_imports_and_cycles():
+    graph = _graph(
+        _file("/p/tests/suite.robot", ["../resources/a.resource"]),
+        _file("/p/resources/a.resource", ["${CURDIR}/b.resource"]),
+        _file("/p/resources/b.resource", ["a.resource", "nested/c.resource"]),
+        _file("/p/resources/nested/c.resource", []),
+        _file("/p/resources/unused.resource", []),
+    )
+    suite, a, b, c, unused = (graph.find_file(path) for path in graph.paths)
+
+    assert graph.get_imports(suite) == [a]
+    assert graph.get_closure(suite) == (1 << suite) | (1 << a) | (1 << b) | (1 << c)
+    assert graph.get_closure(a) == graph.get_closure(b) == (1 << a) | (1 << b) | (1 << c)
+    assert graph.get_closure(unused) == 1 << unused
+    assert graph.is_closure_complete(suite) is True
+
+
+def test_importers_include_indirect_importers():
+    graph = _graph(
+        _file("/p/tests/suite.robot", ["../resources/a.resource"]),
+        _file("/p/tests/other.robot", ["../resources/nested/c.resource"]),
+        _file("/p/resources/a.resource", ["b.resource"]),
+        _file("/p/resources/b.resource", []),
+        _file("/p/resources/nested/c.resource", []),
+    )
+    suite, other, a, b, c = (graph.find_file(path) for path in graph.paths)
+
+    assert graph.get_importers([b]) == [suite, a, b]
+    assert graph.get_importers([b, c]) == [suite, other, a, b, c]
+    assert graph.get_importers([]) == []
+
+
+def test_imports_fall_back_to_search_path_and_mark_unknown_scopes():
+    graph = _graph(
+        _file("/p/tests/suite.robot", ["resources/common.resource"]),
+        _file("/p/tests/other.robot", ["${ENV}/common.resource"]),
+        _file("/p/tests/legacy.robot"),
+        _file("/p/resources/common.resource", []),
+    )
+    suite, other, legacy, common = range(4)
+
+    assert graph.get_imports(suite) == [common]
+    assert graph.is_closure_complete(suite) is True
+    assert graph.is_closure_complete(other) is False
+    assert graph.is_closure_complete(legacy) is False
+
+
+def test_scoped_resolver_prefers_local_then_imported_then_library_keywords():
+    keyword_registry = KeywordRegistry()
+    login_a = _keyword("a", "Login", "/p/resources/a.resource")
+    login_b = _keyword("b", "Login", "/p/resources/b.resource")
+    local_log = _keyword("local", "Log", "/p/tests/suite.robot")
+    builtin_log = _keyword("builtin", "Log", "BuiltIn", is_user_defined=False)
+    for keyword in (login_a, login_b, builtin_log, local_log):
+        keyword_registry.register(keyword)
+    file_registry = FileRegistry()
+    for file in (
+        _file("/p/tests/suite.robot", ["../resources/b.resource"]),
+        _file("/p/tests/other.robot", []),
+        _file("/p/tests/legacy.robot"),
+        _file("/p/resources/a.resource", []),
+        _file("/p/resources/b.resource", []),
+    ):
+        file_registry.register(file)
+    resolver = ScopedKeywordResolver(keyword_registry, ImportGraph.build(file_registry))
+
+    assert resolver.resolve("Login", "/p/tests/suite.robot") is login_b
+    assert resolver.resolve("Given Login", "/p/tests/suite.robot") is login_b
+    assert resolver.resolve("a.Login", "/p/tests/suite.robot") is None
+    assert resolver.resolve("Log", "/p/tests/suite.robot") is local_log
+    assert resolver.resolve("Log", "/p/tests/other.robot") is builtin_log
+    assert resolver.resolve("Login", "/p/tests/other.robot") is None
+    # Unknown imports fall back to the global lookup
+    assert resolver.resolve("Login", "/p/tests/legacy.robot") is login_a
+
+
+def test_closures_for_deep_import_chains_in_linear_passes():
+    paths = [f"/p/resources/r{index}.resource" for index in range(5_000)]
+    graph = _graph(*(_file(path, [f"r{index + 1}.resource"] if index + 1 < len(paths) else []) for index, path in enumerate(paths)))
+
+    start = time.perf_counter()
+    closure = graph.get_closure(0)
+    elapsed = time.perf_counter() - start
+
+    assert closure == (1 << len(paths)) - 1
+    assert graph.get_closure(len(paths) - 1) == 1 << (len(paths) - 1)
+    assert elapsed < 1.0
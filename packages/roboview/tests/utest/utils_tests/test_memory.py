@@ -0,0 +1,112 @@
+import sys
+import threading
+import tracemalloc
+
+from roboview.utils.memory import (
+    AllocationTracker,
+    estimate_deep_size,
+    estimate_retained_sizes,
+    get_top_allocation_sites,
+)
+
+
+class _Holder:
+    def __init__(self, payload: object) -> None:
+        self.payload = payload
+        self.lock = threading.Lock()
+
+
+class _Slotted:
+    __slots__ = ("payload",)
+
+    def __init__(self, payload: object) -> None:
+        self.payload = payload
+
+
+def test_estimate_deep_size_follows_containers_and_attributes():
+    payload = "x" * 10_000
+
+    assert estimate_deep_size([payload]) >= sys.getsizeof(payload)
+    assert estimate_deep_size({"key": payload}) >= sys.getsizeof(payload)
+    assert estimate_deep_size(_Holder(payload)) >= sys.getsizeof(payload)
+    assert estimate_deep_size(_Slotted(payload)) >= sys.getsizeof(payload)
+
+
+def test_estimate_deep_size_counts_shared_objects_once():
+    payload = "x" * 10_000
+
+    assert estimate_deep_size([payload, payload]) < 2 * sys.getsizeof(payload)
+
+
+def test_estimate_deep_size_excludes_given_objects():
+    payload = ["x" * 10_000]
+
+    assert estimate_deep_size(_Holder(payload), exclude_ids={id(payload)}) < sys.getsizeof(payload[0])
+
+
+def test_estimate_deep_size_ignores_modules_and_classes():
+    assert estimate_deep_size([sys, _Holder]) == sys.getsizeof([sys, _Holder])
+
+
+def test_estimate_retained_sizes_attributes_shared_objects_to_first_structure():
+    payload = "x" * 10_000
+    first = _Holder(payload)
+    second = _Holder(payload)
+
+    sizes = estimate_retained_sizes({"first": first, "second": second})
+
+    assert list(sizes) == ["first", "second"]
+    assert sizes["first"] >= sys.getsizeof(payload)
+    assert sizes["second"] < sys.getsizeof(payload)
+    assert sizes["first"] + sizes["second"] == estimate_deep_size([first, second]) - sys.getsizeof([first, second])
+
+
+def test_estimate_retained_sizes_excludes_given_objects():
+    payload = ["x" * 10_000]
+
+    sizes = estimate_retained_sizes({"holder": _Holder(payload)}, exclude_ids={id(payload)})
+
+    assert sizes["holder"] < sys.getsizeof(payload[0])
+
+
+def test_allocation_tracker_records_allocations_per_phase():
+    tracker = AllocationTracker(top=5)
+    retained = []
+
+    with tracker.phase("allocate"):
+        retained.extend(bytearray(1_000) for _ in range(1_000))
+    with tracker.phase("idle"):
+        pass
+    tracker.stop()
+
+    assert [phase.phase for phase in tracker.phases] == ["allocate", "idle"]
+    allocate = tracker.phases[0]
+    assert allocate.peak_traced_bytes >= allocate.top_sites[0].size_bytes
+    assert len(allocate.top_sites) <= 5
+    assert allocate.top_sites[0].file == __file__
+    assert allocate.top_sites[0].size_bytes >= 1_000_000
+    assert not tracemalloc.is_tracing()
+    assert not get_top_allocation_sites()
+
+
+def test_disabled_allocation_tracker_only_runs_phases():
+    tracker = AllocationTracker(enabled=False)
+
+    with tracker.phase("allocate"):
+        pass
+
+    assert tracker.phases == []
+    assert not tracemalloc.is_tracing()
+
+
+def test_get_top_allocation_sites_while_tracing():
+    tracemalloc.start()
+    try:
+        retained = [bytearray(1_000) for _ in range(1_000)]
+        sites = get_top_allocation_sites(3)
+    finally:
+        tracemalloc.stop()
+
+    assert len(retained) == 1_000
+    assert 0 < len(sites) <= 3
+    assert sites[0].size_bytes >= 1_000_000
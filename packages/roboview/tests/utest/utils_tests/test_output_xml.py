@@ -0,0 +1,173 @@
+import time
+from pathlib import Path
+
+import pytest
+
+from roboview.utils.output_xml import KeywordRuntimeAggregator, OutputXmlError
+
+_OUTPUT_XML = """\
+<?xml version="1.0" encoding="UTF-8"?>
+<robot generator="Robot 7.0" schemaversion="5">
+<suite id="s1" name="Shop" source="/project/tests/shop.robot">
+<test id="s1-t1" name="Buy" line="5">
+<kw name="Login As" owner="users">
+<kw name="Log" owner="BuiltIn">
+<arg>login</arg>
+<status status="PASS" start="2024-01-01T10:00:00.000000" elapsed="0.010"/>
+</kw>
+<status status="PASS" start="2024-01-01T10:00:00.000000" elapsed="1.000"/>
+</kw>
+<kw name="Add 3 Items" source_name="Add ${count} Items" owner="cart">
+<status status="FAIL" start="2024-01-01T10:00:01.000000" elapsed="3.000"/>
+</kw>
+<kw name="Local Helper">
+<status status="PASS" start="2024-01-01T10:00:04.000000" elapsed="0.500"/>
+</kw>
+<kw name="Login As" owner="users">
+<status status="NOT RUN" start="2024-01-01T10:00:05.000000" elapsed="0.000"/>
+</kw>
+<status status="FAIL" start="2024-01-01T10:00:00.000000" elapsed="5.000"/>
+</test>
+<status status="FAIL" start="2024-01-01T10:00:00.000000" elapsed="5.000"/>
+</suite>
+<statistics/>
+<errors/>
+</robot>
+"""
+
+_LEGACY_OUTPUT_XML = """\
+<?xml version="1.0" encoding="UTF-8"?>
+<robot generator="Robot 6.1" schemaversion="4">
+<suite id="s1" name="Shop" source="/project/tests/shop.robot">
+<test id="s1-t1" name="Buy">
+<kw name="Login As" library="users">
+<status status="PASS" starttime="20240101 10:00:00.000" endtime="20240101 10:00:02.500"/>
+</kw>
+<kw name="Login As" library="users">
+<status status="NOT RUN" starttime="N/A" endtime="N/A"/>
+</kw>
+<status status="PASS" starttime="20240101 10:00:00.000" endtime="20240101 10:00:02.500"/>
+</test>
+<status status="PASS" starttime="20240101 10:00:00.000" endtime="20240101 10:00:02.500"/>
+</suite>
+</robot>
+"""
+
+
+def _write(path: Path, content: str) -> Path:
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+def test_feed_aggregates_executed_keywords_by_total_time(tmp_path: Path) -> None:
+    aggregator = KeywordRuntimeAggregator()
+
+    assert aggregator.feed(_write(tmp_path / "output.xml", _OUTPUT_XML)) == 4
+
+    executed = aggregator.get_executed_keywords()
+    assert [keyword.statistics.keyword_name for keyword in executed] == [
+        "cart.Add ${count} Items",
+        "users.Login As",
+        "Local Helper",
+        "BuiltIn.Log",
+    ]
+    cart = executed[0]
+    assert (cart.owner, cart.name, cart.suite_source) == ("cart", "Add ${count} Items", None)
+    assert cart.statistics.failure_count == 1
+    assert cart.statistics.total_seconds == pytest.approx(3.0)
+    login = executed[1].statistics
+    assert login.call_count == 1
+    assert login.failure_count == 0
+    local = executed[2]
+    assert (local.owner, local.suite_source) == (None, "/project/tests/shop.robot")
+
+
+def test_feed_reads_legacy_time_stamps(tmp_path: Path) -> None:
+    aggregator = KeywordRuntimeAggregator()
+
+    aggregator.feed(_write(tmp_path / "output.xml", _LEGACY_OUTPUT_XML))
+
+    [login] = aggregator.get_executed_keywords()
+    assert login.statistics.keyword_name == "users.Login As"
+    assert login.statistics.call_count == 1
+    assert login.statistics.total_seconds == pytest.approx(2.5)
+
+
+def test_feed_counts_keywords_without_time_stamps_as_zero_seconds(tmp_path: Path) -> None:
+    output = (
+        '<robot><suite source="/s.robot"><test name="T"><kw name="Log" owner="BuiltIn">'
+        '<status status="PASS" starttime="20240101 10:00:00.000"/></kw></test></suite></robot>'
+    )
+    aggregator = KeywordRuntimeAggregator()
+
+    aggregator.feed(_write(tmp_path / "output.xml", output))
+
+    [log] = aggregator.get_executed_keywords()
+    assert log.statistics.call_count == 1
+    assert log.statistics.total_seconds == 0.0
+
+
+def test_feed_merges_several_files(tmp_path: Path) -> None:
+    aggregator = KeywordRuntimeAggregator()
+
+    aggregator.feed(_write(tmp_path / "shard1.xml", _OUTPUT_XML))
+    aggregator.feed(_write(tmp_path / "shard2.xml", _LEGACY_OUTPUT_XML))
+
+    assert aggregator.file_count == 2
+    assert aggregator.call_count == 5
+    login = next(keyword for keyword in aggregator.get_executed_keywords() if keyword.name == "Login As")
+    assert login.statistics.call_count == 2
+    assert login.statistics.total_seconds == pytest.approx(3.5)
+    assert login.statistics.mean_seconds == pytest.approx(1.75)
+    assert login.statistics.max_seconds == pytest.approx(2.5)
+
+
+def test_p95_is_estimated_within_one_percent(tmp_path: Path) -> None:
+    calls = "".join(
+        f'<kw name="Wait" owner="BuiltIn"><status status="PASS" elapsed="{index / 100:.2f}"/></kw>'
+        for index in range(1, 201)
+    )
+    output = f'<robot><suite source="/s.robot"><test name="T">{calls}</test></suite></robot>'
+    aggregator = KeywordRuntimeAggregator()
+
+    aggregator.feed(_write(tmp_path / "output.xml", output))
+
+    [wait] = aggregator.get_executed_keywords()
+    assert wait.statistics.call_count == 200
+    assert wait.statistics.p95_seconds == pytest.approx(1.90, rel=0.01)
+    assert wait.statistics.max_seconds == pytest.approx(2.0)
+
+
+def test_feed_streams_large_files(tmp_path: Path) -> None:
+    path = tmp_path / "output.xml"
+    with path.open("w", encoding="utf-8") as file:
+        file.write('<robot><suite source="/s.robot">')
+        for test in range(2_000):
+            file.write(f'<test name="T{test}">')
+            for index in range(10):
+                file.write(
+                    f'<kw name="Step {index}" owner="steps"><arg>x</arg>'
+                    f'<kw name="Log" owner="BuiltIn"><msg>{"m" * 50}</msg><status status="PASS" elapsed="0.002"/></kw>'
+                    '<status status="PASS" elapsed="0.01"/></kw>'
+                )
+            file.write('<status status="PASS" elapsed="0.1"/></test>')
+        file.write("</suite></robot>")
+    aggregator = KeywordRuntimeAggregator()
+
+    started = time.perf_counter()
+    assert aggregator.feed(path) == 40_000
+    assert time.perf_counter() - started < 10
+
+    executed = aggregator.get_executed_keywords()
+    assert len(executed) == 11
+    assert executed[0].statistics.keyword_name == "BuiltIn.Log"
+    assert executed[0].statistics.call_count == 20_000
+
+
+def test_feed_raises_on_invalid_xml(tmp_path: Path) -> None:
+    aggregator = KeywordRuntimeAggregator()
+
+    with pytest.raises(OutputXmlError, match="Invalid output file"):
+        aggregator.feed(_write(tmp_path / "output.xml", "<robot><suite>"))
+
+    assert aggregator.file_count == 0
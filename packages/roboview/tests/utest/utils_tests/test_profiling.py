@@ -0,0 +1,98 @@
+import json
+import pstats
+from pathlib import Path
+
+from roboview.utils.profiling import SPEEDSCOPE_FILE_NAME, PhaseProfiler, get_hotspots, to_speedscope, write_profiles
+
+
+def _leaf(n: int) -> int:
+    return sum(i * i for i in range(n))
+
+
+def _branch(n: int) -> int:
+    return _leaf(n) + _leaf(n // 2)
+
+
+def _recurse(depth: int) -> int:
+    return _leaf(1_000) if depth == 0 else _recurse(depth - 1)
+
+
+def test_phase_profiler_records_one_profile_per_phase():
+    profiler = PhaseProfiler()
+
+    with profiler.phase("parse"):
+        _branch(10_000)
+    with profiler.phase("report"):
+        _leaf(10_000)
+    with profiler.phase("parse"):
+        _leaf(10_000)
+
+    assert list(profiler.profiles) == ["parse", "report"]
+    parse_functions = {function[2]: values[1] for function, values in pstats.Stats(profiler.profiles["parse"]).stats.items()}
+    assert parse_functions["_branch"] == 1
+    assert parse_functions["_leaf"] == 3
+
+
+def test_disabled_phase_profiler_only_runs_phases():
+    profiler = PhaseProfiler(enabled=False)
+
+    with profiler.phase("parse"):
+        result = _leaf(10)
+
+    assert result == 285
+    assert profiler.profiles == {}
+
+
+def test_write_profiles_writes_pstats_and_speedscope(tmp_path: Path):
+    profiler = PhaseProfiler()
+    with profiler.phase("parse"):
+        _branch(10_000)
+    with profiler.phase("report"):
+        _leaf(10_000)
+
+    written = write_profiles(tmp_path / "profiles", profiler.profiles)
+
+    assert [path.name for path in written] == ["parse.pstats", "report.pstats", SPEEDSCOPE_FILE_NAME]
+    assert "_branch" in {function[2] for function in pstats.Stats(str(written[0])).stats}
+    speedscope = json.loads(written[-1].read_text(encoding="utf-8"))
+    assert [profile["name"] for profile in speedscope["profiles"]] == ["parse", "report"]
+
+
+def test_to_speedscope_rebuilds_call_stacks():
+    profiler = PhaseProfiler()
+    with profiler.phase("parse"):
+        _branch(20_000)
+        _recurse(5)
+
+    speedscope = to_speedscope(profiler.profiles)
+
+    frames = speedscope["shared"]["frames"]
+    profile = speedscope["profiles"][0]
+    assert speedscope["$schema"] == "https://www.speedscope.app/file-format-schema.json"
+    assert profile["type"] == "sampled"
+    assert len(profile["samples"]) == len(profile["weights"])
+    assert profile["endValue"] == sum(profile["weights"])
+
+    stacks = [[frames[index]["name"] for index in sample] for sample in profile["samples"]]
+    assert ["_branch", "_leaf"] in [stack[-2:] for stack in stacks if "_branch" in stack and stack[-1] == "_leaf"]
+    # Recursive calls are folded into their outermost call
+    assert all(stack.count("_recurse") <= 1 for stack in stacks)
+    leaf = next(frame for frame in frames if frame["name"] == "_leaf")
+    assert leaf["file"] == __file__
+    assert leaf["line"] > 0
+
+
+def test_get_hotspots_orders_functions_by_own_time():
+    profiler = PhaseProfiler()
+    with profiler.phase("parse"):
+        _branch(50_000)
+
+    hotspots = get_hotspots(profiler.profiles["parse"], limit=3)
+
+    assert len(hotspots) == 3
+    assert [hotspot.own_seconds for hotspot in hotspots] == sorted(
+        (hotspot.own_seconds for hotspot in hotspots), reverse=True
+    )
+    branch = next(hotspot for hotspot in get_hotspots(profiler.profiles["parse"]) if hotspot.function == "_branch")
+    assert branch.calls == 1
+    assert branch.cumulative_seconds >= branch.own_seconds
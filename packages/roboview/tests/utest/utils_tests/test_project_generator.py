@@ -0,0 +1,96 @@
+from pathlib import Path
+
+from roboview.services.file_register_service import FileRegistryService
+from roboview.services.keyword_register_service import KeywordRegistryService
+from roboview.services.keyword_similarity_service import KeywordSimilarityService
+from roboview.utils.project_generator import ProjectGenerator, ProjectGeneratorConfig
+
+
+def _read_project(project_root: Path) -> dict[str, str]:
+    return {
+        path.relative_to(project_root).as_posix(): path.read_text(encoding="utf-8")
+        for path in sorted(project_root.rglob("*"))
+        if path.is_file()
+    }
+
+
+def test_generate_writes_configured_shape(tmp_path: Path):
+    config = ProjectGeneratorConfig(
+        resource_files=6,
+        suite_files=2,
+        keywords_per_file=8,
+        tests_per_suite=3,
+        import_depth=3,
+        documentation_ratio=1.0,
+        violation_density=0.0,
+    )
+
+    summary = ProjectGenerator(config).generate(tmp_path)
+
+    files = _read_project(tmp_path)
+    assert len([name for name in files if name.endswith(".resource")]) == 6
+    assert len([name for name in files if name.endswith(".robot")]) == 2
+    assert {name.split("/")[1] for name in files if name.startswith("resources/")} == {"layer_0", "layer_1", "layer_2"}
+    assert summary.keywords == 48
+    assert summary.test_cases == 6
+    assert summary.documented_keywords == 48
+    assert summary.violating_keywords == 0
+    assert "TODO" not in "".join(files.values())
+
+
+def test_generate_is_deterministic_per_seed(tmp_path: Path):
+    config = ProjectGeneratorConfig(resource_files=4, keywords_per_file=5, seed=7)
+
+    ProjectGenerator(config).generate(tmp_path / "a")
+    ProjectGenerator(config).generate(tmp_path / "b")
+    ProjectGenerator(config.model_copy(update={"seed": 8})).generate(tmp_path / "c")
+
+    assert _read_project(tmp_path / "a") == _read_project(tmp_path / "b")
+    assert _read_project(tmp_path / "a") != _read_project(tmp_path / "c")
+
+
+def test_generate_counts_violations_of_duplicated_keywords(tmp_path: Path):
+    config = ProjectGeneratorConfig(
+        resource_files=4, suite_files=0, keywords_per_file=10, duplicate_ratio=0.5, violation_density=0.5, seed=3
+    )
+
+    summary = ProjectGenerator(config).generate(tmp_path)
+
+    violating_bodies = "".join(_read_project(tmp_path).values()).count("# TODO remove workaround")
+    assert summary.duplicate_keywords > 0
+    assert summary.violating_keywords == violating_bodies
+
+
+def test_generated_calls_resolve_to_generated_keywords(tmp_path: Path):
+    config = ProjectGeneratorConfig(resource_files=4, suite_files=2, keywords_per_file=6, duplicate_ratio=0.5, seed=3)
+    summary = ProjectGenerator(config).generate(tmp_path)
+
+    file_registry_service = FileRegistryService(tmp_path)
+    file_registry_service.initialize()
+    file_registry = file_registry_service.get_file_registry()
+
+    assert len(file_registry) == 6
+    defined = {keyword for file in file_registry.get_all_files() for keyword in file.initialized_keywords or []}
+    called = {keyword for file in file_registry.get_all_files() for keyword in file.called_keywords or []}
+    builtins = {"Log", "Log Many", "Should Be Equal", "Set Test Variable", "Set Variable"}
+    assert len(defined) == summary.keywords
+    assert called - builtins <= defined
+    assert summary.duplicate_keywords > 0
+
+
+def test_generated_duplicates_are_found_by_similarity(tmp_path: Path):
+    config = ProjectGeneratorConfig(resource_files=3, suite_files=0, keywords_per_file=10, duplicate_ratio=0.5, seed=5)
+    summary = ProjectGenerator(config).generate(tmp_path)
+
+    keyword_registry_service = KeywordRegistryService(tmp_path)
+    keyword_registry_service.initialize()
+    similarity_service = KeywordSimilarityService(keyword_registry_service.get_keyword_registry())
+    similarity_service.calculate_keyword_similarity_matrix()
+
+    copied_keywords = {
+        keyword
+        for pair in similarity_service.get_similar_keyword_pairs(threshold=0.9)
+        for keyword in (pair.keyword1_name, pair.keyword2_name)
+    }
+    assert summary.duplicate_keywords > 0
+    assert len(copied_keywords) >= summary.duplicate_keywords
@@ -0,0 +1,121 @@
+from pathlib import Path
+
+import pytest
+
+from roboview.core.config import get_settings
+from roboview.utils.similarity_index import SimilarityIndex, get_similarity_index_path
+
+
+def _write(path: Path, top_k: int = 2) -> Path:
+    SimilarityIndex.write(
+        path,
+        [11, 22, 2**64 - 1],
+        [[(1, 0.75), (2, 0.5), (0, 0.1)], [(0, 0.75)], []],
+        top_k,
+        normalize_variables=True,
+    )
+    return SimilarityIndex._get_versions(path)[-1]
+
+
+def test_write_and_load_round_trip(tmp_path: Path):
+    path = tmp_path / "index.rvsim"
+    _write(path)
+
+    index = SimilarityIndex.load(path)
+
+    assert index is not None
+    assert len(index) == 3
+    assert index.top_k == 2
+    assert index.normalize_variables is True
+    assert list(index.row_hashes) == [11, 22, 2**64 - 1]
+    assert index.row_map == {11: 0, 22: 1, 2**64 - 1: 2}
+    # Rows are cut off at top_k and scores are stored as float32
+    assert index[0] == [(1, 0.75), (2, 0.5)]
+    assert index[1] == [(0, 0.75)]
+    assert index[2] == []
+    assert list(index) == [index[0], index[1], index[2]]
+    with pytest.raises(IndexError):
+        index[3]
+    index.close()
+
+
+def test_load_returns_none_for_missing_file(tmp_path: Path):
+    assert SimilarityIndex.load(tmp_path / "missing.rvsim") is None
+
+
+@pytest.mark.parametrize("content", [b"", b"RVSIMIDX", b"NOTANIDX" + bytes(24)])
+def test_load_returns_none_for_invalid_file(tmp_path: Path, content: bytes):
+    path = tmp_path / "index.rvsim"
+    (tmp_path / "index.rvsim.0000000000000001").write_bytes(content)
+
+    assert SimilarityIndex.load(path) is None
+
+
+def test_load_returns_none_for_truncated_file(tmp_path: Path):
+    path = tmp_path / "index.rvsim"
+    version_path = _write(path)
+    version_path.write_bytes(version_path.read_bytes()[:-4])
+
+    assert SimilarityIndex.load(path) is None
+
+
+def test_write_replaces_existing_index(tmp_path: Path):
+    path = tmp_path / "nested" / "index.rvsim"
+    _write(path)
+    SimilarityIndex.write(path, [5], [[]], 4, normalize_variables=False)
+
+    index = SimilarityIndex.load(path)
+
+    assert index is not None
+    assert list(index.row_hashes) == [5]
+    assert index.top_k == 4
+    assert list(path.parent.iterdir()) == [index.path]
+    assert index.path.name.startswith("index.rvsim.")
+    index.close()
+
+
+def test_write_keeps_mapped_index_and_loads_newest_version(tmp_path: Path, monkeypatch):
+    path = tmp_path / "index.rvsim"
+    first_path = _write(path)
+    mapped = SimilarityIndex.load(path)
+
+    original_unlink = Path.unlink
+
+    # Windows refuses to remove files that are still mapped
+    def refuse_unlink(self, missing_ok=False):
+        if self == first_path:
+            raise PermissionError(self)
+        original_unlink(self, missing_ok=missing_ok)
+
+    with monkeypatch.context() as patch:
+        patch.setattr(Path, "unlink", refuse_unlink)
+        SimilarityIndex.write(path, [5], [[]], 4, normalize_variables=False)
+
+    index = SimilarityIndex.load(path)
+    assert list(index.row_hashes) == [5]
+    assert list(mapped.row_hashes) == [11, 22, 2**64 - 1]
+    assert first_path.exists()
+    index.close()
+    mapped.close()
+
+    SimilarityIndex.write(path, [6], [[]], 4, normalize_variables=False)
+
+    assert not first_path.exists()
+    assert len(list(tmp_path.iterdir())) == 1
+
+
+def test_get_similarity_index_path(monkeypatch, tmp_path: Path):
+    monkeypatch.setenv("SIMILARITY_INDEX_DIR", str(tmp_path))
+    get_settings.cache_clear()
+    try:
+        first = get_similarity_index_path(tmp_path / "project")
+        assert first.parent == tmp_path
+        assert first.suffix == ".rvsim"
+        assert get_similarity_index_path(tmp_path / "project") == first
+        assert get_similarity_index_path(tmp_path / "other") != first
+
+        monkeypatch.setenv("SIMILARITY_INDEX_ENABLED", "false")
+        get_settings.cache_clear()
+        assert get_similarity_index_path(tmp_path / "project") is None
+    finally:
+        get_settings.cache_clear()
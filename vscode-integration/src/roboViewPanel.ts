@@ -21,6 +21,10 @@ let roboviewPathManager: PathManager = new PathManager(
   PathManager.getWorkspaceRoot(),
 );
 
+// Report generation is polled every 500 ms for at most 10 minutes
+const REPORT_POLL_INTERVAL_MS = 500;
+const REPORT_POLL_MAX_ATTEMPTS = 1200;
+
 export class RoboViewPanel {
   public static currentPanel: RoboViewPanel | undefined;
   private readonly _panel: WebviewPanel;
@@ -35,6 +39,14 @@ export class RoboViewPanel {
   ) {
     this._panel = panel;
     this._axiosInstance = axios.create({ baseURL: apiBaseUrl });
+    // The backend can hold several projects, route every request to this workspace
+    this._axiosInstance.interceptors.request.use((config: any) => {
+      const projectRootDir = PathManager.getWorkspaceRoot();
+      if (projectRootDir) {
+        config.params = { project: projectRootDir, ...config.params };
+      }
+      return config;
+    });
     this._currentProjectDir = roboviewPathManager.getCurrentProjectPath();
 
     roboviewPathManager.onPathChange((newPath) => {
@@ -401,9 +413,27 @@ export class RoboViewPanel {
                   project_root_dir: this._currentProjectDir,
                 },
               );
+              // Report generation runs in the background, poll until it has finished
+              let reportStatus = generateResponse.data;
+              let attempts = 0;
+              while (reportStatus.status === "generating") {
+                if (attempts >= REPORT_POLL_MAX_ATTEMPTS) {
+                  throw new Error(
+                    "Report generation did not finish in time, check the available reports later",
+                  );
+                }
+                attempts++;
+                await new Promise((resolve) =>
+                  setTimeout(resolve, REPORT_POLL_INTERVAL_MS),
+                );
+                const statusResponse = await this._axiosInstance.get(
+                  `/api/v1/reports/status/${reportStatus.report_id}`,
+                );
+                reportStatus = statusResponse.data;
+              }
               this._panel.webview.postMessage({
                 command: "reportGenerated",
-                status: generateResponse.data,
+                status: reportStatus,
               });
               break;
             }
@@ -8,7 +8,7 @@ export interface ReportGenerateRequest {
 
 export interface ReportStatusResponse {
   report_id: string;
-  status: "pending" | "completed" | "failed";
+  status: "generating" | "completed" | "failed";
   download_url?: string;
   error_message?: string;
   file_size?: number;